@@ -1,13 +1,31 @@
 from __future__ import division
 from pyomo.environ import *
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.opt import SolverResults
+from pyomo.common.modeling import NOTSET
+from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.repn import generate_standard_repn
+from pyomo.core.expr.visitor import identify_variables, replace_expressions
 import csv
 import sys
-import cloudpickle
+import json
+import hashlib
 import time
 import os
+import importlib.util
 from datetime import datetime
 from scipy.stats import norm
+from scipy.sparse import coo_matrix, identity
+from scipy.sparse.linalg import splu
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import numpy as np
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import logging
+from reader import file_hash
 
 # import cartopy
 # import cartopy.crs as ccrs
@@ -21,16 +39,832 @@ def strfdelta(tdelta, fmt):
 	d["M"], d["S"] = divmod(rem, 60)
 	return fmt.format(**d)
 
+def load_tab_file(data, tab_file_format='tab', **kwds):
+	# Loads a .tab-file into 'data' (arguments as DataPortal.load, with the name of the set or parameter). If 'data'
+	# is a DataPortal the file is read by Pyomo, otherwise (a dict, for the ConcreteModel) it is read with pandas.
+	# With tab_file_format 'parquet' the .parquet-file written by the reader and scenario generator is read with
+	# pandas instead (files only available as .tab, e.g. pre-made scenario data, are still read as .tab). The data
+	# is stored in the same form as DataPortal stores it when reading the corresponding .tab-file.
+	parquet_file = os.path.splitext(kwds['filename'])[0] + '.parquet'
+	if tab_file_format == 'parquet' and os.path.exists(parquet_file):
+		table = pd.read_parquet(parquet_file)
+	elif isinstance(data, DataPortal):
+		data.load(**kwds)
+		return
+	else:
+		table = pd.read_csv(kwds['filename'], sep='\t', keep_default_na=False, float_precision='round_trip')
+	columns = [table[column].tolist() for column in table.columns]
+	if kwds['format'] == 'set':
+		data[kwds['set']] = {None: columns[0] if len(columns) == 1 else list(zip(*columns))}
+	elif len(columns) == 1:
+		data[kwds['param']] = {None: columns[0][0]}
+	else:
+		index = columns[0] if len(columns) == 2 else list(zip(*columns[:-1]))
+		data[kwds['param']] = dict(zip(index, columns[-1]))
+
+def param_array(param, sets, default):
+	# Values of the indexed parameter 'param' as a NumPy array with one axis per set in 'sets' (lists of the set
+	# elements in the index order of the parameter, elements of multidimensional sets are tuples). Indices without
+	# data get the value 'default'.
+	return values_array(param.extract_values_sparse(), sets, default)
+
+def var_array(var, sets):
+	# Values of the indexed variable 'var' (or the dictionary of its values, e.g. from read_checkpoint) as a NumPy
+	# array (axes as in param_array). Indices that are not constructed (variables with dense=False) or without value
+	# get the value 0.
+	values = var if isinstance(var, dict) else var.extract_values()
+	values = {key: (0 if v is None else v) for key, v in values.items()}
+	return values_array(values, sets, 0)
+
+def values_array(values, sets, default):
+	# The dictionary 'values' (index: value) of an indexed component as a NumPy array (axes as in param_array)
+	array = np.full([len(s) for s in sets], default, dtype=float)
+	if len(values) > 0:
+		widths = [len(s[0]) if len(s) > 0 and isinstance(s[0], tuple) else 1 for s in sets]
+		starts = np.cumsum([0] + widths[:-1])
+		keys = [key if isinstance(key, tuple) else (key,) for key in values.keys()]
+		index = []
+		for s, start, width in zip(sets, starts, widths):
+			position = {e: k for k, e in enumerate(s)}
+			if width == 1:
+				index.append(np.array([position[key[start]] for key in keys], dtype=int))
+			else:
+				index.append(np.array([position[key[start:start + width]] for key in keys], dtype=int))
+		array[tuple(index)] = np.fromiter(values.values(), dtype=float, count=len(keys))
+	return array
+
+def store_param_array(param, sets, array):
+	# Stores the NumPy array 'array' (axes as in param_array) in the mutable indexed parameter 'param' in one go
+	keys = itertools.product(*sets)
+	if any(len(s) > 0 and isinstance(s[0], tuple) for s in sets):
+		keys = (sum((e if isinstance(e, tuple) else (e,) for e in key), ()) for key in keys)
+	param.store_values(dict(zip(keys, array.ravel().tolist())))
+
+def power_emission_intensity(emissions, generation, received, linkFrom, linkTo):
+	# Emission intensity of the power consumed at the nodes by proportional flow tracing: the power at a node is a
+	# mix of its generation and the power received on the links into the node, so the intensities x solve
+	# (I - A)x = e with A[n,m] the share of the power at n received from m and e the emissions of the generation at n per
+	# power at n.
+	# The systems of all columns (hours, periods, scenarios) are solved at once as one block diagonal sparse system.
+	# Input: emissions and generation at the nodes (node x column), power received on the links (link x column),
+	# node positions of the start and end of the links
+	# Output: intensities (node x column), 0 at nodes without power
+	[nodes, columns] = generation.shape
+	supply = generation.copy()
+	np.add.at(supply, linkTo, received)
+	share = np.divide(received, supply[linkTo], out=np.zeros_like(received), where=supply[linkTo] > 0)
+	e = np.divide(emissions, supply, out=np.zeros_like(emissions), where=supply > 0)
+	#Rows and columns of the block diagonal system are ordered column, node
+	offset = np.arange(columns)[None, :] * nodes
+	A = coo_matrix((share.ravel(), ((offset + linkTo[:, None]).ravel(), (offset + linkFrom[:, None]).ravel())), shape=(nodes * columns, nodes * columns))
+	try:
+		x = splu((identity(nodes * columns, format='csc') - A).tocsc()).solve(e.T.ravel())
+	except RuntimeError:
+		#Power only circulating between nodes without generation, the intensities of the affected columns are 0
+		print('Warning: Power circulates between nodes without generation, solving power emission intensities column by column')
+		x = np.zeros(nodes * columns)
+		A = A.tocsr()
+		for k in range(columns):
+			block = slice(k * nodes, (k + 1) * nodes)
+			try:
+				x[block] = np.linalg.solve(np.eye(nodes) - A[block, block].toarray(), e[:, k])
+			except np.linalg.LinAlgError:
+				pass
+	return x.reshape(columns, nodes).T
+
+def presolve_instance(instance):
+	# Substitutes out variables that are only defined by an equality constraint. A variable pinned by an equality on
+	# that variable alone (e.g. meetHydrogenDemand, or a binary forced to 0) is fixed, a variable that is a scaled
+	# copy of another variable (x == r*y + c with r > 0, e.g. hydrogenProducedReformer_ton) is replaced by r*y + c in
+	# all constraints, expressions and objectives. The defining equality constraints are deactivated. Variables are
+	# only substituted if the bounds of the remaining variable imply their bounds.
+	# Output: the fixed variables and a map from the substituted variables to (r, y, c), which
+	# restore_presolved_values uses to give the substituted variables their values after the solve
+	fixed = []
+	aliases = ComponentMap()
+	targets = ComponentSet()
+	for con in instance.component_data_objects(Constraint, active=True, descend_into=True):
+		if not con.equality:
+			continue
+		if con.body.is_expression_type() and con.body.nargs() > 3:
+			continue
+		repn = generate_standard_repn(con.body, compute_values=True, quadratic=False)
+		if not repn.is_linear() or any(v in aliases for v in repn.linear_vars):
+			continue
+		rhs = value(con.upper) - repn.constant
+		if len(repn.linear_vars) == 1:
+			x = repn.linear_vars[0]
+			if repn.linear_coefs[0] == 0 or x in targets:
+				continue
+			v = rhs / repn.linear_coefs[0]
+			if (x.lb is None or v >= x.lb) and (x.ub is None or v <= x.ub) and (x.is_continuous() or v == round(v)):
+				x.fix(v)
+				con.deactivate()
+				fixed.append(x)
+		elif len(repn.linear_vars) == 2:
+			for k in [0, 1]:
+				x, y = repn.linear_vars[k], repn.linear_vars[1 - k]
+				a, b = repn.linear_coefs[k], repn.linear_coefs[1 - k]
+				if a == 0 or x in targets or not x.is_continuous():
+					continue
+				r = -b / a
+				c = rhs / a
+				if r <= 0:
+					continue
+				if x.lb is not None and (y.lb is None or r * y.lb + c < x.lb):
+					continue
+				if x.ub is not None and (y.ub is None or r * y.ub + c > x.ub):
+					continue
+				aliases[x] = (r, y, c)
+				targets.add(y)
+				con.deactivate()
+				break
+
+	if len(aliases) > 0:
+		substitution = {id(x): (y if r == 1 and c == 0 else r * y + c) for x, (r, y, c) in aliases.items()}
+		for e in instance.component_data_objects(Expression, active=True, descend_into=True):
+			e.set_value(replace_expressions(e.expr, substitution, descend_into_named_expressions=False, remove_named_expressions=False))
+		for o in instance.component_data_objects(Objective, active=True, descend_into=True):
+			o.expr = replace_expressions(o.expr, substitution, descend_into_named_expressions=False, remove_named_expressions=False)
+		for con in instance.component_data_objects(Constraint, active=True, descend_into=True):
+			if any(v in aliases for v in identify_variables(con.body, include_fixed=False)):
+				body = replace_expressions(con.body, substitution, descend_into_named_expressions=False, remove_named_expressions=False)
+				con.set_value((con.lower, body, con.upper))
+	return [fixed, aliases]
+
+def restore_presolved_values(aliases):
+	# Sets the values of the variables substituted by presolve_instance from the solution
+	for x, (r, y, c) in aliases.items():
+		if y.value is not None:
+			x.set_value(r * y.value + c, skip_validation=True)
+
+def load_warmstart(instance, warmstart_path, hydrogen=False, result_file_format='csv'):
+	# Sets the investment decisions written by a previous run in warmstart_path (its result directory, with the result
+	# tables in result_file_format) as the values of the investment variables, which the solver uses as a start (MIP
+	# start) when it is warm started
+	# Output: the number of variable values set
+	period = {str(2015+int(i)*5)+"-"+str(2020+int(i)*5): i for i in instance.Period}
+	tables = [['results_output_gen', instance.genInvCap, ["Node","GeneratorType","Period"], "genInvCap_MW"],
+			  ['results_output_transmission', instance.transmissionInvCap, ["BetweenNode","AndNode","Period"], "transmissionInvCap_MW"],
+			  ['results_output_transmission', instance.transmissionFixedCostPaid, ["BetweenNode","AndNode","Period"], "transmissionBuilt?"],
+			  ['results_output_stor', instance.storPWInvCap, ["Node","StorageType","Period"], "storPWInvCap_MW"],
+			  ['results_output_stor', instance.storENInvCap, ["Node","StorageType","Period"], "storENInvCap_MWh"]]
+	if hydrogen is True:
+		tables += [['results_hydrogen_production_investments', instance.elyzerCapBuilt, ["Node","Period"], "New electrolyzer capacity [MW]"],
+				   ['results_hydrogen_pipeline_investments', instance.hydrogenPipelineBuilt, ["Between node","And node","Pipeline type","Period"], "Pipelines built [#]"],
+				   ['results_CO2_pipeline_investments', instance.CO2PipelineBuilt, ["Between node","And node","Pipeline type","Period"], "Pipelines built [#]"]]
+	count = 0
+	for [file, var, keys, column] in tables:
+		try:
+			table = load_result_table(warmstart_path, file, result_file_format)
+		except (OSError, KeyError):
+			print('Warning: ' + file + ' not found in ' + warmstart_path + ', no start values for ' + var.name)
+			continue
+		for row in table[keys + [column]].itertuples(index=False):
+			index = tuple(row[:-2]) + (period[row[-2]],)
+			if index in var:
+				v = row[-1] if var[index].is_continuous() else round(row[-1])
+				var[index].set_value(v, skip_validation=True)
+				count += 1
+	return count
+
+def input_hash(files, options):
+	# sha256 of the contents of the input files and of the run options (their repr), identifies the input of a solve
+	key = hashlib.sha256()
+	key.update(repr(options).encode())
+	for file in sorted(files):
+		key.update(os.path.basename(file).encode())
+		key.update(file_hash(file).encode())
+	return key.hexdigest()
+
+def save_checkpoint(instance, checkpoint_path, manifest):
+	# Saves the solution of the instance in the directory checkpoint_path: the values of all variables
+	# (values.parquet: component, index as JSON list, value), the duals if the instance has a dual suffix
+	# (duals.parquet: constraint, index, dual) and the dictionary 'manifest' (manifest.json: solver status, input hash,
+	# ...). The checkpoint only depends on the names and indices of the components, not on the Pyomo version.
+	if not os.path.exists(checkpoint_path):
+		os.makedirs(checkpoint_path)
+	rows = []
+	for var in instance.component_objects(Var, active=True):
+		for index, v in var.extract_values().items():
+			rows.append([var.name, json.dumps(list(index) if isinstance(index, tuple) else [index]), v])
+	values = pd.DataFrame(rows, columns=["Component", "Index", "Value"]).astype({"Component": 'category', "Value": float})
+	values.to_parquet(checkpoint_path + '/values.parquet', index=False)
+	manifest = dict(manifest, variables=len(values), duals=0)
+	dual = instance.component('dual')
+	if isinstance(dual, Suffix) and len(dual) > 0:
+		rows = [[c.parent_component().name, json.dumps(list(c.index()) if isinstance(c.index(), tuple) else [c.index()]), d] for c, d in dual.items()]
+		duals = pd.DataFrame(rows, columns=["Component", "Index", "Dual"]).astype({"Component": 'category', "Dual": float})
+		duals.to_parquet(checkpoint_path + '/duals.parquet', index=False)
+		manifest['duals'] = len(duals)
+	elif os.path.exists(checkpoint_path + '/duals.parquet'):
+		os.remove(checkpoint_path + '/duals.parquet')
+	with open(checkpoint_path + '/manifest.json', 'w') as f:
+		json.dump(manifest, f, indent=1)
+
+def read_checkpoint(checkpoint_path):
+	# Reads a checkpoint written by save_checkpoint without an instance
+	# Output: the manifest, the values of the variables and the duals of the constraints, both as dictionaries
+	# {component name: {index: value}} (like Var.extract_values(), so var_array takes them as well)
+	with open(checkpoint_path + '/manifest.json') as f:
+		manifest = json.load(f)
+	solution = []
+	for file in ['values.parquet', 'duals.parquet']:
+		components = {}
+		if os.path.exists(checkpoint_path + '/' + file):
+			table = pd.read_parquet(checkpoint_path + '/' + file)
+			for component, rows in table.groupby("Component", observed=True, sort=False):
+				indices = [json.loads(index) for index in rows["Index"]]
+				indices = [index[0] if len(index) == 1 else tuple(index) for index in indices]
+				components[component] = dict(zip(indices, [None if np.isnan(v) else v for v in rows.iloc[:, 2].tolist()]))
+		solution.append(components)
+	return [manifest] + solution
+
+def load_checkpoint(instance, checkpoint_path):
+	# Sets the solution of a checkpoint written by save_checkpoint on a freshly built instance (the duals in the dual
+	# suffix, which is added if the instance has none)
+	# Output: the manifest of the checkpoint
+	[manifest, values, duals] = read_checkpoint(checkpoint_path)
+	for name, components in values.items():
+		var = instance.find_component(name)
+		for index, v in components.items():
+			var[index].set_value(v, skip_validation=True)
+	if len(duals) > 0:
+		if not isinstance(instance.component('dual'), Suffix):
+			instance.dual = Suffix(direction=Suffix.IMPORT)
+		for name, components in duals.items():
+			constraint = instance.find_component(name)
+			for index, d in components.items():
+				instance.dual[constraint[index]] = d
+	return manifest
+
+def current_rss():
+	# Resident set size of the process in MB (read from /proc, so only on Linux, nan elsewhere)
+	try:
+		with open('/proc/self/statm') as f:
+			return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+	except (OSError, ValueError, AttributeError):
+		return float('nan')
+
+class ConstructionProfiler(logging.Handler):
+	# Records the construction of every component (Set, Param, BuildAction, Var, Constraint, ...) from the
+	# construction timers Pyomo reports to the logger 'pyomo.common.timing.construction': the wall time, the number
+	# of indices built and skipped (not built by the rule, e.g. Constraint.Skip) and the change of the resident set
+	# size since the previous component was constructed.
+	def __init__(self):
+		logging.Handler.__init__(self, level=logging.INFO)
+		self.logger = logging.getLogger('pyomo.common.timing.construction')
+		self.rows = []
+
+	def start(self):
+		self.rss = current_rss()
+		self.level, self.propagate = self.logger.level, self.logger.propagate
+		self.logger.setLevel(logging.INFO)
+		self.logger.propagate = False
+		self.logger.addHandler(self)
+
+	def stop(self):
+		self.logger.removeHandler(self)
+		self.logger.setLevel(self.level)
+		self.logger.propagate = self.propagate
+
+	def emit(self, record):
+		component = getattr(record.msg, 'obj', None)
+		if component is None or not hasattr(component, 'ctype'):
+			return
+		try:
+			built = len(component)
+			total = len(component.index_set()) if component.is_indexed() else built
+		except TypeError:
+			#Infinite sets (e.g. Any)
+			return
+		rss = current_rss()
+		self.rows.append([record.msg.name, component.ctype.__name__, record.msg.timer, built, total - built, rss - self.rss])
+		self.rss = rss
+
+	def write(self, path):
+		# Writes the profile to construction_profile.csv and construction_profile.json in path
+		profile = pd.DataFrame(self.rows, columns=["Component", "Type", "Time [sec]", "Indices built", "Indices skipped", "RSS delta [MB]"])
+		profile.to_csv(path + '/construction_profile.csv', index=False)
+		profile.to_json(path + '/construction_profile.json', orient='records', indent=1)
+		return profile
+
+class ResultWriter:
+	# Used like csv.writer for a result file: the rows are written as typed columnar table (result_file_format
+	# 'parquet': <file>.parquet, 'hdf5': key <file> of results.h5, needs PyTables) and/or as <file>.csv ('csv', or
+	# CSV_EXPORT). A blank row followed by a header starts a new table, stored as <file>_<first column of the header> in
+	# the columnar formats. The columnar tables are streamed in row groups of row_group_size rows: the column types
+	# (float64, or categorical text in parquet and text in hdf5) and the number of columns are set by the first row
+	# group of a table
+	def __init__(self, result_file_path, file, result_file_format='csv', CSV_EXPORT=False, row_group_size=100000):
+		self.result_file_path = result_file_path
+		self.file = file
+		self.result_file_format = result_file_format
+		self.row_group_size = row_group_size
+		self.csvfile = None
+		if result_file_format == 'csv' or CSV_EXPORT:
+			self.csvfile = open(result_file_path + '/' + file + '.csv', 'w', newline='')
+			self.csvwriter = csv.writer(self.csvfile)
+		self.store = None
+		if result_file_format == 'hdf5':
+			self.store = pd.HDFStore(result_file_path + '/results.h5', mode='a', complevel=9, complib='blosc')
+		self.name = None
+		self.rows = []
+		self.start_table(file)
+
+	def start_table(self, name):
+		self.name = name
+		self.header = None
+		self.columns = None
+		self.parquet = None
+
+	def writerow(self, row):
+		if self.csvfile is not None:
+			self.csvwriter.writerow(row)
+		if self.result_file_format == 'csv':
+			return
+		if row == [""]:
+			self.end_table()
+			self.start_table(None)
+		elif self.header is None:
+			self.header = [str(c) for c in row]
+			if self.name is None:
+				self.name = self.file + '_' + self.header[0]
+		else:
+			self.rows.append(row)
+			if len(self.rows) >= self.row_group_size:
+				self.write_row_group()
+
+	def write_row_group(self):
+		# Writes the collected rows of the current table as a row group
+		if self.columns is None:
+			width = max([len(self.header)] + [len(row) for row in self.rows])
+			header = self.header + ['Column' + str(c + 1) for c in range(len(self.header), width)]
+		else:
+			width = len(self.columns)
+			header = list(self.columns)
+		if max([0] + [len(row) for row in self.rows]) > width:
+			sys.exit("ERROR! A row of result table " + self.name + " has more columns than its first row group")
+		table = pd.DataFrame([row + [None] * (width - len(row)) for row in self.rows], columns=header)
+		first = self.columns is None
+		if first:
+			#Column types of the table: numeric if the first row group converts to numbers, text otherwise
+			self.columns = {}
+			for column in table.columns:
+				try:
+					pd.to_numeric(table[column])
+					self.columns[column] = 'float64'
+				except (ValueError, TypeError):
+					self.columns[column] = 'text'
+		for column, kind in self.columns.items():
+			if kind == 'float64':
+				try:
+					table[column] = pd.to_numeric(table[column]).astype('float64')
+				except (ValueError, TypeError):
+					sys.exit("ERROR! Column " + column + " of result table " + self.name + " is numeric in its first row group but not in a later one")
+			elif self.result_file_format == 'parquet':
+				table[column] = table[column].astype(str).astype('category')
+			else:
+				table[column] = table[column].astype(str)
+		if self.result_file_format == 'parquet':
+			if first:
+				schema = pa.Schema.from_pandas(table, preserve_index=False)
+				self.parquet = pq.ParquetWriter(self.result_file_path + '/' + self.name + '.parquet', schema)
+			self.parquet.write_table(pa.Table.from_pandas(table, schema=self.parquet.schema, preserve_index=False))
+		elif self.result_file_format == 'hdf5':
+			if first:
+				if self.name in self.store:
+					self.store.remove(self.name)
+				#Text columns have a fixed width in the hdf5 table, set generously by the first row group
+				text = {column: max(64, 2 * int(table[column].str.len().max())) for column, kind in self.columns.items() if kind == 'text' and len(table) > 0}
+				self.store.append(self.name, table, format='table', index=False, min_itemsize=text if text else None)
+			else:
+				self.store.append(self.name, table, format='table', index=False)
+		self.rows = []
+
+	def end_table(self):
+		#Writes the remaining rows, or the header of a table without rows
+		if self.header is not None and (self.rows or self.columns is None):
+			self.write_row_group()
+		if self.parquet is not None:
+			self.parquet.close()
+		self.parquet = None
+
+	def close(self):
+		if self.csvfile is not None:
+			self.csvfile.close()
+			self.csvfile = None
+		if self.result_file_format != 'csv':
+			self.end_table()
+		if self.store is not None:
+			self.store.close()
+			self.store = None
+
+def load_result_table(result_file_path, file, result_file_format='csv'):
+	# A result table written by ResultWriter (file without extension, e.g. 'results_output_Operational') as dataframe
+	if result_file_format == 'parquet':
+		return pd.read_parquet(result_file_path + '/' + file + '.parquet')
+	if result_file_format == 'hdf5':
+		return pd.read_hdf(result_file_path + '/results.h5', key=file)
+	return pd.read_csv(result_file_path + '/' + file + '.csv')
+
+def take_constraints(model):
+	# Removes the constraints from the AbstractModel 'model', so that create_instance builds the instance without
+	# them, and BendersDecomposition builds them from their rules in its master problem and subproblems instead
+	# Output: list of [name, rule, names of the sets of the index (None if not indexed)] in the declaration order
+	constraints = []
+	for constraint in list(model.component_objects(Constraint, descend_into=False)):
+		sets = [s.name for s in constraint.index_set().subsets(expand_all_set_operators=False)] if constraint.is_indexed() else None
+		constraints.append([constraint.local_name, constraint.rule, sets])
+		model.del_component(constraint)
+	return constraints
+
+# Benders decomposition of a worker process, set once by init_benders_worker
+benders_decomposition = None
+
+def init_benders_worker(decomposition):
+	global benders_decomposition
+	benders_decomposition = decomposition
+
+def solve_benders_subproblem_worker(task):
+	return benders_decomposition.solve_subproblem(*task)
+
+class BendersDecomposition:
+	# Benders decomposition (L-shaped method, one cut per subproblem and iteration) of an instance built without its
+	# constraints ('constraints' from take_constraints). The constraints are built from their rules once: the indices
+	# without a scenario in the instance (the master problem), the indices with a period and scenario (..., i, w) in
+	# the block BendersSubproblem[s] of subproblem s = (i, w). A variable is first-stage if its index contains no
+	# scenario or it is in a master constraint (e.g. hydroBudget), the other variables are operational variables of the
+	# (period, scenario) of their index. The master problem has a variable theta per subproblem for its operational
+	# cost, its objective and cuts are in the block BendersMaster, and it is solved as the instance with the
+	# subproblems and Obj deactivated. In the subproblems the first-stage variables are replaced by copies that are
+	# fixed to the master solution by the constraints 'fixing', so they are LPs, and the duals of 'fixing' are the
+	# gradient of the cut. Without load shedding a subproblem is infeasible for a master solution with too little
+	# capacity, so its equality constraints (balances) are elastic: their slack variables cost 'penalty' per unit,
+	# like load shedding. The inequality constraints (capacities) get no slack, their duals would be as large as the
+	# penalty at every capacity of 0. Since the penalised cost is below the cost of the subproblem, the cuts are valid
+	# for the instance, and a master solution is only an upper bound if no slack is used. If the penalised problem
+	# converges with slack, the penalty is increased tenfold. The subproblems are solved in a process pool with
+	# 'workers' processes (None = one per CPU, 1 = serial).
+	def __init__(self, instance, constraints, workers=None):
+		self.instance = instance
+		self.workers = workers
+		self.solver = None
+		scenarios = set(instance.Scenario)
+		def block(index):
+			#(period, scenario) of an index, None without scenario
+			index = index if isinstance(index, tuple) else (index,)
+			position = [k for k, i in enumerate(index) if i in scenarios]
+			return index[max(position[0] - 1, 0):position[0] + 1] if len(position) > 0 else None
+		self.blocks = [(i, w) for i in instance.Period for w in instance.Scenario]
+		blockNumber = {key: s for s, key in enumerate(self.blocks)}
+		def built(rule):
+			#Rule of a constraint built in the instance or a subproblem block from the rule of the AbstractModel
+			return lambda b, *index: rule(instance, index if len(index) > 1 else index[0] if len(index) == 1 else None)
+
+		#Objective: constant and first-stage terms in the master, operational terms in the subproblems. The
+		#coefficients are kept as expressions of the parameters, which can change between the points of a sweep.
+		repn = generate_standard_repn(instance.Obj.expr, compute_values=False, quadratic=False)
+		if not repn.is_linear():
+			sys.exit("ERROR! Benders decomposition needs a linear objective")
+
+		#The constraints in the master problem and the subproblems, indices grouped by (period, scenario)
+		instance.BendersSubproblem = Block(range(len(self.blocks)))
+		masterConstraints = 0
+		for [name, rule, sets] in constraints:
+			if sets is None:
+				instance.add_component(name, Constraint(rule=built(rule)))
+				masterConstraints += 1
+				continue
+			indexSet = instance.component(sets[0])
+			for s in sets[1:]:
+				indexSet = indexSet * instance.component(s)
+			indices = {}
+			for index in indexSet:
+				indices.setdefault(block(index), []).append(index)
+			for key, keyIndices in indices.items():
+				if key is not None and key not in blockNumber:
+					sys.exit("ERROR! Benders decomposition: the constraint " + name + " has indices with a scenario but without a period before it")
+				component = Constraint(keyIndices, rule=built(rule))
+				if key is None:
+					instance.add_component(name, component)
+					masterConstraints += len(component)
+				else:
+					instance.BendersSubproblem[blockNumber[key]].add_component(name, component)
+			del indices
+
+		#First-stage variables: without scenario in their index, or in a master constraint
+		inMaster = ComponentSet()
+		for constraint in instance.component_data_objects(Constraint, active=True, descend_into=False):
+			inMaster.update(identify_variables(constraint.body, include_fixed=False))
+		self.firstStageVars = []
+		firstStage = ComponentMap()
+		for var in instance.component_data_objects(Var, active=True, descend_into=False):
+			if not var.fixed and (var in inMaster or block(var.index()) is None):
+				firstStage[var] = len(self.firstStageVars)
+				self.firstStageVars.append(var)
+		del inMaster
+
+		#Initial penalty of the slacks: the largest operational cost coefficient (the cost of load shedding). The
+		#objectives of the master and the subproblems are divided by objectiveScale, so that the largest operational
+		#cost coefficient is 1e4, the thetas are operational costs divided by objectiveScale.
+		costs = [[] for s in self.blocks]
+		firstStageCost = []
+		for coef, var in zip(repn.linear_coefs, repn.linear_vars):
+			if var in firstStage:
+				firstStageCost.append([coef, var])
+			elif not var.fixed:
+				costs[blockNumber[block(var.index())]].append([coef, var])
+		self.initialPenalty = max([abs(value(coef)) for blockCosts in costs for [coef, var] in blockCosts] + [1])
+		self.penalty = self.initialPenalty
+		self.objectiveScale = self.initialPenalty / 1e4
+
+		instance.BendersMaster = master = Block()
+		master.theta = Var(range(len(self.blocks)))
+		master.cuts = ConstraintList()
+		self.firstStageCost = repn.constant + sum(coef * var for [coef, var] in firstStageCost)
+		master.Obj = Objective(expr=self.firstStageCost / self.objectiveScale + sum(master.theta[s] for s in range(len(self.blocks))), sense=minimize)
+		self.master = master
+
+		#Subproblems: the first-stage variables of their constraints replaced by copies, slacks on the equalities
+		self.subproblems = []
+		self.linking = []
+		self.operationalVars = []
+		for s, key in enumerate(self.blocks):
+			sub = instance.BendersSubproblem[s]
+			sub.x = VarList()
+			sub.slackUp = VarList(domain=NonNegativeReals)
+			sub.slackDown = VarList(domain=NonNegativeReals)
+			sub.penalty = Param(mutable=True, initialize=0)
+			linking = ComponentMap()
+			operationalVars = ComponentSet(var for [coef, var] in costs[s])
+			for constraint in list(sub.component_data_objects(Constraint, active=True)):
+				substitution = {}
+				for var in identify_variables(constraint.body, include_fixed=False):
+					if var in firstStage:
+						if var not in linking:
+							linking[var] = sub.x.add()
+						substitution[id(var)] = linking[var]
+					elif block(var.index()) == key:
+						operationalVars.add(var)
+					else:
+						sys.exit("ERROR! Benders decomposition: the constraint " + constraint.name + " has the variable " + var.name + " of another period or scenario")
+				if len(substitution) == 0 and not constraint.equality:
+					continue
+				body = replace_expressions(constraint.body, substitution, descend_into_named_expressions=True, remove_named_expressions=True) if len(substitution) > 0 else constraint.body
+				if constraint.equality:
+					body = body + sub.slackUp.add() - sub.slackDown.add()
+				constraint.set_value((constraint.lower, body, constraint.upper))
+			linking = list(linking.items())
+			sub.firstStage = Param(range(len(linking)), mutable=True, initialize=0)
+			sub.fixing = ConstraintList()
+			for j, [var, copy] in enumerate(linking):
+				sub.fixing.add(copy == sub.firstStage[j])
+			sub.Obj = Objective(expr=sum(coef / self.objectiveScale * var for [coef, var] in costs[s]) +
+									 sub.penalty * sum(sub.slackUp[e] + sub.slackDown[e] for e in sub.slackUp), sense=minimize)
+			sub.dual = Suffix(direction=Suffix.IMPORT)
+			sub.deactivate()
+			self.subproblems.append(sub)
+			self.linking.append([firstStage[var] for [var, copy] in linking])
+			self.operationalVars.append(list(operationalVars))
+			#The operational costs are not negative if all cost coefficients and variables are not
+			if all(value(coef) >= 0 and var.lb is not None and var.lb >= 0 for [coef, var] in costs[s]):
+				master.theta[s].setlb(0)
+		print("Benders decomposition: " + str(len(self.firstStageVars)) + " first-stage variables, " +
+			  str(masterConstraints) + " master constraints, " + str(len(self.subproblems)) + " subproblems")
+
+	def subproblem_solver(self):
+		#One solver per process
+		if self.solver is None:
+			self.solver = SolverFactory(self.solverName)
+			for key, option in self.options.items():
+				self.solver.options[key] = option
+		return self.solver
+
+	def solve_subproblem(self, s, firstStageValues, penalty, returnValues=False):
+		# Solves subproblem s for the first-stage values of its linking variables
+		# Output: penalised operational cost, its gradient in the first-stage values, largest slack, and with
+		# returnValues the values of the operational variables
+		sub = self.subproblems[s]
+		for j, v in enumerate(firstStageValues):
+			sub.firstStage[j] = v
+		sub.penalty.set_value(penalty / self.objectiveScale)
+		sub.activate()
+		try:
+			results = self.subproblem_solver().solve(sub)
+		finally:
+			sub.deactivate()
+		if results.solver.termination_condition != TerminationCondition.optimal:
+			raise RuntimeError("Benders subproblem " + str(self.blocks[s]) + " not solved: " + str(results.solver.termination_condition))
+		gradient = [self.objectiveScale * sub.dual[sub.fixing[j + 1]] for j in range(len(firstStageValues))]
+		slack = max([0] + [var.value or 0 for var in sub.slackUp.values()] + [var.value or 0 for var in sub.slackDown.values()])
+		solution = [var.value for var in self.operationalVars[s]] if returnValues else None
+		return [self.objectiveScale * value(sub.Obj), gradient, slack, solution]
+
+	def solve_subproblems(self, pool, firstStageValues, returnValues=False):
+		tasks = [[s, [firstStageValues[j] for j in linking], self.penalty, returnValues] for s, linking in enumerate(self.linking)]
+		if pool is None:
+			return [self.solve_subproblem(*task) for task in tasks]
+		return list(pool.map(solve_benders_subproblem_worker, tasks, chunksize=max(1, len(tasks) // (4 * (self.workers or os.cpu_count() or 1)))))
+
+	def solve(self, solverName, options, gap=1e-2, max_iterations=100, time_limit=None, logfile=None, separation_weight=0.2):
+		# Solves the master problem and the subproblems with the solver solverName and its options, and iterates until the
+		# relative gap between the best upper bound (first-stage cost and operational cost of the subproblems without
+		# slack) and the lower bound (master objective) is below 'gap'. The first iteration starts from the values of the
+		# first-stage variables in the instance (e.g. a warm start, otherwise 0), with the cuts and penalty of a previous
+		# solve removed (the parameters, e.g. the hydrogen demand of a sweep, may have changed). The instance gets the
+		# first-stage values with the best upper bound and the operational values of the subproblems for them.
+		# The master solutions jump to capacities with large slacks, where the cuts say little about the costs near the
+		# optimum, so the subproblems are solved at a separation point between the master solution and a core point, a
+		# running mean of the master solutions (in-out method): separation_weight * master + (1 - separation_weight) * core.
+		# After 5 iterations without a better master objective the subproblems are solved at the master solution once,
+		# with separation_weight 1 always (Kelley's cutting planes). The separation points are only feasible for the
+		# master problem if its integer variables are relaxed or fixed, so with integer first-stage variables the stages
+		# are: 'relaxed' until the gap of the relaxed problem is below 'gap', then the master problem with the integer
+		# variables (lower bound), and 'fixed' with the integer variables fixed to its solution (upper bounds) until the
+		# gap of the fixed problem is below 'gap', then the master problem with the integer variables again.
+		# Output: SolverResults with status, termination condition and bounds
+		startBenders = time.time()
+		self.solverName = solverName.replace('_persistent', '_direct')
+		self.options = dict(options)
+		self.solver = None
+		self.penalty = self.initialPenalty
+		self.master.del_component(self.master.cuts)
+		self.master.cuts = ConstraintList()
+		firstStageValues = []
+		for var in self.firstStageVars:
+			v = 0 if var.value is None else var.value
+			v = v if var.lb is None else max(v, var.lb)
+			v = v if var.ub is None else min(v, var.ub)
+			var.set_value(v, skip_validation=True)
+			firstStageValues.append(v)
+		#Integer first-stage variables with their domain and bounds, relaxed to reals with the same bounds
+		integerVars = [[var, var.domain, var.lb, var.ub] for var in self.firstStageVars if var.is_integer()]
+		stage = 'relaxed' if len(integerVars) > 0 else 'continuous'
+
+		#More than one worker needs the fork start method, the subproblems are not pickled
+		if self.workers == 1 or len(self.subproblems) < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+			pool = None
+		else:
+			pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('fork'),
+									   initializer=init_benders_worker, initargs=(self,))
+		masterSolver = SolverFactory(self.solverName)
+		for key, option in self.options.items():
+			masterSolver.options[key] = option
+		def solve_master():
+			#Objective value (in the units of the instance) and best bound of the master problem
+			results = masterSolver.solve(self.instance)
+			if results.solver.termination_condition != TerminationCondition.optimal:
+				raise RuntimeError("Benders master problem not solved: " + str(results.solver.termination_condition))
+			bound = results.problem.lower_bound
+			if bound is None or not np.isfinite(bound):
+				bound = value(self.master.Obj)
+			return [self.objectiveScale * value(self.master.Obj), self.objectiveScale * min(bound, value(self.master.Obj))]
+		def relative_gap(upper, lower):
+			return (upper - lower) / max(abs(upper), 1) if upper < float('inf') else float('inf')
+
+		#upperBound: best solution without slack, stageUpperBound and penalisedBound: best solution of the stage without
+		#slack and with the penalised slack, stageBound: master objective of the stage (the lower bound unless fixed)
+		upperBound = stageUpperBound = penalisedBound = float('inf')
+		lowerBound = stageBound = -float('inf')
+		bestValues = firstStageValues
+		core = None
+		stalled = 0
+		converged = False
+		log = []
+		self.instance.Obj.deactivate()
+		try:
+			for [var, domain, lb, ub] in integerVars:
+				var.domain = Reals
+				var.setlb(lb)
+				var.setub(ub)
+			for iteration in range(1, max_iterations + 1):
+				start = time.time()
+				subproblemResults = self.solve_subproblems(pool, firstStageValues)
+				subproblemTime = time.time() - start
+				cost = value(self.firstStageCost) + sum(objective for [objective, gradient, slack, solution] in subproblemResults)
+				largestSlack = max(slack for [objective, gradient, slack, solution] in subproblemResults)
+				if largestSlack <= 1e-6:
+					stageUpperBound = min(stageUpperBound, cost)
+					if stage != 'relaxed' and cost < upperBound:
+						upperBound = cost
+						bestValues = firstStageValues
+				penalisedBound = min(penalisedBound, cost)
+				#Optimality cuts theta >= cost + gradient * (x - x^)
+				for s, [objective, gradient, slack, solution] in enumerate(subproblemResults):
+					self.master.cuts.add(self.master.theta[s] >= (objective + sum(g * (self.firstStageVars[j] - firstStageValues[j])
+																				   for g, j in zip(gradient, self.linking[s]) if abs(g) > 1e-9 * self.objectiveScale)) / self.objectiveScale)
+
+				start = time.time()
+				[objective, bound] = solve_master()
+				stalled = 0 if objective > stageBound + 1e-6 * abs(stageBound) else stalled + 1
+				stageBound = max(stageBound, bound)
+				if stage != 'fixed':
+					lowerBound = max(lowerBound, bound)
+				#The penalised problem of the stage converged with slack: the penalty is too small, or with fixed integer
+				#variables their values are
+				penalisedConverged = relative_gap(penalisedBound, stageBound) <= gap and penalisedBound < stageUpperBound
+				if stage != 'continuous' and (relative_gap(stageUpperBound, stageBound) <= gap or (stage == 'fixed' and penalisedConverged)):
+					#The relaxed or fixed problem converged: the master problem with the integer variables for the lower
+					#bound, and its integer values fixed
+					fixedValues = [var.value if var.fixed else None for [var, domain, lb, ub] in integerVars]
+					for [var, domain, lb, ub] in integerVars:
+						var.unfix()
+						var.domain = domain
+						var.setlb(lb)
+						var.setub(ub)
+					[objective, bound] = solve_master()
+					lowerBound = max(lowerBound, bound)
+					for [var, domain, lb, ub] in integerVars:
+						var.fix(round(var.value))
+					if penalisedConverged and fixedValues == [var.value for [var, domain, lb, ub] in integerVars]:
+						self.penalty = 10 * self.penalty
+						print("Slack in the converged penalised problem, penalty increased to " + str(self.penalty))
+					stage = 'fixed'
+					stageUpperBound = penalisedBound = float('inf')
+					stageBound = -float('inf')
+					core = None
+				elif penalisedConverged:
+					self.penalty = 10 * self.penalty
+					penalisedBound = float('inf')
+					print("Slack in the converged penalised problem, penalty increased to " + str(self.penalty))
+				masterValues = [var.value for var in self.firstStageVars]
+				masterTime = time.time() - start
+
+				relativeGap = relative_gap(upperBound, lowerBound)
+				log.append([iteration, lowerBound, upperBound, relativeGap, largestSlack, self.penalty, stage, subproblemTime, masterTime])
+				print("{hour}:{minute}:{second}: Benders iteration ".format(
+					hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")) +
+					str(iteration) + ": lower bound " + str(lowerBound) + ", upper bound " + str(upperBound) + ", gap " +
+					str(relativeGap) + ", largest slack " + str(largestSlack) + ", " + stage + ", subproblems took [sec] " +
+					str(subproblemTime) + ", master took [sec] " + str(masterTime))
+				if relativeGap <= gap:
+					converged = True
+					break
+				if time_limit is not None and time_limit > 0 and time.time() - startBenders > time_limit:
+					break
+
+				#Next separation point
+				core = masterValues if core is None else [0.5 * (c + v) for c, v in zip(core, masterValues)]
+				if stalled % 6 != 5:
+					firstStageValues = [separation_weight * v + (1 - separation_weight) * c for c, v in zip(core, masterValues)]
+					for var, v in zip(self.firstStageVars, firstStageValues):
+						var.set_value(v, skip_validation=True)
+				else:
+					firstStageValues = masterValues
+
+			if upperBound == float('inf'):
+				raise RuntimeError("Benders decomposition found no first-stage solution without slack in the subproblems")
+			#Operational values for the best first-stage values
+			for var, v in zip(self.firstStageVars, bestValues):
+				var.set_value(v, skip_validation=True)
+			for s, [objective, gradient, slack, solution] in enumerate(self.solve_subproblems(pool, bestValues, returnValues=True)):
+				for var, v in zip(self.operationalVars[s], solution):
+					var.set_value(v, skip_validation=True)
+		finally:
+			for [var, domain, lb, ub] in integerVars:
+				var.unfix()
+				var.domain = domain
+				var.setlb(lb)
+				var.setub(ub)
+			self.instance.Obj.activate()
+			if pool is not None:
+				pool.shutdown()
+
+		if logfile is not None:
+			pd.DataFrame(log, columns=["Iteration", "Lower bound", "Upper bound", "Gap", "Largest slack", "Penalty", "Stage",
+									   "Subproblems [sec]", "Master [sec]"]).to_csv(logfile, index=False)
+
+		results = SolverResults()
+		results.solver.status = SolverStatus.ok
+		results.solver.termination_condition = TerminationCondition.optimal if converged else TerminationCondition.maxIterations
+		results.problem.lower_bound = lowerBound
+		results.problem.upper_bound = upperBound
+		return results
+
 # noinspection PyTypeChecker
 def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenario_data_path,
 			   solver, temp_dir, FirstHoursOfRegSeason, FirstHoursOfPeakSeason, lengthRegSeason,
 			   lengthPeakSeason, Period, Operationalhour, Scenario, Season, HoursOfSeason,
 			   NoOfNormalScenarios, NoOfHydrogenScenarios,
 			   discountrate, WACC, LeapYearsInvestment, WRITE_LP,
-			   PICKLE_INSTANCE, EMISSION_CAP, USE_TEMP_DIR, NoOfRegSeason, NoOfPeakSeason,
+			   CHECKPOINT, EMISSION_CAP, USE_TEMP_DIR, NoOfRegSeason, NoOfPeakSeason,
 			   windfarmNodes = None, verboseResultWriting=False,
 			   hydrogen=False, TIME_LIMIT=None,
-			   h2storage=False, hydrogen_demand_percentage = 1.0, std_dev_percentage = 0):
+			   h2storage=False, hydrogen_demand_percentage = 1.0, std_dev_percentage = 0,
+			   tab_file_format='tab', construction='abstract', PRESOLVE=False, sweep=None,
+			   WARMSTART=False, warmstart_path=None, solver_interface='shell', PROFILE_CONSTRUCTION=False,
+			   result_file_format='csv', CSV_EXPORT=False, LOAD_CHECKPOINT=False, decomposition='extensive',
+			   benders_workers=None, benders_gap=1e-2, benders_max_iterations=100):
+
+	#sweep: list of [name, result_file_path, hydrogen_demand_percentage, std_dev_percentage], the instance is built
+	#once and solved for each of them (None: only the name, result_file_path and percentages given)
+	if sweep is None:
+		sweep = [[name, result_file_path, hydrogen_demand_percentage, std_dev_percentage]]
+	[name, result_file_path, hydrogen_demand_percentage, std_dev_percentage] = sweep[0]
+
+	if PRESOLVE and len(sweep) > 1:
+		sys.exit("ERROR! PRESOLVE fixes the hydrogen demand, and can not be combined with a sweep")
 
 	if USE_TEMP_DIR:
 		TempfileManager.tempdir = temp_dir
@@ -48,7 +882,39 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			  f'normal scenarios ({NoOfNormalScenarios}) and hydrogen scenarios ({NoOfHydrogenScenarios})!')
 		exit()
 
-	model = AbstractModel()
+	#construction 'abstract': AbstractModel, built from a DataPortal by create_instance
+	#construction 'concrete': ConcreteModel, built while it is declared from the data read with pandas
+	if construction == 'concrete':
+		model = ConcreteModel()
+	elif construction == 'abstract':
+		model = AbstractModel()
+	else:
+		sys.exit("ERROR! Invalid construction! Options: abstract, concrete")
+
+	#result_file_format 'csv': result tables as .csv-files, 'parquet'/'hdf5': as typed columnar tables (.parquet-files
+	#or results.h5, which needs PyTables), with CSV_EXPORT also as .csv-files
+	if result_file_format not in ['csv', 'parquet', 'hdf5']:
+		sys.exit("ERROR! Invalid result file format! Options: csv, parquet, hdf5")
+	if result_file_format == 'hdf5' and importlib.util.find_spec('tables') is None:
+		sys.exit("ERROR! result_file_format hdf5 needs the Python package tables (PyTables), use csv or parquet")
+
+	#decomposition 'extensive': the instance is solved as one problem, 'benders': Benders decomposition into an
+	#investment master problem and operational subproblems per period and scenario, solved in a process pool with
+	#benders_workers processes. The constraints are built in the master problem and the subproblems instead of the
+	#instance, so there is no extensive instance to presolve or write as LP-file.
+	if decomposition not in ['extensive', 'benders']:
+		sys.exit("ERROR! Invalid decomposition! Options: extensive, benders")
+	if decomposition == 'benders' and construction != 'abstract':
+		sys.exit("ERROR! decomposition benders builds the constraints from the AbstractModel, use construction abstract")
+	if decomposition == 'benders' and (PRESOLVE or WRITE_LP):
+		sys.exit("ERROR! decomposition benders can not be combined with PRESOLVE or WRITE_LP")
+
+	#The components of a ConcreteModel are constructed while they are declared, so the profiler starts here, and for
+	#an AbstractModel when the instance is created
+	if PROFILE_CONSTRUCTION:
+		profiler = ConstructionProfiler()
+		if construction == 'concrete':
+			profiler.start()
 
 	###########
 	##SOLVERS##
@@ -63,6 +929,24 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	else:
 		sys.exit("ERROR! Invalid solver! Options: CPLEX, Xpress, Gurobi")
 
+	#solver_interface 'shell': the instance is written to an LP-file that is read by the solver executable, and the
+	#solution is read back from a file. 'direct', 'persistent' and 'appsi': the instance is given to the solver in
+	#memory through its Python interface (gurobipy, cplex, xpress), and the solution is read back in memory.
+	#Writing the LP-file is only an export (WRITE_LP).
+	solverName = {"CPLEX": "cplex", "Xpress": "xpress", "Gurobi": "gurobi"}[solver]
+	if solver_interface in ["direct", "persistent"]:
+		solverName = solverName + "_" + solver_interface
+	elif solver_interface == "appsi":
+		if solver == "Xpress":
+			sys.exit("ERROR! No appsi interface for Xpress! Options: shell, direct, persistent")
+		solverName = "appsi_" + solverName
+	elif solver_interface != "shell":
+		sys.exit("ERROR! Invalid solver_interface! Options: shell, direct, persistent, appsi")
+	solverPackage = {"CPLEX": "cplex", "Xpress": "xpress", "Gurobi": "gurobipy"}[solver]
+	if solver_interface != "shell" and importlib.util.find_spec(solverPackage) is None:
+		sys.exit("ERROR! solver_interface " + solver_interface + " needs the Python package " + solverPackage + ", use solver_interface shell")
+	print("Solver interface: " + solver_interface)
+
 	##########
 	##MODULE##
 	##########
@@ -70,8 +954,26 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	if WRITE_LP:
 		print("Will write LP-file...")
 
-	if PICKLE_INSTANCE:
-		print("Will pickle instance...")
+	if CHECKPOINT:
+		print("Will save a checkpoint of the solution...")
+
+	if LOAD_CHECKPOINT:
+		print("Will load the solution from the checkpoint instead of solving...")
+
+	if PRESOLVE:
+		print("Will presolve instance...")
+
+	if WARMSTART:
+		print("Will warm start the solver...")
+
+	if decomposition == 'benders':
+		print("Will solve with Benders decomposition...")
+
+	if PROFILE_CONSTRUCTION:
+		print("Will profile the construction of the components...")
+
+	if result_file_format != 'csv':
+		print("Will write the result tables as " + result_file_format + (" and csv" if CSV_EXPORT else "") + "...")
 
 	if EMISSION_CAP:
 		print("Absolute emission cap in each scenario...")
@@ -85,15 +987,52 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	##SETS##
 	########
 
-	#Define the sets
 	timeStart = datetime.now()
+	print("Reading sets...")
+
+	#Load the data. The data is read before the components are declared, since the components of a ConcreteModel
+	#are initialized with it when they are declared (see tab_data)
+
+	if construction == 'concrete':
+		data = {}
+	else:
+		data = DataPortal()
+
+	def tab_data(name, default=NOTSET):
+		#Initial values of the component 'name' of the ConcreteModel. The AbstractModel gets the data from the
+		#DataPortal in create_instance instead, and is only given 'default' (the initial values without data,
+		#NOTSET as if no initialize was given)
+		if construction != 'concrete' or name not in data:
+			return default
+		if None in data[name]:
+			return data[name][None]
+		return data[name]
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_Generator.tab',format="set", set='Generator')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Sets_HydrogenGenerators.tab', format="set", set='HydrogenGenerators')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_ThermalGenerators.tab',format="set", set='ThermalGenerators')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_HydroGenerator.tab',format="set", set='HydroGenerator')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_HydroGeneratorWithReservoir.tab',format="set", set='RegHydroGenerator')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_Storage.tab',format="set", set='Storage')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_DependentStorage.tab',format="set", set='DependentStorage')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_Technology.tab',format="set", set='Technology')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_Node.tab',format="set", set='Node')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_DirectionalLines.tab',format="set", set='DirectionalLink')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_LineType.tab',format="set", set='TransmissionType')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_LineTypeOfDirectionalLines.tab',format="set", set='TransmissionTypeOfDirectionalLink')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_GeneratorsOfTechnology.tab',format="set", set='GeneratorsOfTechnology')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_GeneratorsOfNode.tab',format="set", set='GeneratorsOfNode')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_StorageOfNodes.tab',format="set", set='StoragesOfNode')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_PipelineType.tab',format="set", set='PipelineType')
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Sets_PipelineTypeOfLines.tab',format="set", set='PipelineTypeOfDirectionalLink')
+
+	#Define the sets
 	print("Declaring sets...")
 
 	#Supply technology sets
-	model.Generator = Set(ordered=True) #g
-	model.HydrogenGenerators = Set(ordered=True, within=model.Generator)
-	model.Technology = Set(ordered=True) #t
-	model.Storage =  Set() #b
+	model.Generator = Set(ordered=True, initialize=tab_data('Generator')) #g
+	model.HydrogenGenerators = Set(ordered=True, within=model.Generator, initialize=tab_data('HydrogenGenerators'))
+	model.Technology = Set(ordered=True, initialize=tab_data('Technology')) #t
+	model.Storage =  Set(initialize=tab_data('Storage')) #b
 
 
 	#Temporal sets
@@ -102,10 +1041,10 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	model.Season = Set(ordered=True, initialize=Season) #s
 
 	#Spatial sets
-	model.Node = Set(ordered=True) #n
-	model.DirectionalLink = Set(dimen=2, within=model.Node*model.Node, ordered=True) #a
-	model.TransmissionType = Set(ordered=True)
-	model.PipelineType = Set(ordered=True)
+	model.Node = Set(ordered=True, initialize=tab_data('Node')) #n
+	model.DirectionalLink = Set(dimen=2, within=model.Node*model.Node, ordered=True, initialize=tab_data('DirectionalLink')) #a
+	model.TransmissionType = Set(ordered=True, initialize=tab_data('TransmissionType'))
+	model.PipelineType = Set(ordered=True, initialize=tab_data('PipelineType'))
 
 	if windfarmNodes is not None:
 		#GD: Set of all offshore wind farm nodes. Need this set to restrict transmission through wind farms based on their invested capacity
@@ -115,43 +1054,20 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	model.Scenario = Set(ordered=True, initialize=Scenario) #w
 
 	#Subsets
-	model.GeneratorsOfTechnology=Set(dimen=2) #(t,g) for all t in T, g in G_t
-	model.GeneratorsOfNode = Set(dimen=2) #(n,g) for all n in N, g in G_n
-	model.TransmissionTypeOfDirectionalLink = Set(dimen=3) #(n1,n2,t) for all (n1,n2) in L, t in T
-	model.PipelineTypeOfDirectionalLink = Set(dimen=3) #(n1,n2,t) for all (n1,n2) in L, t in T
-	model.ThermalGenerators = Set(within=model.Generator) #g_ramp
-	model.RegHydroGenerator = Set(within=model.Generator) #g_reghyd
-	model.HydroGenerator = Set(within=model.Generator) #g_hyd
-	model.StoragesOfNode = Set(dimen=2) #(n,b) for all n in N, b in B_n
-	model.DependentStorage = Set() #b_dagger
+	model.GeneratorsOfTechnology=Set(dimen=2, initialize=tab_data('GeneratorsOfTechnology')) #(t,g) for all t in T, g in G_t
+	model.GeneratorsOfNode = Set(dimen=2, initialize=tab_data('GeneratorsOfNode')) #(n,g) for all n in N, g in G_n
+	model.TransmissionTypeOfDirectionalLink = Set(dimen=3, initialize=tab_data('TransmissionTypeOfDirectionalLink')) #(n1,n2,t) for all (n1,n2) in L, t in T
+	model.PipelineTypeOfDirectionalLink = Set(dimen=3, initialize=tab_data('PipelineTypeOfDirectionalLink')) #(n1,n2,t) for all (n1,n2) in L, t in T
+	model.ThermalGenerators = Set(within=model.Generator, initialize=tab_data('ThermalGenerators')) #g_ramp
+	model.RegHydroGenerator = Set(within=model.Generator, initialize=tab_data('RegHydroGenerator')) #g_reghyd
+	model.HydroGenerator = Set(within=model.Generator, initialize=tab_data('HydroGenerator')) #g_hyd
+	model.StoragesOfNode = Set(dimen=2, initialize=tab_data('StoragesOfNode')) #(n,b) for all n in N, b in B_n
+	model.DependentStorage = Set(initialize=tab_data('DependentStorage')) #b_dagger
 	model.HoursOfSeason = Set(dimen=2, ordered=True, initialize=HoursOfSeason) #(s,h) for all s in S, h in H_s
 	model.FirstHoursOfRegSeason = Set(within=model.Operationalhour, ordered=True, initialize=FirstHoursOfRegSeason)
 	model.FirstHoursOfPeakSeason = Set(within=model.Operationalhour, ordered=True, initialize=FirstHoursOfPeakSeason)
 
 
-	print("Reading sets...")
-
-	#Load the data
-
-	data = DataPortal()
-	data.load(filename=tab_file_path + "/" + 'Sets_Generator.tab',format="set", set=model.Generator)
-	data.load(filename=tab_file_path + '/' + 'Sets_HydrogenGenerators.tab', format="set", set=model.HydrogenGenerators)
-	data.load(filename=tab_file_path + "/" + 'Sets_ThermalGenerators.tab',format="set", set=model.ThermalGenerators)
-	data.load(filename=tab_file_path + "/" + 'Sets_HydroGenerator.tab',format="set", set=model.HydroGenerator)
-	data.load(filename=tab_file_path + "/" + 'Sets_HydroGeneratorWithReservoir.tab',format="set", set=model.RegHydroGenerator)
-	data.load(filename=tab_file_path + "/" + 'Sets_Storage.tab',format="set", set=model.Storage)
-	data.load(filename=tab_file_path + "/" + 'Sets_DependentStorage.tab',format="set", set=model.DependentStorage)
-	data.load(filename=tab_file_path + "/" + 'Sets_Technology.tab',format="set", set=model.Technology)
-	data.load(filename=tab_file_path + "/" + 'Sets_Node.tab',format="set", set=model.Node)
-	data.load(filename=tab_file_path + "/" + 'Sets_DirectionalLines.tab',format="set", set=model.DirectionalLink)
-	data.load(filename=tab_file_path + "/" + 'Sets_LineType.tab',format="set", set=model.TransmissionType)
-	data.load(filename=tab_file_path + "/" + 'Sets_LineTypeOfDirectionalLines.tab',format="set", set=model.TransmissionTypeOfDirectionalLink)
-	data.load(filename=tab_file_path + "/" + 'Sets_GeneratorsOfTechnology.tab',format="set", set=model.GeneratorsOfTechnology)
-	data.load(filename=tab_file_path + "/" + 'Sets_GeneratorsOfNode.tab',format="set", set=model.GeneratorsOfNode)
-	data.load(filename=tab_file_path + "/" + 'Sets_StorageOfNodes.tab',format="set", set=model.StoragesOfNode)
-	data.load(filename=tab_file_path + "/" + 'Sets_PipelineType.tab',format="set", set=model.PipelineType)
-	data.load(filename=tab_file_path + "/" + 'Sets_PipelineTypeOfLines.tab',format="set", set=model.PipelineTypeOfDirectionalLink)
-
 	print("Constructing sub sets...")
 
 	#Build arc subsets
@@ -172,11 +1088,129 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		return retval
 	model.BidirectionalArc = Set(dimen=2, initialize=BidirectionalArc_init, ordered=True) #l
 
+	#Build sparse indexes of the subsets, so that the constraint rules only iterate over the elements of a node,
+	#season or link
+
+	def GeneratorsAtNode_init(model, node):
+		return [g for g in model.Generator if (node,g) in model.GeneratorsOfNode]
+	model.GeneratorsAtNode = Set(model.Node, ordered=True, initialize=GeneratorsAtNode_init) #g in G_n
+
+	def HydroGeneratorsAtNode_init(model, node):
+		return [g for g in model.GeneratorsAtNode[node] if g in model.HydroGenerator]
+	model.HydroGeneratorsAtNode = Set(model.Node, ordered=True, initialize=HydroGeneratorsAtNode_init) #g in G_n and G_hydro
+
+	def GeneratorsAtNodeOfTechnology_init(model, node, tech):
+		return [g for g in model.GeneratorsAtNode[node] if (tech,g) in model.GeneratorsOfTechnology]
+	model.GeneratorsAtNodeOfTechnology = Set(model.Node, model.Technology, ordered=True, initialize=GeneratorsAtNodeOfTechnology_init) #g in G_n and G_t
+
+	def StoragesAtNode_init(model, node):
+		return [b for b in model.Storage if (node,b) in model.StoragesOfNode]
+	model.StoragesAtNode = Set(model.Node, ordered=True, initialize=StoragesAtNode_init) #b in B_n
+
+	def HoursInSeason_init(model, season):
+		return [h for (s,h) in model.HoursOfSeason if s == season]
+	model.HoursInSeason = Set(model.Season, ordered=True, initialize=HoursInSeason_init) #h in H_s
+
+	def PipelineTypesOfLink_init(model, n1, n2):
+		return [t for t in model.PipelineType if (n1,n2,t) in model.PipelineTypeOfDirectionalLink]
+	model.PipelineTypesOfLink = Set(model.DirectionalLink, ordered=True, initialize=PipelineTypesOfLink_init)
+
 
 	##############
 	##PARAMETERS##
 	##############
 
+	#Load the parameters
+
+	print("Reading parameters...")
+
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_CapitalCosts.tab', param='genCapitalCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_FixedOMCosts.tab', param='genFixedOMCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_VariableOMCosts.tab', param='genVariableOMCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_FuelCosts.tab', param='genFuelCostRaw', format="table")
+	# data.load(filename=tab_file_path + "/" + 'Generator_CCSCostTSVariable.tab', param=model.CCSCostTSVariable, format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_Efficiency.tab', param='genEfficiency', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_RefInitialCap.tab', param='genRefInitCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_ScaleFactorInitialCap.tab', param='genScaleInitCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_InitialCapacity.tab', param='genInitCap', format="table") #node_generator_intial_capacity.xlsx
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_MaxBuiltCapacity.tab', param='genMaxBuiltCap', format="table")#?
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_MaxInstalledCapacity.tab', param='genMaxInstalledCapRaw', format="table")#maximum_capacity_constraint_040317_high
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_CO2Content.tab', param='genCO2TypeFactor', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_CO2Captured.tab', param='genCO2Captured', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_RampRate.tab', param='genRampUpCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_GeneratorTypeAvailability.tab', param='genCapAvailTypeRaw', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Generator_Lifetime.tab', param='genLifetime', format="table")
+
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_InitialCapacity.tab', param='transmissionInitCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_MaxBuiltCapacity.tab', param='transmissionMaxBuiltCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_MaxInstallCapacityRaw.tab', param='transmissionMaxInstalledCapRaw', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_Length.tab', param='transmissionLength', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_TypeConverterFixedCost.tab', param='transmissionTypeConverterFixedCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_TypeConverterVariableCost.tab', param='transmissionTypeConverterVariableCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_TypeCableFixedCost.tab', param='transmissionTypeCableFixedCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_TypeCableVariableCost.tab', param='transmissionTypeCableVariableCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_TypeFixedOMCost.tab', param='transmissionTypeFixedOMCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_lineEfficiency.tab', param='lineEfficiency', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Transmission_Lifetime.tab', param='transmissionLifetime', format="table")
+
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_StorageBleedEfficiency.tab', param='storageBleedEff', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_StorageChargeEff.tab', param='storageChargeEff', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_StorageDischargeEff.tab', param='storageDischargeEff', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_StoragePowToEnergy.tab', param='storagePowToEnergy', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_EnergyCapitalCost.tab', param='storENCapitalCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_EnergyFixedOMCost.tab', param='storENFixedOMCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_EnergyInitialCapacity.tab', param='storENInitCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_EnergyMaxBuiltCapacity.tab', param='storENMaxBuiltCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_EnergyMaxInstalledCapacity.tab', param='storENMaxInstalledCapRaw', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_StorageInitialEnergyLevel.tab', param='storOperationalInit', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_PowerCapitalCost.tab', param='storPWCapitalCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_PowerFixedOMCost.tab', param='storPWFixedOMCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_InitialPowerCapacity.tab', param='storPWInitCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_PowerMaxBuiltCapacity.tab', param='storPWMaxBuiltCap', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_PowerMaxInstalledCapacity.tab', param='storPWMaxInstalledCapRaw', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Storage_Lifetime.tab', param='storageLifetime', format="table")
+
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Node_NodeLostLoadCost.tab', param='nodeLostLoadCost', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Node_ElectricAnnualDemand.tab', param='sloadAnnualDemand', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Node_HydroGenMaxAnnualProduction.tab', param='maxHydroNode', format="table")
+
+	#SÆVAREID: Coordinates
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Node_Latitude.tab', param='Latitude', format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'Node_Longitude.tab', param='Longitude', format="table")
+
+	if scenariogeneration:
+		scenariopath = tab_file_path
+	else:
+		scenariopath = scenario_data_path
+
+	# data.load(filename=scenariopath + "/" + f'Stochastic_HydroGenMaxSeasonalProduction.tab', param=model.maxRegHydroGenRaw, format="table")
+	# data.load(filename=scenariopath + "/" + f'Stochastic_StochasticAvailability.tab', param=model.genCapAvailStochRaw, format="table")
+	# data.load(filename=scenariopath + "/" + f'Stochastic_ElectricLoadRaw.tab', param=model.sloadRaw, format="table")
+	load_tab_file(data, tab_file_format, filename=scenariopath + "/" + f'Stochastic_HydroGenMaxSeasonalProduction_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}.tab', param='maxRegHydroGenRaw', format="table")
+	load_tab_file(data, tab_file_format, filename=scenariopath + "/" + f'Stochastic_StochasticAvailability_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}.tab', param='genCapAvailStochRaw', format="table")
+	load_tab_file(data, tab_file_format, filename=scenariopath + "/" + f'Stochastic_ElectricLoadRaw_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}.tab', param='sloadRaw', format="table")
+
+	# data.load(filename=tab_file_path + "/" + 'General_seasonScale.tab', param=model.seasScale, format="table")
+	#Season scales of clustered representative weeks (scenario generation with sampling='cluster')
+	seasonScaleFile = scenariopath + "/" + f'Stochastic_SeasonScale_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}'
+	seasonScaleFromFile = os.path.exists(seasonScaleFile + '.tab') or \
+		(tab_file_format == 'parquet' and os.path.exists(seasonScaleFile + '.parquet'))
+	if seasonScaleFromFile:
+		load_tab_file(data, tab_file_format, filename=seasonScaleFile + '.tab', param='seasScale', format="table")
+
+	#Scenario probabilities of reduced scenario sets (scenario_reduction.reduce_scenarios)
+	sceProbabFile = scenariopath + "/" + f'Stochastic_ScenarioProbability_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}'
+	sceProbabFromFile = os.path.exists(sceProbabFile + '.tab') or \
+		(tab_file_format == 'parquet' and os.path.exists(sceProbabFile + '.parquet'))
+	if sceProbabFromFile:
+		load_tab_file(data, tab_file_format, filename=sceProbabFile + '.tab', param='sceProbab', format="table")
+
+	if EMISSION_CAP:
+		load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'General_CO2Cap.tab', param='CO2cap', format="table")
+	# else:
+	# 	data.load(filename=tab_file_path + "/" + 'General_CO2Price.tab', param=model.CO2price, format="table")
+	load_tab_file(data, tab_file_format, filename=tab_file_path + "/" + 'General_CO2Price.tab', param='CO2price', format="table")
+
 	#Define the parameters
 
 	print("Declaring parameters...")
@@ -187,189 +1221,117 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	model.WACC = Param(initialize=WACC)
 	model.LeapYearsInvestment = Param(initialize=LeapYearsInvestment)
 	model.operationalDiscountrate = Param(mutable=True)
-	model.sceProbab = Param(model.Scenario, mutable=True)
-	model.seasScale = Param(model.Season, initialize=1.0, mutable=True)
+	model.sceProbab = Param(model.Scenario, mutable=True, initialize=tab_data('sceProbab'))
+	model.seasScale = Param(model.Season, initialize=tab_data('seasScale', 1.0), mutable=True)
 	model.lengthRegSeason = Param(initialize=lengthRegSeason)
 	model.lengthPeakSeason = Param(initialize=lengthPeakSeason)
 
 	#Cost
 
-	model.genCapitalCost = Param(model.Generator, model.Period, default=0, mutable=True)
-	model.transmissionTypeConverterFixedCost = Param(model.TransmissionType, model.Period, default=0, mutable=True)
-	model.transmissionTypeConverterVariableCost = Param(model.TransmissionType, model.Period, default=0, mutable=True)
-	model.transmissionTypeCableFixedCost = Param(model.TransmissionType, model.Period, default=0, mutable=True)
-	model.transmissionTypeCableVariableCost = Param(model.TransmissionType, model.Period, default=0, mutable=True)
-	model.storPWCapitalCost = Param(model.Storage, model.Period, default=0, mutable=True)
-	model.storENCapitalCost = Param(model.Storage, model.Period, default=0, mutable=True)
-	model.genFixedOMCost = Param(model.Generator, model.Period, default=0, mutable=True)
-	model.transmissionTypeFixedOMCost = Param(model.TransmissionType, model.Period, default=0, mutable=True)
-	model.storPWFixedOMCost = Param(model.Storage, model.Period, default=0, mutable=True)
-	model.storENFixedOMCost = Param(model.Storage, model.Period, default=0, mutable=True)
+	model.genCapitalCost = Param(model.Generator, model.Period, default=0, mutable=True, initialize=tab_data('genCapitalCost'))
+	model.transmissionTypeConverterFixedCost = Param(model.TransmissionType, model.Period, default=0, mutable=True, initialize=tab_data('transmissionTypeConverterFixedCost'))
+	model.transmissionTypeConverterVariableCost = Param(model.TransmissionType, model.Period, default=0, mutable=True, initialize=tab_data('transmissionTypeConverterVariableCost'))
+	model.transmissionTypeCableFixedCost = Param(model.TransmissionType, model.Period, default=0, mutable=True, initialize=tab_data('transmissionTypeCableFixedCost'))
+	model.transmissionTypeCableVariableCost = Param(model.TransmissionType, model.Period, default=0, mutable=True, initialize=tab_data('transmissionTypeCableVariableCost'))
+	model.storPWCapitalCost = Param(model.Storage, model.Period, default=0, mutable=True, initialize=tab_data('storPWCapitalCost'))
+	model.storENCapitalCost = Param(model.Storage, model.Period, default=0, mutable=True, initialize=tab_data('storENCapitalCost'))
+	model.genFixedOMCost = Param(model.Generator, model.Period, default=0, mutable=True, initialize=tab_data('genFixedOMCost'))
+	model.transmissionTypeFixedOMCost = Param(model.TransmissionType, model.Period, default=0, mutable=True, initialize=tab_data('transmissionTypeFixedOMCost'))
+	model.storPWFixedOMCost = Param(model.Storage, model.Period, default=0, mutable=True, initialize=tab_data('storPWFixedOMCost'))
+	model.storENFixedOMCost = Param(model.Storage, model.Period, default=0, mutable=True, initialize=tab_data('storENFixedOMCost'))
 	model.genInvCost = Param(model.Generator, model.Period, default=9000000, mutable=True)
 	model.transmissionFixInvCost = Param(model.BidirectionalArc, model.Period, default=3000000, mutable=True)
 	model.transmissionVarInvCost = Param(model.BidirectionalArc, model.Period, default=3000000, mutable=True)
 	model.storPWInvCost = Param(model.Storage, model.Period, default=1000000, mutable=True)
 	model.storENInvCost = Param(model.Storage, model.Period, default=800000, mutable=True)
-	model.transmissionLength = Param(model.BidirectionalArc, default=0, mutable=True)
-	model.genVariableOMCost = Param(model.Generator, default=0.0, mutable=True)
-	model.genFuelCostRaw = Param(model.Generator, model.Period, default=0.0, mutable=True)
+	model.transmissionLength = Param(model.BidirectionalArc, default=0, mutable=True, initialize=tab_data('transmissionLength'))
+	model.genVariableOMCost = Param(model.Generator, default=0.0, mutable=True, initialize=tab_data('genVariableOMCost'))
+	model.genFuelCostRaw = Param(model.Generator, model.Period, default=0.0, mutable=True, initialize=tab_data('genFuelCostRaw'))
 	model.genFuelCost = Param(model.Generator, model.Period, default=0.0, mutable=True)
 	model.genMargCost = Param(model.Generator, model.Period, default=600, mutable=True)
-	model.genCO2TypeFactor = Param(model.Generator, default=0.0, mutable=True)
-	model.genCO2Captured = Param(model.Generator, default=0.0, mutable=True)
-	model.nodeLostLoadCost = Param(model.Node, model.Period, default=22000.0)
-	model.CO2price = Param(model.Period, default=0.0, mutable=True)
+	model.genCO2TypeFactor = Param(model.Generator, default=0.0, mutable=True, initialize=tab_data('genCO2TypeFactor'))
+	model.genCO2Captured = Param(model.Generator, default=0.0, mutable=True, initialize=tab_data('genCO2Captured'))
+	model.nodeLostLoadCost = Param(model.Node, model.Period, default=22000.0, initialize=tab_data('nodeLostLoadCost'))
+	model.CO2price = Param(model.Period, default=0.0, mutable=True, initialize=tab_data('CO2price'))
 	# model.CCSCostTSFix = Param(initialize=1149873.72) #NB! Hard-coded
 	# model.CCSCostTSVariable = Param(model.Period, default=0.0, mutable=True)
 	# model.CCSRemFrac = Param(initialize=0.9)
 
 	#Node dependent technology limitations
 
-	model.genRefInitCap = Param(model.GeneratorsOfNode, default=0.0, mutable=True)
-	model.genScaleInitCap = Param(model.Generator, model.Period, default=0.0, mutable=True)
-	model.genInitCap = Param(model.GeneratorsOfNode, model.Period, default=0.0, mutable=True)
-	model.transmissionInitCap = Param(model.BidirectionalArc, model.Period, default=0.0, mutable=True)
-	model.storPWInitCap = Param(model.StoragesOfNode, model.Period, default=0.0, mutable=True)
-	model.storENInitCap = Param(model.StoragesOfNode, model.Period, default=0.0, mutable=True)
-	model.genMaxBuiltCap = Param(model.Node, model.Technology, model.Period, default=500000.0, mutable=True)
-	model.transmissionMaxBuiltCap = Param(model.BidirectionalArc, model.Period, default=20000.0, mutable=True)
-	model.storPWMaxBuiltCap = Param(model.StoragesOfNode, model.Period, default=500000.0, mutable=True)
-	model.storENMaxBuiltCap = Param(model.StoragesOfNode, model.Period, default=500000.0, mutable=True)
-	model.genMaxInstalledCapRaw = Param(model.Node, model.Technology, default=0.0, mutable=True)
+	model.genRefInitCap = Param(model.GeneratorsOfNode, default=0.0, mutable=True, initialize=tab_data('genRefInitCap'))
+	model.genScaleInitCap = Param(model.Generator, model.Period, default=0.0, mutable=True, initialize=tab_data('genScaleInitCap'))
+	model.genInitCap = Param(model.GeneratorsOfNode, model.Period, default=0.0, mutable=True, initialize=tab_data('genInitCap'))
+	model.transmissionInitCap = Param(model.BidirectionalArc, model.Period, default=0.0, mutable=True, initialize=tab_data('transmissionInitCap'))
+	model.storPWInitCap = Param(model.StoragesOfNode, model.Period, default=0.0, mutable=True, initialize=tab_data('storPWInitCap'))
+	model.storENInitCap = Param(model.StoragesOfNode, model.Period, default=0.0, mutable=True, initialize=tab_data('storENInitCap'))
+	model.genMaxBuiltCap = Param(model.Node, model.Technology, model.Period, default=500000.0, mutable=True, initialize=tab_data('genMaxBuiltCap'))
+	model.transmissionMaxBuiltCap = Param(model.BidirectionalArc, model.Period, default=20000.0, mutable=True, initialize=tab_data('transmissionMaxBuiltCap'))
+	model.storPWMaxBuiltCap = Param(model.StoragesOfNode, model.Period, default=500000.0, mutable=True, initialize=tab_data('storPWMaxBuiltCap'))
+	model.storENMaxBuiltCap = Param(model.StoragesOfNode, model.Period, default=500000.0, mutable=True, initialize=tab_data('storENMaxBuiltCap'))
+	model.genMaxInstalledCapRaw = Param(model.Node, model.Technology, default=0.0, mutable=True, initialize=tab_data('genMaxInstalledCapRaw'))
 	model.genMaxInstalledCap = Param(model.Node, model.Technology, model.Period, default=0.0, mutable=True)
-	model.transmissionMaxInstalledCapRaw = Param(model.BidirectionalArc, model.Period, default=0.0)
+	model.transmissionMaxInstalledCapRaw = Param(model.BidirectionalArc, model.Period, default=0.0, initialize=tab_data('transmissionMaxInstalledCapRaw'))
 	model.transmissionMaxInstalledCap = Param(model.BidirectionalArc, model.Period, default=0.0, mutable=True)
 	model.storPWMaxInstalledCap = Param(model.StoragesOfNode, model.Period, default=0.0, mutable=True)
-	model.storPWMaxInstalledCapRaw = Param(model.StoragesOfNode, default=0.0, mutable=True)
+	model.storPWMaxInstalledCapRaw = Param(model.StoragesOfNode, default=0.0, mutable=True, initialize=tab_data('storPWMaxInstalledCapRaw'))
 	model.storENMaxInstalledCap = Param(model.StoragesOfNode, model.Period, default=0.0, mutable=True)
-	model.storENMaxInstalledCapRaw = Param(model.StoragesOfNode, default=0.0, mutable=True)
+	model.storENMaxInstalledCapRaw = Param(model.StoragesOfNode, default=0.0, mutable=True, initialize=tab_data('storENMaxInstalledCapRaw'))
 
 	#Type dependent technology limitations
 
-	model.genLifetime = Param(model.Generator, default=0.0, mutable=True)
-	model.transmissionLifetime = Param(model.BidirectionalArc, default=40.0, mutable=True)
-	model.storageLifetime = Param(model.Storage, default=0.0, mutable=True)
-	model.genEfficiency = Param(model.Generator, model.Period, default=1.0, mutable=True)
-	model.lineEfficiency = Param(model.DirectionalLink, default=0.97, mutable=True)
-	model.storageChargeEff = Param(model.Storage, default=1.0, mutable=True)
-	model.storageDischargeEff = Param(model.Storage, default=1.0, mutable=True)
-	model.storageBleedEff = Param(model.Storage, default=1.0, mutable=True)
-	model.genRampUpCap = Param(model.ThermalGenerators, default=0.0, mutable=True)
+	model.genLifetime = Param(model.Generator, default=0.0, mutable=True, initialize=tab_data('genLifetime'))
+	model.transmissionLifetime = Param(model.BidirectionalArc, default=40.0, mutable=True, initialize=tab_data('transmissionLifetime'))
+	model.storageLifetime = Param(model.Storage, default=0.0, mutable=True, initialize=tab_data('storageLifetime'))
+	model.genEfficiency = Param(model.Generator, model.Period, default=1.0, mutable=True, initialize=tab_data('genEfficiency'))
+	model.lineEfficiency = Param(model.DirectionalLink, default=0.97, mutable=True, initialize=tab_data('lineEfficiency'))
+	model.storageChargeEff = Param(model.Storage, default=1.0, mutable=True, initialize=tab_data('storageChargeEff'))
+	model.storageDischargeEff = Param(model.Storage, default=1.0, mutable=True, initialize=tab_data('storageDischargeEff'))
+	model.storageBleedEff = Param(model.Storage, default=1.0, mutable=True, initialize=tab_data('storageBleedEff'))
+	model.genRampUpCap = Param(model.ThermalGenerators, default=0.0, mutable=True, initialize=tab_data('genRampUpCap'))
 	model.storageDiscToCharRatio = Param(model.Storage, default=1.0, mutable=True) #NB! Hard-coded
-	model.storagePowToEnergy = Param(model.DependentStorage, default=1.0, mutable=True)
+	model.storagePowToEnergy = Param(model.DependentStorage, default=1.0, mutable=True, initialize=tab_data('storagePowToEnergy'))
 
 
 	#Stochastic input
 
-	model.sloadRaw = Param(model.Node, model.Operationalhour, model.Scenario, model.Period, default=0.0, mutable=True)
-	model.sloadAnnualDemand = Param(model.Node, model.Period, default=0.0, mutable=True)
+	model.sloadRaw = Param(model.Node, model.Operationalhour, model.Scenario, model.Period, default=0.0, mutable=True, initialize=tab_data('sloadRaw'))
+	model.sloadAnnualDemand = Param(model.Node, model.Period, default=0.0, mutable=True, initialize=tab_data('sloadAnnualDemand'))
 	model.sload = Param(model.Node, model.Operationalhour, model.Period, model.Scenario, default=0.0, mutable=True)
-	model.genCapAvailTypeRaw = Param(model.Generator, default=1.0, mutable=True)
-	model.genCapAvailStochRaw = Param(model.GeneratorsOfNode, model.Operationalhour, model.Scenario, model.Period, default=0.0, mutable=True)
+	model.genCapAvailTypeRaw = Param(model.Generator, default=1.0, mutable=True, initialize=tab_data('genCapAvailTypeRaw'))
+	model.genCapAvailStochRaw = Param(model.GeneratorsOfNode, model.Operationalhour, model.Scenario, model.Period, default=0.0, mutable=True, initialize=tab_data('genCapAvailStochRaw'))
 	model.genCapAvail = Param(model.GeneratorsOfNode, model.Operationalhour, model.Scenario, model.Period, default=0.0, mutable=True)
-	model.maxRegHydroGenRaw = Param(model.Node, model.Period, model.HoursOfSeason, model.Scenario, default=1.0, mutable=True)
+	model.maxRegHydroGenRaw = Param(model.Node, model.Period, model.HoursOfSeason, model.Scenario, default=1.0, mutable=True, initialize=tab_data('maxRegHydroGenRaw'))
 	model.maxRegHydroGen = Param(model.Node, model.Period, model.Season, model.Scenario, default=1.0, mutable=True)
-	model.maxHydroNode = Param(model.Node, default=0.0, mutable=True)
-	model.storOperationalInit = Param(model.Storage, default=0.0, mutable=True) #Percentage of installed energy capacity initially
+	model.maxHydroNode = Param(model.Node, default=0.0, mutable=True, initialize=tab_data('maxHydroNode'))
+	model.storOperationalInit = Param(model.Storage, default=0.0, mutable=True, initialize=tab_data('storOperationalInit')) #Percentage of installed energy capacity initially
 
 	if EMISSION_CAP:
-		model.CO2cap = Param(model.Period, default=5000.0, mutable=True)
+		model.CO2cap = Param(model.Period, default=5000.0, mutable=True, initialize=tab_data('CO2cap'))
 
 	#SÆVAREID: Coordinates for map visualization
-	model.Latitude = Param(model.Node, default=0.0, mutable=True)
-	model.Longitude = Param(model.Node, default=0.0, mutable=True)
-
-	#Load the parameters
-
-	print("Reading parameters...")
-
-	data.load(filename=tab_file_path + "/" + 'Generator_CapitalCosts.tab', param=model.genCapitalCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_FixedOMCosts.tab', param=model.genFixedOMCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_VariableOMCosts.tab', param=model.genVariableOMCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_FuelCosts.tab', param=model.genFuelCostRaw, format="table")
-	# data.load(filename=tab_file_path + "/" + 'Generator_CCSCostTSVariable.tab', param=model.CCSCostTSVariable, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_Efficiency.tab', param=model.genEfficiency, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_RefInitialCap.tab', param=model.genRefInitCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_ScaleFactorInitialCap.tab', param=model.genScaleInitCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_InitialCapacity.tab', param=model.genInitCap, format="table") #node_generator_intial_capacity.xlsx
-	data.load(filename=tab_file_path + "/" + 'Generator_MaxBuiltCapacity.tab', param=model.genMaxBuiltCap, format="table")#?
-	data.load(filename=tab_file_path + "/" + 'Generator_MaxInstalledCapacity.tab', param=model.genMaxInstalledCapRaw, format="table")#maximum_capacity_constraint_040317_high
-	data.load(filename=tab_file_path + "/" + 'Generator_CO2Content.tab', param=model.genCO2TypeFactor, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_CO2Captured.tab', param=model.genCO2Captured, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_RampRate.tab', param=model.genRampUpCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_GeneratorTypeAvailability.tab', param=model.genCapAvailTypeRaw, format="table")
-	data.load(filename=tab_file_path + "/" + 'Generator_Lifetime.tab', param=model.genLifetime, format="table")
-
-	data.load(filename=tab_file_path + "/" + 'Transmission_InitialCapacity.tab', param=model.transmissionInitCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_MaxBuiltCapacity.tab', param=model.transmissionMaxBuiltCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_MaxInstallCapacityRaw.tab', param=model.transmissionMaxInstalledCapRaw, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_Length.tab', param=model.transmissionLength, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_TypeConverterFixedCost.tab', param=model.transmissionTypeConverterFixedCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_TypeConverterVariableCost.tab', param=model.transmissionTypeConverterVariableCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_TypeCableFixedCost.tab', param=model.transmissionTypeCableFixedCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_TypeCableVariableCost.tab', param=model.transmissionTypeCableVariableCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_TypeFixedOMCost.tab', param=model.transmissionTypeFixedOMCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_lineEfficiency.tab', param=model.lineEfficiency, format="table")
-	data.load(filename=tab_file_path + "/" + 'Transmission_Lifetime.tab', param=model.transmissionLifetime, format="table")
-
-	data.load(filename=tab_file_path + "/" + 'Storage_StorageBleedEfficiency.tab', param=model.storageBleedEff, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_StorageChargeEff.tab', param=model.storageChargeEff, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_StorageDischargeEff.tab', param=model.storageDischargeEff, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_StoragePowToEnergy.tab', param=model.storagePowToEnergy, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_EnergyCapitalCost.tab', param=model.storENCapitalCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_EnergyFixedOMCost.tab', param=model.storENFixedOMCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_EnergyInitialCapacity.tab', param=model.storENInitCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_EnergyMaxBuiltCapacity.tab', param=model.storENMaxBuiltCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_EnergyMaxInstalledCapacity.tab', param=model.storENMaxInstalledCapRaw, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_StorageInitialEnergyLevel.tab', param=model.storOperationalInit, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_PowerCapitalCost.tab', param=model.storPWCapitalCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_PowerFixedOMCost.tab', param=model.storPWFixedOMCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_InitialPowerCapacity.tab', param=model.storPWInitCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_PowerMaxBuiltCapacity.tab', param=model.storPWMaxBuiltCap, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_PowerMaxInstalledCapacity.tab', param=model.storPWMaxInstalledCapRaw, format="table")
-	data.load(filename=tab_file_path + "/" + 'Storage_Lifetime.tab', param=model.storageLifetime, format="table")
-
-	data.load(filename=tab_file_path + "/" + 'Node_NodeLostLoadCost.tab', param=model.nodeLostLoadCost, format="table")
-	data.load(filename=tab_file_path + "/" + 'Node_ElectricAnnualDemand.tab', param=model.sloadAnnualDemand, format="table")
-	data.load(filename=tab_file_path + "/" + 'Node_HydroGenMaxAnnualProduction.tab', param=model.maxHydroNode, format="table")
-
-	#SÆVAREID: Coordinates
-	data.load(filename=tab_file_path + "/" + 'Node_Latitude.tab', param=model.Latitude, format="table")
-	data.load(filename=tab_file_path + "/" + 'Node_Longitude.tab', param=model.Longitude, format="table")
-
-	if scenariogeneration:
-		scenariopath = tab_file_path
-	else:
-		scenariopath = scenario_data_path
-
-	# data.load(filename=scenariopath + "/" + f'Stochastic_HydroGenMaxSeasonalProduction.tab', param=model.maxRegHydroGenRaw, format="table")
-	# data.load(filename=scenariopath + "/" + f'Stochastic_StochasticAvailability.tab', param=model.genCapAvailStochRaw, format="table")
-	# data.load(filename=scenariopath + "/" + f'Stochastic_ElectricLoadRaw.tab', param=model.sloadRaw, format="table")
-	data.load(filename=scenariopath + "/" + f'Stochastic_HydroGenMaxSeasonalProduction_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}.tab', param=model.maxRegHydroGenRaw, format="table")
-	data.load(filename=scenariopath + "/" + f'Stochastic_StochasticAvailability_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}.tab', param=model.genCapAvailStochRaw, format="table")
-	data.load(filename=scenariopath + "/" + f'Stochastic_ElectricLoadRaw_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}.tab', param=model.sloadRaw, format="table")
-
-	# data.load(filename=tab_file_path + "/" + 'General_seasonScale.tab', param=model.seasScale, format="table")
-
-	if EMISSION_CAP:
-		data.load(filename=tab_file_path + "/" + 'General_CO2Cap.tab', param=model.CO2cap, format="table")
-	# else:
-	# 	data.load(filename=tab_file_path + "/" + 'General_CO2Price.tab', param=model.CO2price, format="table")
-	data.load(filename=tab_file_path + "/" + 'General_CO2Price.tab', param=model.CO2price, format="table")
+	model.Latitude = Param(model.Node, default=0.0, mutable=True, initialize=tab_data('Latitude'))
+	model.Longitude = Param(model.Node, default=0.0, mutable=True, initialize=tab_data('Longitude'))
 
 	print("Constructing parameter values...")
 
 	def prepSceProbab_rule(model):
-		#Build an equiprobable probability distribution for scenarios
-
+		#Build an equiprobable probability distribution for scenarios, unless the probabilities are read from
+		#Stochastic_ScenarioProbability
+		if sceProbabFromFile:
+			return
 		for sce in model.Scenario:
 			model.sceProbab[sce] = value(1/len(model.Scenario))
 
 	model.build_SceProbab = BuildAction(rule=prepSceProbab_rule)
 
 	def prepSeasScale(model):
+		#Regular seasons (the first NoOfRegSeason seasons) represent the hours outside the peak seasons,
+		#unless the season scales are read from Stochastic_SeasonScale
+		if seasonScaleFromFile:
+			return
 		for s in model.Season:
-			if s in ["winter", "spring", "summer", "fall"]:
+			if s in Season[:NoOfRegSeason]:
 				model.seasScale[s] = (8760 - lengthPeakSeason * NoOfPeakSeason) / (NoOfRegSeason * lengthRegSeason)
 			else:
 				model.seasScale[s] = 1
@@ -485,8 +1447,8 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		for t in model.Technology:
 			for n in model.Node:
 				for i in model.Period:
-					if value(model.genMaxInstalledCapRaw[n,t] <= sum(model.genInitCap[n,g,i] for g in model.Generator if (n,g) in model.GeneratorsOfNode and (t,g) in model.GeneratorsOfTechnology)):
-						model.genMaxInstalledCap[n,t,i]=sum(model.genInitCap[n,g,i] for g in model.Generator if (n,g) in model.GeneratorsOfNode and (t,g) in model.GeneratorsOfTechnology)
+					if value(model.genMaxInstalledCapRaw[n,t] <= sum(model.genInitCap[n,g,i] for g in model.GeneratorsAtNodeOfTechnology[n,t])):
+						model.genMaxInstalledCap[n,t,i]=sum(model.genInitCap[n,g,i] for g in model.GeneratorsAtNodeOfTechnology[n,t])
 					else:
 						model.genMaxInstalledCap[n,t,i]=model.genMaxInstalledCapRaw[n,t]
 	model.build_genMaxInstalledCap = BuildAction(rule=prepGenMaxInstalledCap_rule)
@@ -514,66 +1476,116 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	model.build_storPWMaxInstalledCap = BuildAction(rule=storPWMaxInstalledCap_rule)
 
 	def prepRegHydro_rule(model):
-		#Build hydrolimits for all periods
+		#Build hydrolimits for all periods: sum of the raw limits over the hours of each season
 
-		for n in model.Node:
-			for s in model.Season:
-				for i in model.Period:
-					for sce in model.Scenario:
-						model.maxRegHydroGen[n,i,s,sce]=sum(model.maxRegHydroGenRaw[n,i,s,h,sce] for h in model.Operationalhour if (s,h) in model.HoursOfSeason)
+		sets = [list(model.Node), list(model.Period), list(model.Season), list(model.Operationalhour), list(model.Scenario)]
+		maxRegHydroGenRaw = param_array(model.maxRegHydroGenRaw, sets, model.maxRegHydroGenRaw.default())
+		hoursOfSeason = np.zeros((len(sets[2]), len(sets[3])))
+		for (s,h) in model.HoursOfSeason:
+			hoursOfSeason[sets[2].index(s), sets[3].index(h)] = 1
+		maxRegHydroGen = (maxRegHydroGenRaw * hoursOfSeason[None, None, :, :, None]).sum(axis=3)
+		store_param_array(model.maxRegHydroGen, [sets[0], sets[1], sets[2], sets[4]], maxRegHydroGen)
 
 	model.build_maxRegHydroGen = BuildAction(rule=prepRegHydro_rule)
 
 	def prepGenCapAvail_rule(model):
-		#Build generator availability for all periods
+		#Build generator availability for all periods: the generator type availability, or the stochastic availability
+		#(below 0.001 set to 0) for types with availability 0
 
-		for (n,g) in model.GeneratorsOfNode:
-			for h in model.Operationalhour:
-				for s in model.Scenario:
-					for i in model.Period:
-						if value(model.genCapAvailTypeRaw[g]) == 0:
-							if value(model.genCapAvailStochRaw[n,g,h,s,i]) >= 0.001:
-								model.genCapAvail[n,g,h,s,i] = model.genCapAvailStochRaw[n,g,h,s,i]
-							else:
-								model.genCapAvail[n,g,h,s,i] = 0
-						else:
-							model.genCapAvail[n,g,h,s,i]=model.genCapAvailTypeRaw[g]
+		sets = [list(model.GeneratorsOfNode), list(model.Operationalhour), list(model.Scenario), list(model.Period)]
+		genCapAvailTypeRaw = np.array([value(model.genCapAvailTypeRaw[g]) for (n,g) in sets[0]])[:, None, None, None]
+		genCapAvailStochRaw = param_array(model.genCapAvailStochRaw, sets, model.genCapAvailStochRaw.default())
+		genCapAvailStochRaw = np.where(genCapAvailStochRaw >= 0.001, genCapAvailStochRaw, 0)
+		genCapAvail = np.where(genCapAvailTypeRaw == 0, genCapAvailStochRaw, genCapAvailTypeRaw)
+		store_param_array(model.genCapAvail, sets, genCapAvail)
 
 	model.build_genCapAvail = BuildAction(rule=prepGenCapAvail_rule)
 
 	def prepSload_rule(model):
-		#Build load profiles for all periods
-
-		counter = 0
+		#Build load profiles for all periods: the raw load shifted so that the probability weighted average load in
+		#the regular seasons matches the annual demand, loads that become negative are set to 0
+
+		nodes, hours, scenarios, periods = [list(model.Node), list(model.Operationalhour), list(model.Scenario), list(model.Period)]
+		sloadRaw = param_array(model.sloadRaw, [nodes, hours, scenarios, periods], model.sloadRaw.default())
+		sceProbab = np.array([value(model.sceProbab[sce]) for sce in scenarios])
+		regularSeasonHours = np.array(hours) < value(model.FirstHoursOfRegSeason.last() + model.lengthRegSeason)
+		nodeaverageload = (sloadRaw[:, regularSeasonHours] * sceProbab[None, None, :, None]).sum(axis=(1, 2)) / value(
+			(model.FirstHoursOfRegSeason.last() + model.lengthRegSeason - 1))
+
+		sloadAnnualDemand = param_array(model.sloadAnnualDemand, [nodes, periods], model.sloadAnnualDemand.default())
+		hourlyadjustment = sloadAnnualDemand / 8760 - nodeaverageload
+		#Load in the index order of sload: node, hour, period, scenario
+		sload = (sloadRaw + hourlyadjustment[:, None, None, :]).transpose(0, 1, 3, 2)
+
+		#Hours with too small load are written in the order node, period, hour, scenario
 		f = open(result_file_path + '/AdjustedNegativeLoad_' + name + '.txt', 'w')
-		for n in model.Node:
-			for i in model.Period:
-				nodeaverageload = 0
-				for h in model.Operationalhour:
-					if value(h) < value(model.FirstHoursOfRegSeason[-1] + model.lengthRegSeason):
-						for sce in model.Scenario:
-							nodeaverageload += model.sloadRaw[n, h, sce, i].value
-				nodeaverageload = nodeaverageload / value(
-					(model.FirstHoursOfRegSeason[-1] + model.lengthRegSeason - 1) * len(model.Scenario))
-
-				hourlyadjustment = value(model.sloadAnnualDemand[n, i].value / 8760) - value(nodeaverageload)
-				for h in model.Operationalhour:
-					for sce in model.Scenario:
-						if value(model.sloadRaw[n, h, sce, i].value + hourlyadjustment) > 0:
-							model.sload[n, h, i, sce] = model.sloadRaw[n, h, sce, i].value + hourlyadjustment
-							if value(model.sload[n,h,i,sce]) < 0:
-								f.write('Adjusted electricity load: ' + str(value(model.sload[n,h,i,sce])) + ', 10 MW for hour ' + str(h) + ' and scenario ' + str(sce) + ' in ' + str(n) + "\n")
-								model.sload[n,h,i,sce] = 10
-								counter += 1
-						else:
-							f.write('Adjusted electricity load: ' + str(value(model.sloadRaw[n,h,sce,i].value + hourlyadjustment)) + ', 0 MW for hour ' + str(h) + ' and scenario ' + str(sce) + ' in ' + str(n) + "\n")
-							model.sload[n,h,i,sce] = 0
-							counter += 1
-		f.write('Hours with too small raw electricity load: ' + str(counter))
+		tooSmall = np.argwhere(sload.transpose(0, 2, 1, 3) <= 0)
+		for (n, i, h, sce) in tooSmall:
+			f.write('Adjusted electricity load: ' + str(float(sload[n, h, i, sce])) + ', 0 MW for hour ' + str(hours[h]) + ' and scenario ' + str(scenarios[sce]) + ' in ' + str(nodes[n]) + "\n")
+		f.write('Hours with too small raw electricity load: ' + str(len(tooSmall)))
 		f.close()
 
+		store_param_array(model.sload, [nodes, hours, periods, scenarios], np.where(sload > 0, sload, 0))
+
 	model.build_sload = BuildAction(rule=prepSload_rule)
 
+	#Prune the generators, storages and transmission links without capacity potential: no initial capacity and no
+	#investment allowed (maximum built or maximum installed capacity 0 in all periods), and for generators also the
+	#ones that are never available. The hourly variables and constraints are only built for the remaining ones.
+
+	def OperationalGeneratorsOfNode_init(model):
+		generatorsOfNode = list(model.GeneratorsOfNode)
+		genCapAvail = param_array(model.genCapAvail, [generatorsOfNode, list(model.Operationalhour), list(model.Scenario), list(model.Period)], model.genCapAvail.default())
+		available = genCapAvail.reshape(len(generatorsOfNode), -1).any(axis=1)
+		technology = {g: t for (t,g) in model.GeneratorsOfTechnology}
+		retval = []
+		for k, (n,g) in enumerate(generatorsOfNode):
+			t = technology[g]
+			initial = any(value(model.genInitCap[n,g,i]) > 0 for i in model.Period)
+			investment = any(value(model.genMaxBuiltCap[n,t,i]) > 0 for i in model.Period) and any(value(model.genMaxInstalledCap[n,t,i]) > 0 for i in model.Period)
+			if available[k] and (initial or investment):
+				retval.append((n,g))
+		return retval
+	model.OperationalGeneratorsOfNode = Set(dimen=2, initialize=OperationalGeneratorsOfNode_init, ordered=True)
+
+	def OperationalGeneratorsAtNode_init(model, node):
+		return [g for g in model.GeneratorsAtNode[node] if (node,g) in model.OperationalGeneratorsOfNode]
+	model.OperationalGeneratorsAtNode = Set(model.Node, ordered=True, initialize=OperationalGeneratorsAtNode_init)
+
+	def OperationalHydroGeneratorsAtNode_init(model, node):
+		return [g for g in model.HydroGeneratorsAtNode[node] if (node,g) in model.OperationalGeneratorsOfNode]
+	model.OperationalHydroGeneratorsAtNode = Set(model.Node, ordered=True, initialize=OperationalHydroGeneratorsAtNode_init)
+
+	def OperationalStoragesOfNode_init(model):
+		retval = []
+		for (n,b) in model.StoragesOfNode:
+			initial = any(value(model.storPWInitCap[n,b,i]) > 0 or value(model.storENInitCap[n,b,i]) > 0 for i in model.Period)
+			investmentPW = any(value(model.storPWMaxBuiltCap[n,b,i]) > 0 for i in model.Period) and any(value(model.storPWMaxInstalledCap[n,b,i]) > 0 for i in model.Period)
+			investmentEN = any(value(model.storENMaxBuiltCap[n,b,i]) > 0 for i in model.Period) and any(value(model.storENMaxInstalledCap[n,b,i]) > 0 for i in model.Period)
+			if initial or investmentPW or investmentEN:
+				retval.append((n,b))
+		return retval
+	model.OperationalStoragesOfNode = Set(dimen=2, initialize=OperationalStoragesOfNode_init, ordered=True)
+
+	def OperationalStoragesAtNode_init(model, node):
+		return [b for b in model.StoragesAtNode[node] if (node,b) in model.OperationalStoragesOfNode]
+	model.OperationalStoragesAtNode = Set(model.Node, ordered=True, initialize=OperationalStoragesAtNode_init)
+
+	def OperationalDirectionalLink_init(model):
+		retval = []
+		for (n1,n2) in model.DirectionalLink:
+			arc = (n1,n2) if (n1,n2) in model.BidirectionalArc else (n2,n1)
+			initial = any(value(model.transmissionInitCap[arc,i]) > 0 for i in model.Period)
+			investment = any(value(model.transmissionMaxBuiltCap[arc,i]) > 0 for i in model.Period) and any(value(model.transmissionMaxInstalledCap[arc,i]) > 0 for i in model.Period)
+			if initial or investment:
+				retval.append((n1,n2))
+		return retval
+	model.OperationalDirectionalLink = Set(dimen=2, initialize=OperationalDirectionalLink_init, ordered=True)
+
+	def OperationalNodesLinked_init(model, node):
+		return [n1 for n1 in model.NodesLinked[node] if (n1,node) in model.OperationalDirectionalLink]
+	model.OperationalNodesLinked = Set(model.Node, initialize=OperationalNodesLinked_init)
+
 	stopReading = startConstraints = datetime.now()
 	print("Sets and parameters declared and read...")
 
@@ -583,33 +1595,66 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 
 	print("Declaring variables...")
 
-	model.genInvCap = Var(model.GeneratorsOfNode, model.Period, domain=NonNegativeReals)
+	#Capacity limits on a single variable are given as variable bounds (mutable, so they follow the parameters).
+	#The generator limits are per technology and node, and only a bound if the node has one generator of the technology.
+	def genCapBound(model, n, g, i, maxCap):
+		for t in model.Technology:
+			if (t,g) in model.GeneratorsOfTechnology and len(model.GeneratorsAtNodeOfTechnology[n,t]) == 1:
+				return (0, maxCap[n,t,i])
+		return (0, None)
+
+	def genInvCap_bounds(model, n, g, i):
+		return genCapBound(model, n, g, i, model.genMaxBuiltCap)
+
+	def genInstalledCap_bounds(model, n, g, i):
+		return genCapBound(model, n, g, i, model.genMaxInstalledCap)
+
+	def transmissionInvCap_bounds(model, n1, n2, i):
+		return (0, model.transmissionMaxBuiltCap[n1,n2,i])
+
+	def transmissionInstalledCap_bounds(model, n1, n2, i):
+		return (0, model.transmissionMaxInstalledCap[n1,n2,i])
+
+	def storPWInvCap_bounds(model, n, b, i):
+		return (0, model.storPWMaxBuiltCap[n,b,i])
+
+	def storENInvCap_bounds(model, n, b, i):
+		return (0, model.storENMaxBuiltCap[n,b,i])
+
+	def storPWInstalledCap_bounds(model, n, b, i):
+		return (0, model.storPWMaxInstalledCap[n,b,i])
+
+	def storENInstalledCap_bounds(model, n, b, i):
+		return (0, model.storENMaxInstalledCap[n,b,i])
+
+	model.genInvCap = Var(model.GeneratorsOfNode, model.Period, domain=NonNegativeReals, bounds=genInvCap_bounds)
 	model.transmissionFixedCostPaid = Var(model.BidirectionalArc, model.Period, domain=Binary)
-	model.transmissionInvCap = Var(model.BidirectionalArc, model.Period, domain=NonNegativeReals)
-	model.storPWInvCap = Var(model.StoragesOfNode, model.Period, domain=NonNegativeReals)
-	model.storENInvCap = Var(model.StoragesOfNode, model.Period, domain=NonNegativeReals)
-	model.genOperational = Var(model.GeneratorsOfNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals)
-	model.storOperational = Var(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals)
-	model.transmissionOperational = Var(model.DirectionalLink, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals) #flow
-	model.storCharge = Var(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals)
-	model.storDischarge = Var(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals)
+	model.transmissionInvCap = Var(model.BidirectionalArc, model.Period, domain=NonNegativeReals, bounds=transmissionInvCap_bounds)
+	model.storPWInvCap = Var(model.StoragesOfNode, model.Period, domain=NonNegativeReals, bounds=storPWInvCap_bounds)
+	model.storENInvCap = Var(model.StoragesOfNode, model.Period, domain=NonNegativeReals, bounds=storENInvCap_bounds)
+	#Hourly variables are only built when they are used in the model (dense=False), so not for the pruned generators,
+	#storages and links. When the results are written these are created with their value 0.
+	model.genOperational = Var(model.GeneratorsOfNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals, dense=False, initialize=0)
+	model.storOperational = Var(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals, dense=False, initialize=0)
+	model.transmissionOperational = Var(model.DirectionalLink, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals, dense=False, initialize=0) #flow
+	model.storCharge = Var(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals, dense=False, initialize=0)
+	model.storDischarge = Var(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals, dense=False, initialize=0)
 	model.loadShed = Var(model.Node, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals, initialize=0)
-	model.genInstalledCap = Var(model.GeneratorsOfNode, model.Period, domain=NonNegativeReals)
-	model.transmissionInstalledCap = Var(model.BidirectionalArc, model.Period, domain=NonNegativeReals)
-	model.storPWInstalledCap = Var(model.StoragesOfNode, model.Period, domain=NonNegativeReals)
-	model.storENInstalledCap = Var(model.StoragesOfNode, model.Period, domain=NonNegativeReals)
+	model.genInstalledCap = Var(model.GeneratorsOfNode, model.Period, domain=NonNegativeReals, bounds=genInstalledCap_bounds)
+	model.transmissionInstalledCap = Var(model.BidirectionalArc, model.Period, domain=NonNegativeReals, bounds=transmissionInstalledCap_bounds)
+	model.storPWInstalledCap = Var(model.StoragesOfNode, model.Period, domain=NonNegativeReals, bounds=storPWInstalledCap_bounds)
+	model.storENInstalledCap = Var(model.StoragesOfNode, model.Period, domain=NonNegativeReals, bounds=storENInstalledCap_bounds)
 
 	if hydrogen is True:
-		#Hydrogen sets
-		model.HydrogenProdNode = Set(ordered=True, within=model.Node)
-		model.ReformerLocations = Set(ordered=True, within=model.HydrogenProdNode)
-		model.ReformerPlants = Set(ordered=True)
-
-
 		#Reading sets
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ProductionNodes.tab', format="set", set=model.HydrogenProdNode)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerLocations.tab', format="set", set=model.ReformerLocations)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerPlants.tab', format="set", set=model.ReformerPlants)
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ProductionNodes.tab', format="set", set='HydrogenProdNode')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerLocations.tab', format="set", set='ReformerLocations')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerPlants.tab', format="set", set='ReformerPlants')
+
+		#Hydrogen sets
+		model.HydrogenProdNode = Set(ordered=True, within=model.Node, initialize=tab_data('HydrogenProdNode'))
+		model.ReformerLocations = Set(ordered=True, within=model.HydrogenProdNode, initialize=tab_data('ReformerLocations'))
+		model.ReformerPlants = Set(ordered=True, initialize=tab_data('ReformerPlants'))
 
 
 		def HydrogenLinks_init(model):
@@ -638,41 +1683,84 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			return retval
 		model.HydrogenLinks = Set(model.Node, initialize=HydrogenLinks_init)
 
+		def ElyzerVintagesOfPeriod_init(model):
+			retval = []
+			for j in model.Period:
+				for i in model.Period:
+					if j <= i:
+						retval.append((j,i))
+			return retval
+		model.ElyzerVintagesOfPeriod = Set(dimen=2, initialize=ElyzerVintagesOfPeriod_init, ordered=True) #(j,i) for all i in I, j <= i (year j the electrolyzer is built)
+
+		def ElyzerOperation_init(model):
+			return ((n,j,h,i,w) for n in model.HydrogenProdNode for j in model.Period for h in model.Operationalhour for i in model.Period if j <= i for w in model.Scenario)
+		model.ElyzerOperation = Set(dimen=5, initialize=ElyzerOperation_init, ordered=True) #(n,j,h,i,w) for all n in N_H2, (j,i) in ElyzerVintagesOfPeriod, h in H, w in W
+
+		#Reading parameters
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerPlantCapitalCost.tab', format="table", param='elyzerPlantCapitalCostRaw')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerStackCapitalCost.tab', format="table", param='elyzerStackCapitalCostRaw')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerFixedOMCost.tab', format="table", param='elyzerFixedOMCostRaw')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerMWhPerTon.tab', format="table", param='elyzerPowerConsumptionPerTon')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerLifetime.tab', format="table", param='elyzerLifetime')
+
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerCapitalCost.tab', format='table', param='ReformerPlantsCapitalCostRaw')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerFixedOMCost.tab', format='table', param='ReformerPlantFixedOMCostRaw')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerVariableOMCost.tab', format='table', param='ReformerPlantVarOMCostRaw')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerEfficiency.tab', format='table', param='ReformerPlantEfficiency')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerElectricityUse.tab', format='table', param='ReformerPlantElectricityUse')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerLifetime.tab', format='table', param='ReformerPlantLifetime')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerEmissionFactor.tab', format='table', param='ReformerEmissionFactor')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_ReformerCO2CaptureFactor.tab', format='table', param='ReformerCO2CaptureFactor')
+
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_PipelineCapitalCost.tab', format="table", param='hydrogenPipelineCapCost')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_PipelineOMCostPerKM.tab', format="table", param='hydrogenPipelineOMCost')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_PipelineCapacity.tab', format="table", param='hydrogenPipelineCapacity')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_PipelineCompressorPowerUsage.tab', format="table", param='hydrogenPipelineCompressorElectricityUsage')
+		# data.load(filename=tab_file_path + '/' + 'Hydrogen_Distances.tab', format="table", param=model.PipelineLength) # Depecreated; Distances are now copied from the transmission distances
+
+
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_Demand.tab', format="table", param='hydrogenDemandRaw') # Depecreated; Distances are now copied from the transmission distances
+
+		if h2storage is True:
+			load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_StorageCapitalCost.tab', format="table", param='hydrogenStorageCapitalCost')
+			load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_StorageFixedOMCost.tab', format="table", param='hydrogenStorageFixedOMCost')
+			load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'Hydrogen_StorageMaxCapacity.tab', format="table", param='hydrogenMaxStorageCapacity')
+
 		# Hydrogen parameters
-		model.hydrogenDemandRaw = Param(model.HydrogenProdNode, model.Period, default=0, mutable=True)
+		model.hydrogenDemandRaw = Param(model.HydrogenProdNode, model.Period, default=0, mutable=True, initialize=tab_data('hydrogenDemandRaw'))
 		model.hydrogenDemand = Param (model.HydrogenProdNode, model.Period, model.Scenario, default=0, mutable=True)
 
-		model.elyzerPlantCapitalCostRaw = Param(model.Period, default=99999, mutable=True)
+		model.elyzerPlantCapitalCostRaw = Param(model.Period, default=99999, mutable=True, initialize=tab_data('elyzerPlantCapitalCostRaw'))
 		model.elyzerPlantCapitalCost = Param(model.Period, default=99999, mutable=True)
-		model.elyzerStackCapitalCostRaw = Param(model.Period, default=99999, mutable=True)
+		model.elyzerStackCapitalCostRaw = Param(model.Period, default=99999, mutable=True, initialize=tab_data('elyzerStackCapitalCostRaw'))
 		model.elyzerStackCapitalCost = Param(model.Period, default=99999, mutable=True)
-		model.elyzerFixedOMCostRaw = Param(model.Period, default=99999, mutable=True)
+		model.elyzerFixedOMCostRaw = Param(model.Period, default=99999, mutable=True, initialize=tab_data('elyzerFixedOMCostRaw'))
 		model.elyzerFixedOMCost = Param(model.Period, default=99999, mutable=True)
-		model.elyzerPowerConsumptionPerTon = Param(model.Period, default=99999, mutable=True)
-		model.elyzerLifetime = Param(default=20, mutable=True)
+		model.elyzerPowerConsumptionPerTon = Param(model.Period, default=99999, mutable=True, initialize=tab_data('elyzerPowerConsumptionPerTon'))
+		model.elyzerLifetime = Param(default=20, mutable=True, initialize=tab_data('elyzerLifetime'))
 		model.elyzerInvCost = Param(model.Period, default=99999, mutable=True)
 
-		model.ReformerPlantsCapitalCostRaw = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
+		model.ReformerPlantsCapitalCostRaw = Param(model.ReformerPlants, model.Period, default=99999, mutable=True, initialize=tab_data('ReformerPlantsCapitalCostRaw'))
 		model.ReformerPlantsCapitalCost = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
-		model.ReformerPlantFixedOMCostRaw = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
+		model.ReformerPlantFixedOMCostRaw = Param(model.ReformerPlants, model.Period, default=99999, mutable=True, initialize=tab_data('ReformerPlantFixedOMCostRaw'))
 		model.ReformerPlantFixedOMCost = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
-		model.ReformerPlantVarOMCostRaw = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
+		model.ReformerPlantVarOMCostRaw = Param(model.ReformerPlants, model.Period, default=99999, mutable=True, initialize=tab_data('ReformerPlantVarOMCostRaw'))
 		model.ReformerPlantVarOMCost = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
 		model.ReformerPlantInvCost = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
-		model.ReformerPlantEfficiency = Param(model.ReformerPlants, model.Period, default=0, mutable=True)
-		model.ReformerPlantElectricityUse = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
-		model.ReformerPlantLifetime = Param(model.ReformerPlants, default=25, mutable=True)
-		model.ReformerEmissionFactor = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
-		model.ReformerCO2CaptureFactor = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
+		model.ReformerPlantEfficiency = Param(model.ReformerPlants, model.Period, default=0, mutable=True, initialize=tab_data('ReformerPlantEfficiency'))
+		model.ReformerPlantElectricityUse = Param(model.ReformerPlants, model.Period, default=99999, mutable=True, initialize=tab_data('ReformerPlantElectricityUse'))
+		model.ReformerPlantLifetime = Param(model.ReformerPlants, default=25, mutable=True, initialize=tab_data('ReformerPlantLifetime'))
+		model.ReformerEmissionFactor = Param(model.ReformerPlants, model.Period, default=99999, mutable=True, initialize=tab_data('ReformerEmissionFactor'))
+		model.ReformerCO2CaptureFactor = Param(model.ReformerPlants, model.Period, default=99999, mutable=True, initialize=tab_data('ReformerCO2CaptureFactor'))
 		model.ReformerMargCost = Param(model.ReformerPlants, model.Period, default=99999, mutable=True)
 
 		model.hydrogenPipelineLifetime = Param(default=40)
-		model.hydrogenPipelineCapCost = Param(model.PipelineType, default=99999, mutable=True)
-		model.hydrogenPipelineOMCost = Param(model.PipelineType, default=99999, mutable=True)
-		model.hydrogenPipelineCapacity = Param(model.PipelineType, default=0, mutable=True)
+		model.hydrogenPipelineCapCost = Param(model.PipelineType, default=99999, mutable=True, initialize=tab_data('hydrogenPipelineCapCost'))
+		model.hydrogenPipelineOMCost = Param(model.PipelineType, default=99999, mutable=True, initialize=tab_data('hydrogenPipelineOMCost'))
+		model.hydrogenPipelineCapacity = Param(model.PipelineType, default=0, mutable=True, initialize=tab_data('hydrogenPipelineCapacity'))
 		model.hydrogenPipelineInvCost = Param(model.HydrogenBidirectionPipelines, model.PipelineType, default=999999, mutable=True)
 		model.PipelineLength = Param(model.HydrogenBidirectionPipelines, mutable=True, default=9999)
-		model.hydrogenPipelineCompressorElectricityUsage = Param(model.PipelineType, default=99999, mutable=True)
+		model.hydrogenPipelineCompressorElectricityUsage = Param(model.PipelineType, default=99999, mutable=True, initialize=tab_data('hydrogenPipelineCompressorElectricityUsage'))
 		model.hydrogenPipelinePowerDemandPerTon = Param(model.HydrogenBidirectionPipelines, model.PipelineType, default=99999, mutable=True)
 
 
@@ -680,9 +1768,9 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			#Cost of storing the produced hydrogen intraseasonally. Have to have this because we have implicit free storage without.
 			model.averageHydrogenSeasonalStorageCost = Param(default=0.35, mutable=True) #Source: Levelized cost of storage from Table 5 in Picturing the value of underground gas storage to the European hydrogen system by Gas Infrastructure Europe (GIE)
 		else:
-			model.hydrogenMaxStorageCapacity = Param(model.HydrogenProdNode, default=0, mutable=True)
-			model.hydrogenStorageCapitalCost = Param(model.Period, default=99999, mutable=True)
-			model.hydrogenStorageFixedOMCost = Param(model.Period, default=99999, mutable=True)
+			model.hydrogenMaxStorageCapacity = Param(model.HydrogenProdNode, default=0, mutable=True, initialize=tab_data('hydrogenMaxStorageCapacity'))
+			model.hydrogenStorageCapitalCost = Param(model.Period, default=99999, mutable=True, initialize=tab_data('hydrogenStorageCapitalCost'))
+			model.hydrogenStorageFixedOMCost = Param(model.Period, default=99999, mutable=True, initialize=tab_data('hydrogenStorageFixedOMCost'))
 			model.hydrogenStorageInvCost = Param(model.Period, default=99999, mutable=True)
 			model.hydrogenStorageInitOperational = Param(default=0.5)
 			model.hydrogenStorageLifetime = Param(default=30)
@@ -696,7 +1784,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		model.hydrogenProducedReformer_ton = Var(model.ReformerLocations, model.ReformerPlants, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals)
 		model.hydrogenProducedReformer_MWh = Var(model.ReformerLocations, model.ReformerPlants, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals)
 		model.hydrogenSentPipeline = Var(model.PipelineTypeOfDirectionalLink, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals)
-		model.powerForHydrogen = Var(model.HydrogenProdNode, model.Period, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals) #Two period indexes because one describes the year it was bought (the first index), the other describes when it is used (second index)
+		model.powerForHydrogen = Var(model.ElyzerOperation, domain=NonNegativeReals) #Two period indexes because one describes the year it was bought (the first index), the other describes when it is used (second index)
 		model.h2_demand_shed = Var(model.HydrogenProdNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals, initialize=0)
 
 		if h2storage is True:
@@ -707,8 +1795,8 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		model.hydrogenForPower = Var(model.HydrogenGenerators ,model.HydrogenProdNode, model.Operationalhour, model.Period, model.Scenario, domain=NonNegativeReals,initialize=0.0)
 
 		#Strategic
-		model.elyzerCapBuilt = Var(model.HydrogenProdNode, model.Period, model.Period, domain=NonNegativeReals)
-		model.elyzerTotalCap = Var(model.HydrogenProdNode, model.Period, model.Period, domain=NonNegativeReals)
+		model.elyzerCapBuilt = Var(model.HydrogenProdNode, model.Period, domain=NonNegativeReals) #Capacity built in period j
+		model.elyzerTotalCap = Var(model.HydrogenProdNode, model.ElyzerVintagesOfPeriod, domain=NonNegativeReals) #Capacity built in period j that is available in period i
 		model.ReformerCapBuilt = Var(model.ReformerLocations, model.ReformerPlants, model.Period, domain=NonNegativeReals) #Capacity  of MW H2 production built in period i
 		model.ReformerTotalCap = Var(model.ReformerLocations, model.ReformerPlants, model.Period, domain=NonNegativeReals) #Total capacity of MW H2 production
 		# model.hydrogenPipelineBuilt = Var(model.HydrogenBidirectionPipelines, model.PipelineType, model.Period, domain=NonNegativeReals)
@@ -716,37 +1804,9 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		model.totalHydrogenPipelineCapacity = Var(model.HydrogenBidirectionPipelines, model.PipelineType, model.Period, domain=NonNegativeReals)
 		if h2storage is True:
 			model.hydrogenStorageBuilt = Var(model.HydrogenProdNode, model.Period, domain=NonNegativeReals)
-			model.hydrogenTotalStorage = Var(model.HydrogenProdNode, model.Period, domain=NonNegativeReals)
-
-		#Reading parameters
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerPlantCapitalCost.tab', format="table", param=model.elyzerPlantCapitalCostRaw)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerStackCapitalCost.tab', format="table", param=model.elyzerStackCapitalCostRaw)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerFixedOMCost.tab', format="table", param=model.elyzerFixedOMCostRaw)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerMWhPerTon.tab', format="table", param=model.elyzerPowerConsumptionPerTon)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ElectrolyzerLifetime.tab', format="table", param=model.elyzerLifetime)
-
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerCapitalCost.tab', format='table', param=model.ReformerPlantsCapitalCostRaw)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerFixedOMCost.tab', format='table', param=model.ReformerPlantFixedOMCostRaw)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerVariableOMCost.tab', format='table', param=model.ReformerPlantVarOMCostRaw)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerEfficiency.tab', format='table', param=model.ReformerPlantEfficiency)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerElectricityUse.tab', format='table', param=model.ReformerPlantElectricityUse)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerLifetime.tab', format='table', param=model.ReformerPlantLifetime)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerEmissionFactor.tab', format='table', param=model.ReformerEmissionFactor)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_ReformerCO2CaptureFactor.tab', format='table', param=model.ReformerCO2CaptureFactor)
-
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_PipelineCapitalCost.tab', format="table", param=model.hydrogenPipelineCapCost)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_PipelineOMCostPerKM.tab', format="table", param=model.hydrogenPipelineOMCost)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_PipelineCapacity.tab', format="table", param=model.hydrogenPipelineCapacity)
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_PipelineCompressorPowerUsage.tab', format="table", param=model.hydrogenPipelineCompressorElectricityUsage)
-		# data.load(filename=tab_file_path + '/' + 'Hydrogen_Distances.tab', format="table", param=model.PipelineLength) # Depecreated; Distances are now copied from the transmission distances
-
-
-		data.load(filename=tab_file_path + '/' + 'Hydrogen_Demand.tab', format="table", param=model.hydrogenDemandRaw) # Depecreated; Distances are now copied from the transmission distances
-
-		if h2storage is True:
-			data.load(filename=tab_file_path + '/' + 'Hydrogen_StorageCapitalCost.tab', format="table", param=model.hydrogenStorageCapitalCost)
-			data.load(filename=tab_file_path + '/' + 'Hydrogen_StorageFixedOMCost.tab', format="table", param=model.hydrogenStorageFixedOMCost)
-			data.load(filename=tab_file_path + '/' + 'Hydrogen_StorageMaxCapacity.tab', format="table", param=model.hydrogenMaxStorageCapacity)
+			def hydrogenTotalStorage_bounds(model, n, i):
+				return (0, model.hydrogenMaxStorageCapacity[n])
+			model.hydrogenTotalStorage = Var(model.HydrogenProdNode, model.Period, domain=NonNegativeReals, bounds=hydrogenTotalStorage_bounds)
 
 		def prepPipelineLength_rule(model):
 			for (n1,n2) in model.HydrogenBidirectionPipelines:
@@ -811,7 +1871,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		model.reformerEmissionsCost = Expression(model.Period, rule=reformer_emissions_cost_rule)
 
 		def CO2_captured_generators_rule(model, n, h, i, w):
-			return sum(model.genCO2Captured[g] * model.genOperational[n,g,h,i,w] * 3.6 / model.genEfficiency[g,i] for g in model.Generator if (n,g) in model.GeneratorsOfNode)
+			return sum(model.genCO2Captured[g] * model.genOperational[n,g,h,i,w] * 3.6 / model.genEfficiency[g,i] for g in model.OperationalGeneratorsAtNode[n])
 		model.co2_captured_generators = Expression(model.Node, model.Operationalhour, model.Period, model.Scenario, rule=CO2_captured_generators_rule)
 
 		def CO2_captured_reformers_rule(model, n, h, i, w):
@@ -871,20 +1931,36 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		model.build_hydrogenPipelineCompressorPowerDemand = BuildAction(rule=prepHydrogenCompressorElectricityUsage_rule)
 
 		# CO2 part
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'CO2_CO2SequestrationNodes.tab', format="set", set='CO2SequestrationNodes')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'CO2_StorageSiteCapitalCost.tab', format="table", param='CO2StorageSiteCapitalCost')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'CO2_StorageSiteFixedOMCost.tab', format="table", param='StorageSiteFixedOMCost')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'CO2_PipelineCapacity.tab', format="table", param='CO2PipelineCapacity')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'CO2_PipelineCapitalCost.tab', format="table", param='CO2PipelineCapCost')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'CO2_PipelineFixedOM.tab', format="table", param='CO2PipelineOMCost')
+		load_tab_file(data, tab_file_format, filename=tab_file_path + '/' + 'CO2_PipelineElectricityUsage.tab', format="table", param='CO2PipelineElectricityUsage')
+
 		model.OnshoreNodes = Set(initialize=model.HydrogenProdNode)
 		model.CO2DirectionalLinks = Set(dimen=2, initialize=model.AllowedHydrogenLinks)
 		model.CO2BidirectionalPipelines = Set(dimen=2, initialize=model.HydrogenBidirectionPipelines)
-		model.CO2SequestrationNodes = Set(within=model.Node, initialize = ["Norway"])
+		model.CO2SequestrationNodes = Set(within=model.Node, initialize=tab_data('CO2SequestrationNodes', ["Norway"]))
+
+		def CO2LinksFrom_init(model, node):
+			retval = []
+			for n2 in model.OnshoreNodes:
+				if (node,n2) in model.CO2DirectionalLinks:
+					retval.append(n2)
+			return retval
+		model.CO2LinksFrom = Set(model.Node, initialize=CO2LinksFrom_init)
 
-		model.CO2StorageSiteCapitalCost = Param(model.CO2SequestrationNodes, default=999999999, mutable=True)
+		model.CO2StorageSiteCapitalCost = Param(model.CO2SequestrationNodes, default=999999999, mutable=True, initialize=tab_data('CO2StorageSiteCapitalCost'))
 		model.CO2StorageSiteInvCost = Param(model.CO2SequestrationNodes, model.Period, default=999999999, mutable=True)
-		model.StorageSiteFixedOMCost = Param(model.CO2SequestrationNodes, default=999999999, mutable=True)
+		model.StorageSiteFixedOMCost = Param(model.CO2SequestrationNodes, default=999999999, mutable=True, initialize=tab_data('StorageSiteFixedOMCost'))
 		model.CO2PipelineLifetime = Param(default=40, mutable=False)
-		model.CO2PipelineCapCost = Param(model.PipelineType, default=99999, mutable=True)
-		model.CO2PipelineOMCost = Param(model.PipelineType, default=99999, mutable=True)
+		model.CO2PipelineCapCost = Param(model.PipelineType, default=99999, mutable=True, initialize=tab_data('CO2PipelineCapCost'))
+		model.CO2PipelineOMCost = Param(model.PipelineType, default=99999, mutable=True, initialize=tab_data('CO2PipelineOMCost'))
 		model.CO2PipelineInvCost = Param(model.CO2BidirectionalPipelines, model.PipelineType, model.Period, default=99999, mutable=True)
-		model.CO2PipelineCapacity = Param(model.PipelineType, default=99999, mutable=True)
-		model.CO2PipelineElectricityUsage = Param(model.PipelineType, default=99999, mutable=True)
+		model.CO2PipelineCapacity = Param(model.PipelineType, default=99999, mutable=True, initialize=tab_data('CO2PipelineCapacity'))
+		model.CO2PipelineElectricityUsage = Param(model.PipelineType, default=99999, mutable=True, initialize=tab_data('CO2PipelineElectricityUsage'))
 		model.CO2PipelinePowerDemandPerTon = Param(model.CO2BidirectionalPipelines, model.PipelineType, default=99999, mutable=True)
 
 		# model.CO2LiquefierCapitalCost = Param(default=99999, mutable=True)
@@ -910,14 +1986,6 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		# model.CO2LiquidShipSpeed = Param(default=27.78, mutable=False) # 15 nm/hr ~ 27.78 km/h shipping speed
 		# model.ShippingTimes = Param(model.CO2DirectionalLinks, default=1000, mutable=True)
 
-		data.load(filename=tab_file_path + '/' + 'CO2_CO2SequestrationNodes.tab', format="set", set=model.CO2SequestrationNodes)
-		data.load(filename=tab_file_path + '/' + 'CO2_StorageSiteCapitalCost.tab', format="table", param=model.CO2StorageSiteCapitalCost)
-		data.load(filename=tab_file_path + '/' + 'CO2_StorageSiteFixedOMCost.tab', format="table", param=model.StorageSiteFixedOMCost)
-		data.load(filename=tab_file_path + '/' + 'CO2_PipelineCapacity.tab', format="table", param=model.CO2PipelineCapacity)
-		data.load(filename=tab_file_path + '/' + 'CO2_PipelineCapitalCost.tab', format="table", param=model.CO2PipelineCapCost)
-		data.load(filename=tab_file_path + '/' + 'CO2_PipelineFixedOM.tab', format="table", param=model.CO2PipelineOMCost)
-		data.load(filename=tab_file_path + '/' + 'CO2_PipelineElectricityUsage.tab', format="table", param=model.CO2PipelineElectricityUsage)
-
 		# data.load(filename=tab_file_path + '/' + 'CO2_LiquefierCapitalCost.tab', format="table", param=model.CO2LiquefierCapitalCost)
 		# data.load(filename=tab_file_path + '/' + 'CO2_LiquefierFixedOMCost.tab', format="table", param=model.CO2LiquefierFixedOMCost)
 		# data.load(filename=tab_file_path + '/' + 'CO2_LiquefierElectricityUse.tab', format="table", param=model.CO2LiquefierElectricityUse)
@@ -991,6 +2059,38 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 							model.CO2PipelinePowerDemandPerTon[n1,n2,t] = model.CO2PipelineElectricityUsage[t]
 		model.build_co2_pipeline_power_use = BuildAction(rule=prep_CO2PipelinePowerUse)
 
+		#Upper bounds on the number of pipelines built. The flow in a pipeline never has to be bigger than the hydrogen
+		#(CO2) that can be used (captured) in the whole system in an hour, so more pipelines than needed for this flow
+		#are never part of an optimal solution. The bounds are derived from the prepared capacities and demand.
+		def prepPipelineBuiltBounds_rule(model):
+			technology = {g: t for (t,g) in model.GeneratorsOfTechnology}
+			def maxGeneration(n, g, i):
+				maxAvail = max(value(model.genCapAvail[n,g,h,w,i]) for h in model.Operationalhour for w in model.Scenario)
+				return maxAvail * value(model.genMaxInstalledCap[n,technology[g],i])
+			maxHydrogenFlow = {}
+			maxCO2Flow = {}
+			for i in model.Period:
+				maxHydrogenFlow[i] = max(sum(value(model.hydrogenDemand[n,i,w]) for n in model.HydrogenProdNode) for w in model.Scenario)
+				if h2storage is True:
+					maxHydrogenFlow[i] += sum(value(model.hydrogenMaxStorageCapacity[n]) for n in model.HydrogenProdNode)
+				for n in model.HydrogenProdNode:
+					for g in model.OperationalGeneratorsAtNode[n]:
+						if g in model.HydrogenGenerators:
+							maxHydrogenFlow[i] += maxGeneration(n,g,i) / value(model.genEfficiency[g,i] * model.hydrogenLHV_kg * 1000)
+				maxCO2Flow[i] = maxHydrogenFlow[i] * max([value(model.ReformerCO2CaptureFactor[p,i]) for p in model.ReformerPlants] + [0])
+				for n in model.OnshoreNodes:
+					for g in model.OperationalGeneratorsAtNode[n]:
+						if value(model.genCO2Captured[g]) > 0:
+							maxCO2Flow[i] += value(model.genCO2Captured[g]) * maxGeneration(n,g,i) * 3.6 / value(model.genEfficiency[g,i])
+			for (n1,n2,t) in model.PipelineTypeOfDirectionalLink:
+				if (n1,n2) in model.HydrogenBidirectionPipelines and value(model.hydrogenPipelineCapacity[t]) > 0:
+					for j in model.Period:
+						model.hydrogenPipelineBuilt[n1,n2,t,j].setub(int(np.ceil(max(maxHydrogenFlow[i] for i in model.Period if i>=j) / value(model.hydrogenPipelineCapacity[t]))))
+				if (n1,n2) in model.CO2BidirectionalPipelines and value(model.CO2PipelineCapacity[t]) > 0:
+					for j in model.Period:
+						model.CO2PipelineBuilt[n1,n2,t,j].setub(int(np.ceil(max(maxCO2Flow[i] for i in model.Period if i>=j) / value(model.CO2PipelineCapacity[t]))))
+		model.build_PipelineBuiltBounds = BuildAction(rule=prepPipelineBuiltBounds_rule)
+
 		def prep_CO2_storage_cost(model, i):
 			return sum(model.CO2StorageSiteInvCost[n,i] * model.CO2SiteCapacityDeveloped[n,i] for n in model.CO2SequestrationNodes)
 		model.co2_storage_site_development_cost = Expression(model.Period, rule=prep_CO2_storage_cost)
@@ -1032,7 +2132,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	model.shedcomponent = Expression(model.Period, rule=shed_component_rule)
 
 	def operational_cost_rule(model,i):
-		return sum(model.operationalDiscountrate*model.seasScale[s]*model.sceProbab[w]*model.genMargCost[g,i]*model.genOperational[n,g,h,i,w] for (n,g) in model.GeneratorsOfNode for (s,h) in model.HoursOfSeason for w in model.Scenario)
+		return sum(model.operationalDiscountrate*model.seasScale[s]*model.sceProbab[w]*model.genMargCost[g,i]*model.genOperational[n,g,h,i,w] for (n,g) in model.OperationalGeneratorsOfNode for (s,h) in model.HoursOfSeason for w in model.Scenario)
 	model.operationalcost = Expression(model.Period, rule=operational_cost_rule)
 
 	if hydrogen is True and h2storage is False:
@@ -1053,11 +2153,11 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 														  sum((model.storPWInvCost[b,i]*model.storPWInvCap[n,b,i]+model.storENInvCost[b,i]*model.storENInvCap[n,b,i]) for (n,b) in model.StoragesOfNode ) + \
 														  model.shedcomponent[i] + \
 														  model.operationalcost[i] + \
-														  sum(model.elyzerInvCost[i] * model.elyzerCapBuilt[n,i,i] for n in model.HydrogenProdNode) + \
-														  sum(model.hydrogenPipelineInvCost[n1,n2,t] * model.hydrogenPipelineBuilt[n1,n2,t,i] for (n1,n2) in model.HydrogenBidirectionPipelines for t in model.PipelineType if (n1,n2,t) in model.PipelineTypeOfDirectionalLink) + \
+														  sum(model.elyzerInvCost[i] * model.elyzerCapBuilt[n,i] for n in model.HydrogenProdNode) + \
+														  sum(model.hydrogenPipelineInvCost[n1,n2,t] * model.hydrogenPipelineBuilt[n1,n2,t,i] for (n1,n2) in model.HydrogenBidirectionPipelines for t in model.PipelineTypesOfLink[n1,n2]) + \
 														  sum(model.ReformerPlantInvCost[p,i] * model.ReformerCapBuilt[n,p,i] for n in model.ReformerLocations for p in model.ReformerPlants) + \
 														  model.reformerOperationalCost[i] + model.reformerEmissionsCost[i] +
-														  sum(model.CO2PipelineInvCost[n1,n2,t,i] * model.CO2PipelineBuilt[n1,n2,t,i] for (n1,n2) in model.CO2BidirectionalPipelines for t in model.PipelineType if (n1,n2,t) in model.PipelineTypeOfDirectionalLink) + \
+														  sum(model.CO2PipelineInvCost[n1,n2,t,i] * model.CO2PipelineBuilt[n1,n2,t,i] for (n1,n2) in model.CO2BidirectionalPipelines for t in model.PipelineTypesOfLink[n1,n2]) + \
 														  model.co2_storage_site_development_cost[i])# + \
 														  # sum(model.CO2LiquidShipInvCost[i] * model.CO2ShipBought[n1,n2,i] for (n1,n2) in model.CO2DirectionalLinks) + \
 														  # model.co2_ship_operational_expense[i] + \
@@ -1082,27 +2182,27 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 
 	def FlowBalance_rule(model, n, h, i, w):
 		if hydrogen is False or n not in model.HydrogenProdNode:
-			retVal = sum(model.genOperational[n,g,h,i,w] for g in model.Generator if (n,g) in model.GeneratorsOfNode) \
-				   + sum((model.storageDischargeEff[b]*model.storDischarge[n,b,h,i,w]-model.storCharge[n,b,h,i,w]) for b in model.Storage if (n,b) in model.StoragesOfNode) \
-				   + sum((model.lineEfficiency[link,n]*model.transmissionOperational[link,n,h,i,w] - model.transmissionOperational[n,link,h,i,w]) for link in model.NodesLinked[n]) \
+			retVal = sum(model.genOperational[n,g,h,i,w] for g in model.OperationalGeneratorsAtNode[n]) \
+				   + sum((model.storageDischargeEff[b]*model.storDischarge[n,b,h,i,w]-model.storCharge[n,b,h,i,w]) for b in model.OperationalStoragesAtNode[n]) \
+				   + sum((model.lineEfficiency[link,n]*model.transmissionOperational[link,n,h,i,w] - model.transmissionOperational[n,link,h,i,w]) for link in model.OperationalNodesLinked[n]) \
 				   - model.sload[n,h,i,w]
 			# retVal += model.loadShed[n,h,i,w]
 			return  retVal == 0
 
 		else:
-			returnSum = (sum(model.genOperational[n, g, h, i, w] for g in model.Generator if (n, g) in model.GeneratorsOfNode) \
-						+ sum((model.storageDischargeEff[b] * model.storDischarge[n, b, h, i, w] - model.storCharge[n, b, h, i, w]) for b in model.Storage if (n, b) in model.StoragesOfNode) \
-						+ sum((model.lineEfficiency[link, n] * model.transmissionOperational[link, n, h, i, w] - model.transmissionOperational[n, link, h, i, w]) for link in model.NodesLinked[n]) \
+			returnSum = (sum(model.genOperational[n, g, h, i, w] for g in model.OperationalGeneratorsAtNode[n]) \
+						+ sum((model.storageDischargeEff[b] * model.storDischarge[n, b, h, i, w] - model.storCharge[n, b, h, i, w]) for b in model.OperationalStoragesAtNode[n]) \
+						+ sum((model.lineEfficiency[link, n] * model.transmissionOperational[link, n, h, i, w] - model.transmissionOperational[n, link, h, i, w]) for link in model.OperationalNodesLinked[n]) \
 						- model.sload[n, h, i, w] \
 						- sum(model.powerForHydrogen[n,j,h,i,w] for j in model.Period if j<=i))
 			# returnSum += model.loadShed[n, h, i, w]
 			for n2 in model.HydrogenLinks[n]:
 				if (n,n2) in model.HydrogenBidirectionPipelines:
-					returnSum -= 0.5 * sum(model.hydrogenPipelinePowerDemandPerTon[n,n2,t] * (model.hydrogenSentPipeline[n,n2,t,h,i,w] + model.hydrogenSentPipeline[n2,n,t,h,i,w]) for t in model.PipelineType if (n,n2,t) in model.PipelineTypeOfDirectionalLink)
-					returnSum -= 0.5 * sum(model.CO2PipelinePowerDemandPerTon[n,n2,t] * (model.CO2sentPipeline[n,n2,t,h,i,w] + model.CO2sentPipeline[n2,n,t,h,i,w]) for t in model.PipelineType if (n,n2,t) in model.PipelineTypeOfDirectionalLink)
+					returnSum -= 0.5 * sum(model.hydrogenPipelinePowerDemandPerTon[n,n2,t] * (model.hydrogenSentPipeline[n,n2,t,h,i,w] + model.hydrogenSentPipeline[n2,n,t,h,i,w]) for t in model.PipelineTypesOfLink[n,n2])
+					returnSum -= 0.5 * sum(model.CO2PipelinePowerDemandPerTon[n,n2,t] * (model.CO2sentPipeline[n,n2,t,h,i,w] + model.CO2sentPipeline[n2,n,t,h,i,w]) for t in model.PipelineTypesOfLink[n,n2])
 				elif (n2,n) in model.HydrogenBidirectionPipelines:
-					returnSum -= 0.5 * sum(model.hydrogenPipelinePowerDemandPerTon[n2,n,t] * (model.hydrogenSentPipeline[n,n2,t,h,i,w] + model.hydrogenSentPipeline[n2,n,t,h,i,w]) for t in model.PipelineType if (n,n2,t) in model.PipelineTypeOfDirectionalLink)
-					returnSum -= 0.5 * sum(model.CO2PipelinePowerDemandPerTon[n2,n,t] * (model.CO2sentPipeline[n,n2,t,h,i,w] + model.CO2sentPipeline[n2,n,t,h,i,w]) for t in model.PipelineType if (n,n2,t) in model.PipelineTypeOfDirectionalLink)
+					returnSum -= 0.5 * sum(model.hydrogenPipelinePowerDemandPerTon[n2,n,t] * (model.hydrogenSentPipeline[n,n2,t,h,i,w] + model.hydrogenSentPipeline[n2,n,t,h,i,w]) for t in model.PipelineTypesOfLink[n,n2])
+					returnSum -= 0.5 * sum(model.CO2PipelinePowerDemandPerTon[n2,n,t] * (model.CO2sentPipeline[n,n2,t,h,i,w] + model.CO2sentPipeline[n2,n,t,h,i,w]) for t in model.PipelineTypesOfLink[n,n2])
 			if n in model.ReformerLocations:
 				returnSum -= sum(model.ReformerPlantElectricityUse[p,i] * model.hydrogenProducedReformer_ton[n,p,h,i,w] for p in model.ReformerPlants)
 			# if n in model.OnshoreNodes:
@@ -1115,7 +2215,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 
 	def genMaxProd_rule(model, n, g, h, i, w):
 		return model.genOperational[n,g,h,i,w] - model.genCapAvail[n,g,h,w,i]*model.genInstalledCap[n,g,i] <= 0
-	model.maxGenProduction = Constraint(model.GeneratorsOfNode, model.Operationalhour, model.Period, model.Scenario, rule=genMaxProd_rule)
+	model.maxGenProduction = Constraint(model.OperationalGeneratorsOfNode, model.Operationalhour, model.Period, model.Scenario, rule=genMaxProd_rule)
 
 	#################################################################
 
@@ -1127,7 +2227,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 				return model.genOperational[n,g,h,i,w]-model.genOperational[n,g,(h-1),i,w] - model.genRampUpCap[g]*model.genInstalledCap[n,g,i] <= 0   #
 			else:
 				return Constraint.Skip
-	model.ramping = Constraint(model.GeneratorsOfNode, model.Operationalhour, model.Period, model.Scenario, rule=ramping_rule)
+	model.ramping = Constraint(model.OperationalGeneratorsOfNode, model.Operationalhour, model.Period, model.Scenario, rule=ramping_rule)
 
 	#################################################################
 
@@ -1136,7 +2236,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			return model.storOperationalInit[b]*model.storENInstalledCap[n,b,i] + model.storageChargeEff[b]*model.storCharge[n,b,h,i,w]-model.storDischarge[n,b,h,i,w]-model.storOperational[n,b,h,i,w] == 0   #
 		else:
 			return model.storageBleedEff[b]*model.storOperational[n,b,(h-1),i,w] + model.storageChargeEff[b]*model.storCharge[n,b,h,i,w]-model.storDischarge[n,b,h,i,w]-model.storOperational[n,b,h,i,w] == 0   #
-	model.storage_energy_balance = Constraint(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_energy_balance_rule)
+	model.storage_energy_balance = Constraint(model.OperationalStoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_energy_balance_rule)
 
 	#################################################################
 
@@ -1147,40 +2247,56 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			return model.storOperational[n,b,h+value(model.lengthPeakSeason)-1,i,w] - model.storOperationalInit[b]*model.storENInstalledCap[n,b,i] == 0  #
 		else:
 			return Constraint.Skip
-	model.storage_seasonal_net_zero_balance = Constraint(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_seasonal_net_zero_balance_rule)
+	model.storage_seasonal_net_zero_balance = Constraint(model.OperationalStoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_seasonal_net_zero_balance_rule)
 
 	#################################################################
 
 	def storage_operational_cap_rule(model, n, b, h, i, w):
 		return model.storOperational[n,b,h,i,w] - model.storENInstalledCap[n,b,i]  <= 0   #
-	model.storage_operational_cap = Constraint(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_operational_cap_rule)
+	model.storage_operational_cap = Constraint(model.OperationalStoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_operational_cap_rule)
 
 	#################################################################
 
 	def storage_power_discharg_cap_rule(model, n, b, h, i, w):
 		return model.storDischarge[n,b,h,i,w] - model.storageDiscToCharRatio[b]*model.storPWInstalledCap[n,b,i] <= 0   #
-	model.storage_power_discharg_cap = Constraint(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_power_discharg_cap_rule)
+	model.storage_power_discharg_cap = Constraint(model.OperationalStoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_power_discharg_cap_rule)
 
 	#################################################################
 
 	def storage_power_charg_cap_rule(model, n, b, h, i, w):
 		return model.storCharge[n,b,h,i,w] - model.storPWInstalledCap[n,b,i] <= 0   #
-	model.storage_power_charg_cap = Constraint(model.StoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_power_charg_cap_rule)
+	model.storage_power_charg_cap = Constraint(model.OperationalStoragesOfNode, model.Operationalhour, model.Period, model.Scenario, rule=storage_power_charg_cap_rule)
 
 	#################################################################
 
 	def hydro_gen_limit_rule(model, n, g, s, i, w):
 		if g in model.RegHydroGenerator:
-			return sum(model.genOperational[n,g,h,i,w] for h in model.Operationalhour if (s,h) in model.HoursOfSeason) - model.maxRegHydroGen[n,i,s,w] <= 0
+			return sum(model.genOperational[n,g,h,i,w] for h in model.HoursInSeason[s]) - model.maxRegHydroGen[n,i,s,w] <= 0
 		else:
 			return Constraint.Skip  #
-	model.hydro_gen_limit = Constraint(model.GeneratorsOfNode, model.Season, model.Period, model.Scenario, rule=hydro_gen_limit_rule)
+	model.hydro_gen_limit = Constraint(model.OperationalGeneratorsOfNode, model.Season, model.Period, model.Scenario, rule=hydro_gen_limit_rule)
 
 	#################################################################
 
-	def hydro_node_limit_rule(model, n, i):
-		return sum(model.genOperational[n,g,h,i,w]*model.seasScale[s]*model.sceProbab[w] for g in model.HydroGenerator if (n,g) in model.GeneratorsOfNode for (s,h) in model.HoursOfSeason for w in model.Scenario) - model.maxHydroNode[n] <= 0   #
-	model.hydro_node_limit = Constraint(model.Node, model.Period, rule=hydro_node_limit_rule)
+	if decomposition == 'benders':
+		#The expected hydro production of a node is limited through a hydro budget of each scenario, a first-stage
+		#variable, so that the limit does not couple the scenarios of the Benders subproblems. The budgets start at the
+		#limit, where they do not restrict the first subproblems.
+		def hydroBudget_init(model, n, i, w):
+			return value(model.maxHydroNode[n])
+		model.hydroBudget = Var(model.Node, model.Period, model.Scenario, domain=NonNegativeReals, initialize=hydroBudget_init)
+
+		def hydro_budget_rule(model, n, i, w):
+			return sum(model.genOperational[n,g,h,i,w]*model.seasScale[s] for g in model.OperationalHydroGeneratorsAtNode[n] for (s,h) in model.HoursOfSeason) - model.hydroBudget[n,i,w] <= 0   #
+		model.hydro_budget = Constraint(model.Node, model.Period, model.Scenario, rule=hydro_budget_rule)
+
+		def hydro_node_limit_rule(model, n, i):
+			return sum(model.hydroBudget[n,i,w]*model.sceProbab[w] for w in model.Scenario) - model.maxHydroNode[n] <= 0   #
+		model.hydro_node_limit = Constraint(model.Node, model.Period, rule=hydro_node_limit_rule)
+	else:
+		def hydro_node_limit_rule(model, n, i):
+			return sum(model.genOperational[n,g,h,i,w]*model.seasScale[s]*model.sceProbab[w] for g in model.OperationalHydroGeneratorsAtNode[n] for (s,h) in model.HoursOfSeason for w in model.Scenario) - model.maxHydroNode[n] <= 0   #
+		model.hydro_node_limit = Constraint(model.Node, model.Period, rule=hydro_node_limit_rule)
 
 
 	#################################################################
@@ -1190,13 +2306,16 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			return model.transmissionOperational[(n1,n2),h,i,w]  - model.transmissionInstalledCap[(n1,n2),i] <= 0
 		elif (n2,n1) in model.BidirectionalArc:
 			return model.transmissionOperational[(n1,n2),h,i,w]  - model.transmissionInstalledCap[(n2,n1),i] <= 0
-	model.transmission_cap = Constraint(model.DirectionalLink, model.Operationalhour, model.Period, model.Scenario, rule=transmission_cap_rule)
+	model.transmission_cap = Constraint(model.OperationalDirectionalLink, model.Operationalhour, model.Period, model.Scenario, rule=transmission_cap_rule)
 
 	def transmission_pay_fixed_cost(model, n1, n2, i):
 		for t in model.TransmissionType:
 			if (n1,n2,t) in model.TransmissionTypeOfDirectionalLink:
 				if "hvdc" in t.lower():
-					return model.transmissionInvCap[n1,n2,i] <= 40000 * model.transmissionFixedCostPaid[n1,n2,i]
+					#Big-M from the capacity that can be built in the period: limited by the maximum built capacity and, since
+					#the capacity built in period i is installed in period i, the maximum installed minus the initial capacity
+					bigM = min(40000, value(model.transmissionMaxBuiltCap[n1,n2,i]), value(model.transmissionMaxInstalledCap[n1,n2,i] - model.transmissionInitCap[n1,n2,i]))
+					return model.transmissionInvCap[n1,n2,i] <= max(bigM, 0) * model.transmissionFixedCostPaid[n1,n2,i]
 				else:
 					#If it is not HVDC, then there is no fixed cost, and we just force the binary variable to 0.
 					return model.transmissionFixedCostPaid[n1,n2,i] == 0
@@ -1217,14 +2336,14 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			if n1 in model.windfarmNodes or n2 in model.windfarmNodes:
 				if (n1,n2) in model.BidirectionalArc:
 					if n1 in model.windfarmNodes:
-						return model.transmissionInstalledCap[(n1,n2),i] <= sum(model.genInstalledCap[n1,g,i] for g in model.Generator if (n1,g) in model.GeneratorsOfNode)
+						return model.transmissionInstalledCap[(n1,n2),i] <= sum(model.genInstalledCap[n1,g,i] for g in model.GeneratorsAtNode[n1])
 					else:
-						return model.transmissionInstalledCap[(n1,n2),i] <= sum(model.genInstalledCap[n2,g,i] for g in model.Generator if (n2,g) in model.GeneratorsOfNode)
+						return model.transmissionInstalledCap[(n1,n2),i] <= sum(model.genInstalledCap[n2,g,i] for g in model.GeneratorsAtNode[n2])
 				elif (n2,n1) in model.BidirectionalArc:
 					if n1 in model.windfarmNodes:
-						return model.transmissionInstalledCap[(n2,n1),i] <= sum(model.genInstalledCap[n1,g,i] for g in model.Generator if (n1,g) in model.GeneratorsOfNode)
+						return model.transmissionInstalledCap[(n2,n1),i] <= sum(model.genInstalledCap[n1,g,i] for g in model.GeneratorsAtNode[n1])
 					else:
-						return model.transmissionInstalledCap[(n2,n1),i] <= sum(model.genInstalledCap[n2,g,i] for g in model.Generator if (n2,g) in model.GeneratorsOfNode)
+						return model.transmissionInstalledCap[(n2,n1),i] <= sum(model.genInstalledCap[n2,g,i] for g in model.GeneratorsAtNode[n2])
 				else:
 					return Constraint.Skip
 			else:
@@ -1237,7 +2356,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 
 	if EMISSION_CAP:
 		def emission_cap_rule(model, i, w):
-			return sum(model.seasScale[s]*model.genCO2TypeFactor[g]*(3.6/model.genEfficiency[g,i])*model.genOperational[n,g,h,i,w] for (n,g) in model.GeneratorsOfNode for (s,h) in model.HoursOfSeason)/1000000 \
+			return sum(model.seasScale[s]*model.genCO2TypeFactor[g]*(3.6/model.genEfficiency[g,i])*model.genOperational[n,g,h,i,w] for (n,g) in model.OperationalGeneratorsOfNode for (s,h) in model.HoursOfSeason)/1000000 \
 				   - model.CO2cap[i] <= 0   #
 		model.emission_cap = Constraint(model.Period, model.Scenario, rule=emission_cap_rule)
 
@@ -1279,54 +2398,24 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 
 	#################################################################
 
+	#The capacity limits of single generators, transmission and storage are variable bounds, only the limits on the sum
+	#over several generators of a technology at a node are constraints.
 	def investment_gen_cap_rule(model, t, n, i):
-		return sum(model.genInvCap[n,g,i] for g in model.Generator if (n,g) in model.GeneratorsOfNode and (t,g) in model.GeneratorsOfTechnology) - model.genMaxBuiltCap[n,t,i] <= 0
+		if len(model.GeneratorsAtNodeOfTechnology[n,t]) <= 1:
+			return Constraint.Skip
+		return sum(model.genInvCap[n,g,i] for g in model.GeneratorsAtNodeOfTechnology[n,t]) - model.genMaxBuiltCap[n,t,i] <= 0
 	model.investment_gen_cap = Constraint(model.Technology, model.Node, model.Period, rule=investment_gen_cap_rule)
 
-	#################################################################
-
-	def investment_trans_cap_rule(model, n1, n2, i):
-		return model.transmissionInvCap[n1,n2,i] - model.transmissionMaxBuiltCap[n1,n2,i] <= 0
-	model.investment_trans_cap = Constraint(model.BidirectionalArc, model.Period, rule=investment_trans_cap_rule)
-
-	#################################################################
-
-	def investment_storage_power_cap_rule(model, n, b, i):
-		return model.storPWInvCap[n,b,i] - model.storPWMaxBuiltCap[n,b,i] <= 0
-	model.investment_storage_power_cap = Constraint(model.StoragesOfNode, model.Period, rule=investment_storage_power_cap_rule)
-
-	#################################################################
-
-	def investment_storage_energy_cap_rule(model, n, b, i):
-		return model.storENInvCap[n,b,i] - model.storENMaxBuiltCap[n,b,i] <= 0
-	model.investment_storage_energy_cap = Constraint(model.StoragesOfNode, model.Period, rule=investment_storage_energy_cap_rule)
-
 	################################################################
 
 	def installed_gen_cap_rule(model, t, n, i):
-		return sum(model.genInstalledCap[n,g,i] for g in model.Generator if (n,g) in model.GeneratorsOfNode and (t,g) in model.GeneratorsOfTechnology) - model.genMaxInstalledCap[n,t,i] <= 0
+		if len(model.GeneratorsAtNodeOfTechnology[n,t]) <= 1:
+			return Constraint.Skip
+		return sum(model.genInstalledCap[n,g,i] for g in model.GeneratorsAtNodeOfTechnology[n,t]) - model.genMaxInstalledCap[n,t,i] <= 0
 	model.installed_gen_cap = Constraint(model.Technology, model.Node, model.Period, rule=installed_gen_cap_rule)
 
 	#################################################################
 
-	def installed_trans_cap_rule(model, n1, n2, i):
-		return model.transmissionInstalledCap[n1, n2, i] - model.transmissionMaxInstalledCap[n1, n2, i] <= 0
-	model.installed_trans_cap = Constraint(model.BidirectionalArc, model.Period, rule=installed_trans_cap_rule)
-
-	#################################################################
-
-	def installed_storage_power_cap_rule(model, n, b, i):
-		return model.storPWInstalledCap[n,b,i] - model.storPWMaxInstalledCap[n,b,i] <= 0
-	model.installed_storage_power_cap = Constraint(model.StoragesOfNode, model.Period, rule=installed_storage_power_cap_rule)
-
-	#################################################################
-
-	def installed_storage_energy_cap_rule(model, n, b, i):
-		return model.storENInstalledCap[n,b,i] - model.storENMaxInstalledCap[n,b,i] <= 0
-	model.installed_storage_energy_cap = Constraint(model.StoragesOfNode, model.Period, rule=installed_storage_energy_cap_rule)
-
-	#################################################################
-
 	def power_energy_relate_rule(model, n, b, i):
 		if b in model.DependentStorage:
 			return model.storPWInstalledCap[n,b,i] - model.storagePowToEnergy[b]*model.storENInstalledCap[n,b,i] == 0   #
@@ -1340,14 +2429,15 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	def powerFromHydrogenRule(model, n, g, h, i, w):
 		if hydrogen is True:
 			if g in model.HydrogenGenerators:
-				if (n,g) in model.GeneratorsOfNode:
+				if (n,g) in model.OperationalGeneratorsOfNode:
 					return model.genOperational[n,g,h,i,w] == model.genEfficiency[g,i] * model.hydrogenForPower[g,n,h,i,w] * model.hydrogenLHV_kg * 1000
 				else:
-					return model.genOperational[n,g,h,i,w] == 0
+					#No power from a pruned generator, so no hydrogen to it either
+					return model.hydrogenForPower[g,n,h,i,w] == 0
 			else:
 				return Constraint.Skip
 		else:
-			if g in model.HydrogenGenerators:
+			if g in model.HydrogenGenerators and (n,g) in model.OperationalGeneratorsOfNode:
 				return model.genOperational[n,g,h,i,w] == 0
 			else:
 				return Constraint.Skip
@@ -1381,15 +2471,11 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			startPeriod = 1
 			if value(1+i-model.elyzerLifetime/model.LeapYearsInvestment)>startPeriod:
 				startPeriod=value(1+i-model.elyzerLifetime/model.LeapYearsInvestment)
-			return sum(model.elyzerCapBuilt[n,j,k] for k in model.Period if k>=startPeriod and k<=i) - model.elyzerTotalCap[n,j,i] == 0
-		model.installedCapDefinitionElyzer = Constraint(model.HydrogenProdNode,model.Period, model.Period, rule=lifetime_rule_elyzer)
-
-		def link_electrolyzer_year_built_and_period_rule(model,n,i,j):
-			if i != j:
-				return model.elyzerCapBuilt[n,j,i] == 0
+			if j>=startPeriod:
+				return model.elyzerCapBuilt[n,j] - model.elyzerTotalCap[n,j,i] == 0
 			else:
-				return Constraint.Skip
-		model.link_electrolyzer_year_built_and_period = Constraint(model.HydrogenProdNode, model.Period, model.Period, rule=link_electrolyzer_year_built_and_period_rule)
+				return model.elyzerTotalCap[n,j,i] == 0
+		model.installedCapDefinitionElyzer = Constraint(model.HydrogenProdNode, model.ElyzerVintagesOfPeriod, rule=lifetime_rule_elyzer)
 
 		def lifetime_rule_reformer(model,n,p,i):
 			startPeriod = 1
@@ -1417,7 +2503,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		def hydrogen_flow_balance_rule(model,n,h,i,w):
 			balance = - model.meetHydrogenDemand[n,h,i,w] \
 					  - sum(model.hydrogenForPower[g,n,h,i,w] for g in model.HydrogenGenerators) \
-					  + sum(model.hydrogenSentPipeline[(n2,n), t, h, i, w] - model.hydrogenSentPipeline[(n,n2), t, h, i, w] for n2 in model.HydrogenLinks[n] for t in model.PipelineType if (n,n2,t) in model.PipelineTypeOfDirectionalLink) \
+					  + sum(model.hydrogenSentPipeline[(n2,n), t, h, i, w] - model.hydrogenSentPipeline[(n,n2), t, h, i, w] for n2 in model.HydrogenLinks[n] for t in model.PipelineTypesOfLink[n,n2]) \
 					  # + model.h2_demand_shed[n,h,i,w]
 			if n in model.HydrogenProdNode:
 				balance += model.hydrogenProducedElectro[n,h,i,w]
@@ -1438,7 +2524,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 
 		def hydrogen_production_electrolyzer_capacity_rule(model,n,j,h,i,w):
 			return model.powerForHydrogen[n,j,h,i,w] <= model.elyzerTotalCap[n,j,i] #j = Year the electrolyzer was bought
-		model.hydrogen_production_electrolyzer_capacity = Constraint(model.HydrogenProdNode, model.Period, model.Operationalhour, model.Period, model.Scenario, rule=hydrogen_production_electrolyzer_capacity_rule)
+		model.hydrogen_production_electrolyzer_capacity = Constraint(model.ElyzerOperation, rule=hydrogen_production_electrolyzer_capacity_rule)
 
 		def hydrogen_production_reformer_capacity_rule(model,n,p,h,i,w):
 			return model.hydrogenProducedReformer_MWh[n,p,h,i,w] <= model.ReformerTotalCap[n,p,i]
@@ -1456,10 +2542,6 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 					return model.hydrogenStorageOperational[n,h-1,i,w] + model.hydrogenChargeStorage[n,h,i,w] - model.hydrogenDischargeStorage[n,h,i,w] - model.hydrogenStorageOperational[n,h,i,w] == 0
 			model.hydrogen_storage_balance = Constraint(model.HydrogenProdNode, model.Operationalhour, model.Period, model.Scenario, rule=hydrogen_storage_balance_rule)
 
-			def hydrogen_storage_max_capacity_rule(model,n,i):
-				return model.hydrogenTotalStorage[n,i] <= model.hydrogenMaxStorageCapacity[n]
-			model.hydrogen_storage_max_capacity = Constraint(model.HydrogenProdNode, model.Period, rule=hydrogen_storage_max_capacity_rule)
-
 			def hydrogen_storage_operational_capacity_rule(model,n,h,i,w):
 				return model.hydrogenStorageOperational[n,h,i,w] <= model.hydrogenTotalStorage[n,i]
 			model.hydrogen_storage_operational_capacity = Constraint(model.HydrogenProdNode, model.Operationalhour, model.Period, model.Scenario, rule=hydrogen_storage_operational_capacity_rule)
@@ -1509,7 +2591,7 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 			balance = 0
 			balance += model.co2_captured_generators[n,h,i,w]
 			balance += model.co2_captured_reformers[n,h,i,w]
-			balance += sum(model.CO2sentPipeline[n2,n,t,h,i,w] - model.CO2sentPipeline[n,n2,t,h,i,w] for n2 in model.OnshoreNodes if (n,n2) in model.CO2DirectionalLinks for t in model.PipelineType if (n,n2,t) in model.PipelineTypeOfDirectionalLink)
+			balance += sum(model.CO2sentPipeline[n2,n,t,h,i,w] - model.CO2sentPipeline[n,n2,t,h,i,w] for n2 in model.CO2LinksFrom[n] for t in model.PipelineTypesOfLink[n,n2])
 			# balance += model.CO2Regasified[n,h,i,w] - model.CO2Liquefied[n,h,i,w]
 			if n in model.CO2SequestrationNodes:
 				balance -= model.CO2sequestered[n,h,i,w]
@@ -1628,7 +2710,24 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 
 	start = time.time()
 
-	instance = model.create_instance(data) #, report_timing=True)
+	if construction == 'concrete':
+		instance = model
+	else:
+		if PROFILE_CONSTRUCTION:
+			profiler.start()
+		if decomposition == 'benders':
+			bendersConstraints = take_constraints(model)
+		instance = model.create_instance(data) #, report_timing=True)
+		if decomposition == 'benders' and not LOAD_CHECKPOINT:
+			benders = BendersDecomposition(instance, bendersConstraints, benders_workers)
+
+	if PROFILE_CONSTRUCTION:
+		profiler.stop()
+		print("{hour}:{minute}:{second}: Writing construction profile to construction_profile.csv...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+		profile = profiler.write(result_file_path)
+		print("Slowest components to construct:")
+		print(profile.sort_values("Time [sec]", ascending=False).head(10).to_string(index=False))
 	# instance.dual = Suffix(direction=Suffix.IMPORT) #Make sure the dual value is collected into solver results (if solver supplies dual information)
 	# instance.seasScale.pprint()
 
@@ -1668,6 +2767,9 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	print("TotalGenerators: "+str(len(instance.GeneratorsOfNode)))
 	print("StorageTypes: "+str(len(instance.Storage)))
 	print("TotalStorages: "+str(len(instance.StoragesOfNode)))
+	print("OperationalGenerators: "+str(len(instance.OperationalGeneratorsOfNode)))
+	print("OperationalStorages: "+str(len(instance.OperationalStoragesOfNode)))
+	print("OperationalDirectionalLinks: "+str(len(instance.OperationalDirectionalLink))+" of "+str(len(instance.DirectionalLink)))
 	print("")
 	print("InvestmentYears: "+str(len(instance.Period)))
 	print("Scenarios: "+str(len(instance.Scenario)))
@@ -1682,8 +2784,31 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 	print("Discount rate: "+str(value(instance.discountrate)))
 	print(f"Operational discount scale: {value(instance.operationalDiscountrate):.3f}")
 	print("Optimizing with hydrogen: " + str(hydrogen))
+	print("")
+	#Hourly columns and rows not built for the pruned generators, storages and links
+	hourIndices = len(instance.Operationalhour)*len(instance.Period)*len(instance.Scenario)
+	firstHourIndices = (len(instance.FirstHoursOfRegSeason)+len(instance.FirstHoursOfPeakSeason))*len(instance.Period)*len(instance.Scenario)
+	prunedGenerators = [g for (n,g) in instance.GeneratorsOfNode if (n,g) not in instance.OperationalGeneratorsOfNode]
+	prunedStorages = len(instance.StoragesOfNode) - len(instance.OperationalStoragesOfNode)
+	prunedLinks = len(instance.DirectionalLink) - len(instance.OperationalDirectionalLink)
+	prunedColumns = (len(prunedGenerators) + 3*prunedStorages + prunedLinks)*hourIndices
+	prunedRows = len(prunedGenerators)*hourIndices + 4*prunedStorages*hourIndices + prunedStorages*firstHourIndices + prunedLinks*hourIndices \
+				 + sum(hourIndices - firstHourIndices for g in prunedGenerators if g in instance.ThermalGenerators) \
+				 + sum(len(instance.Season)*len(instance.Period)*len(instance.Scenario) for g in prunedGenerators if g in instance.RegHydroGenerator)
+	if hydrogen is False:
+		prunedRows += sum(hourIndices for g in prunedGenerators if g in instance.HydrogenGenerators)
+	print("Pruned without capacity potential: " + str(prunedColumns) + " columns, " + str(prunedRows) + " rows")
 	print("--------------------------------------------------------------\n")
 
+	if PRESOLVE:
+		print("{hour}:{minute}:{second}: Presolving instance...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+		start = time.time()
+		[presolveFixed, presolveAliases] = presolve_instance(instance)
+		end = time.time()
+		print("Presolve fixed " + str(len(presolveFixed)) + " variables and substituted " + str(len(presolveAliases)) + " variables, took [sec]:")
+		print(str(end - start))
+
 	if WRITE_LP:
 		print("Writing LP-file...")
 		start = time.time()
@@ -1695,1068 +2820,1163 @@ def run_empire(name, tab_file_path, result_file_path, scenariogeneration, scenar
 		print("Writing LP-file took:")
 		print(str(end - start))
 
-	print("{hour}:{minute}:{second}: Solving...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-
-	if solver == "CPLEX":
-		opt = SolverFactory("cplex", Verbose=True)
-		opt.options["lpmethod"] = 4
-		opt.options["barrier crossover"] = -1
-		if TIME_LIMIT is not None and TIME_LIMIT > 0:
-			opt.options['timelimit'] = TIME_LIMIT
-		#instance.display('outputs_cplex.txt')
-	if solver == "Xpress":
-		opt = SolverFactory("xpress") #Verbose=True
-		opt.options["defaultAlg"] = 4
-		opt.options["crossover"] = 0
-		opt.options["lpLog"] = 1
-		opt.options["Trace"] = 1
-		if TIME_LIMIT is not None and TIME_LIMIT > 0:
-			opt.options['maxtime'] = TIME_LIMIT
-		#instance.display('outputs_xpress.txt')
-	if solver == "Gurobi":
-		opt = SolverFactory('gurobi', Verbose=True)
-		opt.options["Crossover"]=-1
-		# opt.options["CrossoverBasis"]=0
-
-		# opt.options["MIRCuts"]=2
-		# opt.options["FlowCoverCuts"]=1
-		# opt.options["Cuts"]=0
-
-
-		# opt.options["FlowPathCuts"]=2
-		# opt.options["Presolve"]=2
-		opt.options['NumericFocus']=3
-		opt.options['PreSparsify']=1
-
-		opt.options['BarConvTol']=1e-20
-		opt.options['MIPGap']=1e-2
-		# opt.options['MIPGap']=2e-1
-		# opt.options['Threads']=32
-		# opt.options['slog'] = 1
-		# opt.options['FeasibilityTol']=10**(-9)
-		if TIME_LIMIT is not None and TIME_LIMIT > 0:
-			opt.options['TimeLimit'] = TIME_LIMIT
-		opt.options["Method"]=2
-		opt.options["NodeMethod"]=2
-
-	# try:
-	results = opt.solve(instance, tee=True, logfile=result_file_path + '/logfile_' + name + '.log')#, keepfiles=True, symbolic_solver_labels=True)
-	# except:
-	# 	print('{hour}:{minute}:{second}: ERROR: Could not load results. Likely cause: time limit reached'.format(
-	# 		hour=datetime.now().strftime("%H"), minute = datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-	# 	exit()
-
-	if PICKLE_INSTANCE:
+	#Investment decisions of a previous run as the start of the first solve. The later points of a sweep start from
+	#the solution of the previous point, which is still in the instance.
+	if WARMSTART and warmstart_path is not None:
 		start = time.time()
-		picklestring = 'instance' + name + '.pkl'
-		if USE_TEMP_DIR:
-			picklestring = temp_dir + '/instance' + name + '.pkl'
-		with open(picklestring, mode='wb') as file:
-			cloudpickle.dump(instance, file)
+		warmstartValues = load_warmstart(instance, warmstart_path, hydrogen, result_file_format)
 		end = time.time()
-		print("Pickling instance took [sec]:")
+		print("Read " + str(warmstartValues) + " start values from " + warmstart_path + ", took [sec]:")
 		print(str(end - start))
 
-	endOptimization = StartReporting = datetime.now()
-
-	#instance.display('outputs_gurobi.txt')
-
-	#import pdb; pdb.set_trace()
-
-	###########
-	##RESULTS##
-	###########
+	#Checkpoints (CHECKPOINT, LOAD_CHECKPOINT) of the solution are in checkpoint_<name> in the temporary directory or
+	#the result directory. They are identified by the hash of the input files and options, and the hydrogen demand.
+	if CHECKPOINT or LOAD_CHECKPOINT:
+		inputFiles = [tab_file_path + '/' + f for f in os.listdir(tab_file_path) if f.endswith('.tab') or f.endswith('.parquet')]
+		if scenariopath != tab_file_path:
+			inputFiles += [scenariopath + '/' + f for f in os.listdir(scenariopath) if f.startswith('Stochastic_') and f'_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}.' in f]
+		inputHash = input_hash(inputFiles, [Period, Scenario, Season, HoursOfSeason, lengthRegSeason, lengthPeakSeason, discountrate, WACC,
+											LeapYearsInvestment, EMISSION_CAP, hydrogen, h2storage, windfarmNodes])
+
+	#The instance is solved for each point of the sweep. Only the hydrogen demand changes between the points, so it
+	#is recomputed (together with the pipeline bounds that depend on it) instead of building the instance again.
+	for point, [name, result_file_path, hydrogen_demand_percentage, std_dev_percentage] in enumerate(sweep):
+		if point > 0:
+			print("{hour}:{minute}:{second}: Updating hydrogen demand for ".format(
+				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")) + name + "...")
+			if not os.path.exists(result_file_path):
+				os.makedirs(result_file_path)
+			if hydrogen is True:
+				prepHydrogenDemand_rule(instance)
+				prepPipelineBuiltBounds_rule(instance)
+			startOptimization = datetime.now()
+		print("{hour}:{minute}:{second}: Solving...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
 
-	def calculatePowerEmissionIntensity(n,h,i,w,m=None):
-			#print(f'Evaluating {n}')
-			emissions = 1000 * value(sum(instance.genOperational[n,g,h,i,w]*instance.genCO2TypeFactor[g]*(3.6/instance.genEfficiency[g,i]) for g in instance.Generator if (n,g) in instance.GeneratorsOfNode))
-			total_power = value(sum(instance.genOperational[n,g,h,i,w] for g in instance.Generator if (n,g) in instance.GeneratorsOfNode))
-			for n2 in instance.NodesLinked[n]:
-				if value(instance.lineEfficiency[n2,n]*instance.transmissionOperational[n2,n,h,i,w]) > 200 and value(instance.lineEfficiency[n,n2]*instance.transmissionOperational[n,n2,h,i,w]) < 1:
-					if n2==m:
-						print(f'Warning: We have recursion loop between {n} and {m} in calculatePowerEmissionIntensity!')
-					emissions += calculatePowerEmissionIntensity(n2,h,i,w,n) * value(instance.lineEfficiency[n2,n]*instance.transmissionOperational[n2,n,h,i,w])
-					total_power += value(instance.lineEfficiency[n2,n]*instance.transmissionOperational[n2,n,h,i,w])
-				else:
-					emissions += 0
-					total_power += 0
-			if total_power > 0:
-				emission_factor = emissions/total_power
+		if solver == "CPLEX":
+			opt = SolverFactory(solverName) #Verbose=True
+			opt.options["lpmethod"] = 4
+			if solver_interface == "shell":
+				opt.options["barrier crossover"] = -1
 			else:
-				emission_factor = 0
-				# print(f'Warning: Total power in {n} in hour {h} in {inv_per[int(i-1)]} in {w} is 0!')
-			# print(f'Node {n}, period {i}, hour {h}, {w}:\tEm.fac.:{emission_factor:.3f} kg/MWh')
-			return emission_factor
-
-	print(("{hour}:{minute}:{second}: Writing results in " + result_file_path + '/\n').format(
-		hour=datetime.now().strftime("%H"), minute = datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-
-	f = open(result_file_path + "/" + 'results_objective.csv', 'w', newline='')
-	writer = csv.writer(f)
-	writer.writerow(["Objective function value:" + str(value(instance.Obj))])
-	writer.writerow(["Scientific notation:", str(value(instance.Obj))])
-	writer.writerow(["Solver status:",results.solver.status])
-	f.close()
-
-	print("{hour}:{minute}:{second}: Writing transmission investment decisions to results_output_transmission.csv...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-	f = open(result_file_path + "/" + 'results_output_transmission.csv', 'w', newline='')
-	writer = csv.writer(f)
-	writer.writerow(["BetweenNode","AndNode","Period","transmissionBuilt?","transmissionInvCap_MW","transmissionInvCapMax_MW","transmissionInstalledCap_MW","transmissionInstalledCapMax_MW","DiscountedInvestmentCost_Euro","transmissionExpectedAnnualVolume_GWh","ExpectedAnnualLosses_GWh"])
-	for (n1,n2) in instance.BidirectionalArc:
-		for i in instance.Period:
-			writer.writerow([n1,n2,inv_per[int(i-1)],
-							 value(instance.transmissionFixedCostPaid[n1,n2,i]),
-							 value(instance.transmissionInvCap[n1,n2,i]), value(instance.transmissionMaxBuiltCap[n1,n2,i]),
-							 value(instance.transmissionInstalledCap[n1,n2,i]), value(instance.transmissionMaxInstalledCap[n1,n2,i]),
-							 value(instance.discount_multiplier[i]*instance.transmissionInvCap[n1,n2,i]*instance.transmissionVarInvCost[n1,n2,i]),
-							 value(sum(instance.sceProbab[w]*instance.seasScale[s]*(instance.transmissionOperational[n1,n2,h,i,w]+instance.transmissionOperational[n2,n1,h,i,w])/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario)),
-							 value(sum(instance.sceProbab[w]*instance.seasScale[s]*((1 - instance.lineEfficiency[n1,n2])*instance.transmissionOperational[n1,n2,h,i,w] + (1 - instance.lineEfficiency[n2,n1])*instance.transmissionOperational[n2,n1,h,i,w])/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario))])
-	f.close()
-
-	print("{hour}:{minute}:{second}: Writing generator investment decisions to results_output_gen.csv...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-
-	f = open(result_file_path + "/" + 'results_output_gen.csv', 'w', newline='')
-	writer = csv.writer(f)
-	my_string = ["Node","GeneratorType","Period","genInvCap_MW","genInstalledCap_MW","genExpectedCapacityFactor","DiscountedInvestmentCost_Euro","genExpectedAnnualProduction_GWh"]
-	writer.writerow(my_string)
-	for (n,g) in instance.GeneratorsOfNode:
-		for i in instance.Period:
-			my_string=[n,g,inv_per[int(i-1)],value(instance.genInvCap[n,g,i]),value(instance.genInstalledCap[n,g,i]),
-					   value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.genOperational[n,g,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario)/(instance.genInstalledCap[n,g,i]*8760) if value(instance.genInstalledCap[n,g,i]) != 0 and value(instance.genInstalledCap[n,g,i]) > 3 else 0),
-					   value(instance.discount_multiplier[i]*instance.genInvCap[n,g,i]*instance.genInvCost[g,i]),
-					   value(sum(instance.seasScale[s]*instance.sceProbab[w]*instance.genOperational[n,g,h,i,w]/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario) if value(instance.genInstalledCap[n,g,i]) > 3 else 0)]
-			writer.writerow(my_string)
-	f.close()
-
-	print("{hour}:{minute}:{second}: Writing storage investment decisions to results_output_stor.csv...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-	f = open(result_file_path + "/" + 'results_output_stor.csv', 'w', newline='')
-	writer = csv.writer(f)
-	writer.writerow(["Node","StorageType","Period","storPWInvCap_MW","storPWInstalledCap_MW","storENInvCap_MWh","storENInstalledCap_MWh","DiscountedInvestmentCostPWEN_EuroPerMWMWh","ExpectedAnnualDischargeVolume_GWh","ExpectedAnnualLossesChargeDischarge_GWh"])
-	for (n,b) in instance.StoragesOfNode:
-		for i in instance.Period:
-			writer.writerow([n,b,inv_per[int(i-1)],value(instance.storPWInvCap[n,b,i]),value(instance.storPWInstalledCap[n,b,i]),
-							 value(instance.storENInvCap[n,b,i]),value(instance.storENInstalledCap[n,b,i]),
-							 value(instance.discount_multiplier[i]*(instance.storPWInvCap[n,b,i]*instance.storPWInvCost[b,i] + instance.storENInvCap[n,b,i]*instance.storENInvCost[b,i])),
-							 value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.storDischarge[n,b,h,i,w]/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario)),
-							 value(sum(instance.sceProbab[w]*instance.seasScale[s]*((1 - instance.storageDischargeEff[b])*instance.storDischarge[n,b,h,i,w] + (1 - instance.storageChargeEff[b])*instance.storCharge[n,b,h,i,w])/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario))])
-	f.close()
-
-	print("{hour}:{minute}:{second}: Writing transmission operational decisions to results_output_transmission_operational.csv...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-	f = open(result_file_path + "/" + 'results_output_transmission_operational.csv', 'w', newline='')
-	writer = csv.writer(f)
-	writer.writerow(["FromNode","ToNode","Period","Season","Scenario","Hour","TransmissionReceived_MW","Losses_MW"])
-	for (n1,n2) in instance.DirectionalLink:
-		for i in instance.Period:
-			for (s,h) in instance.HoursOfSeason:
-				for w in instance.Scenario:
-					transmissionSent = value(instance.transmissionOperational[n1,n2,h,i,w])
-					writer.writerow([n1,n2,inv_per[int(i-1)],s,w,h,
-									 value(instance.lineEfficiency[n1,n2])*transmissionSent,
-									 value((1 - instance.lineEfficiency[n1,n2]))*transmissionSent])
-	f.close()
-
-	print(
-		"{hour}:{minute}:{second}: Writing power balances to results_power_balance.csv...".format(
-			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"),
-			second=datetime.now().strftime("%S")))
-	f = open(result_file_path + "/" + 'results_power_balance.csv', 'w', newline='')
-	writer = csv.writer(f)
-	header = ["Node", "Period", "Season", "Hour", "Scenario", "Available power [MWh]", "Power generation [MWh]", "Power curtailed [MWh]", "Power transmission in [MWh]","Power storage discharge [MWh]", "Power transmission out [MWh]", "Power storage charge [MWh]", "Power load [MWh]", "Power shed [MWh]"]
-	if hydrogen is True:
-		header.append("Power for hydrogen [MWh]")
-	writer.writerow(header)
-	for n in instance.Node:
-		for i in instance.Period:
-			for (s,h) in instance.HoursOfSeason:
-				for w in instance.Scenario:
-					row = [n,inv_per[int(i-1)],s,h,w]
-					row.append(value(sum(instance.genCapAvail[n,g,h,w,i]*instance.genInstalledCap[n,g,i] for g in instance.Generator if (n,g) in instance.GeneratorsOfNode)))
-					row.append(value(sum(instance.genOperational[n,g,h,i,w] for g in instance.Generator if (n,g) in instance.GeneratorsOfNode)))
-					row.append(value(sum((instance.genCapAvail[n,g,h,w,i]*instance.genInstalledCap[n,g,i] - instance.genOperational[n,g,h,i,w]) for g in instance.Generator if (n,g) in instance.GeneratorsOfNode)))
-					row.append(value(sum(instance.lineEfficiency[link,n]*instance.transmissionOperational[link,n,h,i,w] for link in instance.NodesLinked[n])))
-					row.append(value(sum(instance.storageDischargeEff[b] * instance.storDischarge[n, b, h, i, w] for b in instance.Storage if (n, b) in instance.StoragesOfNode)))
-					row.append(value(sum(instance.transmissionOperational[n,link,h,i,w] for link in instance.NodesLinked[n])))
-					row.append(value(sum(instance.storCharge[n,b,h,i,w] for b in instance.Storage if (n,b) in instance.StoragesOfNode)))
-					row.append(value(instance.sload[n,h,i,w]))
-					row.append(value(instance.loadShed[n,h,i,w]))
-					if hydrogen is True and n in instance.HydrogenProdNode:
-						row.append(value(sum(instance.powerForHydrogen[n,j,h,i,w] for j in instance.Period if j<=i)))
-					writer.writerow(row)
-	f.close()
+				opt.options["barrier_crossover"] = -1
+			if TIME_LIMIT is not None and TIME_LIMIT > 0:
+				opt.options['timelimit'] = TIME_LIMIT
+			#instance.display('outputs_cplex.txt')
+		if solver == "Xpress":
+			opt = SolverFactory(solverName) #Verbose=True
+			opt.options["defaultAlg"] = 4
+			opt.options["crossover"] = 0
+			opt.options["lpLog"] = 1
+			opt.options["Trace"] = 1
+			if TIME_LIMIT is not None and TIME_LIMIT > 0:
+				opt.options['maxtime'] = TIME_LIMIT
+			#instance.display('outputs_xpress.txt')
+		if solver == "Gurobi":
+			opt = SolverFactory(solverName) #Verbose=True
+			opt.options["Crossover"]=-1
+			# opt.options["CrossoverBasis"]=0
+
+			# opt.options["MIRCuts"]=2
+			# opt.options["FlowCoverCuts"]=1
+			# opt.options["Cuts"]=0
+
+
+			# opt.options["FlowPathCuts"]=2
+			# opt.options["Presolve"]=2
+			opt.options['NumericFocus']=3
+			opt.options['PreSparsify']=1
+
+			opt.options['BarConvTol']=1e-20
+			opt.options['MIPGap']=1e-2
+			# opt.options['MIPGap']=2e-1
+			# opt.options['Threads']=32
+			# opt.options['slog'] = 1
+			# opt.options['FeasibilityTol']=10**(-9)
+			if TIME_LIMIT is not None and TIME_LIMIT > 0:
+				opt.options['TimeLimit'] = TIME_LIMIT
+			opt.options["Method"]=2
+			opt.options["NodeMethod"]=2
+
+		if solver_interface == "persistent" and decomposition == 'extensive' and not LOAD_CHECKPOINT:
+			#The instance is given to the solver again for each solve, since the hydrogen demand of a sweep changes
+			opt.set_instance(instance)
+
+		checkpointPath = (temp_dir if USE_TEMP_DIR else result_file_path) + '/checkpoint_' + name
+
+		if LOAD_CHECKPOINT:
+			start = time.time()
+			manifest = load_checkpoint(instance, checkpointPath)
+			if manifest["input_hash"] != inputHash or [manifest["hydrogen_demand_percentage"], manifest["std_dev_percentage"]] != [hydrogen_demand_percentage, std_dev_percentage]:
+				sys.exit("ERROR! The checkpoint " + checkpointPath + " was saved for other input files or options")
+			solverStatus = manifest["solver_status"]
+			end = time.time()
+			print("Loading checkpoint took [sec]:")
+			print(str(end - start))
+		else:
+			# try:
+			if decomposition == 'benders':
+				#The first iteration starts from the first-stage values in the instance (warm start or previous point)
+				results = benders.solve(solverName, opt.options, benders_gap, benders_max_iterations, TIME_LIMIT, result_file_path + '/benders_' + name + '.csv')
+			else:
+				warmstart = WARMSTART and (point > 0 or warmstart_path is not None) and (solver_interface == "appsi" or opt.warm_start_capable())
+				logfile = result_file_path + '/logfile_' + name + '.log'
+				if solver_interface == "appsi":
+					#The appsi interfaces take the log file in their config, solve does not accept it
+					if 'logfile' in opt.config:
+						opt.config.logfile = logfile
+					results = opt.solve(instance, tee=True, warmstart=warmstart)
+				else:
+					results = opt.solve(instance, tee=True, logfile=logfile, warmstart=warmstart)#, keepfiles=True, symbolic_solver_labels=True)
+			# except:
+			# 	print('{hour}:{minute}:{second}: ERROR: Could not load results. Likely cause: time limit reached'.format(
+			# 		hour=datetime.now().strftime("%H"), minute = datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# 	exit()
+			solverStatus = results.solver.status
+
+			if PRESOLVE:
+				restore_presolved_values(presolveAliases)
+
+		if CHECKPOINT and not LOAD_CHECKPOINT:
+			start = time.time()
+			save_checkpoint(instance, checkpointPath, {"name": name, "created": datetime.now().isoformat(timespec='seconds'),
+													   "solver": solver, "solver_status": str(results.solver.status),
+													   "termination_condition": str(results.solver.termination_condition),
+													   "objective": value(instance.Obj), "input_hash": inputHash,
+													   "hydrogen_demand_percentage": hydrogen_demand_percentage,
+													   "std_dev_percentage": std_dev_percentage})
+			end = time.time()
+			print("Saving checkpoint took [sec]:")
+			print(str(end - start))
+
+		endOptimization = StartReporting = datetime.now()
+
+		#instance.display('outputs_gurobi.txt')
+
+		#import pdb; pdb.set_trace()
+
+		###########
+		##RESULTS##
+		###########
+
+		#The values of the operational variables and parameters are extracted once as NumPy arrays. Hourly arrays have
+		#the axes component, hour (in the order of HoursOfSeason), period, scenario. Sums over the components at a node
+		#are taken with the incidence matrices ...AtNode (node x component).
+
+		nodes, periods, scenarios, hours = [list(instance.Node), list(instance.Period), list(instance.Scenario), list(instance.Operationalhour)]
+		seasonHours = list(instance.HoursOfSeason)
+		hourPosition = {h: k for k, h in enumerate(hours)}
+		hourIndex = [hourPosition[h] for (s,h) in seasonHours]
+		seasScale = np.array([value(instance.seasScale[s]) for (s,h) in seasonHours])
+		sceProbab = np.array([value(instance.sceProbab[w]) for w in scenarios])
+		expectedScale = seasScale[None, :, None, None] * sceProbab[None, None, None, :]
+		discountMultiplier = np.array([value(instance.discount_multiplier[i]) for i in periods])
+
+		generatorsOfNode = list(instance.GeneratorsOfNode)
+		generators = list(instance.Generator)
+		genAtNode = np.array([[n2 == n for (n2,g) in generatorsOfNode] for n in nodes], dtype=float)
+		genOfType = np.array([[g2 == g for (n,g2) in generatorsOfNode] for g in generators], dtype=float)
+		genOperational = var_array(instance.genOperational, [generatorsOfNode, hours, periods, scenarios])[:, hourIndex]
+		genInvCap = var_array(instance.genInvCap, [generatorsOfNode, periods])
+		genInstalledCap = var_array(instance.genInstalledCap, [generatorsOfNode, periods])
+		genCapAvail = param_array(instance.genCapAvail, [generatorsOfNode, hours, scenarios, periods], instance.genCapAvail.default())
+		genAvailable = genCapAvail.transpose(0, 1, 3, 2)[:, hourIndex] * genInstalledCap[:, None, :, None]
+		genEmissionFactor = np.array([[value(instance.genCO2TypeFactor[g]*(3.6/instance.genEfficiency[g,i])) for i in periods] for (n,g) in generatorsOfNode])
+		genEmissions = genOperational * genEmissionFactor[:, None, :, None]
+
+		storagesOfNode = list(instance.StoragesOfNode)
+		storAtNode = np.array([[n2 == n for (n2,b) in storagesOfNode] for n in nodes], dtype=float)
+		storCharge = var_array(instance.storCharge, [storagesOfNode, hours, periods, scenarios])[:, hourIndex]
+		storDischarge = var_array(instance.storDischarge, [storagesOfNode, hours, periods, scenarios])[:, hourIndex]
+		storOperational = var_array(instance.storOperational, [storagesOfNode, hours, periods, scenarios])[:, hourIndex]
+		storageChargeEff = np.array([value(instance.storageChargeEff[b]) for (n,b) in storagesOfNode])[:, None, None, None]
+		storageDischargeEff = np.array([value(instance.storageDischargeEff[b]) for (n,b) in storagesOfNode])[:, None, None, None]
+		storageBleedEff = np.array([value(instance.storageBleedEff[b]) for (n,b) in storagesOfNode])[:, None, None, None]
+		storLosses = (1 - storageDischargeEff)*storDischarge + (1 - storageChargeEff)*storCharge
+
+		directionalLinks = list(instance.DirectionalLink)
+		linkPosition = {link: k for k, link in enumerate(directionalLinks)}
+		linkInAtNode = np.zeros((len(nodes), len(directionalLinks)))
+		linkOutAtNode = np.zeros((len(nodes), len(directionalLinks)))
+		for k, n in enumerate(nodes):
+			for link in instance.NodesLinked[n]:
+				linkInAtNode[k, linkPosition[link,n]] = 1
+				linkOutAtNode[k, linkPosition[n,link]] = 1
+		transmissionOperational = var_array(instance.transmissionOperational, [directionalLinks, hours, periods, scenarios])[:, hourIndex]
+		lineEfficiency = np.array([value(instance.lineEfficiency[n1,n2]) for (n1,n2) in directionalLinks])[:, None, None, None]
+		transmissionReceived = lineEfficiency * transmissionOperational
+
+		loadShed = var_array(instance.loadShed, [nodes, hours, periods, scenarios])[:, hourIndex]
+		sload = param_array(instance.sload, [nodes, hours, periods, scenarios], instance.sload.default())[:, hourIndex]
+
+		#Sums at the nodes
+		nodeGenAvailable = np.tensordot(genAtNode, genAvailable, axes=1)
+		nodeGeneration = np.tensordot(genAtNode, genOperational, axes=1)
+		nodeEmissions = 1000 * np.tensordot(genAtNode, genEmissions, axes=1)
+		nodeTransmissionIn = np.tensordot(linkInAtNode, transmissionOperational, axes=1)
+		nodeTransmissionReceived = np.tensordot(linkInAtNode, transmissionReceived, axes=1)
+		nodeTransmissionOut = np.tensordot(linkOutAtNode, transmissionOperational, axes=1)
+		nodeStorCharge = np.tensordot(storAtNode, storCharge, axes=1)
+		nodeStorDischarge = np.tensordot(storAtNode, storDischarge, axes=1)
+
+		print(("{hour}:{minute}:{second}: Writing results in " + result_file_path + '/\n').format(
+			hour=datetime.now().strftime("%H"), minute = datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+
+		f = open(result_file_path + "/" + 'results_objective.csv', 'w', newline='')
+		writer = csv.writer(f)
+		writer.writerow(["Objective function value:" + str(value(instance.Obj))])
+		writer.writerow(["Scientific notation:", str(value(instance.Obj))])
+		writer.writerow(["Solver status:",solverStatus])
+		f.close()
 
-	print("{hour}:{minute}:{second}: Writing curtailed power to results_output_curtailed_prod.csv...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-	f = open(result_file_path + "/" + 'results_output_curtailed_prod.csv', 'w', newline='')
-	writer = csv.writer(f)
-	writer.writerow(["Node","RESGeneratorType","Period","ExpectedAnnualCurtailment_GWh", "Expected total available power_GWh", "Expected annual curtailment ratio of total capacity_%"])
-	for t in instance.Technology:
-		if t == 'Hydro_ror' or t == 'Wind_onshr' or t == 'Wind_offshr_grounded' or t == 'Wind_offshr_floating' or t == 'Solar':
-			for (n,g) in instance.GeneratorsOfNode:
-				if (t,g) in instance.GeneratorsOfTechnology:
-					for i in instance.Period:
-						curtailedPower = value(sum(instance.sceProbab[w]*instance.seasScale[s]*(instance.genCapAvail[n,g,h,w,i]*instance.genInstalledCap[n,g,i] - instance.genOperational[n,g,h,i,w])/1000 for w in instance.Scenario for (s,h) in instance.HoursOfSeason))
-						totalPowerProduction = value(sum(instance.sceProbab[w]*instance.seasScale[s]*(instance.genCapAvail[n,g,h,w,i]*instance.genInstalledCap[n,g,i])/1000 for w in instance.Scenario for (s,h) in instance.HoursOfSeason))
-						row = [n,g,inv_per[int(i-1)], curtailedPower, totalPowerProduction]
-						if totalPowerProduction > 0:
-							row.append(curtailedPower/totalPowerProduction*100)
-						else:
-							row.append(0)
-						writer.writerow(row)
-	f.close()
+		print("{hour}:{minute}:{second}: Writing transmission investment decisions to results_output_transmission.csv...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+		writer = ResultWriter(result_file_path, 'results_output_transmission', result_file_format, CSV_EXPORT)
+		writer.writerow(["BetweenNode","AndNode","Period","transmissionBuilt?","transmissionInvCap_MW","transmissionInvCapMax_MW","transmissionInstalledCap_MW","transmissionInstalledCapMax_MW","DiscountedInvestmentCost_Euro","transmissionExpectedAnnualVolume_GWh","ExpectedAnnualLosses_GWh"])
+		for (n1,n2) in instance.BidirectionalArc:
+			for i in instance.Period:
+				writer.writerow([n1,n2,inv_per[int(i-1)],
+								 value(instance.transmissionFixedCostPaid[n1,n2,i]),
+								 value(instance.transmissionInvCap[n1,n2,i]), value(instance.transmissionMaxBuiltCap[n1,n2,i]),
+								 value(instance.transmissionInstalledCap[n1,n2,i]), value(instance.transmissionMaxInstalledCap[n1,n2,i]),
+								 value(instance.discount_multiplier[i]*instance.transmissionInvCap[n1,n2,i]*instance.transmissionVarInvCost[n1,n2,i]),
+								 value(sum(instance.sceProbab[w]*instance.seasScale[s]*(instance.transmissionOperational[n1,n2,h,i,w]+instance.transmissionOperational[n2,n1,h,i,w])/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario)),
+								 value(sum(instance.sceProbab[w]*instance.seasScale[s]*((1 - instance.lineEfficiency[n1,n2])*instance.transmissionOperational[n1,n2,h,i,w] + (1 - instance.lineEfficiency[n2,n1])*instance.transmissionOperational[n2,n1,h,i,w])/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario))])
+		writer.close()
+
+		print("{hour}:{minute}:{second}: Writing generator investment decisions to results_output_gen.csv...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
 
-	#Commenting out this plotting because it is not currently interesting.
-
-	# print("{hour}:{minute}:{second}: Writing plotting file to results_output_EuropePlot.csv...".format(
-	#     hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-	# f = open(result_file_path + "/" + 'results_output_EuropePlot.csv', 'w', newline='')
-	# writer = csv.writer(f)
-	# writer.writerow(["Period","genInstalledCap_MW"])
-	# my_string=[""]
-	# for g in instance.Generator:
-	#     my_string.append(g)
-	# writer.writerow(my_string)
-	# my_string=["Initial"]
-	# for g in instance.Generator:
-	#     my_string.append((value(sum(instance.genInitCap[n,g,1] for n in instance.Node if (n,g) in instance.GeneratorsOfNode))))
-	# writer.writerow(my_string)
-	# for i in instance.Period:
-	#     my_string=[inv_per[int(i-1)]]
-	#     for g in instance.Generator:
-	#         my_string.append(value(sum(instance.genInstalledCap[n,g,i] for n in instance.Node if (n,g) in instance.GeneratorsOfNode)))
-	#     writer.writerow(my_string)
-	# writer.writerow([""])
-	# writer.writerow(["Period","genExpectedAnnualProduction_GWh"])
-	# my_string=[""]
-	# for g in instance.Generator:
-	#     my_string.append(g)
-	# writer.writerow(my_string)
-	# for i in instance.Period:
-	#     my_string=[inv_per[int(i-1)]]
-	#     for g in instance.Generator:
-	#         my_string.append(value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.genOperational[n,g,h,i,w]/1000 for n in instance.Node if (n,g) in instance.GeneratorsOfNode for (s,h) in instance.HoursOfSeason for w in instance.Scenario)))
-	#     writer.writerow(my_string)
-	# writer.writerow([""])
-	# writer.writerow(["Period","storPWInstalledCap_MW"])
-	# my_string=[""]
-	# for b in instance.Storage:
-	#     my_string.append(b)
-	# writer.writerow(my_string)
-	# for i in instance.Period:
-	#     my_string=[inv_per[int(i-1)]]
-	#     for b in instance.Storage:
-	#         my_string.append(value(sum(instance.storPWInstalledCap[n,b,i] for n in instance.Node if (n,b) in instance.StoragesOfNode)))
-	#     writer.writerow(my_string)
-	# writer.writerow([""])
-	# writer.writerow(["Period","storENInstalledCap_MW"])
-	# my_string=[""]
-	# for b in instance.Storage:
-	#     my_string.append(b)
-	# writer.writerow(my_string)
-	# for i in instance.Period:
-	#     my_string=[inv_per[int(i-1)]]
-	#     for b in instance.Storage:
-	#         my_string.append(value(sum(instance.storENInstalledCap[n,b,i] for n in instance.Node if (n,b) in instance.StoragesOfNode)))
-	#     writer.writerow(my_string)
-	# writer.writerow([""])
-	# writer.writerow(["Period","storExpectedAnnualDischarge_GWh"])
-	# my_string=[""]
-	# for b in instance.Storage:
-	#     my_string.append(b)
-	# writer.writerow(my_string)
-	# for i in instance.Period:
-	#     my_string=[inv_per[int(i-1)]]
-	#     for b in instance.Storage:
-	#         my_string.append(value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.storDischarge[n,b,h,i,w]/1000 for n in instance.Node if (n,b) in instance.StoragesOfNode for (s,h) in instance.HoursOfSeason for w in instance.Scenario)))
-	#     writer.writerow(my_string)
-	# f.close()
+		writer = ResultWriter(result_file_path, 'results_output_gen', result_file_format, CSV_EXPORT)
+		my_string = ["Node","GeneratorType","Period","genInvCap_MW","genInstalledCap_MW","genExpectedCapacityFactor","DiscountedInvestmentCost_Euro","genExpectedAnnualProduction_GWh"]
+		writer.writerow(my_string)
+		for (n,g) in instance.GeneratorsOfNode:
+			for i in instance.Period:
+				my_string=[n,g,inv_per[int(i-1)],value(instance.genInvCap[n,g,i]),value(instance.genInstalledCap[n,g,i]),
+						   value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.genOperational[n,g,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario)/(instance.genInstalledCap[n,g,i]*8760) if value(instance.genInstalledCap[n,g,i]) != 0 and value(instance.genInstalledCap[n,g,i]) > 3 else 0),
+						   value(instance.discount_multiplier[i]*instance.genInvCap[n,g,i]*instance.genInvCost[g,i]),
+						   value(sum(instance.seasScale[s]*instance.sceProbab[w]*instance.genOperational[n,g,h,i,w]/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario) if value(instance.genInstalledCap[n,g,i]) > 3 else 0)]
+				writer.writerow(my_string)
+		writer.close()
+
+		print("{hour}:{minute}:{second}: Writing storage investment decisions to results_output_stor.csv...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+		writer = ResultWriter(result_file_path, 'results_output_stor', result_file_format, CSV_EXPORT)
+		writer.writerow(["Node","StorageType","Period","storPWInvCap_MW","storPWInstalledCap_MW","storENInvCap_MWh","storENInstalledCap_MWh","DiscountedInvestmentCostPWEN_EuroPerMWMWh","ExpectedAnnualDischargeVolume_GWh","ExpectedAnnualLossesChargeDischarge_GWh"])
+		for (n,b) in instance.StoragesOfNode:
+			for i in instance.Period:
+				writer.writerow([n,b,inv_per[int(i-1)],value(instance.storPWInvCap[n,b,i]),value(instance.storPWInstalledCap[n,b,i]),
+								 value(instance.storENInvCap[n,b,i]),value(instance.storENInstalledCap[n,b,i]),
+								 value(instance.discount_multiplier[i]*(instance.storPWInvCap[n,b,i]*instance.storPWInvCost[b,i] + instance.storENInvCap[n,b,i]*instance.storENInvCost[b,i])),
+								 value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.storDischarge[n,b,h,i,w]/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario)),
+								 value(sum(instance.sceProbab[w]*instance.seasScale[s]*((1 - instance.storageDischargeEff[b])*instance.storDischarge[n,b,h,i,w] + (1 - instance.storageChargeEff[b])*instance.storCharge[n,b,h,i,w])/1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario))])
+		writer.close()
+
+		print("{hour}:{minute}:{second}: Writing transmission operational decisions to results_output_transmission_operational.csv...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+		writer = ResultWriter(result_file_path, 'results_output_transmission_operational', result_file_format, CSV_EXPORT)
+		writer.writerow(["FromNode","ToNode","Period","Season","Scenario","Hour","TransmissionReceived_MW","Losses_MW"])
+		for (n1,n2) in instance.DirectionalLink:
+			for i in instance.Period:
+				for (s,h) in instance.HoursOfSeason:
+					for w in instance.Scenario:
+						transmissionSent = value(instance.transmissionOperational[n1,n2,h,i,w])
+						writer.writerow([n1,n2,inv_per[int(i-1)],s,w,h,
+										 value(instance.lineEfficiency[n1,n2])*transmissionSent,
+										 value((1 - instance.lineEfficiency[n1,n2]))*transmissionSent])
+		writer.close()
 
-	print("{hour}:{minute}:{second}: Writing summary file to results_output_EuropeSummary.csv...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-	f = open(result_file_path + "/" + 'results_output_EuropeSummary.csv', 'w', newline='')
-	if solver == 'Xpress':
-		fError = open(result_file_path + "/" + "errorLog.log",'w')
-	writer = csv.writer(f)
-	header = ["Period","Scenario","AnnualCO2emission_Ton","CO2Price_EuroPerTon","CO2Cap_Ton","AnnualGeneration_GWh","AvgCO2factor_TonPerMWh","AvgPowerPrice_Euro","TotAnnualCurtailedRES_GWh","TotAnnualLossesChargeDischarge_GWh","AnnualLossesTransmission_GWh"]
-	if hydrogen is True:
-		header.append("AvgH2MarginalCost_EuroPerKg")
-		# header.append('AverageEmissionsH2_kgCO2PerKgH2')
-	writer.writerow(header)
-	for i in instance.Period:
-		for w in instance.Scenario:
-			power_co2_factor = value(sum(instance.seasScale[s]*instance.genOperational[n,g,h,i,w]*instance.genCO2TypeFactor[g]*(3.6/instance.genEfficiency[g,i]) for (n,g) in instance.GeneratorsOfNode for (s,h) in instance.HoursOfSeason)/sum(instance.seasScale[s]*instance.genOperational[n,g,h,i,w] for (n,g) in instance.GeneratorsOfNode for (s,h) in instance.HoursOfSeason))
-			my_string=[inv_per[int(i-1)],w,
-					   value(sum(instance.seasScale[s]*instance.genOperational[n,g,h,i,w]*instance.genCO2TypeFactor[g]*(3.6/instance.genEfficiency[g,i]) for (n,g) in instance.GeneratorsOfNode for (s,h) in instance.HoursOfSeason))]
-			if EMISSION_CAP:
-				try:
-					my_string.append(-value(instance.dual[instance.emission_cap[i,w]]/(instance.discount_multiplier[i]*instance.operationalDiscountrate*instance.sceProbab[w]*1e6)))
-					my_string.append(value(instance.CO2cap[i]*1e6))
-				except:
-					my_string.append(0)
-					my_string.append(value(instance.CO2cap[i]*1e6))
+		print(
+			"{hour}:{minute}:{second}: Writing power balances to results_power_balance.csv...".format(
+				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"),
+				second=datetime.now().strftime("%S")))
+		writer = ResultWriter(result_file_path, 'results_power_balance', result_file_format, CSV_EXPORT)
+		header = ["Node", "Period", "Season", "Hour", "Scenario", "Available power [MWh]", "Power generation [MWh]", "Power curtailed [MWh]", "Power transmission in [MWh]","Power storage discharge [MWh]", "Power transmission out [MWh]", "Power storage charge [MWh]", "Power load [MWh]", "Power shed [MWh]"]
+		if hydrogen is True:
+			header.append("Power for hydrogen [MWh]")
+			#Power for hydrogen of all electrolyzers in operation (built in a period j <= i)
+			hydrogenNodes = list(instance.HydrogenProdNode)
+			powerForHydrogen = var_array(instance.powerForHydrogen, [hydrogenNodes, periods, hours, periods, scenarios]).sum(axis=1)[:, hourIndex]
+		writer.writerow(header)
+		#Columns with the axes node, period, hour, scenario, column
+		balance = np.stack([nodeGenAvailable, nodeGeneration, nodeGenAvailable - nodeGeneration, nodeTransmissionReceived,
+							np.tensordot(storAtNode, storageDischargeEff * storDischarge, axes=1), nodeTransmissionOut,
+							nodeStorCharge, sload, loadShed], axis=-1).transpose(0, 2, 1, 3, 4)
+		for k, n in enumerate(nodes):
+			if hydrogen is True and n in instance.HydrogenProdNode:
+				balanceNode = np.concatenate([balance[k], powerForHydrogen[hydrogenNodes.index(n)].transpose(1, 0, 2)[..., None]], axis=-1)
 			else:
-				my_string.append(value(instance.CO2price[i]))
-				my_string.append("INF")
-			my_string.extend([value(sum(instance.seasScale[s]*instance.genOperational[n,g,h,i,w]/1000 for (n,g) in instance.GeneratorsOfNode for (s,h) in instance.HoursOfSeason)),
-							  power_co2_factor,
-							  # value(sum(instance.dual[instance.FlowBalance[n,h,i,w]]/(instance.discount_multiplier[i]*instance.operationalDiscountrate*instance.seasScale[s]*instance.sceProbab[w]) for n in instance.Node for (s,h) in instance.HoursOfSeason)/value(len(instance.HoursOfSeason)*len(instance.Node))),
-							  0, # No duals with MIPs
-							  value(sum(instance.seasScale[s]*(instance.genCapAvail[n,g,h,w,i]*instance.genInstalledCap[n,g,i] - instance.genOperational[n,g,h,i,w])/1000 for (n,g) in instance.GeneratorsOfNode if g == 'Hydrorun-of-the-river' or g == 'Windonshore' or g == 'Windoffshore' or g == 'Solar' for (s,h) in instance.HoursOfSeason)),
-							  value(sum(instance.seasScale[s]*((1 - instance.storageDischargeEff[b])*instance.storDischarge[n,b,h,i,w] + (1 - instance.storageChargeEff[b])*instance.storCharge[n,b,h,i,w])/1000 for (n,b) in instance.StoragesOfNode for (s,h) in instance.HoursOfSeason)),
-							  value(sum(instance.seasScale[s]*((1 - instance.lineEfficiency[n1,n2])*instance.transmissionOperational[n1,n2,h,i,w] + (1 - instance.lineEfficiency[n2,n1])*instance.transmissionOperational[n2,n1,h,i,w])/1000 for (n1,n2) in instance.BidirectionalArc for (s,h) in instance.HoursOfSeason))])
-			if hydrogen is True:
-				try:
-					my_string.extend([value(sum(instance.dual[instance.hydrogen_flow_balance[n,h,i,w]]/(instance.discount_multiplier[i]*instance.operationalDiscountrate*instance.seasScale[s]*instance.sceProbab[w]) for n in instance.HydrogenProdNode for (s,h) in instance.HoursOfSeason)/value(len(HoursOfSeason)*len(instance.HydrogenProdNode)))])
-				except:
-					# print('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_output_EuropeSummary.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+')')
-					# fError.write('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_output_EuropeSummary.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+'). Dual is likely 0 (poorly handled in Xpress)\n')
-					my_string.extend([0])
-				# green_h2_production = value(sum(instance.seasScale[s]*instance.powerForHydrogen[n,j,h,i,w] for j in instance.Period if j<=i for n in instance.HydrogenProdNode for (s,h) in instance.HoursOfSeason))
-				# green_h2_emissions = 1000 * green_h2_production * power_co2_factor
-				# blue_h2_production = value(sum(instance.seasScale[s] * instance.hydrogenProducedReformer_kg[n,p,h,i,w] for p in instance.ReformerPlants for n in instance.ReformerLocations for (s,h) in instance.HoursOfSeason))
-				# blue_h2_direct_emissions = value(sum(instance.seasScale[s] * instance.ReformerEmissionFactor[p,i] * instance.hydrogenProducedReformer_kg[n,p,h,i,w] for n in instance.ReformerLocations for p in instance.ReformerPlants for (s,h) in instance.HoursOfSeason))
-				# blue_h2_power_emissions = 1000 * power_co2_factor * value(sum(instance.seasScale[s] * instance.ReformerPlantElectricityUse[p,i] * instance.hydrogenProducedReformer_kg[n,p,h,i,w] for n in instance.ReformerLocations for p in instance.ReformerPlants for (s,h) in instance.HoursOfSeason))
-				# my_string.extend([(green_h2_emissions + blue_h2_direct_emissions + blue_h2_power_emissions)/(green_h2_production + blue_h2_production)])
-			writer.writerow(my_string)
-	if solver == 'Xpress':
-		fError.write('\n')
-		fError.close()
-	writer.writerow([""])
-	writer.writerow(["GeneratorType","Period","genInvCap_MW","genInstalledCap_MW","TotDiscountedInvestmentCost_Euro","genExpectedAnnualProduction_GWh"])
-	for g in instance.Generator:
-		for i in instance.Period:
-			expected_production = 0
-			for n in instance.Node:
-				if (n,g) in instance.GeneratorsOfNode:
-					expected_production += value(sum(instance.seasScale[s] * instance.sceProbab[w] * instance.genOperational[n,g,h,i,w] / 1000 for (s,h) in instance.HoursOfSeason for w in instance.Scenario))
-			writer.writerow([g,inv_per[int(i-1)],value(sum(instance.genInvCap[n,g,i] for n in instance.Node if (n,g) in instance.GeneratorsOfNode)),
-							 value(sum(instance.genInstalledCap[n,g,i] for n in instance.Node if (n,g) in instance.GeneratorsOfNode)),
-							 value(sum(instance.discount_multiplier[i]*instance.genInvCap[n,g,i]*instance.genInvCost[g,i] for n in instance.Node if (n,g) in instance.GeneratorsOfNode)),
-							 expected_production])
-	writer.writerow([""])
-	writer.writerow(["StorageType","Period","storPWInvCap_MW","storPWInstalledCap_MW","storENInvCap_MWh","storENInstalledCap_MWh","TotDiscountedInvestmentCostPWEN_Euro","ExpectedAnnualDischargeVolume_GWh"])
-	for b in instance.Storage:
-		for i in instance.Period:
-			expected_discharge = 0
-			for n in instance.Node:
-				if (n,b) in instance.StoragesOfNode:
-					expected_discharge += value(sum(instance.seasScale[s] * instance.sceProbab[w] * instance.storDischarge[n,b,h,i,w] / 1000 for (s,h) in instance.HoursOfSeason or w in instance.Scenario))
-			writer.writerow([b,inv_per[int(i-1)],value(sum(instance.storPWInvCap[n,b,i] for n in instance.Node if (n,b) in instance.StoragesOfNode)),
-							 value(sum(instance.storPWInstalledCap[n,b,i] for n in instance.Node if (n,b) in instance.StoragesOfNode)),
-							 value(sum(instance.storENInvCap[n,b,i] for n in instance.Node if (n,b) in instance.StoragesOfNode)),
-							 value(sum(instance.storENInstalledCap[n,b,i] for n in instance.Node if (n,b) in instance.StoragesOfNode)),
-							 value(sum(instance.discount_multiplier[i]*(instance.storPWInvCap[n,b,i]*instance.storPWInvCost[b,i] + instance.storENInvCap[n,b,i]*instance.storENInvCost[b,i]) for n in instance.Node if (n,b) in instance.StoragesOfNode)),
-							 expected_discharge])
-	f.close()
+				balanceNode = balance[k]
+			rows = balanceNode.reshape(-1, balanceNode.shape[-1]).tolist()
+			for (i, (s,h), w), row in zip(itertools.product(periods, seasonHours, scenarios), rows):
+				writer.writerow([n,inv_per[int(i-1)],s,h,w] + row)
+		writer.close()
 
-	print("{hour}:{minute}:{second}: Writing operational results to results_output_Operational.csv...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-	f = open(result_file_path + "/" + 'results_output_Operational.csv', 'w', newline='')
-	writer = csv.writer(f)
-	my_header = ["Node","Period","Scenario","Season","Hour"]
-	for g in instance.Generator:
-		my_string = str(g)+"_MW"
-		my_header.append(my_string)
-	my_header.extend(["storCharge_MW","storDischarge_MW","storEnergyLevel_MWh","LossesChargeDischargeBleed_MW","FlowOut_MW","FlowIn_MW","LossesFlowIn_MW","LoadShed_MW","Price_EURperMWh","AvgCO2_kgCO2perMWh_PRODUCTION","AvgCO2_kgCO2perMWh_TOTAL"])
-	writer.writerow(my_header)
-	for n in instance.Node:
-			for i in instance.Period:
-				for w in instance.Scenario:
-					for (s,h) in instance.HoursOfSeason:
-						my_string=[n,inv_per[int(i-1)],w,s,h]
-						for g in instance.Generator:
-							if (n,g) in instance.GeneratorsOfNode:
-								my_string.append(value(instance.genOperational[n,g,h,i,w]))
-							else:
-								my_string.append(0)
-						my_string.extend([value(sum(-instance.storCharge[n,b,h,i,w] for b in instance.Storage if (n,b) in instance.StoragesOfNode)),
-										  value(sum(instance.storDischarge[n,b,h,i,w] for b in instance.Storage if (n,b) in instance.StoragesOfNode)),
-										  value(sum(instance.storOperational[n,b,h,i,w] for b in instance.Storage if (n,b) in instance.StoragesOfNode)),
-										  value(sum(-(1 - instance.storageDischargeEff[b])*instance.storDischarge[n,b,h,i,w] - (1 - instance.storageChargeEff[b])*instance.storCharge[n,b,h,i,w] - (1 - instance.storageBleedEff[b])*instance.storOperational[n,b,h,i,w] for b in instance.Storage if (n,b) in instance.StoragesOfNode)),
-										  value(sum(-instance.transmissionOperational[n,link,h,i,w] for link in instance.NodesLinked[n])),
-										  value(sum(instance.transmissionOperational[link,n,h,i,w] for link in instance.NodesLinked[n])),
-										  value(sum(-(1 - instance.lineEfficiency[link,n])*instance.transmissionOperational[link,n,h,i,w] for link in instance.NodesLinked[n])),
-										  value(instance.loadShed[n,h,i,w]),
-										  # value(instance.dual[instance.FlowBalance[n,h,i,w]]/(instance.discount_multiplier[i]*instance.operationalDiscountrate*instance.seasScale[s]*instance.sceProbab[w]))])
-										  0]) # No duals with MIPs
-						if value(sum(instance.genOperational[n,g,h,i,w] for g in instance.Generator if (n,g) in instance.GeneratorsOfNode)) > 0:
-							my_string.extend([value(1000*sum(instance.genOperational[n,g,h,i,w]*instance.genCO2TypeFactor[g]*(3.6/instance.genEfficiency[g,i]) for g in instance.Generator if (n,g) in instance.GeneratorsOfNode)/sum(instance.genOperational[n,g,h,i,w] for g in instance.Generator if (n,g) in instance.GeneratorsOfNode))])
-						my_string.extend([calculatePowerEmissionIntensity(n,h,i,w)])
-						if verboseResultWriting is True:
-							print("{hour}:{minute}:{second}: ".format(hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"),
-																	  second=datetime.now().strftime("%S")) + str(my_string))
-						writer.writerow(my_string)
-	f.close()
+		print("{hour}:{minute}:{second}: Writing curtailed power to results_output_curtailed_prod.csv...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+		writer = ResultWriter(result_file_path, 'results_output_curtailed_prod', result_file_format, CSV_EXPORT)
+		writer.writerow(["Node","RESGeneratorType","Period","ExpectedAnnualCurtailment_GWh", "Expected total available power_GWh", "Expected annual curtailment ratio of total capacity_%"])
+		curtailedPower = (expectedScale * (genAvailable - genOperational)).sum(axis=(1, 3)) / 1000
+		totalPowerProduction = (expectedScale * genAvailable).sum(axis=(1, 3)) / 1000
+		curtailedRatio = np.divide(curtailedPower, totalPowerProduction, out=np.zeros_like(curtailedPower), where=totalPowerProduction > 0) * 100
+		[curtailedPower, totalPowerProduction, curtailedRatio] = [curtailedPower.tolist(), totalPowerProduction.tolist(), curtailedRatio.tolist()]
+		for t in instance.Technology:
+			if t == 'Hydro_ror' or t == 'Wind_onshr' or t == 'Wind_offshr_grounded' or t == 'Wind_offshr_floating' or t == 'Solar':
+				for k, (n,g) in enumerate(generatorsOfNode):
+					if (t,g) in instance.GeneratorsOfTechnology:
+						for l, i in enumerate(periods):
+							writer.writerow([n,g,inv_per[int(i-1)], curtailedPower[k][l], totalPowerProduction[k][l], curtailedRatio[k][l]])
+		writer.close()
+
+		#Commenting out this plotting because it is not currently interesting.
+
+		# print("{hour}:{minute}:{second}: Writing plotting file to results_output_EuropePlot.csv...".format(
+		#     hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+		# f = open(result_file_path + "/" + 'results_output_EuropePlot.csv', 'w', newline='')
+		# writer = csv.writer(f)
+		# writer.writerow(["Period","genInstalledCap_MW"])
+		# my_string=[""]
+		# for g in instance.Generator:
+		#     my_string.append(g)
+		# writer.writerow(my_string)
+		# my_string=["Initial"]
+		# for g in instance.Generator:
+		#     my_string.append((value(sum(instance.genInitCap[n,g,1] for n in instance.Node if (n,g) in instance.GeneratorsOfNode))))
+		# writer.writerow(my_string)
+		# for i in instance.Period:
+		#     my_string=[inv_per[int(i-1)]]
+		#     for g in instance.Generator:
+		#         my_string.append(value(sum(instance.genInstalledCap[n,g,i] for n in instance.Node if (n,g) in instance.GeneratorsOfNode)))
+		#     writer.writerow(my_string)
+		# writer.writerow([""])
+		# writer.writerow(["Period","genExpectedAnnualProduction_GWh"])
+		# my_string=[""]
+		# for g in instance.Generator:
+		#     my_string.append(g)
+		# writer.writerow(my_string)
+		# for i in instance.Period:
+		#     my_string=[inv_per[int(i-1)]]
+		#     for g in instance.Generator:
+		#         my_string.append(value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.genOperational[n,g,h,i,w]/1000 for n in instance.Node if (n,g) in instance.GeneratorsOfNode for (s,h) in instance.HoursOfSeason for w in instance.Scenario)))
+		#     writer.writerow(my_string)
+		# writer.writerow([""])
+		# writer.writerow(["Period","storPWInstalledCap_MW"])
+		# my_string=[""]
+		# for b in instance.Storage:
+		#     my_string.append(b)
+		# writer.writerow(my_string)
+		# for i in instance.Period:
+		#     my_string=[inv_per[int(i-1)]]
+		#     for b in instance.Storage:
+		#         my_string.append(value(sum(instance.storPWInstalledCap[n,b,i] for n in instance.Node if (n,b) in instance.StoragesOfNode)))
+		#     writer.writerow(my_string)
+		# writer.writerow([""])
+		# writer.writerow(["Period","storENInstalledCap_MW"])
+		# my_string=[""]
+		# for b in instance.Storage:
+		#     my_string.append(b)
+		# writer.writerow(my_string)
+		# for i in instance.Period:
+		#     my_string=[inv_per[int(i-1)]]
+		#     for b in instance.Storage:
+		#         my_string.append(value(sum(instance.storENInstalledCap[n,b,i] for n in instance.Node if (n,b) in instance.StoragesOfNode)))
+		#     writer.writerow(my_string)
+		# writer.writerow([""])
+		# writer.writerow(["Period","storExpectedAnnualDischarge_GWh"])
+		# my_string=[""]
+		# for b in instance.Storage:
+		#     my_string.append(b)
+		# writer.writerow(my_string)
+		# for i in instance.Period:
+		#     my_string=[inv_per[int(i-1)]]
+		#     for b in instance.Storage:
+		#         my_string.append(value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.storDischarge[n,b,h,i,w]/1000 for n in instance.Node if (n,b) in instance.StoragesOfNode for (s,h) in instance.HoursOfSeason for w in instance.Scenario)))
+		#     writer.writerow(my_string)
+		# f.close()
 
-	if hydrogen is True:
-		print("{hour}:{minute}:{second}: Writing hydrogen investment results to results_hydrogen_production_investments.csv...".format(
+		print("{hour}:{minute}:{second}: Writing summary file to results_output_EuropeSummary.csv...".format(
 			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + "/" + 'results_hydrogen_production_investments.csv', 'w', newline='')
 		if solver == 'Xpress':
-			fError = open(result_file_path + "/" + "errorLog.log",'a')
-		writer = csv.writer(f)
-		my_header = ["Node","Period","New electrolyzer capacity [MW]", "Total electrolyzer capacity [MW]", "New electrolyzer capacity [ton/h]", "Total electrolyzer capacity [ton/h]",
-					 "Expected annual power usage [MWh]","Expected annual electrolyzer hydrogen production [ton]",
-					 'Expected electrolyzer capacity factor', 'New Reformer capacity [ton/h]', 'Total Reformer capacity [ton/h]',
-					 'Expected annual reformer hydrogen production [ton]',"Expected marginal price of hydrogen [EUR/ton]"]
-		writer.writerow(my_header)
-		for n in instance.HydrogenProdNode:
-			for i in instance.Period:
-				try:
-					# hydrogenPrice = value(sum(instance.sceProbab[w]*instance.dual[instance.hydrogen_flow_balance[n,h,i,w]] for w in instance.Scenario))
-					hydrogenPrice = 0
-				except:
-					fError.write('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_investments.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+'). Dual is likely 0 (poorly handled in Xpress). Setting dual = 0.\n')
-					hydrogenPrice = 0
-				if n in instance.ReformerLocations:
-					ReformerCapBuilt = value(sum(instance.ReformerCapBuilt[n,p,i] for p in instance.ReformerPlants)/(instance.hydrogenLHV_kg * 1000))
-					reformerCapTotal = value(sum(instance.ReformerTotalCap[n,p,i] for p in instance.ReformerPlants)/(instance.hydrogenLHV_kg * 1000))
-					reformerExpectedProduction = value(sum(instance.seasScale[s] * instance.sceProbab[w] * instance.hydrogenProducedReformer_ton[n,p,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario for p in instance.ReformerPlants))
+			fError = open(result_file_path + "/" + "errorLog.log",'w')
+		writer = ResultWriter(result_file_path, 'results_output_EuropeSummary', result_file_format, CSV_EXPORT)
+		header = ["Period","Scenario","AnnualCO2emission_Ton","CO2Price_EuroPerTon","CO2Cap_Ton","AnnualGeneration_GWh","AvgCO2factor_TonPerMWh","AvgPowerPrice_Euro","TotAnnualCurtailedRES_GWh","TotAnnualLossesChargeDischarge_GWh","AnnualLossesTransmission_GWh"]
+		if hydrogen is True:
+			header.append("AvgH2MarginalCost_EuroPerKg")
+			# header.append('AverageEmissionsH2_kgCO2PerKgH2')
+		writer.writerow(header)
+		#Annual sums with the axes period, scenario
+		seasonScale = seasScale[None, :, None, None]
+		annualEmissions = (seasonScale * genEmissions).sum(axis=(0, 1)).tolist()
+		annualGeneration = (seasonScale * genOperational).sum(axis=(0, 1))
+		annualGenerationGWh = (annualGeneration / 1000).tolist()
+		annualGeneration = annualGeneration.tolist()
+		curtailedRES = np.array([g == 'Hydrorun-of-the-river' or g == 'Windonshore' or g == 'Windoffshore' or g == 'Solar' for (n,g) in generatorsOfNode], dtype=bool)
+		annualCurtailedRES = (seasonScale * (genAvailable - genOperational))[curtailedRES].sum(axis=(0, 1)) / 1000
+		annualStorLosses = (seasonScale * storLosses).sum(axis=(0, 1)) / 1000
+		#Both directions of the bidirectional arcs
+		arcLinks = np.zeros(len(directionalLinks))
+		for (n1,n2) in instance.BidirectionalArc:
+			arcLinks[linkPosition[n1,n2]] += 1
+			arcLinks[linkPosition[n2,n1]] += 1
+		annualTransmissionLosses = np.tensordot(arcLinks, seasonScale * (1 - lineEfficiency) * transmissionOperational, axes=1).sum(axis=0) / 1000
+		[annualCurtailedRES, annualStorLosses, annualTransmissionLosses] = [annualCurtailedRES.tolist(), annualStorLosses.tolist(), annualTransmissionLosses.tolist()]
+		for l, i in enumerate(periods):
+			for m, w in enumerate(scenarios):
+				power_co2_factor = annualEmissions[l][m]/annualGeneration[l][m]
+				my_string=[inv_per[int(i-1)],w,annualEmissions[l][m]]
+				if EMISSION_CAP:
+					try:
+						my_string.append(-value(instance.dual[instance.emission_cap[i,w]]/(instance.discount_multiplier[i]*instance.operationalDiscountrate*instance.sceProbab[w]*1e6)))
+						my_string.append(value(instance.CO2cap[i]*1e6))
+					except:
+						my_string.append(0)
+						my_string.append(value(instance.CO2cap[i]*1e6))
 				else:
-					ReformerCapBuilt = 0
-					reformerCapTotal = 0
-					reformerExpectedProduction = 0
-				electrolyzerCapacity = value(sum(instance.elyzerTotalCap[n,j,i] / instance.elyzerPowerConsumptionPerTon[j] for j in instance.Period if j<=i))
-				expectedElectrolyzerProduction = value(sum(instance.sceProbab[w] * instance.seasScale[s] * instance.hydrogenProducedElectro[n,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario))
-				electrolyzerCapFactor = (expectedElectrolyzerProduction/(electrolyzerCapacity*8760) if electrolyzerCapacity > 10 else 0)
-				writer.writerow([n,inv_per[int(i-1)],
-								 value(instance.elyzerCapBuilt[n,i,i]),
-								 value(sum(instance.elyzerTotalCap[n,j,i] for j in instance.Period if j <= i)),
-								 value(sum(instance.elyzerCapBuilt[n,j,i] / instance.elyzerPowerConsumptionPerTon[j] for j in instance.Period if j<=i)),
-								 electrolyzerCapacity,
-								 value(sum(instance.seasScale[s] * instance.sceProbab[w] * instance.powerForHydrogen[n,j,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario for j in instance.Period if j<=i)),
-								 expectedElectrolyzerProduction,
-								 electrolyzerCapFactor,
-								 ReformerCapBuilt,
-								 reformerCapTotal,
-								 reformerExpectedProduction,
-								 hydrogenPrice])
-		f.close()
+					my_string.append(value(instance.CO2price[i]))
+					my_string.append("INF")
+				my_string.extend([annualGenerationGWh[l][m],
+								  power_co2_factor,
+								  # value(sum(instance.dual[instance.FlowBalance[n,h,i,w]]/(instance.discount_multiplier[i]*instance.operationalDiscountrate*instance.seasScale[s]*instance.sceProbab[w]) for n in instance.Node for (s,h) in instance.HoursOfSeason)/value(len(instance.HoursOfSeason)*len(instance.Node))),
+								  0, # No duals with MIPs
+								  annualCurtailedRES[l][m],
+								  annualStorLosses[l][m],
+								  annualTransmissionLosses[l][m]])
+				if hydrogen is True:
+					try:
+						my_string.extend([value(sum(instance.dual[instance.hydrogen_flow_balance[n,h,i,w]]/(instance.discount_multiplier[i]*instance.operationalDiscountrate*instance.seasScale[s]*instance.sceProbab[w]) for n in instance.HydrogenProdNode for (s,h) in instance.HoursOfSeason)/value(len(HoursOfSeason)*len(instance.HydrogenProdNode)))])
+					except:
+						# print('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_output_EuropeSummary.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+')')
+						# fError.write('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_output_EuropeSummary.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+'). Dual is likely 0 (poorly handled in Xpress)\n')
+						my_string.extend([0])
+					# green_h2_production = value(sum(instance.seasScale[s]*instance.powerForHydrogen[n,j,h,i,w] for j in instance.Period if j<=i for n in instance.HydrogenProdNode for (s,h) in instance.HoursOfSeason))
+					# green_h2_emissions = 1000 * green_h2_production * power_co2_factor
+					# blue_h2_production = value(sum(instance.seasScale[s] * instance.hydrogenProducedReformer_kg[n,p,h,i,w] for p in instance.ReformerPlants for n in instance.ReformerLocations for (s,h) in instance.HoursOfSeason))
+					# blue_h2_direct_emissions = value(sum(instance.seasScale[s] * instance.ReformerEmissionFactor[p,i] * instance.hydrogenProducedReformer_kg[n,p,h,i,w] for n in instance.ReformerLocations for p in instance.ReformerPlants for (s,h) in instance.HoursOfSeason))
+					# blue_h2_power_emissions = 1000 * power_co2_factor * value(sum(instance.seasScale[s] * instance.ReformerPlantElectricityUse[p,i] * instance.hydrogenProducedReformer_kg[n,p,h,i,w] for n in instance.ReformerLocations for p in instance.ReformerPlants for (s,h) in instance.HoursOfSeason))
+					# my_string.extend([(green_h2_emissions + blue_h2_direct_emissions + blue_h2_power_emissions)/(green_h2_production + blue_h2_production)])
+				writer.writerow(my_string)
 		if solver == 'Xpress':
 			fError.write('\n')
 			fError.close()
-		f.close()
-
-
-		# print("{hour}:{minute}:{second}: Writing detailed Reformer investment results to results_hydrogen_electrolyzer_detailed_check.csv...".format(
-		# 	hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + "/" + 'results_hydrogen_electrolyzer_detailed_check.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# my_header = ['Node','Buying Period','Operating period','New capacity','Total capacity']
-		# writer.writerow(my_header)
-		# for n in instance.HydrogenProdNode:
-		# 	for j in instance.Period:
-		# 		for i in instance.Period:
-		# 			my_string= [n,j,i,
-		# 						value(instance.elyzerCapBuilt[n,j,i]),
-		# 						value(instance.elyzerTotalCap[n,j,i])]
-		# 			writer.writerow(my_string)
-		# f.close()
-
-
-		print("{hour}:{minute}:{second}: Writing detailed reformer investment results to results_hydrogen_reformer_detailed_investments.csv...".format(
+		writer.writerow([""])
+		writer.writerow(["GeneratorType","Period","genInvCap_MW","genInstalledCap_MW","TotDiscountedInvestmentCost_Euro","genExpectedAnnualProduction_GWh"])
+		genInvCost = np.array([[value(instance.genInvCost[g,i]) for i in periods] for g in generators])
+		typeInvCap = genOfType @ genInvCap
+		typeInstalledCap = (genOfType @ genInstalledCap).tolist()
+		typeInvestmentCost = (discountMultiplier[None, :] * typeInvCap * genInvCost).tolist()
+		typeProduction = (genOfType @ (expectedScale * genOperational).sum(axis=(1, 3)) / 1000).tolist()
+		typeInvCap = typeInvCap.tolist()
+		for k, g in enumerate(generators):
+			for l, i in enumerate(periods):
+				writer.writerow([g,inv_per[int(i-1)],typeInvCap[k][l],typeInstalledCap[k][l],typeInvestmentCost[k][l],typeProduction[k][l]])
+		writer.writerow([""])
+		writer.writerow(["StorageType","Period","storPWInvCap_MW","storPWInstalledCap_MW","storENInvCap_MWh","storENInstalledCap_MWh","TotDiscountedInvestmentCostPWEN_Euro","ExpectedAnnualDischargeVolume_GWh"])
+		storages = list(instance.Storage)
+		storOfType = np.array([[b2 == b for (n,b2) in storagesOfNode] for b in storages], dtype=float)
+		storPWInvCost = np.array([[value(instance.storPWInvCost[b,i]) for i in periods] for b in storages])
+		storENInvCost = np.array([[value(instance.storENInvCost[b,i]) for i in periods] for b in storages])
+		typePWInvCap = storOfType @ var_array(instance.storPWInvCap, [storagesOfNode, periods])
+		typePWInstalledCap = (storOfType @ var_array(instance.storPWInstalledCap, [storagesOfNode, periods])).tolist()
+		typeENInvCap = storOfType @ var_array(instance.storENInvCap, [storagesOfNode, periods])
+		typeENInstalledCap = (storOfType @ var_array(instance.storENInstalledCap, [storagesOfNode, periods])).tolist()
+		typeInvestmentCost = (discountMultiplier[None, :] * (typePWInvCap * storPWInvCost + typeENInvCap * storENInvCost)).tolist()
+		typeDischarge = (storOfType @ (expectedScale * storDischarge).sum(axis=(1, 3)) / 1000).tolist()
+		[typePWInvCap, typeENInvCap] = [typePWInvCap.tolist(), typeENInvCap.tolist()]
+		for k, b in enumerate(storages):
+			for l, i in enumerate(periods):
+				writer.writerow([b,inv_per[int(i-1)],typePWInvCap[k][l],typePWInstalledCap[k][l],typeENInvCap[k][l],typeENInstalledCap[k][l],typeInvestmentCost[k][l],typeDischarge[k][l]])
+		writer.close()
+
+		print("{hour}:{minute}:{second}: Writing operational results to results_output_Operational.csv...".format(
 			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + "/" + 'results_hydrogen_reformer_detailed_investments.csv', 'w', newline='')
-		writer = csv.writer(f)
-		my_header = ['Node','Reformer plant type','Period','New capacity [MW]','Total capacity [MW]','New capacity [ton/h]','Total capacity [ton/h]',
-					 'Expected production [ton H2/year]', 'Expected capacity factor [%]', 'Expected emissions [tons CO2/year]', 'Expected electricity consumption [GWh]']
+		writer = ResultWriter(result_file_path, 'results_output_Operational', result_file_format, CSV_EXPORT)
+		my_header = ["Node","Period","Scenario","Season","Hour"]
+		for g in instance.Generator:
+			my_string = str(g)+"_MW"
+			my_header.append(my_string)
+		my_header.extend(["storCharge_MW","storDischarge_MW","storEnergyLevel_MWh","LossesChargeDischargeBleed_MW","FlowOut_MW","FlowIn_MW","LossesFlowIn_MW","LoadShed_MW","Price_EURperMWh","AvgCO2_kgCO2perMWh_PRODUCTION","AvgCO2_kgCO2perMWh_TOTAL"])
 		writer.writerow(my_header)
-		for n in instance.ReformerLocations:
-			for p in instance.ReformerPlants:
-				for i in instance.Period:
-					reformerCap = value(instance.ReformerTotalCap[n,p,i])
-					reformerProduction = value(sum(instance.sceProbab[w] * instance.seasScale[s] * instance.hydrogenProducedReformer_ton[n,p,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario))
-					capFactor = (reformerProduction / (8760*(reformerCap/value(instance.hydrogenLHV_kg * 1000))) if reformerCap > 1 else 0)
-					my_string = [n,p,inv_per[int(i)-1],
-								 value(instance.ReformerCapBuilt[n,p,i]),
-								 reformerCap,
-								 value(instance.ReformerCapBuilt[n,p,i]/(instance.hydrogenLHV_kg * 1000)),
-								 reformerCap/(value(instance.hydrogenLHV_kg) * 1000),
-								 reformerProduction,
-								 capFactor,
-								 reformerProduction * value(instance.ReformerEmissionFactor[p,i]),
-								 reformerProduction * value(instance.ReformerPlantElectricityUse[p,i]/1000)]
-					writer.writerow(my_string)
-		f.close()
+		#Columns with the axes node, hour, period, scenario, column
+		operational = np.stack([-nodeStorCharge, nodeStorDischarge, np.tensordot(storAtNode, storOperational, axes=1),
+								-np.tensordot(storAtNode, storLosses + (1 - storageBleedEff)*storOperational, axes=1),
+								-nodeTransmissionOut, nodeTransmissionIn, -np.tensordot(linkInAtNode, (1 - lineEfficiency)*transmissionOperational, axes=1),
+								loadShed, np.zeros_like(loadShed)], axis=-1) # No duals with MIPs (price)
+		productionIntensity = np.divide(nodeEmissions, nodeGeneration, out=np.zeros_like(nodeEmissions), where=nodeGeneration > 0)
+		linkFrom = np.array([nodes.index(n1) for (n1,n2) in directionalLinks], dtype=int)
+		linkTo = np.array([nodes.index(n2) for (n1,n2) in directionalLinks], dtype=int)
+		totalIntensity = power_emission_intensity(nodeEmissions.reshape(len(nodes), -1), nodeGeneration.reshape(len(nodes), -1),
+												  transmissionReceived.reshape(len(directionalLinks), -1), linkFrom, linkTo).reshape(nodeGeneration.shape)
+		for k, n in enumerate(nodes):
+			#Production of the generator types (0 for types without generator at the node) and the other columns with the
+			#axes period, scenario, hour
+			genNode = np.tensordot(genOfType * genAtNode[k], genOperational, axes=1).transpose(2, 3, 1, 0)
+			genNode = genNode.reshape(-1, len(generators)).tolist()
+			operationalNode = operational[k].transpose(1, 2, 0, 3).reshape(len(genNode), -1).tolist()
+			generationNode = nodeGeneration[k].transpose(1, 2, 0).ravel().tolist()
+			productionIntensityNode = productionIntensity[k].transpose(1, 2, 0).ravel().tolist()
+			totalIntensityNode = totalIntensity[k].transpose(1, 2, 0).ravel().tolist()
+			for r, (i, w, (s,h)) in enumerate(itertools.product(periods, scenarios, seasonHours)):
+				my_string = [n,inv_per[int(i-1)],w,s,h] + genNode[r] + operationalNode[r]
+				#Empty without production, so that the total intensity stays in its column
+				my_string.extend([productionIntensityNode[r] if generationNode[r] > 0 else None])
+				my_string.extend([totalIntensityNode[r]])
+				if verboseResultWriting is True:
+					print("{hour}:{minute}:{second}: ".format(hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"),
+															  second=datetime.now().strftime("%S")) + str(my_string))
+				writer.writerow(my_string)
+		writer.close()
 
-
-		if h2storage is True:
-			print("{hour}:{minute}:{second}: Writing hydrogen storage investment results to results_hydrogen_storage_investments.csv...".format(
+		if hydrogen is True:
+			print("{hour}:{minute}:{second}: Writing hydrogen investment results to results_hydrogen_production_investments.csv...".format(
 				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-			f = open(result_file_path + "/" + 'results_hydrogen_storage_investments.csv', 'w', newline='')
-			writer = csv.writer(f)
-			my_header = ['Node','Period','New storage capacity [ton]','Total storage capacity [ton]', 'Discounted cost of new capacity [EUR]','Discounted total cost [EUR]']
+			if solver == 'Xpress':
+				fError = open(result_file_path + "/" + "errorLog.log",'a')
+			writer = ResultWriter(result_file_path, 'results_hydrogen_production_investments', result_file_format, CSV_EXPORT)
+			my_header = ["Node","Period","New electrolyzer capacity [MW]", "Total electrolyzer capacity [MW]", "New electrolyzer capacity [ton/h]", "Total electrolyzer capacity [ton/h]",
+						 "Expected annual power usage [MWh]","Expected annual electrolyzer hydrogen production [ton]",
+						 'Expected electrolyzer capacity factor', 'New Reformer capacity [ton/h]', 'Total Reformer capacity [ton/h]',
+						 'Expected annual reformer hydrogen production [ton]',"Expected marginal price of hydrogen [EUR/ton]"]
 			writer.writerow(my_header)
 			for n in instance.HydrogenProdNode:
 				for i in instance.Period:
-					my_string = [n,inv_per[int(i)-1],
-								 value(instance.hydrogenStorageBuilt[n,i]),
-								 value(instance.hydrogenTotalStorage[n,i]),
-								 value(instance.hydrogenStorageBuilt[n,i] * instance.hydrogenStorageInvCost[i]),
-								 value(sum(instance.hydrogenStorageBuilt[n,j] * instance.hydrogenStorageInvCost[j] for j in instance.Period if j<=i))]
-					writer.writerow(my_string)
-			f.close()
+					try:
+						# hydrogenPrice = value(sum(instance.sceProbab[w]*instance.dual[instance.hydrogen_flow_balance[n,h,i,w]] for w in instance.Scenario))
+						hydrogenPrice = 0
+					except:
+						fError.write('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_investments.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+'). Dual is likely 0 (poorly handled in Xpress). Setting dual = 0.\n')
+						hydrogenPrice = 0
+					if n in instance.ReformerLocations:
+						ReformerCapBuilt = value(sum(instance.ReformerCapBuilt[n,p,i] for p in instance.ReformerPlants)/(instance.hydrogenLHV_kg * 1000))
+						reformerCapTotal = value(sum(instance.ReformerTotalCap[n,p,i] for p in instance.ReformerPlants)/(instance.hydrogenLHV_kg * 1000))
+						reformerExpectedProduction = value(sum(instance.seasScale[s] * instance.sceProbab[w] * instance.hydrogenProducedReformer_ton[n,p,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario for p in instance.ReformerPlants))
+					else:
+						ReformerCapBuilt = 0
+						reformerCapTotal = 0
+						reformerExpectedProduction = 0
+					electrolyzerCapacity = value(sum(instance.elyzerTotalCap[n,j,i] / instance.elyzerPowerConsumptionPerTon[j] for j in instance.Period if j<=i))
+					expectedElectrolyzerProduction = value(sum(instance.sceProbab[w] * instance.seasScale[s] * instance.hydrogenProducedElectro[n,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario))
+					electrolyzerCapFactor = (expectedElectrolyzerProduction/(electrolyzerCapacity*8760) if electrolyzerCapacity > 10 else 0)
+					writer.writerow([n,inv_per[int(i-1)],
+									 value(instance.elyzerCapBuilt[n,i]),
+									 value(sum(instance.elyzerTotalCap[n,j,i] for j in instance.Period if j <= i)),
+									 value(instance.elyzerCapBuilt[n,i] / instance.elyzerPowerConsumptionPerTon[i]),
+									 electrolyzerCapacity,
+									 value(sum(instance.seasScale[s] * instance.sceProbab[w] * instance.powerForHydrogen[n,j,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario for j in instance.Period if j<=i)),
+									 expectedElectrolyzerProduction,
+									 electrolyzerCapFactor,
+									 ReformerCapBuilt,
+									 reformerCapTotal,
+									 reformerExpectedProduction,
+									 hydrogenPrice])
+			writer.close()
+			if solver == 'Xpress':
+				fError.write('\n')
+				fError.close()
+
+
+			# print("{hour}:{minute}:{second}: Writing detailed Reformer investment results to results_hydrogen_electrolyzer_detailed_check.csv...".format(
+			# 	hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + "/" + 'results_hydrogen_electrolyzer_detailed_check.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# my_header = ['Node','Buying Period','Operating period','New capacity','Total capacity']
+			# writer.writerow(my_header)
+			# for n in instance.HydrogenProdNode:
+			# 	for j in instance.Period:
+			# 		for i in instance.Period:
+			# 			my_string= [n,j,i,
+			# 						value(instance.elyzerCapBuilt[n,j,i]),
+			# 						value(instance.elyzerTotalCap[n,j,i])]
+			# 			writer.writerow(my_string)
+			# f.close()
+
+
+			print("{hour}:{minute}:{second}: Writing detailed reformer investment results to results_hydrogen_reformer_detailed_investments.csv...".format(
+				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			writer = ResultWriter(result_file_path, 'results_hydrogen_reformer_detailed_investments', result_file_format, CSV_EXPORT)
+			my_header = ['Node','Reformer plant type','Period','New capacity [MW]','Total capacity [MW]','New capacity [ton/h]','Total capacity [ton/h]',
+						 'Expected production [ton H2/year]', 'Expected capacity factor [%]', 'Expected emissions [tons CO2/year]', 'Expected electricity consumption [GWh]']
+			writer.writerow(my_header)
+			for n in instance.ReformerLocations:
+				for p in instance.ReformerPlants:
+					for i in instance.Period:
+						reformerCap = value(instance.ReformerTotalCap[n,p,i])
+						reformerProduction = value(sum(instance.sceProbab[w] * instance.seasScale[s] * instance.hydrogenProducedReformer_ton[n,p,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario))
+						capFactor = (reformerProduction / (8760*(reformerCap/value(instance.hydrogenLHV_kg * 1000))) if reformerCap > 1 else 0)
+						my_string = [n,p,inv_per[int(i)-1],
+									 value(instance.ReformerCapBuilt[n,p,i]),
+									 reformerCap,
+									 value(instance.ReformerCapBuilt[n,p,i]/(instance.hydrogenLHV_kg * 1000)),
+									 reformerCap/(value(instance.hydrogenLHV_kg) * 1000),
+									 reformerProduction,
+									 capFactor,
+									 reformerProduction * value(instance.ReformerEmissionFactor[p,i]),
+									 reformerProduction * value(instance.ReformerPlantElectricityUse[p,i]/1000)]
+						writer.writerow(my_string)
+			writer.close()
+
 
-			print("{hour}:{minute}:{second}: Writing hydrogen storage operational results to results_hydrogen_storage_operational.csv...".format(
+			if h2storage is True:
+				print("{hour}:{minute}:{second}: Writing hydrogen storage investment results to results_hydrogen_storage_investments.csv...".format(
+					hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+				writer = ResultWriter(result_file_path, 'results_hydrogen_storage_investments', result_file_format, CSV_EXPORT)
+				my_header = ['Node','Period','New storage capacity [ton]','Total storage capacity [ton]', 'Discounted cost of new capacity [EUR]','Discounted total cost [EUR]']
+				writer.writerow(my_header)
+				for n in instance.HydrogenProdNode:
+					for i in instance.Period:
+						my_string = [n,inv_per[int(i)-1],
+									 value(instance.hydrogenStorageBuilt[n,i]),
+									 value(instance.hydrogenTotalStorage[n,i]),
+									 value(instance.hydrogenStorageBuilt[n,i] * instance.hydrogenStorageInvCost[i]),
+									 value(sum(instance.hydrogenStorageBuilt[n,j] * instance.hydrogenStorageInvCost[j] for j in instance.Period if j<=i))]
+						writer.writerow(my_string)
+				writer.close()
+
+				print("{hour}:{minute}:{second}: Writing hydrogen storage operational results to results_hydrogen_storage_operational.csv...".format(
+					hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+				writer = ResultWriter(result_file_path, 'results_hydrogen_storage_operational', result_file_format, CSV_EXPORT)
+				my_header = ['Node','Period','Scenario', 'Season',' Hour','Initial storage [ton]','Charge [ton]','Discharge [ton]','Final stored [ton]']
+				writer.writerow(my_header)
+				for n in instance.HydrogenProdNode:
+					for i in instance.Period:
+						for w in instance.Scenario:
+							for (s,h) in instance.HoursOfSeason:
+								my_string= [n,inv_per[i-1], w, s, h]
+								if h in instance.FirstHoursOfRegSeason or h in instance.FirstHoursOfPeakSeason:
+									my_string.extend([value(instance.hydrogenStorageInitOperational * instance.hydrogenTotalStorage[n,i])])
+								else:
+									my_string.extend([value(instance.hydrogenStorageOperational[n,h-1,i,w])])
+								my_string.extend([value(instance.hydrogenChargeStorage[n,h,i,w]),
+												  value(instance.hydrogenDischargeStorage[n,h,i,w]),
+												  value(instance.hydrogenStorageOperational[n,h,i,w])])
+								writer.writerow(my_string)
+				writer.close()
+
+
+			print("{hour}:{minute}:{second}: Writing hydrogen production results to results_hydrogen_production.csv...".format(
 				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-			f = open(result_file_path + "/" + 'results_hydrogen_storage_operational.csv', 'w', newline='')
-			writer = csv.writer(f)
-			my_header = ['Node','Period','Scenario', 'Season',' Hour','Initial storage [ton]','Charge [ton]','Discharge [ton]','Final stored [ton]']
+			writer = ResultWriter(result_file_path, 'results_hydrogen_production', result_file_format, CSV_EXPORT)
+			my_header = ["Node", "Period", "Scenario", "Season", "Hour", "Power for hydrogen [MWh]", "Electrolyzer production [ton]", "Electrolyzer production SCALED [ton]", 'Reformer production [ton]', 'Reformer production SCALED [ton]', 'Emissions per ton [ton CO2/ton H2]']
 			writer.writerow(my_header)
 			for n in instance.HydrogenProdNode:
 				for i in instance.Period:
 					for w in instance.Scenario:
 						for (s,h) in instance.HoursOfSeason:
-							my_string= [n,inv_per[i-1], w, s, h]
-							if h in instance.FirstHoursOfRegSeason or h in instance.FirstHoursOfPeakSeason:
-								my_string.extend([value(instance.hydrogenStorageInitOperational * instance.hydrogenTotalStorage[n,i])])
+							my_string = [n, inv_per[int(i-1)], w, s, h,
+										 value(sum(instance.powerForHydrogen[n,j,h,i,w] for j in instance.Period if j<=i)),
+										 value(instance.hydrogenProducedElectro[n,h,i,w]),
+										 value(instance.seasScale[s] * instance.hydrogenProducedElectro[n,h,i,w])]
+							# power_emissions_kg_per_MWh = calculatePowerEmissionIntensity(n,h,i,w) # Commented out this calculation because it's not needed.
+							if n in instance.ReformerLocations:
+								blue_h2_production_ton = value(sum(instance.hydrogenProducedReformer_ton[n,p,h,i,w] for p in instance.ReformerPlants))
+								blue_h2_direct_emissions_ton = value(sum(instance.ReformerEmissionFactor[p,i] * instance.hydrogenProducedReformer_ton[n,p,h,i,w] for p in instance.ReformerPlants))
+								# blue_h2_emissions_from_power_ton = power_emissions_kg_per_MWh/1000 * value(sum(instance.ReformerPlantElectricityUse[p,i] * instance.hydrogenProducedReformer_ton[n,p,h,i,w] for p in instance.ReformerPlants))
+								blue_h2_emissions_from_power_ton = 0 # Emissions from use of power is 0, because marginal emissions from a sector (here, there power sector) which is already capped on emissions is 0.
 							else:
-								my_string.extend([value(instance.hydrogenStorageOperational[n,h-1,i,w])])
-							my_string.extend([value(instance.hydrogenChargeStorage[n,h,i,w]),
-											  value(instance.hydrogenDischargeStorage[n,h,i,w]),
-											  value(instance.hydrogenStorageOperational[n,h,i,w])])
-							writer.writerow(my_string)
-			f.close()
-
-
-		print("{hour}:{minute}:{second}: Writing hydrogen production results to results_hydrogen_production.csv...".format(
-			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_hydrogen_production.csv', 'w', newline='')
-		writer = csv.writer(f)
-		my_header = ["Node", "Period", "Scenario", "Season", "Hour", "Power for hydrogen [MWh]", "Electrolyzer production [ton]", "Electrolyzer production SCALED [ton]", 'Reformer production [ton]', 'Reformer production SCALED [ton]', 'Emissions per ton [ton CO2/ton H2]']
-		writer.writerow(my_header)
-		for n in instance.HydrogenProdNode:
-			for i in instance.Period:
-				for w in instance.Scenario:
-					for (s,h) in instance.HoursOfSeason:
-						my_string = [n, inv_per[int(i-1)], w, s, h,
-									 value(sum(instance.powerForHydrogen[n,j,h,i,w] for j in instance.Period if j<=i)),
-									 value(instance.hydrogenProducedElectro[n,h,i,w]),
-									 value(instance.seasScale[s] * instance.hydrogenProducedElectro[n,h,i,w])]
-						# power_emissions_kg_per_MWh = calculatePowerEmissionIntensity(n,h,i,w) # Commented out this calculation because it's not needed.
-						if n in instance.ReformerLocations:
-							blue_h2_production_ton = value(sum(instance.hydrogenProducedReformer_ton[n,p,h,i,w] for p in instance.ReformerPlants))
-							blue_h2_direct_emissions_ton = value(sum(instance.ReformerEmissionFactor[p,i] * instance.hydrogenProducedReformer_ton[n,p,h,i,w] for p in instance.ReformerPlants))
-							# blue_h2_emissions_from_power_ton = power_emissions_kg_per_MWh/1000 * value(sum(instance.ReformerPlantElectricityUse[p,i] * instance.hydrogenProducedReformer_ton[n,p,h,i,w] for p in instance.ReformerPlants))
-							blue_h2_emissions_from_power_ton = 0 # Emissions from use of power is 0, because marginal emissions from a sector (here, there power sector) which is already capped on emissions is 0.
-						else:
-							blue_h2_production_ton = 0
-							blue_h2_direct_emissions_ton = 0
-							blue_h2_emissions_from_power_ton = 0
-						my_string.extend([blue_h2_production_ton,
-										  value(instance.seasScale[s] * blue_h2_production_ton)])
-
-						green_h2_production_ton = value(instance.hydrogenProducedElectro[n,h,i,w])
-						# green_h2_emissions_ton = power_emissions_kg_per_MWh/1000 * value(sum(instance.powerForHydrogen[n,j,h,i,w] for j in instance.Period if j<=i))
-						green_h2_emissions_ton = 0 # Emissions from green H2 is 0, because marginal emissions from a sector (here, there power sector) which is already capped on emissions is 0.
-						total_h2_production = blue_h2_production_ton + green_h2_production_ton
-						if total_h2_production < .5:
-							total_h2_emissions = 0
-							my_string.extend([0])
-						else:
-							total_h2_emissions = blue_h2_direct_emissions_ton + blue_h2_emissions_from_power_ton + green_h2_emissions_ton
-							my_string.extend([total_h2_emissions / total_h2_production])
+								blue_h2_production_ton = 0
+								blue_h2_direct_emissions_ton = 0
+								blue_h2_emissions_from_power_ton = 0
+							my_string.extend([blue_h2_production_ton,
+											  value(instance.seasScale[s] * blue_h2_production_ton)])
+
+							green_h2_production_ton = value(instance.hydrogenProducedElectro[n,h,i,w])
+							# green_h2_emissions_ton = power_emissions_kg_per_MWh/1000 * value(sum(instance.powerForHydrogen[n,j,h,i,w] for j in instance.Period if j<=i))
+							green_h2_emissions_ton = 0 # Emissions from green H2 is 0, because marginal emissions from a sector (here, there power sector) which is already capped on emissions is 0.
+							total_h2_production = blue_h2_production_ton + green_h2_production_ton
+							if total_h2_production < .5:
+								total_h2_emissions = 0
+								my_string.extend([0])
+							else:
+								total_h2_emissions = blue_h2_direct_emissions_ton + blue_h2_emissions_from_power_ton + green_h2_emissions_ton
+								my_string.extend([total_h2_emissions / total_h2_production])
 
-						writer.writerow(my_string)
-		f.close()
+							writer.writerow(my_string)
+			writer.close()
 
-		print("{hour}:{minute}:{second}: Writing hydrogen sales results to results_hydrogen_use.csv...".format(
-			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_hydrogen_use.csv', 'w', newline='')
-		if solver == 'Xpress':
-			fError = open(result_file_path + "/" + "errorLog.log",'a')
-		writer = csv.writer(f)
-		my_header = ["Node", "Period", "Scenario", "Season", "Hour", "Hydrogen stored [ton]", "Hydrogen withdrawn from storage [ton]", "Total demand in period [ton]", "Average hourly demand [ton]", "Demand shed [ton]", "Demand met [ton]", "Demand met SCALED [ton]", "Hydrogen burned for power [ton]", "Hydrogen price [EUR]", 'Hydrogen exported [ton]', 'Hydrogen imported [ton]']
-		writer.writerow(my_header)
-		if h2storage is True:
-			for n in instance.HydrogenProdNode:
-				for i in instance.Period:
-					for w in instance.Scenario:
-						for (s, h) in instance.HoursOfSeason:
-							try:
-								dualVar = value(instance.dual[instance.hydrogen_flow_balance[n,h,i,w]])
-							except:
-								# print('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_use.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+')')
-								# fError.write('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_use.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+'). Dual is likely 0 (poorly handled in Xpress)\n')
-								dualVar = 0
-							my_string = [n, inv_per[int(i - 1)], w, s, h,
-										 value(instance.hydrogenChargeStorage[n,h,i,w]),
-										 value(instance.hydrogenDischargeStorage[n,h,i,w]),
-										 value(instance.hydrogenDemand[n,i,w])*8760,
+			print("{hour}:{minute}:{second}: Writing hydrogen sales results to results_hydrogen_use.csv...".format(
+				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			if solver == 'Xpress':
+				fError = open(result_file_path + "/" + "errorLog.log",'a')
+			writer = ResultWriter(result_file_path, 'results_hydrogen_use', result_file_format, CSV_EXPORT)
+			my_header = ["Node", "Period", "Scenario", "Season", "Hour", "Hydrogen stored [ton]", "Hydrogen withdrawn from storage [ton]", "Total demand in period [ton]", "Average hourly demand [ton]", "Demand shed [ton]", "Demand met [ton]", "Demand met SCALED [ton]", "Hydrogen burned for power [ton]", "Hydrogen price [EUR]", 'Hydrogen exported [ton]', 'Hydrogen imported [ton]']
+			writer.writerow(my_header)
+			if h2storage is True:
+				for n in instance.HydrogenProdNode:
+					for i in instance.Period:
+						for w in instance.Scenario:
+							for (s, h) in instance.HoursOfSeason:
+								try:
+									dualVar = value(instance.dual[instance.hydrogen_flow_balance[n,h,i,w]])
+								except:
+									# print('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_use.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+')')
+									# fError.write('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_use.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+'). Dual is likely 0 (poorly handled in Xpress)\n')
+									dualVar = 0
+								my_string = [n, inv_per[int(i - 1)], w, s, h,
+											 value(instance.hydrogenChargeStorage[n,h,i,w]),
+											 value(instance.hydrogenDischargeStorage[n,h,i,w]),
+											 value(instance.hydrogenDemand[n,i,w])*8760,
+											 value(instance.hydrogenDemand[n,i,w]),
+											 value(instance.h2_demand_shed[n,h,i,w]),
+											 value(instance.meetHydrogenDemand[n,h,i,w]),
+											 value(instance.seasScale[s] * instance.meetHydrogenDemand[n,h,i,w]),
+											 value(sum(instance.hydrogenForPower[g,n,h,i,w] for g in instance.HydrogenGenerators)),
+											 dualVar,
+											 value(sum(instance.hydrogenSentPipeline[n,n2,t,h,i,w] for n2 in instance.HydrogenLinks[n] for t in instance.PipelineTypesOfLink[n,n2])),
+											 value(sum(instance.hydrogenSentPipeline[n2,n,t,h,i,w] for n2 in instance.HydrogenLinks[n] for t in instance.PipelineTypesOfLink[n2,n]))]
+								writer.writerow(my_string)
+				if solver == 'Xpress':
+					fError.write('\n')
+					fError.close()
+			else:
+				for n in instance.HydrogenProdNode:
+					for i in instance.Period:
+						for w in instance.Scenario:
+							for (s, h) in instance.HoursOfSeason:
+								try:
+									dualVar = value(instance.dual[instance.hydrogen_flow_balance[n,h,i,w]])
+								except:
+									# print('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_use.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+')')
+									# fError.write('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_use.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+'). Dual is likely 0 (poorly handled in Xpress)\n')
+									dualVar = 0
+								my_string = [n, inv_per[int(i - 1)], w, s, h,
+										 0,
+										 0,
 										 value(instance.hydrogenDemand[n,i,w]),
-										 value(instance.h2_demand_shed[n,h,i,w]),
-										 value(instance.meetHydrogenDemand[n,h,i,w]),
-										 value(instance.seasScale[s] * instance.meetHydrogenDemand[n,h,i,w]),
 										 value(sum(instance.hydrogenForPower[g,n,h,i,w] for g in instance.HydrogenGenerators)),
 										 dualVar,
-										 value(sum(instance.hydrogenSentPipeline[n,n2,t,h,i,w] for n2 in instance.HydrogenLinks[n] for t in instance.PipelineType if (n,n2,t) in instance.PipelineTypeOfDirectionalLink)),
-										 value(sum(instance.hydrogenSentPipeline[n2,n,t,h,i,w] for n2 in instance.HydrogenLinks[n] for t in instance.PipelineType if (n2,n,t) in instance.PipelineTypeOfDirectionalLink))]
-							writer.writerow(my_string)
-			if solver == 'Xpress':
-				fError.write('\n')
-				fError.close()
-		else:
-			for n in instance.HydrogenProdNode:
-				for i in instance.Period:
-					for w in instance.Scenario:
-						for (s, h) in instance.HoursOfSeason:
-							try:
-								dualVar = value(instance.dual[instance.hydrogen_flow_balance[n,h,i,w]])
-							except:
-								# print('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_use.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+')')
-								# fError.write('Something went wrong when accessing dual for hydrogen_flow_balance with key for results_hydrogen_use.csv. Key (node,period,scenario)=('+n+','+str(i)+','+w+'). Dual is likely 0 (poorly handled in Xpress)\n')
-								dualVar = 0
-							my_string = [n, inv_per[int(i - 1)], w, s, h,
-									 0,
-									 0,
-									 value(instance.hydrogenDemand[n,i,w]),
-									 value(sum(instance.hydrogenForPower[g,n,h,i,w] for g in instance.HydrogenGenerators)),
-									 dualVar,
-									 value(sum(instance.hydrogenSentPipeline[n,n2,t,h,i,w] for n2 in instance.HydrogenLinks[n] for t in instance.PipelineType if (n,n2,t) in instance.PipelineTypeOfDirectionalLink))]
-							writer.writerow(my_string)
-			if solver == 'Xpress':
-				fError.write('\n')
-				fError.close()
-		f.close()
-
-		print("{hour}:{minute}:{second}: Writing hydrogen pipeline investment results to results_hydrogen_pipeline_investments.csv...".format(
-			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_hydrogen_pipeline_investments.csv', 'w', newline='')
-		writer = csv.writer(f)
-		my_header = ["Between node", "And node", "Pipeline type", "Period", "Pipelines built [#]", "Pipeline total capacity [ton]",
-					 "Discounted cost of (newly) built pipeline [EUR]", "Expected hydrogen transmission [tons]"]
-		writer.writerow(my_header)
-		for (n1,n2) in instance.HydrogenBidirectionPipelines:
-			for i in instance.Period:
-				for t in instance.PipelineType:
-					if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
-						my_string = [n1, n2, t, inv_per[int(i-1)],
-									 value(instance.hydrogenPipelineBuilt[n1,n2,t,i]),
-									 value(instance.totalHydrogenPipelineCapacity[n1,n2,t,i]),
-									 value(instance.discount_multiplier[i] * (instance.hydrogenPipelineBuilt[n1,n2,t,i] * instance.hydrogenPipelineInvCost[n1,n2,t])),
-									 value(sum(instance.sceProbab[w]*instance.seasScale[s]*(instance.hydrogenSentPipeline[n1,n2,t,h,i,w] + instance.hydrogenSentPipeline[n2,n1,t,h,i,w]) for (s,h) in instance.HoursOfSeason for w in instance.Scenario))]
-						writer.writerow(my_string)
-		f.close()
-
-		print(
-			"{hour}:{minute}:{second}: Writing hydrogen pipeline operational results to results_hydrogen_pipeline_operational.csv...".format(
+										 value(sum(instance.hydrogenSentPipeline[n,n2,t,h,i,w] for n2 in instance.HydrogenLinks[n] for t in instance.PipelineTypesOfLink[n,n2]))]
+								writer.writerow(my_string)
+				if solver == 'Xpress':
+					fError.write('\n')
+					fError.close()
+			writer.close()
+
+			print("{hour}:{minute}:{second}: Writing hydrogen pipeline investment results to results_hydrogen_pipeline_investments.csv...".format(
 				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_hydrogen_pipeline_operational.csv', 'w', newline='')
-		writer = csv.writer(f)
-		my_header = ["From node", "To node", "PipelineType", "Period", "Season", "Scenario", "Hour", "Hydrogen sent [ton]", "Power consumed in each node for transport (MWh)"]
-		writer.writerow(my_header)
-		for (n1,n2) in instance.AllowedHydrogenLinks:
-			if (n1,n2) in instance.HydrogenBidirectionPipelines:
-				for t in instance.PipelineType:
-					if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
-						for i in instance.Period:
-							for (s,h) in instance.HoursOfSeason:
-								for w in instance.Scenario:
-									my_string = [n1,n2,t,inv_per[int(i-1)],s,w,h,
-												 value(instance.hydrogenSentPipeline[n1,n2,t,h,i,w]),
-												 value(0.5*(instance.hydrogenSentPipeline[n1,n2,t,h,i,w] * instance.hydrogenPipelinePowerDemandPerTon[n1,n2,t]))]
-									writer.writerow(my_string)
-			else:
+			writer = ResultWriter(result_file_path, 'results_hydrogen_pipeline_investments', result_file_format, CSV_EXPORT)
+			my_header = ["Between node", "And node", "Pipeline type", "Period", "Pipelines built [#]", "Pipeline total capacity [ton]",
+						 "Discounted cost of (newly) built pipeline [EUR]", "Expected hydrogen transmission [tons]"]
+			writer.writerow(my_header)
+			for (n1,n2) in instance.HydrogenBidirectionPipelines:
 				for i in instance.Period:
 					for t in instance.PipelineType:
 						if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
-							for (s,h) in instance.HoursOfSeason:
-								for w in instance.Scenario:
-									my_string = [n1,n2,t,inv_per[int(i-1)],s,w,h,
-												 value(instance.hydrogenSentPipeline[n1,n2,t,h,i,w]),
-												 value(0.5*(instance.hydrogenSentPipeline[n1,n2,t,h,i,w] * instance.hydrogenPipelinePowerDemandPerTon[n2,n1,t]))]
-									writer.writerow(my_string)
-		f.close()
-
-		print("{hour}:{minute}:{second}: Writing CO2 pipeline investment results to results_CO2_pipeline_investments.csv...".format(
-			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_CO2_pipeline_investments.csv', 'w', newline='')
-		writer = csv.writer(f)
-		my_header = ["Between node", "And node", "Pipeline type", "Period", "Pipelines built [#]", "Pipeline total capacity [ton]",
-					 "Discounted cost of (newly) built pipeline [EUR]", "Expected CO2 transmission [tons]"]
-		writer.writerow(my_header)
-		for (n1,n2) in instance.CO2BidirectionalPipelines:
-			for i in instance.Period:
-				for t in instance.PipelineType:
-					if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
-						my_string = [n1, n2, t, inv_per[int(i-1)],
-									 value(instance.CO2PipelineBuilt[n1,n2,t,i]),
-									 value(instance.totalCO2PipelineCapacity[n1,n2,t,i]),
-									 value(instance.discount_multiplier[i] * (instance.CO2PipelineBuilt[n1,n2,t,i] * instance.CO2PipelineInvCost[n1,n2,t,i])),
-									 value(sum(instance.sceProbab[w]*instance.seasScale[s]*(instance.CO2sentPipeline[n1,n2,t,h,i,w] + instance.CO2sentPipeline[n2,n1,t,h,i,w]) for (s,h) in instance.HoursOfSeason for w in instance.Scenario))]
-						writer.writerow(my_string)
-		f.close()
+							my_string = [n1, n2, t, inv_per[int(i-1)],
+										 value(instance.hydrogenPipelineBuilt[n1,n2,t,i]),
+										 value(instance.totalHydrogenPipelineCapacity[n1,n2,t,i]),
+										 value(instance.discount_multiplier[i] * (instance.hydrogenPipelineBuilt[n1,n2,t,i] * instance.hydrogenPipelineInvCost[n1,n2,t])),
+										 value(sum(instance.sceProbab[w]*instance.seasScale[s]*(instance.hydrogenSentPipeline[n1,n2,t,h,i,w] + instance.hydrogenSentPipeline[n2,n1,t,h,i,w]) for (s,h) in instance.HoursOfSeason for w in instance.Scenario))]
+							writer.writerow(my_string)
+			writer.close()
 
-		print("{hour}:{minute}:{second}: Writing CO2 pipeline operational results to results_CO2_pipeline_operational.csv...".format(
+			print(
+				"{hour}:{minute}:{second}: Writing hydrogen pipeline operational results to results_hydrogen_pipeline_operational.csv...".format(
+					hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			writer = ResultWriter(result_file_path, 'results_hydrogen_pipeline_operational', result_file_format, CSV_EXPORT)
+			my_header = ["From node", "To node", "PipelineType", "Period", "Season", "Scenario", "Hour", "Hydrogen sent [ton]", "Power consumed in each node for transport (MWh)"]
+			writer.writerow(my_header)
+			for (n1,n2) in instance.AllowedHydrogenLinks:
+				if (n1,n2) in instance.HydrogenBidirectionPipelines:
+					for t in instance.PipelineType:
+						if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
+							for i in instance.Period:
+								for (s,h) in instance.HoursOfSeason:
+									for w in instance.Scenario:
+										my_string = [n1,n2,t,inv_per[int(i-1)],s,w,h,
+													 value(instance.hydrogenSentPipeline[n1,n2,t,h,i,w]),
+													 value(0.5*(instance.hydrogenSentPipeline[n1,n2,t,h,i,w] * instance.hydrogenPipelinePowerDemandPerTon[n1,n2,t]))]
+										writer.writerow(my_string)
+				else:
+					for i in instance.Period:
+						for t in instance.PipelineType:
+							if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
+								for (s,h) in instance.HoursOfSeason:
+									for w in instance.Scenario:
+										my_string = [n1,n2,t,inv_per[int(i-1)],s,w,h,
+													 value(instance.hydrogenSentPipeline[n1,n2,t,h,i,w]),
+													 value(0.5*(instance.hydrogenSentPipeline[n1,n2,t,h,i,w] * instance.hydrogenPipelinePowerDemandPerTon[n2,n1,t]))]
+										writer.writerow(my_string)
+			writer.close()
+
+			print("{hour}:{minute}:{second}: Writing CO2 pipeline investment results to results_CO2_pipeline_investments.csv...".format(
 				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_CO2_pipeline_operational.csv', 'w', newline='')
-		writer = csv.writer(f)
-		my_header = ["From node", "To node", "PipelineType", "Period", "Season", "Scenario", "Hour", "CO2 sent [ton]", "Power consumed in each node for transport (MWh)"]
-		writer.writerow(my_header)
-		for (n1,n2) in instance.CO2DirectionalLinks:
-			if (n1,n2) in instance.CO2BidirectionalPipelines:
-				for t in instance.PipelineType:
-					if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
-						for i in instance.Period:
-							for (s,h) in instance.HoursOfSeason:
-								for w in instance.Scenario:
-									my_string = [n1,n2,t,inv_per[int(i-1)],s,w,h,
-												 value(instance.CO2sentPipeline[n1,n2,t,h,i,w]),
-												 value(0.5*(instance.CO2sentPipeline[n1,n2,t,h,i,w] * instance.CO2PipelinePowerDemandPerTon[n1,n2,t]))]
-									writer.writerow(my_string)
-			else:
+			writer = ResultWriter(result_file_path, 'results_CO2_pipeline_investments', result_file_format, CSV_EXPORT)
+			my_header = ["Between node", "And node", "Pipeline type", "Period", "Pipelines built [#]", "Pipeline total capacity [ton]",
+						 "Discounted cost of (newly) built pipeline [EUR]", "Expected CO2 transmission [tons]"]
+			writer.writerow(my_header)
+			for (n1,n2) in instance.CO2BidirectionalPipelines:
 				for i in instance.Period:
 					for t in instance.PipelineType:
 						if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
-							for (s,h) in instance.HoursOfSeason:
-								for w in instance.Scenario:
-									my_string = [n1,n2,t,inv_per[int(i-1)],s,w,h,
-												 value(instance.CO2sentPipeline[n1,n2,t,h,i,w]),
-												 value(0.5*(instance.CO2sentPipeline[n1,n2,t,h,i,w] * instance.CO2PipelinePowerDemandPerTon[n2,n1,t]))]
-									writer.writerow(my_string)
-		f.close()
-
-		print("{hour}:{minute}:{second}: Writing CO2 sequestration investment results to results_CO2_sequestration_investments.csv...".format(
-				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_CO2_sequestration_investments.csv', 'w', newline='')
-		writer = csv.writer(f)
-		my_header = ["Node","Period", "CO2 sequestration capacity built [ton/hr]", "Total CO2 sequestration capacity[ton/hr]", "Sequestered in period (scaled) [Mton]", "Total cumulative amount of CO2 sequestered (scaled)[Mton]"]
-		writer.writerow(my_header)
-		for n in instance.CO2SequestrationNodes:
-			for i in instance.Period:
-				writer_string = [n,inv_per[int(i-1)],
-								 value(instance.CO2SiteCapacityDeveloped[n,i]),
-								 value(sum(instance.CO2SiteCapacityDeveloped[n,j] for j in instance.Period if j<=i)),
-								 value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.CO2sequestered[n,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario))/1e6,
-								 value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.CO2sequestered[n,h,j,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario for j in instance.Period if j<=i))/1e6]
-				writer.writerow(writer_string)
-		f.close()
+							my_string = [n1, n2, t, inv_per[int(i-1)],
+										 value(instance.CO2PipelineBuilt[n1,n2,t,i]),
+										 value(instance.totalCO2PipelineCapacity[n1,n2,t,i]),
+										 value(instance.discount_multiplier[i] * (instance.CO2PipelineBuilt[n1,n2,t,i] * instance.CO2PipelineInvCost[n1,n2,t,i])),
+										 value(sum(instance.sceProbab[w]*instance.seasScale[s]*(instance.CO2sentPipeline[n1,n2,t,h,i,w] + instance.CO2sentPipeline[n2,n1,t,h,i,w]) for (s,h) in instance.HoursOfSeason for w in instance.Scenario))]
+							writer.writerow(my_string)
+			writer.close()
 
-		print("{hour}:{minute}:{second}: Writing CO2 sequestration results to results_CO2_sequestration_operational.csv...".format(
-				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_CO2_sequestration_operational.csv', 'w', newline='')
-		writer = csv.writer(f)
-		my_header = ["Node","Period", "Season", "Scenario", "Hour", "CO2 sequestered [ton]"]
-		writer.writerow(my_header)
-		for n in instance.CO2SequestrationNodes:
-			for i in instance.Period:
-				for (s,h) in instance.HoursOfSeason:
-					for w in instance.Scenario:
-						writer_string = [n,inv_per[int(i-1)],s,w,h,
-							   value(instance.CO2sequestered[n,h,i,w])]
-						writer.writerow(writer_string)
-		f.close()
+			print("{hour}:{minute}:{second}: Writing CO2 pipeline operational results to results_CO2_pipeline_operational.csv...".format(
+					hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			writer = ResultWriter(result_file_path, 'results_CO2_pipeline_operational', result_file_format, CSV_EXPORT)
+			my_header = ["From node", "To node", "PipelineType", "Period", "Season", "Scenario", "Hour", "CO2 sent [ton]", "Power consumed in each node for transport (MWh)"]
+			writer.writerow(my_header)
+			for (n1,n2) in instance.CO2DirectionalLinks:
+				if (n1,n2) in instance.CO2BidirectionalPipelines:
+					for t in instance.PipelineType:
+						if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
+							for i in instance.Period:
+								for (s,h) in instance.HoursOfSeason:
+									for w in instance.Scenario:
+										my_string = [n1,n2,t,inv_per[int(i-1)],s,w,h,
+													 value(instance.CO2sentPipeline[n1,n2,t,h,i,w]),
+													 value(0.5*(instance.CO2sentPipeline[n1,n2,t,h,i,w] * instance.CO2PipelinePowerDemandPerTon[n1,n2,t]))]
+										writer.writerow(my_string)
+				else:
+					for i in instance.Period:
+						for t in instance.PipelineType:
+							if (n1,n2,t) in instance.PipelineTypeOfDirectionalLink:
+								for (s,h) in instance.HoursOfSeason:
+									for w in instance.Scenario:
+										my_string = [n1,n2,t,inv_per[int(i-1)],s,w,h,
+													 value(instance.CO2sentPipeline[n1,n2,t,h,i,w]),
+													 value(0.5*(instance.CO2sentPipeline[n1,n2,t,h,i,w] * instance.CO2PipelinePowerDemandPerTon[n2,n1,t]))]
+										writer.writerow(my_string)
+			writer.close()
+
+			print("{hour}:{minute}:{second}: Writing CO2 sequestration investment results to results_CO2_sequestration_investments.csv...".format(
+					hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			writer = ResultWriter(result_file_path, 'results_CO2_sequestration_investments', result_file_format, CSV_EXPORT)
+			my_header = ["Node","Period", "CO2 sequestration capacity built [ton/hr]", "Total CO2 sequestration capacity[ton/hr]", "Sequestered in period (scaled) [Mton]", "Total cumulative amount of CO2 sequestered (scaled)[Mton]"]
+			writer.writerow(my_header)
+			for n in instance.CO2SequestrationNodes:
+				for i in instance.Period:
+					writer_string = [n,inv_per[int(i-1)],
+									 value(instance.CO2SiteCapacityDeveloped[n,i]),
+									 value(sum(instance.CO2SiteCapacityDeveloped[n,j] for j in instance.Period if j<=i)),
+									 value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.CO2sequestered[n,h,i,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario))/1e6,
+									 value(sum(instance.sceProbab[w]*instance.seasScale[s]*instance.CO2sequestered[n,h,j,w] for (s,h) in instance.HoursOfSeason for w in instance.Scenario for j in instance.Period if j<=i))/1e6]
+					writer.writerow(writer_string)
+			writer.close()
+
+			print("{hour}:{minute}:{second}: Writing CO2 sequestration results to results_CO2_sequestration_operational.csv...".format(
+					hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			writer = ResultWriter(result_file_path, 'results_CO2_sequestration_operational', result_file_format, CSV_EXPORT)
+			my_header = ["Node","Period", "Season", "Scenario", "Hour", "CO2 sequestered [ton]"]
+			writer.writerow(my_header)
+			for n in instance.CO2SequestrationNodes:
+				for i in instance.Period:
+					for (s,h) in instance.HoursOfSeason:
+						for w in instance.Scenario:
+							writer_string = [n,inv_per[int(i-1)],s,w,h,
+								   value(instance.CO2sequestered[n,h,i,w])]
+							writer.writerow(writer_string)
+			writer.close()
+
+			print("{hour}:{minute}:{second}: Writing CO2 flow balance to results_CO2_flow_balance.csv...".format(
+					hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			writer = ResultWriter(result_file_path, 'results_CO2_flow_balance', result_file_format, CSV_EXPORT)
+			# my_header = ["Node","Period", "Season", "Scenario", "Hour", "CO2 captured from power generators [ton]", "CO2 captured from natural gas reformers [ton]", "CO2 exported by pipeline [ton]", "CO2 imported by pipeline [ton]", "CO2 liquefied [ton]", "CO2 regasified [ton]", "CO2 exported by ship [ton]", "CO2 imported by ship [ton]", "Liquid storage charge [ton]", "Liquid storage discharge [ton]", "CO2 sequested [ton]"]
+			my_header = ["Node","Period", "Season", "Scenario", "Hour", "CO2 captured from power generators [ton]", "CO2 captured from natural gas reformers [ton]", "CO2 exported by pipeline [ton]", "CO2 imported by pipeline [ton]", "CO2 sequested [ton]"]
+			writer.writerow(my_header)
+			for n in instance.OnshoreNodes:
+				for i in instance.Period:
+					for (s,h) in instance.HoursOfSeason:
+						for w in instance.Scenario:
+							writer_string = [n,inv_per[int(i-1)],s,w,h]
+							writer_string.extend([value(instance.co2_captured_generators[n,h,i,w]), value(instance.co2_captured_reformers[n,h,i,w])])
+							writer_string.extend([value(sum(instance.CO2sentPipeline[n,n2,t,h,i,w] for n2 in instance.CO2LinksFrom[n] for t in instance.PipelineTypesOfLink[n,n2]))])
+							writer_string.extend([value(sum(instance.CO2sentPipeline[n2,n,t,h,i,w] for n2 in instance.CO2LinksFrom[n] for t in instance.PipelineTypesOfLink[n,n2]))])
+							# writer_string.extend([value(instance.CO2Liquefied[n,h,i,w])])
+							# writer_string.extend([value(instance.CO2Regasified[n,h,i,w])])
+							# ship_arrival = 0
+							# for n2 in instance.OnshoreNodes:
+							# 	if (n2,n) in instance.CO2DirectionalLinks:
+							# 		half_shipping_time = ceil(value(instance.ShippingTimes[n,n2]) / 2)
+							# 		if h < min(instance.FirstHoursOfPeakSeason): # We are in normal seasons
+							# 			season_starting_hour = 1 + floor((h-1)/lengthRegSeason) * lengthRegSeason
+							# 			starting_hour_receiving_ship = h - half_shipping_time
+							# 			while starting_hour_receiving_ship < season_starting_hour:
+							# 				starting_hour_receiving_ship += lengthRegSeason
+							# 		else: # We are in peak seasons
+							# 			season_starting_hour = 1 + floor((h - 1 - NoOfRegSeason * lengthRegSeason)/lengthPeakSeason) * lengthPeakSeason + NoOfRegSeason * lengthRegSeason
+							# 			starting_hour_receiving_ship = h-half_shipping_time
+							# 			while starting_hour_receiving_ship < season_starting_hour:
+							# 				starting_hour_receiving_ship += lengthPeakSeason
+							# 		ship_arrival += value(instance.CO2Shipped[n2,n,starting_hour_receiving_ship,i,w])
+							# writer_string.extend([value(sum(instance.CO2Shipped[n,n2,h,i,w] for n2 in instance.OnshoreNodes if (n,n2) in instance.CO2DirectionalLinks))])
+							# writer_string.extend([ship_arrival])
+							# writer_string.extend([value(instance.CO2LiquidStorageCharge[n,h,i,w])])
+							# writer_string.extend([value(instance.CO2LiquidStorageDischarge[n,h,i,w])])
+							if n in instance.CO2SequestrationNodes:
+								writer_string.extend([value(instance.CO2sequestered[n,h,i,w])])
+							else:
+								writer_string.extend([0])
+							writer.writerow(writer_string)
+			writer.close()
+
+			# print("{hour}:{minute}:{second}: Writing liquid CO2 ship investment results to results_liquid_CO2_ship_investments.csv...".format(
+			# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + '/' + 'results_liquid_CO2_ship_investments.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# my_header = ["From Node", "To Node", "Period", "Liquid CO2 ships bought [#]", "Added liquid CO2 ship capacity [tons]", "Total liquid CO2 ship capacity [tons]"]
+			# writer.writerow(my_header)
+			# for n in instance.OnshoreNodes:
+			# 	for n2 in instance.OnshoreNodes:
+			# 		if (n,n2) in instance.CO2DirectionalLinks:
+			# 			for i in instance.Period:
+			# 				write_str = [n,n2,inv_per[i-1],
+			# 					   value(instance.CO2ShipBought[n,n2,i]),
+			# 					   value(instance.CO2ShipBought[n,n2,i] * instance.CO2LiquidShipCapacity),
+			# 					   value(instance.totalCO2ShipCapacity[n,n2,i])]
+			# 				writer.writerow(write_str)
+			# f.close()
+			#
+			# print("{hour}:{minute}:{second}: Writing liquid CO2 storage investment results to results_liquid_CO2_storage_investments.csv...".format(
+			# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + '/' + 'results_liquid_CO2_storage_investments.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# my_header = ["Node", "Period", "Storage built [tons]", "Total storage capacity [tons]"]
+			# writer.writerow(my_header)
+			# for n in instance.OnshoreNodes:
+			# 	for i in instance.Period:
+			# 		write_str = [n, inv_per[i-1],
+			# 					 value(instance.CO2LiquidStorageBuilt[n,i]),
+			# 					 value(instance.CO2LiquidTotalStorage[n,i])]
+			# 		writer.writerow(write_str)
+			# f.close()
+			#
+			# print("{hour}:{minute}:{second}: Writing CO2 liquefier investment results to results_liquid_CO2_liquefier_investments.csv...".format(
+			# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + '/' + 'results_liquid_CO2_liquefier_investments.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# my_header = ["Node", "Period", "Liquefier capacity built [tons/hr]", "Total liquefier capacity [tons/hr]"]
+			# writer.writerow(my_header)
+			# for n in instance.OnshoreNodes:
+			# 	for i in instance.Period:
+			# 		write_str = [n, inv_per[i-1],
+			# 					 value(instance.CO2LiquefierCapacityBuilt[n,i]),
+			# 					 value(instance.CO2LiquefierTotalCapacity[n,i])]
+			# 		writer.writerow(write_str)
+			# f.close()
+			#
+			# print("{hour}:{minute}:{second}: Writing liquid CO2 ship operational results to results_liquid_CO2_ship_operational.csv...".format(
+			# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + '/' + 'results_liquid_CO2_ship_operational.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# my_header = ["From Node", "To Node", "Period", "Hour", "Scenario", "CO2 sent via ships [tons]", "Arrival hour [hour]", "CO2 arrived via ships [tons]"]
+			# writer.writerow(my_header)
+			# for n in instance.OnshoreNodes:
+			# 	for n2 in instance.OnshoreNodes:
+			# 		if (n,n2) in instance.CO2DirectionalLinks:
+			# 			half_shipping_time = ceil(value(instance.ShippingTimes[n,n2]) / 2)
+			# 			for i in instance.Period:
+			# 				for h in instance.Operationalhour:
+			# 					if h < min(instance.FirstHoursOfPeakSeason): # We are in normal seasons
+			# 						season_starting_hour = 1 + floor((h-1)/lengthRegSeason) * lengthRegSeason
+			# 						starting_hour_receiving_ship = h - half_shipping_time
+			# 						while starting_hour_receiving_ship < season_starting_hour:
+			# 							starting_hour_receiving_ship += lengthRegSeason
+			# 						for w in instance.Scenario:
+			# 							write_str = [n,n2,inv_per[i-1],h,w,
+			# 								   		value(instance.CO2Shipped[n,n2,h,i,w]),
+			# 									 	(h - season_starting_hour + half_shipping_time) % lengthRegSeason + season_starting_hour,
+			# 								   		value(instance.CO2Shipped[n2,n,starting_hour_receiving_ship,i,w])]
+			# 							writer.writerow(write_str)
+			# 					else:
+			# 						season_starting_hour = 1 + floor((h - 1 - NoOfRegSeason * lengthRegSeason)/lengthPeakSeason) * lengthPeakSeason + NoOfRegSeason * lengthRegSeason
+			# 						starting_hour_receiving_ship = h-half_shipping_time
+			# 						while starting_hour_receiving_ship < season_starting_hour:
+			# 							starting_hour_receiving_ship += lengthPeakSeason
+			# 						for w in instance.Scenario:
+			# 							write_str = [n,n2,inv_per[i-1],h,w,
+			# 								   		value(instance.CO2Shipped[n,n2,h,i,w]),
+			# 										(h - season_starting_hour + half_shipping_time) % lengthPeakSeason + season_starting_hour,
+			# 								   		value(instance.CO2Shipped[n2,n,starting_hour_receiving_ship,i,w])]
+			# 							writer.writerow(write_str)
+			# f.close()
+			#
+			# print("{hour}:{minute}:{second}: Writing liquid CO2 storage operational results to results_liquid_CO2_storage_operational.csv...".format(
+			# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + '/' + 'results_liquid_CO2_storage_operational.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# my_header = ["Node", "Period", "Hour","Scenario", "Storage charge [tons]", "Storage discharge[tons]", "Storage operational level [tons]"]
+			# writer.writerow(my_header)
+			# for n in instance.OnshoreNodes:
+			# 	for i in instance.Period:
+			# 		for h in instance.Operationalhour:
+			# 			for w in instance.Scenario:
+			# 				my_str = [n, inv_per[i-1], h, w,
+			# 						  value(instance.CO2LiquidStorageCharge[n,h,i,w]),
+			# 						  value(instance.CO2LiquidStorageDischarge[n,h,i,w]),
+			# 						  value(instance.CO2LiquidStorageOperational[n,h,i,w])]
+			# 				writer.writerow(my_str)
+			# f.close()
+			#
+			# print("{hour}:{minute}:{second}: Writing liquid CO2 liquefier & gasifier operational results to results_liquid_CO2_liquefier_regasifier_operational.csv...".format(
+			# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + '/' + 'results_liquid_CO2_liquefier_regasifier_operational.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# my_header = ["Node", "Period", "Hour","Scenario", "CO2 liquefied [tons]", "CO2 regasified [tons]"]
+			# writer.writerow(my_header)
+			# for n in instance.OnshoreNodes:
+			# 	for i in instance.Period:
+			# 		for h in instance.Operationalhour:
+			# 			for w in instance.Scenario:
+			# 				my_str = [n, inv_per[i-1], h, w,
+			# 						  value(instance.CO2Liquefied[n,h,i,w]),
+			# 						  value(instance.CO2Regasified[n,h,i,w])]
+			# 				writer.writerow(my_str)
+			# f.close()
+
+			# print("{hour}:{minute}:{second}: Writing hydrogen investments costs and NPV calculation to results_hydrogen_costs.csv...".format(
+			# 	hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + '/' + 'results_hydrogen_costs.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# header = ['Period','Discounted electrolyzer cost [EUR]', 'Discounted Reformer cost [EUR]', 'Discounted pipeline cost [EUR]', 'Discounted storage cost [EUR]',
+			# 		  'Total discounted cost [EUR]', 'Hydrogen sold [kg]','Non-discounted price for NPV = 0 [EUR]']
+			# writer.writerow(header)
+			# if h2storage is True:
+			# 	for i in instance.Period:
+			# 		electrolyzerCost = value(sum(instance.discount_multiplier[j] * instance.elyzerInvCost[j] * sum(instance.elyzerCapBuilt[n,j,j] for n in instance.HydrogenProdNode) for j in instance.Period if j<=i))
+			# 		reformerCost = value(sum(instance.discount_multiplier[j] * sum(instance.ReformerPlantInvCost[p,j] * instance.ReformerCapBuilt[n,p,j] for n in instance.ReformerLocations for p in instance.ReformerPlants) for j in instance.Period if j<=i))
+			# 		pipelineCost = value(sum(instance.discount_multiplier[j] * sum(instance.hydrogenPipelineInvCost[(n1,n2),j] * instance.hydrogenPipelineBuilt[(n1,n2),j] for (n1,n2) in instance.HydrogenBidirectionPipelines) for j in instance.Period if j<=i))
+			# 		storageCost = value(sum(instance.discount_multiplier[j] * sum(instance.hydrogenStorageBuilt[n,j] for n in instance.HydrogenProdNode) for j in instance.Period if j<=i))
+			# 		my_string = [inv_per[i-1],
+			# 					 electrolyzerCost,
+			# 					 reformerCost,
+			# 					 pipelineCost,
+			# 					 storageCost,
+			# 					 electrolyzerCost + reformerCost + pipelineCost + storageCost]
+			# 		if value(sum(instance.hydrogenDemand[n,i] for n in instance.HydrogenProdNode)) > 0:
+			# 			my_string.extend([(electrolyzerCost + reformerCost + pipelineCost + storageCost)/value(sum(instance.discount_multiplier[i] * instance.hydrogenDemand[n,i] for n in instance.HydrogenProdNode))])
+			# 		else:
+			# 			my_string.extend([0])
+			# 		writer.writerow(my_string)
+			# else:
+			# 	for i in instance.Period:
+			# 		electrolyzerCost = value(sum(instance.discount_multiplier[j] * instance.elyzerInvCost[j] * sum(instance.elyzerCapBuilt[n,j,j] for n in instance.HydrogenProdNode) for j in instance.Period if j<=i))
+			# 		reformerCost = value(sum(instance.discount_multiplier[j] * sum(instance.ReformerPlantInvCost[p,j] * instance.ReformerCapBuilt[n,p,j] for n in instance.ReformerLocations for p in instance.ReformerPlants) for j in instance.Period if j<=i))
+			# 		pipelineCost = value(sum(instance.discount_multiplier[j] * sum(instance.hydrogenPipelineInvCost[(n1,n2),j] * instance.hydrogenPipelineBuilt[(n1,n2),j] for (n1,n2) in instance.HydrogenBidirectionPipelines) for j in instance.Period if j<=i))
+			# 		storageCost = 0
+			# 		my_string = [inv_per[i-1],
+			# 					 electrolyzerCost,
+			# 					 reformerCost,
+			# 					 pipelineCost,
+			# 					 storageCost,
+			# 					 electrolyzerCost + reformerCost + pipelineCost + storageCost]
+			# 		if value(sum(instance.hydrogenDemand[n,i] for n in instance.HydrogenProdNode)) > 0:
+			# 			my_string.extend([(electrolyzerCost + reformerCost + pipelineCost + storageCost)/value(sum(instance.discount_multiplier[i] * instance.hydrogenDemand[n,i] for n in instance.HydrogenProdNode))])
+			# 		else:
+			# 			my_string.extend([0])
+			# 		writer.writerow(my_string)
+			# f.close()
+
+			# This reporting was written to track the hydrogenForPower variable. To be deleted later.
+
+			# print("{hour}:{minute}:{second}: Writing hydrogen use in as power fuel in hydrogen_for_power.csv...".format(
+			# 	hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
+			# f = open(result_file_path + '/' + 'hydrogen_for_power.csv', 'w', newline='')
+			# writer = csv.writer(f)
+			# header = ['Node','Generator','Period','Hour','Scenario']
+			# writer.writerow(header)
+			# for (n,g) in instance.GeneratorsOfNode:
+			# 	for i in instance.Period:
+			# 		for (s,h) in instance.HoursOfSeason:
+			# 			for w in instance.Scenario:
+			# 				writer.writerow([n,g,inv_per[i-1],h,w,
+			# 								 value(instance.hydrogenForPower[g,n,h,i,w])])
+
+		endReporting = timeEnd = datetime.now()
+
+		print("{hour}:{minute}:{second}: Writing time usage to time_usage.csv...".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
 
-		print("{hour}:{minute}:{second}: Writing CO2 flow balance to results_CO2_flow_balance.csv...".format(
-				hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		f = open(result_file_path + '/' + 'results_CO2_flow_balance.csv', 'w', newline='')
+		f = open(result_file_path + "/" + 'time_usage.csv', 'w', newline='')
+		timeFrmt = "%H:%M:%S"
+		dateFrmt = "%d.%m.%Y"
+		timeDeltaFrmt = "{H}:{M}:{S}"
 		writer = csv.writer(f)
-		# my_header = ["Node","Period", "Season", "Scenario", "Hour", "CO2 captured from power generators [ton]", "CO2 captured from natural gas reformers [ton]", "CO2 exported by pipeline [ton]", "CO2 imported by pipeline [ton]", "CO2 liquefied [ton]", "CO2 regasified [ton]", "CO2 exported by ship [ton]", "CO2 imported by ship [ton]", "Liquid storage charge [ton]", "Liquid storage discharge [ton]", "CO2 sequested [ton]"]
-		my_header = ["Node","Period", "Season", "Scenario", "Hour", "CO2 captured from power generators [ton]", "CO2 captured from natural gas reformers [ton]", "CO2 exported by pipeline [ton]", "CO2 imported by pipeline [ton]", "CO2 sequested [ton]"]
-		writer.writerow(my_header)
-		for n in instance.OnshoreNodes:
-			for i in instance.Period:
-				for (s,h) in instance.HoursOfSeason:
-					for w in instance.Scenario:
-						writer_string = [n,inv_per[int(i-1)],s,w,h]
-						writer_string.extend([value(instance.co2_captured_generators[n,h,i,w]), value(instance.co2_captured_reformers[n,h,i,w])])
-						writer_string.extend([value(sum(instance.CO2sentPipeline[n,n2,t,h,i,w] for n2 in instance.OnshoreNodes if (n,n2) in instance.CO2DirectionalLinks for t in instance.PipelineType if (n,n2,t) in instance.PipelineTypeOfDirectionalLink))])
-						writer_string.extend([value(sum(instance.CO2sentPipeline[n2,n,t,h,i,w] for n2 in instance.OnshoreNodes if (n,n2) in instance.CO2DirectionalLinks for t in instance.PipelineType if (n,n2,t) in instance.PipelineTypeOfDirectionalLink))])
-						# writer_string.extend([value(instance.CO2Liquefied[n,h,i,w])])
-						# writer_string.extend([value(instance.CO2Regasified[n,h,i,w])])
-						# ship_arrival = 0
-						# for n2 in instance.OnshoreNodes:
-						# 	if (n2,n) in instance.CO2DirectionalLinks:
-						# 		half_shipping_time = ceil(value(instance.ShippingTimes[n,n2]) / 2)
-						# 		if h < min(instance.FirstHoursOfPeakSeason): # We are in normal seasons
-						# 			season_starting_hour = 1 + floor((h-1)/lengthRegSeason) * lengthRegSeason
-						# 			starting_hour_receiving_ship = h - half_shipping_time
-						# 			while starting_hour_receiving_ship < season_starting_hour:
-						# 				starting_hour_receiving_ship += lengthRegSeason
-						# 		else: # We are in peak seasons
-						# 			season_starting_hour = 1 + floor((h - 1 - NoOfRegSeason * lengthRegSeason)/lengthPeakSeason) * lengthPeakSeason + NoOfRegSeason * lengthRegSeason
-						# 			starting_hour_receiving_ship = h-half_shipping_time
-						# 			while starting_hour_receiving_ship < season_starting_hour:
-						# 				starting_hour_receiving_ship += lengthPeakSeason
-						# 		ship_arrival += value(instance.CO2Shipped[n2,n,starting_hour_receiving_ship,i,w])
-						# writer_string.extend([value(sum(instance.CO2Shipped[n,n2,h,i,w] for n2 in instance.OnshoreNodes if (n,n2) in instance.CO2DirectionalLinks))])
-						# writer_string.extend([ship_arrival])
-						# writer_string.extend([value(instance.CO2LiquidStorageCharge[n,h,i,w])])
-						# writer_string.extend([value(instance.CO2LiquidStorageDischarge[n,h,i,w])])
-						if n in instance.CO2SequestrationNodes:
-							writer_string.extend([value(instance.CO2sequestered[n,h,i,w])])
-						else:
-							writer_string.extend([0])
-						writer.writerow(writer_string)
+		if (timeEnd - timeStart).days > 0:
+			writer.writerow(["Process",
+							 "Time started [HH:MM:SS]",
+							 "Time ended [HH:MM:SS]",
+							 "Time spent [HH:MM:SS]",
+							 "Date started [DD.MM.YYYY]",
+							 "Date finished [DD.MM.YYYY]"])
+			writer.writerow(["Overall",
+							 timeStart.strftime(timeFrmt),
+							 timeEnd.strftime(timeFrmt),
+							 strfdelta(timeEnd-timeStart,timeDeltaFrmt),
+							 timeStart.strftime(dateFrmt),
+							 timeEnd.strftime(dateFrmt)])
+			writer.writerow(["Declaring and reading sets & parameters",
+							 timeStart.strftime(timeFrmt),
+							 stopReading.strftime(timeFrmt),
+							 strfdelta(stopReading-timeStart,timeDeltaFrmt),
+							 timeStart.strftime(dateFrmt),
+							 stopReading.strftime(dateFrmt)])
+			writer.writerow(["Declaring variables & constraints",
+							 startConstraints.strftime(timeFrmt),
+							 stopConstraints.strftime(timeFrmt),
+							 strfdelta(stopConstraints-startConstraints,timeDeltaFrmt),
+							 startConstraints.strftime(dateFrmt),
+							 stopConstraints.strftime(dateFrmt)])
+			writer.writerow(["Building model",
+							 startBuild.strftime(timeFrmt),
+							 endBuild.strftime(timeFrmt),
+							 strfdelta(endBuild-startBuild,timeDeltaFrmt),
+							 startBuild.strftime(dateFrmt),
+							 endBuild.strftime(dateFrmt)])
+			writer.writerow(["Optimizing model",
+							 startOptimization.strftime(timeFrmt),
+							 endOptimization.strftime(timeFrmt),
+							 strfdelta(endOptimization-startOptimization,timeDeltaFrmt),
+							 startOptimization.strftime(dateFrmt),
+							 endOptimization.strftime(dateFrmt)])
+			writer.writerow(["Reporting results",
+							 StartReporting.strftime(timeFrmt),
+							 endReporting.strftime(timeFrmt),
+							 strfdelta(endReporting-StartReporting,timeDeltaFrmt),
+							 StartReporting.strftime(dateFrmt),
+							 endReporting.strftime(dateFrmt)])
+		else:
+			writer.writerow(["Process",
+							 "Time started [HH:MM:SS]",
+							 "Time ended [HH:MM:SS]",
+							 "Time spent [HH:MM:SS]"])
+			writer.writerow(["Overall",
+							 timeStart.strftime(timeFrmt),
+							 timeEnd.strftime(timeFrmt),
+							 strfdelta(timeEnd - timeStart, timeDeltaFrmt)])
+			writer.writerow(["Declaring and reading sets & parameters",
+							 timeStart.strftime(timeFrmt),
+							 stopReading.strftime(timeFrmt),
+							 strfdelta(stopReading - timeStart, timeDeltaFrmt)])
+			writer.writerow(["Declaring variables & constraints",
+							 startConstraints.strftime(timeFrmt),
+							 stopConstraints.strftime(timeFrmt),
+							 strfdelta(stopConstraints - startConstraints, timeDeltaFrmt)])
+			writer.writerow(["Building model",
+							 startBuild.strftime(timeFrmt),
+							 endBuild.strftime(timeFrmt),
+							 strfdelta(endBuild - startBuild, timeDeltaFrmt)])
+			writer.writerow(["Optimizing model",
+							 startOptimization.strftime(timeFrmt),
+							 endOptimization.strftime(timeFrmt),
+							 strfdelta(endOptimization - startOptimization,
+									   timeDeltaFrmt)])
+			writer.writerow(["Reporting results",
+							 StartReporting.strftime(timeFrmt),
+							 endReporting.strftime(timeFrmt),
+							 strfdelta(endReporting - StartReporting, timeDeltaFrmt)])
 		f.close()
 
-		# print("{hour}:{minute}:{second}: Writing liquid CO2 ship investment results to results_liquid_CO2_ship_investments.csv...".format(
-		# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + '/' + 'results_liquid_CO2_ship_investments.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# my_header = ["From Node", "To Node", "Period", "Liquid CO2 ships bought [#]", "Added liquid CO2 ship capacity [tons]", "Total liquid CO2 ship capacity [tons]"]
-		# writer.writerow(my_header)
-		# for n in instance.OnshoreNodes:
-		# 	for n2 in instance.OnshoreNodes:
-		# 		if (n,n2) in instance.CO2DirectionalLinks:
-		# 			for i in instance.Period:
-		# 				write_str = [n,n2,inv_per[i-1],
-		# 					   value(instance.CO2ShipBought[n,n2,i]),
-		# 					   value(instance.CO2ShipBought[n,n2,i] * instance.CO2LiquidShipCapacity),
-		# 					   value(instance.totalCO2ShipCapacity[n,n2,i])]
-		# 				writer.writerow(write_str)
-		# f.close()
-		#
-		# print("{hour}:{minute}:{second}: Writing liquid CO2 storage investment results to results_liquid_CO2_storage_investments.csv...".format(
-		# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + '/' + 'results_liquid_CO2_storage_investments.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# my_header = ["Node", "Period", "Storage built [tons]", "Total storage capacity [tons]"]
-		# writer.writerow(my_header)
-		# for n in instance.OnshoreNodes:
-		# 	for i in instance.Period:
-		# 		write_str = [n, inv_per[i-1],
-		# 					 value(instance.CO2LiquidStorageBuilt[n,i]),
-		# 					 value(instance.CO2LiquidTotalStorage[n,i])]
-		# 		writer.writerow(write_str)
-		# f.close()
-		#
-		# print("{hour}:{minute}:{second}: Writing CO2 liquefier investment results to results_liquid_CO2_liquefier_investments.csv...".format(
-		# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + '/' + 'results_liquid_CO2_liquefier_investments.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# my_header = ["Node", "Period", "Liquefier capacity built [tons/hr]", "Total liquefier capacity [tons/hr]"]
-		# writer.writerow(my_header)
-		# for n in instance.OnshoreNodes:
-		# 	for i in instance.Period:
-		# 		write_str = [n, inv_per[i-1],
-		# 					 value(instance.CO2LiquefierCapacityBuilt[n,i]),
-		# 					 value(instance.CO2LiquefierTotalCapacity[n,i])]
-		# 		writer.writerow(write_str)
-		# f.close()
-		#
-		# print("{hour}:{minute}:{second}: Writing liquid CO2 ship operational results to results_liquid_CO2_ship_operational.csv...".format(
-		# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + '/' + 'results_liquid_CO2_ship_operational.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# my_header = ["From Node", "To Node", "Period", "Hour", "Scenario", "CO2 sent via ships [tons]", "Arrival hour [hour]", "CO2 arrived via ships [tons]"]
-		# writer.writerow(my_header)
-		# for n in instance.OnshoreNodes:
-		# 	for n2 in instance.OnshoreNodes:
-		# 		if (n,n2) in instance.CO2DirectionalLinks:
-		# 			half_shipping_time = ceil(value(instance.ShippingTimes[n,n2]) / 2)
-		# 			for i in instance.Period:
-		# 				for h in instance.Operationalhour:
-		# 					if h < min(instance.FirstHoursOfPeakSeason): # We are in normal seasons
-		# 						season_starting_hour = 1 + floor((h-1)/lengthRegSeason) * lengthRegSeason
-		# 						starting_hour_receiving_ship = h - half_shipping_time
-		# 						while starting_hour_receiving_ship < season_starting_hour:
-		# 							starting_hour_receiving_ship += lengthRegSeason
-		# 						for w in instance.Scenario:
-		# 							write_str = [n,n2,inv_per[i-1],h,w,
-		# 								   		value(instance.CO2Shipped[n,n2,h,i,w]),
-		# 									 	(h - season_starting_hour + half_shipping_time) % lengthRegSeason + season_starting_hour,
-		# 								   		value(instance.CO2Shipped[n2,n,starting_hour_receiving_ship,i,w])]
-		# 							writer.writerow(write_str)
-		# 					else:
-		# 						season_starting_hour = 1 + floor((h - 1 - NoOfRegSeason * lengthRegSeason)/lengthPeakSeason) * lengthPeakSeason + NoOfRegSeason * lengthRegSeason
-		# 						starting_hour_receiving_ship = h-half_shipping_time
-		# 						while starting_hour_receiving_ship < season_starting_hour:
-		# 							starting_hour_receiving_ship += lengthPeakSeason
-		# 						for w in instance.Scenario:
-		# 							write_str = [n,n2,inv_per[i-1],h,w,
-		# 								   		value(instance.CO2Shipped[n,n2,h,i,w]),
-		# 										(h - season_starting_hour + half_shipping_time) % lengthPeakSeason + season_starting_hour,
-		# 								   		value(instance.CO2Shipped[n2,n,starting_hour_receiving_ship,i,w])]
-		# 							writer.writerow(write_str)
-		# f.close()
-		#
-		# print("{hour}:{minute}:{second}: Writing liquid CO2 storage operational results to results_liquid_CO2_storage_operational.csv...".format(
-		# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + '/' + 'results_liquid_CO2_storage_operational.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# my_header = ["Node", "Period", "Hour","Scenario", "Storage charge [tons]", "Storage discharge[tons]", "Storage operational level [tons]"]
-		# writer.writerow(my_header)
-		# for n in instance.OnshoreNodes:
-		# 	for i in instance.Period:
-		# 		for h in instance.Operationalhour:
-		# 			for w in instance.Scenario:
-		# 				my_str = [n, inv_per[i-1], h, w,
-		# 						  value(instance.CO2LiquidStorageCharge[n,h,i,w]),
-		# 						  value(instance.CO2LiquidStorageDischarge[n,h,i,w]),
-		# 						  value(instance.CO2LiquidStorageOperational[n,h,i,w])]
-		# 				writer.writerow(my_str)
-		# f.close()
-		#
-		# print("{hour}:{minute}:{second}: Writing liquid CO2 liquefier & gasifier operational results to results_liquid_CO2_liquefier_regasifier_operational.csv...".format(
-		# 		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + '/' + 'results_liquid_CO2_liquefier_regasifier_operational.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# my_header = ["Node", "Period", "Hour","Scenario", "CO2 liquefied [tons]", "CO2 regasified [tons]"]
-		# writer.writerow(my_header)
-		# for n in instance.OnshoreNodes:
-		# 	for i in instance.Period:
-		# 		for h in instance.Operationalhour:
-		# 			for w in instance.Scenario:
-		# 				my_str = [n, inv_per[i-1], h, w,
-		# 						  value(instance.CO2Liquefied[n,h,i,w]),
-		# 						  value(instance.CO2Regasified[n,h,i,w])]
-		# 				writer.writerow(my_str)
-		# f.close()
-
-		# print("{hour}:{minute}:{second}: Writing hydrogen investments costs and NPV calculation to results_hydrogen_costs.csv...".format(
-		# 	hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + '/' + 'results_hydrogen_costs.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# header = ['Period','Discounted electrolyzer cost [EUR]', 'Discounted Reformer cost [EUR]', 'Discounted pipeline cost [EUR]', 'Discounted storage cost [EUR]',
-		# 		  'Total discounted cost [EUR]', 'Hydrogen sold [kg]','Non-discounted price for NPV = 0 [EUR]']
-		# writer.writerow(header)
-		# if h2storage is True:
-		# 	for i in instance.Period:
-		# 		electrolyzerCost = value(sum(instance.discount_multiplier[j] * instance.elyzerInvCost[j] * sum(instance.elyzerCapBuilt[n,j,j] for n in instance.HydrogenProdNode) for j in instance.Period if j<=i))
-		# 		reformerCost = value(sum(instance.discount_multiplier[j] * sum(instance.ReformerPlantInvCost[p,j] * instance.ReformerCapBuilt[n,p,j] for n in instance.ReformerLocations for p in instance.ReformerPlants) for j in instance.Period if j<=i))
-		# 		pipelineCost = value(sum(instance.discount_multiplier[j] * sum(instance.hydrogenPipelineInvCost[(n1,n2),j] * instance.hydrogenPipelineBuilt[(n1,n2),j] for (n1,n2) in instance.HydrogenBidirectionPipelines) for j in instance.Period if j<=i))
-		# 		storageCost = value(sum(instance.discount_multiplier[j] * sum(instance.hydrogenStorageBuilt[n,j] for n in instance.HydrogenProdNode) for j in instance.Period if j<=i))
-		# 		my_string = [inv_per[i-1],
-		# 					 electrolyzerCost,
-		# 					 reformerCost,
-		# 					 pipelineCost,
-		# 					 storageCost,
-		# 					 electrolyzerCost + reformerCost + pipelineCost + storageCost]
-		# 		if value(sum(instance.hydrogenDemand[n,i] for n in instance.HydrogenProdNode)) > 0:
-		# 			my_string.extend([(electrolyzerCost + reformerCost + pipelineCost + storageCost)/value(sum(instance.discount_multiplier[i] * instance.hydrogenDemand[n,i] for n in instance.HydrogenProdNode))])
-		# 		else:
-		# 			my_string.extend([0])
-		# 		writer.writerow(my_string)
-		# else:
-		# 	for i in instance.Period:
-		# 		electrolyzerCost = value(sum(instance.discount_multiplier[j] * instance.elyzerInvCost[j] * sum(instance.elyzerCapBuilt[n,j,j] for n in instance.HydrogenProdNode) for j in instance.Period if j<=i))
-		# 		reformerCost = value(sum(instance.discount_multiplier[j] * sum(instance.ReformerPlantInvCost[p,j] * instance.ReformerCapBuilt[n,p,j] for n in instance.ReformerLocations for p in instance.ReformerPlants) for j in instance.Period if j<=i))
-		# 		pipelineCost = value(sum(instance.discount_multiplier[j] * sum(instance.hydrogenPipelineInvCost[(n1,n2),j] * instance.hydrogenPipelineBuilt[(n1,n2),j] for (n1,n2) in instance.HydrogenBidirectionPipelines) for j in instance.Period if j<=i))
-		# 		storageCost = 0
-		# 		my_string = [inv_per[i-1],
-		# 					 electrolyzerCost,
-		# 					 reformerCost,
-		# 					 pipelineCost,
-		# 					 storageCost,
-		# 					 electrolyzerCost + reformerCost + pipelineCost + storageCost]
-		# 		if value(sum(instance.hydrogenDemand[n,i] for n in instance.HydrogenProdNode)) > 0:
-		# 			my_string.extend([(electrolyzerCost + reformerCost + pipelineCost + storageCost)/value(sum(instance.discount_multiplier[i] * instance.hydrogenDemand[n,i] for n in instance.HydrogenProdNode))])
-		# 		else:
-		# 			my_string.extend([0])
-		# 		writer.writerow(my_string)
-		# f.close()
-
-		# This reporting was written to track the hydrogenForPower variable. To be deleted later.
-
-		# print("{hour}:{minute}:{second}: Writing hydrogen use in as power fuel in hydrogen_for_power.csv...".format(
-		# 	hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-		# f = open(result_file_path + '/' + 'hydrogen_for_power.csv', 'w', newline='')
-		# writer = csv.writer(f)
-		# header = ['Node','Generator','Period','Hour','Scenario']
-		# writer.writerow(header)
-		# for (n,g) in instance.GeneratorsOfNode:
-		# 	for i in instance.Period:
-		# 		for (s,h) in instance.HoursOfSeason:
-		# 			for w in instance.Scenario:
-		# 				writer.writerow([n,g,inv_per[i-1],h,w,
-		# 								 value(instance.hydrogenForPower[g,n,h,i,w])])
-
-	endReporting = timeEnd = datetime.now()
-
-	print("{hour}:{minute}:{second}: Writing time usage to time_usage.csv...".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-
-	f = open(result_file_path + "/" + 'time_usage.csv', 'w', newline='')
-	timeFrmt = "%H:%M:%S"
-	dateFrmt = "%d.%m.%Y"
-	timeDeltaFrmt = "{H}:{M}:{S}"
-	writer = csv.writer(f)
-	if (timeEnd - timeStart).days > 0:
-		writer.writerow(["Process",
-						 "Time started [HH:MM:SS]",
-						 "Time ended [HH:MM:SS]",
-						 "Time spent [HH:MM:SS]",
-						 "Date started [DD.MM.YYYY]",
-						 "Date finished [DD.MM.YYYY]"])
-		writer.writerow(["Overall",
-						 timeStart.strftime(timeFrmt),
-						 timeEnd.strftime(timeFrmt),
-						 strfdelta(timeEnd-timeStart,timeDeltaFrmt),
-						 timeStart.strftime(dateFrmt),
-						 timeEnd.strftime(dateFrmt)])
-		writer.writerow(["Declaring and reading sets & parameters",
-						 timeStart.strftime(timeFrmt),
-						 stopReading.strftime(timeFrmt),
-						 strfdelta(stopReading-timeStart,timeDeltaFrmt),
-						 timeStart.strftime(dateFrmt),
-						 stopReading.strftime(dateFrmt)])
-		writer.writerow(["Declaring variables & constraints",
-						 startConstraints.strftime(timeFrmt),
-						 stopConstraints.strftime(timeFrmt),
-						 strfdelta(stopConstraints-startConstraints,timeDeltaFrmt),
-						 startConstraints.strftime(dateFrmt),
-						 stopConstraints.strftime(dateFrmt)])
-		writer.writerow(["Building model",
-						 startBuild.strftime(timeFrmt),
-						 endBuild.strftime(timeFrmt),
-						 strfdelta(endBuild-startBuild,timeDeltaFrmt),
-						 startBuild.strftime(dateFrmt),
-						 endBuild.strftime(dateFrmt)])
-		writer.writerow(["Optimizing model",
-						 startOptimization.strftime(timeFrmt),
-						 endOptimization.strftime(timeFrmt),
-						 strfdelta(endOptimization-startOptimization,timeDeltaFrmt),
-						 startOptimization.strftime(dateFrmt),
-						 endOptimization.strftime(dateFrmt)])
-		writer.writerow(["Reporting results",
-						 StartReporting.strftime(timeFrmt),
-						 endReporting.strftime(timeFrmt),
-						 strfdelta(endReporting-StartReporting,timeDeltaFrmt),
-						 StartReporting.strftime(dateFrmt),
-						 endReporting.strftime(dateFrmt)])
-	else:
-		writer.writerow(["Process",
-						 "Time started [HH:MM:SS]",
-						 "Time ended [HH:MM:SS]",
-						 "Time spent [HH:MM:SS]"])
-		writer.writerow(["Overall",
-						 timeStart.strftime(timeFrmt),
-						 timeEnd.strftime(timeFrmt),
-						 strfdelta(timeEnd - timeStart, timeDeltaFrmt)])
-		writer.writerow(["Declaring and reading sets & parameters",
-						 timeStart.strftime(timeFrmt),
-						 stopReading.strftime(timeFrmt),
-						 strfdelta(stopReading - timeStart, timeDeltaFrmt)])
-		writer.writerow(["Declaring variables & constraints",
-						 startConstraints.strftime(timeFrmt),
-						 stopConstraints.strftime(timeFrmt),
-						 strfdelta(stopConstraints - startConstraints, timeDeltaFrmt)])
-		writer.writerow(["Building model",
-						 startBuild.strftime(timeFrmt),
-						 endBuild.strftime(timeFrmt),
-						 strfdelta(endBuild - startBuild, timeDeltaFrmt)])
-		writer.writerow(["Optimizing model",
-						 startOptimization.strftime(timeFrmt),
-						 endOptimization.strftime(timeFrmt),
-						 strfdelta(endOptimization - startOptimization,
-								   timeDeltaFrmt)])
-		writer.writerow(["Reporting results",
-						 StartReporting.strftime(timeFrmt),
-						 endReporting.strftime(timeFrmt),
-						 strfdelta(endReporting - StartReporting, timeDeltaFrmt)])
-	f.close()
 
 
+		print("{hour}:{minute}:{second} Finished writing results to files.".format(
+			hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
 
-	print("{hour}:{minute}:{second} Finished writing results to files.".format(
-		hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")))
-
-	del results, instance, model
+	del instance, model
 
 	# for i in instance.Period:
 	#     custom_lines = [Line2D([0], [0], color='black', linewidth=0.5),
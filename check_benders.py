@@ -0,0 +1,132 @@
+from reader import generate_tab_files
+from Empire import run_empire
+from scenario_random import generate_random_scenario
+from datetime import datetime
+import csv
+import sys
+
+# Solves a small instance of the North Sea case (two hours per season, two scenarios) as the extensive form and with the
+# Benders decomposition (DECOMPOSITION = 'benders' in run_NorthSea_100.py), and checks that the Benders objective
+# matches the extensive objective within BENDERS_GAP
+
+########
+##USER##
+########
+
+temp_dir = 'TempDir'
+version = 'north_sea'
+name = 'benders_check'
+NoOfPeriods = 6
+NoOfNormalScenarios = 2
+NoOfHydrogenScenarios = 1
+NoOfScenarios = NoOfNormalScenarios * NoOfHydrogenScenarios
+NoOfRegSeason = 4
+lengthRegSeason = 2
+regular_seasons = ["winter", "spring", "summer", "fall"]
+NoOfPeakSeason = 2
+lengthPeakSeason = 2
+discountrate = 0.05
+WACC = 0.05
+LeapYearsInvestment = 5
+solver = "Gurobi" #"Gurobi" #"CPLEX" #"Xpress"
+BENDERS_WORKERS = None #int/None (processes solving the Benders subproblems, None: one per CPU, 1: serial)
+BENDERS_GAP = 1e-2 #relative gap of the Benders decomposition, and largest relative difference of the objectives
+BENDERS_MAX_ITERATIONS = 1000
+scenario_seed = 1
+hydrogen = True
+h2storage = True
+
+#######
+##RUN##
+#######
+if __name__ == "__main__":
+    # Guard needed since the .tab-file reader starts worker processes
+    workbook_path = 'Data handler/' + version
+    tab_file_path = 'Data handler/' + version + '/Tab_Files_' + name
+    scenario_data_path = 'Data handler/' + version + '/ScenarioData'
+    FirstHoursOfRegSeason = [lengthRegSeason*i + 1 for i in range(NoOfRegSeason)]
+    FirstHoursOfPeakSeason = [lengthRegSeason*NoOfRegSeason + lengthPeakSeason*i + 1 for i in range(NoOfPeakSeason)]
+    Period = [i + 1 for i in range(NoOfPeriods)]
+    Scenario = ["scenario"+str(i + 1) for i in range(NoOfScenarios)]
+    peak_seasons = ['peak'+str(i + 1) for i in range(NoOfPeakSeason)]
+    Season = regular_seasons + peak_seasons
+    Operationalhour = [i + 1 for i in range(FirstHoursOfPeakSeason[-1] + lengthPeakSeason - 1)]
+    HoursOfRegSeason = [(s,h) for s in regular_seasons for h in Operationalhour \
+                     if h in list(range(regular_seasons.index(s)*lengthRegSeason+1,
+                                   regular_seasons.index(s)*lengthRegSeason+lengthRegSeason+1))]
+    HoursOfPeakSeason = [(s,h) for s in peak_seasons for h in Operationalhour \
+                         if h in list(range(lengthRegSeason*len(regular_seasons)+ \
+                                            peak_seasons.index(s)*lengthPeakSeason+1,
+                                            lengthRegSeason*len(regular_seasons)+ \
+                                                peak_seasons.index(s)*lengthPeakSeason+ \
+                                                    lengthPeakSeason+1))]
+    HoursOfSeason = HoursOfRegSeason + HoursOfPeakSeason
+    dict_countries = {"BE": "Belgium", "DE": "Germany", "DK": "Denmark",
+                      "GB": "GreatBrit.","NL": "Netherlands", "NO": "Norway",
+                      "DB": "DoggerBank", "SEE": "SouthEastEngland", "BS": "Borssele",
+                      "HK": "HollandseeKust", "HB": "HelgoländerBucht", "NS": "Nordsøen",
+                      "UN": "UtsiraNord", "SN1": "SørligeNordsjøI", "SN2": "SørligeNordsjøII"}
+    windfarmNodes = ["Dogger Bank","South East England","Borssele","Hollandsee Kust","Helgoländer Bucht","Nordsøen","Utsira Nord","Sørlige Nordsjø I","Sørlige Nordsjø II"]
+
+    generate_random_scenario(filepath = scenario_data_path,
+                             tab_file_path = tab_file_path,
+                             scenarios = NoOfScenarios,
+                             seasons = regular_seasons,
+                             Periods = NoOfPeriods,
+                             regularSeasonHours = lengthRegSeason,
+                             peakSeasonHours = lengthPeakSeason,
+                             dict_countries = dict_countries,
+                             seed = scenario_seed,
+                             file_suffix = f'_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}')
+    generate_tab_files(filepath = workbook_path, tab_file_path = tab_file_path,
+                       scenariogeneration = True, hydrogen = hydrogen)
+
+    objective = {}
+    for decomposition in ['extensive', 'benders']:
+        result_file_path = 'Results/' + version + '/' + name + '_' + decomposition
+        run_empire(name = name,
+                   tab_file_path = tab_file_path,
+                   result_file_path = result_file_path,
+                   scenariogeneration = True,
+                   scenario_data_path = scenario_data_path,
+                   solver = solver,
+                   temp_dir = temp_dir,
+                   FirstHoursOfRegSeason = FirstHoursOfRegSeason,
+                   FirstHoursOfPeakSeason = FirstHoursOfPeakSeason,
+                   lengthRegSeason = lengthRegSeason,
+                   lengthPeakSeason = lengthPeakSeason,
+                   Period = Period,
+                   Operationalhour = Operationalhour,
+                   Scenario = Scenario,
+                   Season = Season,
+                   HoursOfSeason = HoursOfSeason,
+                   NoOfNormalScenarios = NoOfNormalScenarios,
+                   NoOfHydrogenScenarios = NoOfHydrogenScenarios,
+                   discountrate = discountrate,
+                   WACC = WACC,
+                   LeapYearsInvestment = LeapYearsInvestment,
+                   WRITE_LP = False,
+                   CHECKPOINT = False,
+                   EMISSION_CAP = False,
+                   USE_TEMP_DIR = False,
+                   NoOfRegSeason = NoOfRegSeason,
+                   NoOfPeakSeason = NoOfPeakSeason,
+                   hydrogen = hydrogen,
+                   TIME_LIMIT = 0,
+                   h2storage = h2storage,
+                   windfarmNodes = list(windfarmNodes),
+                   decomposition = decomposition,
+                   benders_workers = BENDERS_WORKERS,
+                   benders_gap = BENDERS_GAP,
+                   benders_max_iterations = BENDERS_MAX_ITERATIONS)
+        with open(result_file_path + '/results_objective.csv', newline='') as f:
+            for row in csv.reader(f):
+                if row[0] == "Scientific notation:":
+                    objective[decomposition] = float(row[1])
+
+    difference = abs(objective['benders'] - objective['extensive']) / abs(objective['extensive'])
+    print('Objective extensive: ' + str(objective['extensive']) + ', Benders: ' + str(objective['benders']) +
+          ', relative difference: ' + str(difference))
+    if difference > BENDERS_GAP:
+        sys.exit("ERROR! The Benders objective differs from the extensive objective by more than BENDERS_GAP")
+    print(f'{datetime.now().strftime("%H:%M:%S")}: Benders check passed')
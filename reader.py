@@ -1,8 +1,31 @@
 import pandas as pd
 import os
+import hashlib
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
-def read_file(filepath, excel, sheet, columns, tab_file_path):
+def save_tab_file(frame, filename, tab_file_format='tab'):
+    # Function description: save a table either as tab separated text (.tab) or as typed columnar file (.parquet)
+    # Input: dataframe, filename without extension, 'tab' or 'parquet'
+    if tab_file_format == 'parquet':
+        frame.to_parquet(filename + '.parquet', index=False)
+    else:
+        frame.to_csv(filename + '.tab', header=True, index=None, sep='\t', mode='w')
+
+def load_tab_frame(filename, tab_file_format='tab'):
+    # Function description: read a table saved by save_tab_file (the .tab-file if there is no .parquet-file)
+    # Input: filename without extension, 'tab' or 'parquet'
+    # Output: dataframe
+    if tab_file_format == 'parquet' and os.path.exists(filename + '.parquet'):
+        return pd.read_parquet(filename + '.parquet')
+    return pd.read_csv(filename + '.tab', sep='\t')
+
+def read_file(filepath, excel, sheet, columns, tab_file_path, tab_file_format='tab'):
     input_sheet = pd.read_excel(filepath + "/" +excel, sheet, skiprows=2)
+    write_file(input_sheet, excel, sheet, columns, tab_file_path, tab_file_format)
+
+def write_file(input_sheet, excel, sheet, columns, tab_file_path, tab_file_format='tab'):
     if "_noCCS" in excel:
         excel = excel.replace('_noCCS','')
     if '_sequestration_all' in excel:
@@ -20,11 +43,14 @@ def read_file(filepath, excel, sheet, columns, tab_file_path):
         os.makedirs(tab_file_path)
     #excel = excel.replace(".xlsx", "_")
     #excel = excel.replace("Excel/", "")
-    save_csv_frame.to_csv(tab_file_path + "/" + excel.replace(".xlsx", '_') + sheet + '.tab', header=True, index=None, sep='\t', mode='w')
+    save_tab_file(save_csv_frame, tab_file_path + "/" + excel.replace(".xlsx", '_') + sheet, tab_file_format)
     #save_csv_frame.to_csv(excel.replace(".xlsx", '_') + sheet + '.tab', header=True, index=None, sep='\t', mode='w')
 
-def read_sets(filepath, excel, sheet, tab_file_path):
+def read_sets(filepath, excel, sheet, tab_file_path, tab_file_format='tab'):
     input_sheet = pd.read_excel(filepath + "/" + excel, sheet)
+    write_sets(input_sheet, excel, sheet, tab_file_path, tab_file_format)
+
+def write_sets(input_sheet, excel, sheet, tab_file_path, tab_file_format='tab'):
     if "_noCCS" in excel:
         excel = excel.replace('_noCCS','')
     if '_sequestration_all' in excel:
@@ -42,35 +68,132 @@ def read_sets(filepath, excel, sheet, tab_file_path):
         #excel = excel.replace("Excel/", "")
         if 'Unnamed' in column:
             print('\n\n\nWARNING: Unnamed column found in sheet ' + sheet + '\n\n\n')
-        save_csv_frame.to_csv(tab_file_path + "/" + excel.replace(".xlsx", '_') + column + '.tab', header=True, index=None, sep='\t', mode='w')
+        save_tab_file(save_csv_frame, tab_file_path + "/" + excel.replace(".xlsx", '_') + column, tab_file_format)
         #save_csv_frame.to_csv(excel.replace(".xlsx", '_') + column + '.tab', header=True, index=None, sep='\t', mode='w')
 
-def generate_tab_files(filepath, tab_file_path, scenariogeneration=True, hydrogen=False, case = ''):
+def read_workbook(filepath, excel, sheets, tab_file_path, tab_file_format='tab'):
+    # Function description: open an excel workbook once and write all requested sheets as .tab files
+    # Input: excel name, list of (sheet name, columns) where columns=None reads the sheet as sets
+    # Output: .tab files for every sheet in the list
+
+    with pd.ExcelFile(filepath + "/" + excel) as workbook:
+        for sheet, columns in sheets:
+            if columns is None:
+                write_sets(workbook.parse(sheet), excel, sheet, tab_file_path, tab_file_format)
+            else:
+                write_file(workbook.parse(sheet, skiprows=2), excel, sheet, columns, tab_file_path, tab_file_format)
+    return excel
+
+def file_hash(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def tab_cache_key(filepath, workbooks, hydrogen, case, tab_file_format='tab'):
+    # Function description: content address of a set of .tab-files
+    # Input: the workbooks (and their sheets) to be read, and the flags of generate_tab_files
+    # Output: sha256 of the workbook contents, the sheets read from them, the hydrogen/case flags and the file format
+
+    key = hashlib.sha256()
+    key.update(repr((hydrogen, case, tab_file_format, sorted(workbooks.items()))).encode())
+    for excel in sorted(workbooks):
+        key.update(excel.encode())
+        key.update(file_hash(filepath + "/" + excel).encode())
+    return key.hexdigest()
+
+def verify_tab_cache(cache_entry):
+    # Checks that every file in the manifest of a cache entry is present and unchanged
+    manifest = cache_entry + "/manifest.tab"
+    if not os.path.isfile(manifest):
+        return False
+    files = pd.read_csv(manifest, sep='\t')
+    for file, sha in zip(files['File'], files['Sha256']):
+        if not os.path.isfile(cache_entry + "/" + file) or file_hash(cache_entry + "/" + file) != sha:
+            return False
+    return True
+
+def write_tab_cache(cache_path, key, read_tab_files):
+    # Generates the .tab-files in a temporary directory of the cache, writes the manifest and moves
+    # the directory in place, so that an entry is never seen half written
+    if not os.path.exists(cache_path):
+        os.makedirs(cache_path)
+    cache_entry = cache_path + "/" + key
+    temp_entry = tempfile.mkdtemp(dir=cache_path, prefix='tmp_' + key[:8] + '_')
+    try:
+        read_tab_files(temp_entry)
+        files = sorted(os.listdir(temp_entry))
+        pd.DataFrame({'File': files, 'Sha256': [file_hash(temp_entry + "/" + file) for file in files]}).to_csv(
+            temp_entry + "/manifest.tab", header=True, index=None, sep='\t', mode='w')
+        if os.path.exists(cache_entry):
+            shutil.rmtree(cache_entry)
+        os.rename(temp_entry, cache_entry)
+    except OSError:
+        # Another run stored the same entry in the meantime
+        if not verify_tab_cache(cache_entry):
+            raise
+    finally:
+        if os.path.exists(temp_entry):
+            shutil.rmtree(temp_entry)
+    return cache_entry
+
+def link_tab_cache(cache_entry, tab_file_path):
+    # Places the cached .tab-files in tab_file_path as hardlinks, falling back to symlinks and copies.
+    # Existing files are removed first, so that a later write to tab_file_path never goes into the cache.
+    files = pd.read_csv(cache_entry + "/manifest.tab", sep='\t')['File']
+    for file in files:
+        source = os.path.abspath(cache_entry + "/" + file)
+        target = tab_file_path + "/" + file
+        if os.path.lexists(target):
+            os.remove(target)
+        try:
+            os.link(source, target)
+        except OSError:
+            try:
+                os.symlink(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+
+def generate_tab_files(filepath, tab_file_path, scenariogeneration=True, hydrogen=False, case = '', workers=None, cache_path=None, tab_file_format='tab'):
     # Function description: read column value from excel sheet and save as .tab file "sheet.tab"
     # Input: excel name, sheet name, the number of columns to be read
     # Output:  .tab file
-    
+    # Each workbook is opened once and all its sheets are parsed in one pass. Different workbooks are
+    # handled in parallel by a process pool with 'workers' processes (None = one per CPU, 1 = serial).
+    # If cache_path is given, the .tab-files are stored there under a hash of the workbooks and flags, and
+    # a verified cache entry is reused (hardlinked) instead of reading the workbooks again.
+    # With tab_file_format='parquet' the tables are saved as typed .parquet files instead of text .tab files.
+
     print("Generating .tab-files...")
 
-    # Reading Excel workbooks using our function read_file
+    # Collecting the sheets to read from each Excel workbook, which are then read using read_workbook
 
     if not os.path.exists(tab_file_path):
         os.makedirs(tab_file_path)
 
-    read_sets(filepath, 'Sets.xlsx', 'Nodes',tab_file_path = tab_file_path)
-    #read_sets(filepath, 'Sets.xlsx', 'Times', tab_file_path = tab_file_path)
-    read_sets(filepath, 'Sets.xlsx', 'LineType', tab_file_path = tab_file_path)
-    read_sets(filepath, 'Sets.xlsx', 'PipelineType', tab_file_path = tab_file_path)
-    read_sets(filepath, 'Sets.xlsx', 'Technology', tab_file_path = tab_file_path)
-    read_sets(filepath, 'Sets.xlsx', 'Storage', tab_file_path = tab_file_path)
-    read_sets(filepath, 'Sets.xlsx', 'Generators', tab_file_path = tab_file_path)
-    read_file(filepath, 'Sets.xlsx', 'StorageOfNodes', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Sets.xlsx', 'GeneratorsOfNode', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Sets.xlsx', 'GeneratorsOfTechnology', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Sets.xlsx', 'DirectionalLines', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Sets.xlsx', 'PipelineTypeOfLines', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Sets.xlsx', 'LineTypeOfDirectionalLines', [0, 1, 2], tab_file_path = tab_file_path)
-    read_sets(filepath, 'Sets.xlsx', 'HydrogenGenerators', tab_file_path = tab_file_path)
+    workbooks = {}
+
+    def add_file(excel, sheet, columns):
+        workbooks.setdefault(excel, []).append((sheet, columns))
+
+    def add_sets(excel, sheet):
+        workbooks.setdefault(excel, []).append((sheet, None))
+
+    add_sets('Sets.xlsx', 'Nodes')
+    #add_sets('Sets.xlsx', 'Times')
+    add_sets('Sets.xlsx', 'LineType')
+    add_sets('Sets.xlsx', 'PipelineType')
+    add_sets('Sets.xlsx', 'Technology')
+    add_sets('Sets.xlsx', 'Storage')
+    add_sets('Sets.xlsx', 'Generators')
+    add_file('Sets.xlsx', 'StorageOfNodes', [0, 1])
+    add_file('Sets.xlsx', 'GeneratorsOfNode', [0, 1])
+    add_file('Sets.xlsx', 'GeneratorsOfTechnology', [0, 1])
+    add_file('Sets.xlsx', 'DirectionalLines', [0, 1])
+    add_file('Sets.xlsx', 'PipelineTypeOfLines', [0, 1, 2])
+    add_file('Sets.xlsx', 'LineTypeOfDirectionalLines', [0, 1, 2])
+    add_sets('Sets.xlsx', 'HydrogenGenerators')
 
 
     # Reading GeneratorPeriod
@@ -78,65 +201,65 @@ def generate_tab_files(filepath, tab_file_path, scenariogeneration=True, hydroge
         generator_file_name = 'Generator_noCCS.xlsx'
     else:
         generator_file_name = 'Generator.xlsx'
-    read_file(filepath, generator_file_name, 'FixedOMCosts', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'CapitalCosts', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'VariableOMCosts', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'FuelCosts', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'CCSCostTSVariable', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'Efficiency', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'RefInitialCap', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'ScaleFactorInitialCap', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'InitialCapacity', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'MaxBuiltCapacity', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'MaxInstalledCapacity', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'RampRate', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'GeneratorTypeAvailability', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'CO2Content', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'CO2Captured', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, generator_file_name, 'Lifetime', [0, 1], tab_file_path = tab_file_path)
+    add_file(generator_file_name, 'FixedOMCosts', [0, 1, 2])
+    add_file(generator_file_name, 'CapitalCosts', [0, 1, 2])
+    add_file(generator_file_name, 'VariableOMCosts', [0, 1])
+    add_file(generator_file_name, 'FuelCosts', [0, 1, 2])
+    add_file(generator_file_name, 'CCSCostTSVariable', [0, 1])
+    add_file(generator_file_name, 'Efficiency', [0, 1, 2])
+    add_file(generator_file_name, 'RefInitialCap', [0, 1, 2])
+    add_file(generator_file_name, 'ScaleFactorInitialCap', [0, 1, 2])
+    add_file(generator_file_name, 'InitialCapacity', [0, 1, 2, 3])
+    add_file(generator_file_name, 'MaxBuiltCapacity', [0, 1, 2, 3])
+    add_file(generator_file_name, 'MaxInstalledCapacity', [0, 1, 2])
+    add_file(generator_file_name, 'RampRate', [0, 1])
+    add_file(generator_file_name, 'GeneratorTypeAvailability', [0, 1])
+    add_file(generator_file_name, 'CO2Content', [0, 1])
+    add_file(generator_file_name, 'CO2Captured', [0, 1])
+    add_file(generator_file_name, 'Lifetime', [0, 1])
 
     #Reading InterConnector
-    read_file(filepath, 'Transmission.xlsx', 'lineEfficiency', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'MaxInstallCapacityRaw', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'MaxBuiltCapacity', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'Length', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'TypeConverterFixedCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'TypeConverterVariableCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'TypeCableFixedCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'TypeCableVariableCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'TypeFixedOMCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'InitialCapacity', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, 'Transmission.xlsx', 'Lifetime', [0, 1, 2], tab_file_path = tab_file_path)
+    add_file('Transmission.xlsx', 'lineEfficiency', [0, 1, 2])
+    add_file('Transmission.xlsx', 'MaxInstallCapacityRaw', [0, 1, 2, 3])
+    add_file('Transmission.xlsx', 'MaxBuiltCapacity', [0, 1, 2, 3])
+    add_file('Transmission.xlsx', 'Length', [0, 1, 2])
+    add_file('Transmission.xlsx', 'TypeConverterFixedCost', [0, 1, 2])
+    add_file('Transmission.xlsx', 'TypeConverterVariableCost', [0, 1, 2])
+    add_file('Transmission.xlsx', 'TypeCableFixedCost', [0, 1, 2])
+    add_file('Transmission.xlsx', 'TypeCableVariableCost', [0, 1, 2])
+    add_file('Transmission.xlsx', 'TypeFixedOMCost', [0, 1, 2])
+    add_file('Transmission.xlsx', 'InitialCapacity', [0, 1, 2, 3])
+    add_file('Transmission.xlsx', 'Lifetime', [0, 1, 2])
 
     #Reading Node
-    read_file(filepath, 'Node.xlsx', 'ElectricAnnualDemand', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Node.xlsx', 'NodeLostLoadCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Node.xlsx', 'HydroGenMaxAnnualProduction', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Node.xlsx', 'Latitude', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Node.xlsx', 'Longitude', [0, 1], tab_file_path = tab_file_path)
+    add_file('Node.xlsx', 'ElectricAnnualDemand', [0, 1, 2])
+    add_file('Node.xlsx', 'NodeLostLoadCost', [0, 1, 2])
+    add_file('Node.xlsx', 'HydroGenMaxAnnualProduction', [0, 1])
+    add_file('Node.xlsx', 'Latitude', [0, 1])
+    add_file('Node.xlsx', 'Longitude', [0, 1])
 
     #Reading Season
-    read_file(filepath, 'General.xlsx', 'seasonScale', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'General.xlsx', 'CO2Cap', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'General.xlsx', 'CO2Price', [0, 1], tab_file_path = tab_file_path)
+    add_file('General.xlsx', 'seasonScale', [0, 1])
+    add_file('General.xlsx', 'CO2Cap', [0, 1])
+    add_file('General.xlsx', 'CO2Price', [0, 1])
     
     #Reading Storage
-    read_file(filepath, 'Storage.xlsx', 'StorageBleedEfficiency', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'StorageChargeEff', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'StorageDischargeEff', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'StoragePowToEnergy', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'StorageInitialEnergyLevel', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'InitialPowerCapacity', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'PowerCapitalCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'PowerFixedOMCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'PowerMaxBuiltCapacity', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'EnergyCapitalCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'EnergyFixedOMCost', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'EnergyInitialCapacity', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'EnergyMaxBuiltCapacity', [0, 1, 2, 3], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'EnergyMaxInstalledCapacity', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'PowerMaxInstalledCapacity', [0, 1, 2], tab_file_path = tab_file_path)
-    read_file(filepath, 'Storage.xlsx', 'Lifetime', [0, 1], tab_file_path = tab_file_path)
+    add_file('Storage.xlsx', 'StorageBleedEfficiency', [0, 1])
+    add_file('Storage.xlsx', 'StorageChargeEff', [0, 1])
+    add_file('Storage.xlsx', 'StorageDischargeEff', [0, 1])
+    add_file('Storage.xlsx', 'StoragePowToEnergy', [0, 1])
+    add_file('Storage.xlsx', 'StorageInitialEnergyLevel', [0, 1])
+    add_file('Storage.xlsx', 'InitialPowerCapacity', [0, 1, 2, 3])
+    add_file('Storage.xlsx', 'PowerCapitalCost', [0, 1, 2])
+    add_file('Storage.xlsx', 'PowerFixedOMCost', [0, 1, 2])
+    add_file('Storage.xlsx', 'PowerMaxBuiltCapacity', [0, 1, 2, 3])
+    add_file('Storage.xlsx', 'EnergyCapitalCost', [0, 1, 2])
+    add_file('Storage.xlsx', 'EnergyFixedOMCost', [0, 1, 2])
+    add_file('Storage.xlsx', 'EnergyInitialCapacity', [0, 1, 2, 3])
+    add_file('Storage.xlsx', 'EnergyMaxBuiltCapacity', [0, 1, 2, 3])
+    add_file('Storage.xlsx', 'EnergyMaxInstalledCapacity', [0, 1, 2])
+    add_file('Storage.xlsx', 'PowerMaxInstalledCapacity', [0, 1, 2])
+    add_file('Storage.xlsx', 'Lifetime', [0, 1])
 
     #Reading CO2 files
     if case == 'sequestration_all':
@@ -144,62 +267,84 @@ def generate_tab_files(filepath, tab_file_path, scenariogeneration=True, hydroge
     else:
         co2_file_name = 'CO2.xlsx'
 
-    read_sets(filepath, co2_file_name, 'CO2SequestrationNodes', tab_file_path = tab_file_path)
-    read_file(filepath, co2_file_name, 'StorageSiteCapitalCost', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, co2_file_name, 'StorageSiteFixedOMCost', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, co2_file_name, 'PipelineCapitalCost', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, co2_file_name, 'PipelineFixedOM', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, co2_file_name, 'PipelineCapacity', [0, 1], tab_file_path = tab_file_path)
-    read_file(filepath, co2_file_name, 'PipelineElectricityUsage', [0, 1], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquefierCapitalCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquefierFixedOMCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquefierElectricityUse', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquidStorageCapitalCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquidStorageFixedOM', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquidShipCapitalCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquidShipFixedOM', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquidShipVariableCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquidShipCapacity', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquidShipLifetime', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'CO2.xlsx', 'LiquidShipLoadingDischargeTime', [0], tab_file_path = tab_file_path)
+    add_sets(co2_file_name, 'CO2SequestrationNodes')
+    add_file(co2_file_name, 'StorageSiteCapitalCost', [0, 1])
+    add_file(co2_file_name, 'StorageSiteFixedOMCost', [0, 1])
+    add_file(co2_file_name, 'PipelineCapitalCost', [0, 1])
+    add_file(co2_file_name, 'PipelineFixedOM', [0, 1])
+    add_file(co2_file_name, 'PipelineCapacity', [0, 1])
+    add_file(co2_file_name, 'PipelineElectricityUsage', [0, 1])
+    # add_file('CO2.xlsx', 'LiquefierCapitalCost', [0])
+    # add_file('CO2.xlsx', 'LiquefierFixedOMCost', [0])
+    # add_file('CO2.xlsx', 'LiquefierElectricityUse', [0])
+    # add_file('CO2.xlsx', 'LiquidStorageCapitalCost', [0])
+    # add_file('CO2.xlsx', 'LiquidStorageFixedOM', [0])
+    # add_file('CO2.xlsx', 'LiquidShipCapitalCost', [0])
+    # add_file('CO2.xlsx', 'LiquidShipFixedOM', [0])
+    # add_file('CO2.xlsx', 'LiquidShipVariableCost', [0])
+    # add_file('CO2.xlsx', 'LiquidShipCapacity', [0])
+    # add_file('CO2.xlsx', 'LiquidShipLifetime', [0])
+    # add_file('CO2.xlsx', 'LiquidShipLoadingDischargeTime', [0])
 
     #Reading ammonia files
-    # read_file(filepath, 'Ammonia.xlsx', 'ShipCapitalCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'ShipFixedOMCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'ShipCapacity', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'ProducerCapitalCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'ProducerFixedOM', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'ProducerElectricityUse', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'CrackerCapitalCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'CrackerFixedOM', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'CrackerElectricityUse', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'StorageCapitalCost', [0], tab_file_path = tab_file_path)
-    # read_file(filepath, 'Ammonia.xlsx', 'StorageFixedOM', [0], tab_file_path = tab_file_path)
+    # add_file('Ammonia.xlsx', 'ShipCapitalCost', [0])
+    # add_file('Ammonia.xlsx', 'ShipFixedOMCost', [0])
+    # add_file('Ammonia.xlsx', 'ShipCapacity', [0])
+    # add_file('Ammonia.xlsx', 'ProducerCapitalCost', [0])
+    # add_file('Ammonia.xlsx', 'ProducerFixedOM', [0])
+    # add_file('Ammonia.xlsx', 'ProducerElectricityUse', [0])
+    # add_file('Ammonia.xlsx', 'CrackerCapitalCost', [0])
+    # add_file('Ammonia.xlsx', 'CrackerFixedOM', [0])
+    # add_file('Ammonia.xlsx', 'CrackerElectricityUse', [0])
+    # add_file('Ammonia.xlsx', 'StorageCapitalCost', [0])
+    # add_file('Ammonia.xlsx', 'StorageFixedOM', [0])
 
     if hydrogen is True:
-        read_sets(filepath, 'Hydrogen.xlsx', 'ProductionNodes', tab_file_path = tab_file_path)
-        # read_file(filepath, 'Hydrogen.xlsx', 'Links', [0,1], tab_file_path = tab_file_path) # Depcreated; The links are now instead defined by the transmission links, but only between the production nodes
-        read_sets(filepath, 'Hydrogen.xlsx', 'ReformerLocations', tab_file_path = tab_file_path)
-        read_sets(filepath, 'Hydrogen.xlsx', 'ReformerPlants', tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ReformerCapitalCost', [0,1,2], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ReformerFixedOMCost', [0,1,2], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ReformerVariableOMCost', [0,1,2], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ReformerEfficiency', [0,1,2], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ReformerElectricityUse', [0,1,2], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ReformerLifetime', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ReformerEmissionFactor', [0,1,2], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ReformerCO2CaptureFactor', [0,1,2], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ElectrolyzerPlantCapitalCost', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ElectrolyzerFixedOMCost', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ElectrolyzerStackCapitalCost', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ElectrolyzerLifetime', [0], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'ElectrolyzerMWhPerTon', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'PipelineCapitalCost', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'PipelineOMCostPerKM', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'PipelineCapacity', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'PipelineCompressorPowerUsage', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'StorageCapitalCost', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'StorageFixedOMCost', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'StorageMaxCapacity', [0,1], tab_file_path = tab_file_path)
-        read_file(filepath, 'Hydrogen.xlsx', 'Demand', [0,1,2], tab_file_path = tab_file_path)
-        # read_file(filepath, 'Hydrogen.xlsx', 'Distances', [0,1,2], tab_file_path = tab_file_path) # Depecreated; Distances are now copied from the transmission distances
\ No newline at end of file
+        add_sets('Hydrogen.xlsx', 'ProductionNodes')
+        # add_file('Hydrogen.xlsx', 'Links', [0,1]) # Depcreated; The links are now instead defined by the transmission links, but only between the production nodes
+        add_sets('Hydrogen.xlsx', 'ReformerLocations')
+        add_sets('Hydrogen.xlsx', 'ReformerPlants')
+        add_file('Hydrogen.xlsx', 'ReformerCapitalCost', [0,1,2])
+        add_file('Hydrogen.xlsx', 'ReformerFixedOMCost', [0,1,2])
+        add_file('Hydrogen.xlsx', 'ReformerVariableOMCost', [0,1,2])
+        add_file('Hydrogen.xlsx', 'ReformerEfficiency', [0,1,2])
+        add_file('Hydrogen.xlsx', 'ReformerElectricityUse', [0,1,2])
+        add_file('Hydrogen.xlsx', 'ReformerLifetime', [0,1])
+        add_file('Hydrogen.xlsx', 'ReformerEmissionFactor', [0,1,2])
+        add_file('Hydrogen.xlsx', 'ReformerCO2CaptureFactor', [0,1,2])
+        add_file('Hydrogen.xlsx', 'ElectrolyzerPlantCapitalCost', [0,1])
+        add_file('Hydrogen.xlsx', 'ElectrolyzerFixedOMCost', [0,1])
+        add_file('Hydrogen.xlsx', 'ElectrolyzerStackCapitalCost', [0,1])
+        add_file('Hydrogen.xlsx', 'ElectrolyzerLifetime', [0])
+        add_file('Hydrogen.xlsx', 'ElectrolyzerMWhPerTon', [0,1])
+        add_file('Hydrogen.xlsx', 'PipelineCapitalCost', [0,1])
+        add_file('Hydrogen.xlsx', 'PipelineOMCostPerKM', [0,1])
+        add_file('Hydrogen.xlsx', 'PipelineCapacity', [0,1])
+        add_file('Hydrogen.xlsx', 'PipelineCompressorPowerUsage', [0,1])
+        add_file('Hydrogen.xlsx', 'StorageCapitalCost', [0,1])
+        add_file('Hydrogen.xlsx', 'StorageFixedOMCost', [0,1])
+        add_file('Hydrogen.xlsx', 'StorageMaxCapacity', [0,1])
+        add_file('Hydrogen.xlsx', 'Demand', [0,1,2])
+        # add_file('Hydrogen.xlsx', 'Distances', [0,1,2]) # Depecreated; Distances are now copied from the transmission distances
+
+    def read_tab_files(path):
+        if workers == 1:
+            for excel, sheets in workbooks.items():
+                read_workbook(filepath, excel, sheets, path, tab_file_format)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                jobs = [pool.submit(read_workbook, filepath, excel, sheets, path, tab_file_format) for excel, sheets in workbooks.items()]
+                for job in jobs:
+                    job.result()
+
+    if cache_path is None:
+        read_tab_files(tab_file_path)
+        return
+
+    key = tab_cache_key(filepath, workbooks, hydrogen, case, tab_file_format)
+    cache_entry = cache_path + "/" + key
+    if verify_tab_cache(cache_entry):
+        print("Reusing cached .tab-files " + key)
+    else:
+        cache_entry = write_tab_cache(cache_path, key, read_tab_files)
+    link_tab_cache(cache_entry, tab_file_path)
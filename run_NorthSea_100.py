@@ -1,6 +1,7 @@
 from reader import generate_tab_files
 from Empire import run_empire
-from scenario_random import generate_random_scenario
+from scenario_random import generate_random_scenario, representative_season_names
+from scenario_reduction import reduce_scenarios
 from datetime import datetime
 import time
 import gc
@@ -11,6 +12,11 @@ import numpy as np
 ########
 
 USE_TEMP_DIR = True #True/False
+USE_TAB_CACHE = True #True/False
+TAB_FILE_FORMAT = 'tab' #'tab'/'parquet'
+RESULT_FILE_FORMAT = 'parquet' #'csv'/'parquet'/'hdf5' (parquet and hdf5: typed, compressed result tables, hdf5 needs PyTables)
+CSV_EXPORT = False #True/False (also write the result tables as .csv-files)
+CONSTRUCTION = 'abstract' #'abstract'/'concrete' (AbstractModel with DataPortal or ConcreteModel with pandas)
 temp_dir = '/mnt/beegfs/users/gorand/TempDir'
 version = 'north_sea'
 NoOfPeriods = 6
@@ -27,10 +33,26 @@ discountrate = 0.05
 WACC = 0.05
 LeapYearsInvestment = 5
 solver = "Gurobi" #"Gurobi" #"CPLEX" #"Xpress"
+SOLVER_INTERFACE = 'shell' #'shell'/'direct'/'persistent'/'appsi' (shell: through an LP-file, the others in memory)
+DECOMPOSITION = 'extensive' #'extensive'/'benders' (investment master problem and operational subproblems per period and scenario)
+BENDERS_WORKERS = None #int/None (processes solving the Benders subproblems, None: one per CPU, 1: serial)
+BENDERS_GAP = 1e-2 #relative gap between the upper and lower bound of the Benders decomposition
+BENDERS_MAX_ITERATIONS = 100
 scenariogeneration = False #True #False
+scenario_seed = None #int/None (None: a new seed is drawn and printed)
+scenario_sampling = 'random' #'random'/'cluster' (representative weeks by k-medoids clustering)
+weeksPerSeason = 2 #representative weeks per season with scenario_sampling = 'cluster'
+scenarioreduction = False #True/False
+NoOfReducedScenarios = 1 #normal scenarios kept per hydrogen scenario with scenarioreduction
 EMISSION_CAP = False #False
 WRITE_LP = False #True
-PICKLE_INSTANCE = False #True 
+CHECKPOINT = False #True/False (save the solution of each run: variable values, duals, solver status)
+LOAD_CHECKPOINT = False #True/False (write the results of the solution saved with CHECKPOINT instead of solving)
+PRESOLVE = False #True (substitute out variables defined by a single equality before solving)
+SWEEP_IN_PROCESS = True #True/False (build the instance once and solve it for all hydrogen demand and std dev percentages)
+WARMSTART = True #True/False (MIP start from the previous sweep point, or from the results in warmstart_path)
+warmstart_path = None #None/result directory of a previous run
+PROFILE_CONSTRUCTION = False #True (time, indices and memory of the construction of each component to construction_profile.csv/.json)
 hydrogen = True
 h2storage = True
 TIME_LIMIT = 0
@@ -40,28 +62,47 @@ hydrogen_demand_percentages = np.linspace(50,100,4, endpoint=True)
 # hydrogen_demand_percentages = hydrogen_demand_percentages[::-1]
 case=''
 
+sample_seasons = regular_seasons
+if scenariogeneration and scenario_sampling == 'cluster':
+    regular_seasons = representative_season_names(sample_seasons, weeksPerSeason)
+    NoOfRegSeason = len(regular_seasons)
+    #The clustered weeks are the same in all scenarios: one normal scenario per hydrogen scenario
+    NoOfNormalScenarios = 1
+    NoOfScenarios = NoOfNormalScenarios * NoOfHydrogenScenarios
+    scenarioreduction = False
+
 #######
 ##RUN##
 #######
-for std_dev in std_dev_percentages:
-    for h2_demand_perc in hydrogen_demand_percentages:
-        if NoOfHydrogenScenarios > 1:
-                name = f'{version}_h2scen{NoOfHydrogenScenarios}_stddev{std_dev}_h2demandperc{h2_demand_perc:.2f}'
-                # name = f'{version}_withoutCCS_h2scen{NoOfHydrogenScenarios}_stddev{std_dev}_h2demandperc{h2_demand_perc:.2f}'
-                # name = f'{version}_sequestrationAll_h2scen{NoOfHydrogenScenarios}_stddev{std_dev}_h2demandperc{h2_demand_perc:.2f}'
-        else:
-            name = f'{version}_Deterministic_h2demandperc{h2_demand_perc:.2f}'
-            # name = f'{version}_withoutCCS_Deterministic_h2demandperc{h2_demand_perc:.2f}'
-            # name = f'{version}_sequestrationAll_Deterministic_h2demandperc{h2_demand_perc:.2f}'
+if __name__ == "__main__":
+    # Guard needed since the .tab-file reader starts worker processes
+    sweep = []
+    for std_dev in std_dev_percentages:
+        for h2_demand_perc in hydrogen_demand_percentages:
+            if NoOfHydrogenScenarios > 1:
+                    name = f'{version}_h2scen{NoOfHydrogenScenarios}_stddev{std_dev}_h2demandperc{h2_demand_perc:.2f}'
+                    # name = f'{version}_withoutCCS_h2scen{NoOfHydrogenScenarios}_stddev{std_dev}_h2demandperc{h2_demand_perc:.2f}'
+                    # name = f'{version}_sequestrationAll_h2scen{NoOfHydrogenScenarios}_stddev{std_dev}_h2demandperc{h2_demand_perc:.2f}'
+            else:
+                name = f'{version}_Deterministic_h2demandperc{h2_demand_perc:.2f}'
+                # name = f'{version}_withoutCCS_Deterministic_h2demandperc{h2_demand_perc:.2f}'
+                # name = f'{version}_sequestrationAll_Deterministic_h2demandperc{h2_demand_perc:.2f}'
+            sweep.append([name, 'Results/' + version + '/' + name, h2_demand_perc/100, std_dev/100])
+
+    # One run for the whole sweep (the first point names the tab files), or one run for each point
+    runs = [sweep] if SWEEP_IN_PROCESS else [[point] for point in sweep]
+    for run_sweep in runs:
+        [name, result_file_path, h2_demand_perc, std_dev] = run_sweep[0]
 
         workbook_path = 'Data handler/' + version
         tab_file_path = 'Data handler/' + version + '/Tab_Files_' + name
+        tab_cache_path = 'Data handler/' + version + '/Tab_Cache' if USE_TAB_CACHE else None
         scenario_data_path = 'Data handler/' + version + '/ScenarioData'
-        result_file_path = 'Results/' + version + '/' + name
         FirstHoursOfRegSeason = [lengthRegSeason*i + 1 for i in range(NoOfRegSeason)]
         FirstHoursOfPeakSeason = [lengthRegSeason*NoOfRegSeason + lengthPeakSeason*i + 1 for i in range(NoOfPeakSeason)]
         Period = [i + 1 for i in range(NoOfPeriods)]
-        Scenario = ["scenario"+str(i + 1) for i in range(NoOfScenarios)]
+        NoOfModelScenarios = NoOfReducedScenarios if scenarioreduction else NoOfNormalScenarios
+        Scenario = ["scenario"+str(i + 1) for i in range(NoOfHydrogenScenarios * NoOfModelScenarios)]
         peak_seasons = ['peak'+str(i + 1) for i in range(NoOfPeakSeason)]
         Season = regular_seasons + peak_seasons
         Operationalhour = [i + 1 for i in range(FirstHoursOfPeakSeason[-1] + lengthPeakSeason - 1)]
@@ -102,17 +143,32 @@ for std_dev in std_dev_percentages:
             generate_random_scenario(filepath = scenario_data_path,
                                      tab_file_path = tab_file_path,
                                      scenarios = NoOfScenarios,
-                                     seasons = regular_seasons,
+                                     seasons = sample_seasons,
                                      Periods = NoOfPeriods,
                                      regularSeasonHours = lengthRegSeason,
                                      peakSeasonHours = lengthPeakSeason,
-                                     dict_countries = dict_countries)
+                                     dict_countries = dict_countries,
+                                     tab_file_format = TAB_FILE_FORMAT,
+                                     seed = scenario_seed,
+                                     sampling = scenario_sampling,
+                                     weeksPerSeason = weeksPerSeason,
+                                     file_suffix = f'_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}')
             tock = time.time()
             print("{hour}:{minute}:{second}: Scenario generation took [sec]:".format(
             hour=datetime.now().strftime("%H"), minute=datetime.now().strftime("%M"), second=datetime.now().strftime("%S")) + str(tock - tick))
 
         generate_tab_files(filepath = workbook_path, tab_file_path = tab_file_path,
-                           scenariogeneration = scenariogeneration, hydrogen = hydrogen, case=case)
+                           scenariogeneration = scenariogeneration, hydrogen = hydrogen, case=case,
+                           cache_path = tab_cache_path, tab_file_format = TAB_FILE_FORMAT)
+
+        if scenarioreduction:
+            scenariopath = tab_file_path if scenariogeneration else scenario_data_path
+            reduce_scenarios(scenario_data_path = scenariopath,
+                             reduced_scenario_data_path = scenariopath,
+                             NoOfHydrogenScenarios = NoOfHydrogenScenarios,
+                             NoOfNormalScenarios = NoOfNormalScenarios,
+                             NoOfReducedScenarios = NoOfReducedScenarios,
+                             tab_file_format = TAB_FILE_FORMAT)
 
         run_empire(name = name,
                    tab_file_path = tab_file_path,
@@ -130,13 +186,13 @@ for std_dev in std_dev_percentages:
                    Scenario = Scenario,
                    Season = Season,
                    HoursOfSeason = HoursOfSeason,
-                   NoOfNormalScenarios = NoOfNormalScenarios,
+                   NoOfNormalScenarios = NoOfModelScenarios,
                    NoOfHydrogenScenarios = NoOfHydrogenScenarios,
                    discountrate = discountrate,
                    WACC = WACC,
                    LeapYearsInvestment = LeapYearsInvestment,
                    WRITE_LP = WRITE_LP,
-                   PICKLE_INSTANCE = PICKLE_INSTANCE,
+                   CHECKPOINT = CHECKPOINT,
                    EMISSION_CAP = EMISSION_CAP,
                    USE_TEMP_DIR = USE_TEMP_DIR,
                    NoOfRegSeason = NoOfRegSeason,
@@ -146,6 +202,21 @@ for std_dev in std_dev_percentages:
                    TIME_LIMIT = TIME_LIMIT,
                    h2storage = h2storage,
                    windfarmNodes = windfarmNodes,
-                   hydrogen_demand_percentage = h2_demand_perc/100,
-                   std_dev_percentage = std_dev/100)
-    gc.collect()
\ No newline at end of file
+                   hydrogen_demand_percentage = h2_demand_perc,
+                   std_dev_percentage = std_dev,
+                   tab_file_format = TAB_FILE_FORMAT,
+                   construction = CONSTRUCTION,
+                   PRESOLVE = PRESOLVE,
+                   sweep = run_sweep,
+                   WARMSTART = WARMSTART,
+                   warmstart_path = warmstart_path,
+                   solver_interface = SOLVER_INTERFACE,
+                   PROFILE_CONSTRUCTION = PROFILE_CONSTRUCTION,
+                   result_file_format = RESULT_FILE_FORMAT,
+                   CSV_EXPORT = CSV_EXPORT,
+                   LOAD_CHECKPOINT = LOAD_CHECKPOINT,
+                   decomposition = DECOMPOSITION,
+                   benders_workers = BENDERS_WORKERS,
+                   benders_gap = BENDERS_GAP,
+                   benders_max_iterations = BENDERS_MAX_ITERATIONS)
+        gc.collect()
\ No newline at end of file
@@ -1,133 +1,113 @@
 import pandas as pd
 import numpy as np
 import os
+from concurrent.futures import ProcessPoolExecutor
+from reader import save_tab_file
 
-def gather_season(data, season):
-    if season=="winter":
-        return data.loc[data.month.isin([12, 1, 2]), :]
-    elif season=="spring":
-        return data.loc[data.month.isin([3, 4, 5]), :]
-    elif season=="summer":
-        return data.loc[data.month.isin([6, 7, 8]), :]
-    elif season=="fall":
-        return data.loc[data.month.isin([9, 10, 11]), :]
-
-def remove_time_index(data):
-    data = data.reset_index(drop=True)
-    data = data.drop(['time', 'year', 'month', 'dayofweek', 'hour'], axis=1)
-    return data
-
-
-def filter_sample_year(data, sample_year):
-    data["time"] = pd.to_datetime(data["time"])
-    data['year'] = data['time'].dt.year
-    data['month'] = data['time'].dt.month
-    data['hour'] = data['time'].dt.hour
-    data['dayofweek'] = data['time'].dt.dayofweek
-    if sample_year != None:
-        data = data.loc[data.year.isin(sample_year), :]
-    return data
-
-def gather_regular_sample(data, season, seasons, regularSeasonHours,
-                          sample_hour):
-    data = gather_season(data=data, season=season)
-    data = data.reset_index(drop=True)
-    sample_data = data.iloc[sample_hour:sample_hour + regularSeasonHours,:]
-    
-    # Sort sample_data to start on midnight monday
-    sample_data = sample_data.sort_values(by=['dayofweek','hour'])
+SEASON_MONTHS = {"winter": [12, 1, 2], "spring": [3, 4, 5],
+                 "summer": [6, 7, 8], "fall": [9, 10, 11]}
+TIME_COLUMNS = ['time', 'year', 'month', 'dayofweek', 'hour']
+
+def index_scenario_data(data, seasons):
+    # Function description: parse the time stamps of a raw scenario time
+    # series once and index the rows of each year and of each season within
+    # a year, so that samples can be taken by integer offsets
+    # Input: raw data (time column and one column per node), season names
+    # Output: dict with the node names, the values (rows x nodes), hour and
+    # day of week of each row, and the row positions per year ('all' and per
+    # season). The year None indexes the rows of all years
+    time = pd.to_datetime(data["time"])
+    year = time.dt.year.values
+    month = time.dt.month.values
+    nodes = [c for c in data.columns if c not in TIME_COLUMNS]
+    rows = {}
+    for y in [None] + sorted(set(year)):
+        if y is None:
+            year_rows = np.arange(len(data))
+        else:
+            year_rows = np.flatnonzero(year == y)
+        rows[y] = {'all': year_rows}
+        for s in seasons:
+            rows[y][s] = year_rows[np.isin(month[year_rows], SEASON_MONTHS[s])]
+    return {'nodes': nodes, 'values': data[nodes].to_numpy(),
+            'hour': time.dt.hour.values,
+            'dayofweek': time.dt.dayofweek.values, 'rows': rows}
+
+def gather_regular_sample(data, sample_year, season, seasons,
+                          regularSeasonHours, sample_hour):
+    rows = data['rows'][sample_year][season]
+    rows = rows[sample_hour:sample_hour + regularSeasonHours]
     
-    # Drop non-country columns
-    sample_data = remove_time_index(sample_data)
+    # Sort sample to start on midnight monday
+    rows = rows[np.lexsort((data['hour'][rows], data['dayofweek'][rows]))]
     
     hours = list(range(1 + regularSeasonHours * seasons.index(season),
                        regularSeasonHours * (seasons.index(season) + 1) + 1))
-    return [sample_data, hours]
+    return [data['values'][rows], hours]
+
+def stack_sample(nodes, blocks, hours, value_name, constants,
+                 block_seasons=None):
+    # Function description: stack sampled blocks (hours x nodes) into one long
+    # table in a single step, node by node, with the hours of all blocks
+    # Input: node names, list of blocks, list with the hours of each block,
+    # name of the value column, columns that are constant for the sample and
+    # (optionally) the season of each block
+    values = np.hstack([block.T for block in blocks]).ravel()
+    block_hours = np.concatenate(hours)
+    data = {'Node': np.repeat(nodes, len(block_hours)),
+            'Operationalhour': np.tile(block_hours, len(nodes))}
+    if block_seasons is not None:
+        data['Season'] = np.tile(
+            np.repeat(block_seasons, [len(h) for h in hours]), len(nodes))
+    data.update(constants)
+    data[value_name] = values
+    return pd.DataFrame(data)
 
-def sample_generator(data, regularSeasonHours, scenario, season, seasons,
-                     period, generator, sample_hour):
-    [sample_data, hours] = gather_regular_sample(data, season, seasons,
-                                                 regularSeasonHours,
+def sample_generator(data, sample_year, regularSeasonHours, scenario, season,
+                     seasons, period, generator, sample_hour):
+    [sample_data, hours] = gather_regular_sample(data, sample_year, season,
+                                                 seasons, regularSeasonHours,
                                                  sample_hour)
-    generator_data = pd.DataFrame()
-    if generator=='Windoffshoregrounded' or generator=='Windoffshorefloating':
-        startNOnode = 2
-    else:
-        startNOnode = 1
-    for c in sample_data.columns:
-        # if c == "NO":
-        #     for i in range(startNOnode, 6):
-        #         c_no = c + str(i)
-        #         df = pd.DataFrame(
-        #             data={'Node': c_no, "IntermitentGenerators": generator,
-        #                   "Operationalhour": hours,
-        #                   "Scenario": "scenario" + str(scenario),
-        #                   "Period": period,
-        #                   "GeneratorStochasticAvailabilityRaw":
-        #                       sample_data[c].values})
-        #         generator_data = generator_data.append(df, ignore_index=True)
-        # else:
-        df = pd.DataFrame(
-            data={'Node': c, "IntermitentGenerators": generator,
-                  "Operationalhour": hours,
-                  "Scenario": "scenario" + str(scenario),
-                  "Period": period,
-                  "GeneratorStochasticAvailabilityRaw":
-                      sample_data[c].values})
-        generator_data = pd.concat([generator_data,df], ignore_index=True)
-    return generator_data
-
-def sample_hydro(data, regularSeasonHours, scenario, season,
+    return stack_sample(data['nodes'], [sample_data], [hours],
+                        "GeneratorStochasticAvailabilityRaw",
+                        {"IntermitentGenerators": generator,
+                         "Scenario": "scenario" + str(scenario),
+                         "Period": period})
+
+def sample_hydro(data, sample_year, regularSeasonHours, scenario, season,
                  seasons, period, sample_hour):
-    [sample_data, hours] = gather_regular_sample(data, season, seasons,
-                                                 regularSeasonHours,
+    [sample_data, hours] = gather_regular_sample(data, sample_year, season,
+                                                 seasons, regularSeasonHours,
                                                  sample_hour)
-    hydro_data = pd.DataFrame()
-    for c in sample_data.columns:
-        if c != 'time':
-            df = pd.DataFrame(
-                data={'Node': c, "Period": period, "Season": season,
-                      "Operationalhour": hours, 
-                      "Scenario": "scenario" + str(scenario),
-                      "HydroGeneratorMaxSeasonalProduction": 
-                          sample_data[c].values})
-            hydro_data = pd.concat([hydro_data,df], ignore_index=True)
-    return hydro_data
-
-def sample_load(data, regularSeasonHours, scenario, season, seasons,
-                period, sample_hour):
-    [sample_data, hours] = gather_regular_sample(data, season, seasons,
-                                                 regularSeasonHours,
+    return stack_sample(data['nodes'], [sample_data], [hours],
+                        "HydroGeneratorMaxSeasonalProduction",
+                        {"Period": period, "Season": season,
+                         "Scenario": "scenario" + str(scenario)})
+
+def sample_load(data, sample_year, regularSeasonHours, scenario, season,
+                seasons, period, sample_hour):
+    [sample_data, hours] = gather_regular_sample(data, sample_year, season,
+                                                 seasons, regularSeasonHours,
                                                  sample_hour)
-    load = pd.DataFrame()
-    for c in sample_data.columns:
-        if c != 'time':
-            df = pd.DataFrame(
-                data={'Node': c, "Period": period, "Operationalhour": hours,
-                      "Scenario": "scenario" + str(scenario),
-                      "ElectricLoadRaw_in_MW": sample_data[c].values})
-            load = pd.concat([load,df], ignore_index=True)
-    return load
-
-def gather_peak_sample(data, seasons, regularSeasonHours, peakSeasonHours,
-                       country_sample, overall_sample):
-    data = data.reset_index(drop=True)
-    country_peak = data.iloc[
-        int(country_sample - (peakSeasonHours/2)):int(
-            country_sample + (peakSeasonHours/2)),
-        :]
-    overall_peak = data.iloc[
-        int(overall_sample - (peakSeasonHours/2)):int(
-            overall_sample + (peakSeasonHours/2)),
-        :]
+    return stack_sample(data['nodes'], [sample_data], [hours], "ElectricLoadRaw_in_MW",
+                        {"Period": period,
+                         "Scenario": "scenario" + str(scenario)})
+
+def gather_peak_sample(data, sample_year, seasons, regularSeasonHours,
+                       peakSeasonHours, country_sample, overall_sample):
+    rows = data['rows'][sample_year]['all']
+    country_rows = rows[int(country_sample - (peakSeasonHours/2)):int(
+        country_sample + (peakSeasonHours/2))]
+    overall_rows = rows[int(overall_sample - (peakSeasonHours/2)):int(
+        overall_sample + (peakSeasonHours/2))]
     
     # Sort data to start on midnight 
-    country_peak = country_peak.sort_values(by=['hour'])
-    overall_peak = overall_peak.sort_values(by=['hour'])
-    
-    # Drop non-country columns
-    country_peak = remove_time_index(country_peak)
-    overall_peak = remove_time_index(overall_peak)
+    country_rows = country_rows[
+        np.argsort(data['hour'][country_rows], kind='stable')]
+    overall_rows = overall_rows[
+        np.argsort(data['hour'][overall_rows], kind='stable')]
+    country_peak = data['values'][country_rows]
+    overall_peak = data['values'][overall_rows]
     
     country_hours = list(
         range(1 + regularSeasonHours * len(seasons),
@@ -139,307 +119,423 @@ def gather_peak_sample(data, seasons, regularSeasonHours, peakSeasonHours,
         )
     return [country_peak, overall_peak, country_hours, overall_hours]
 
-def sample_hydro_peak(data, seasons, scenario, period, regularSeasonHours,
-                      peakSeasonHours, overall_sample, country_sample):
-    peak_data = pd.DataFrame()
+def sample_hydro_peak(data, sample_year, seasons, scenario, period,
+                      regularSeasonHours, peakSeasonHours, overall_sample,
+                      country_sample):
     [country_peak, overall_peak,
-     country_hours, overall_hours] = gather_peak_sample(data, seasons,
+     country_hours, overall_hours] = gather_peak_sample(data, sample_year,
+                                                        seasons,
                                                         regularSeasonHours,
                                                         peakSeasonHours,
                                                         country_sample,
                                                         overall_sample)
-    for c in country_peak.columns:
-        df = pd.DataFrame(
-            data={'Node': c, "Period": period, "Season": "peak1",
-                  "Operationalhour": country_hours,
-                  "Scenario": "scenario" + str(scenario),
-                  "HydroGeneratorMaxSeasonalProduction": 
-                      country_peak[c].values})
-        peak_data = pd.concat([peak_data,df], ignore_index=True)
-        df = pd.DataFrame(
-            data={'Node': c, "Period": period, "Season": "peak2",
-                  "Operationalhour": overall_hours,
-                  "Scenario": "scenario" + str(scenario),
-                  "HydroGeneratorMaxSeasonalProduction": 
-                      overall_peak[c].values})
-        peak_data = pd.concat([peak_data,df], ignore_index=True)
-    return peak_data
-
-def sample_load_peak(data, seasons, scenario, period, regularSeasonHours,
-                     peakSeasonHours, overall_sample, country_sample):
-    peak_data = pd.DataFrame()
+    return stack_sample(data['nodes'], [country_peak, overall_peak],
+                        [country_hours, overall_hours],
+                        "HydroGeneratorMaxSeasonalProduction",
+                        {"Period": period,
+                         "Scenario": "scenario" + str(scenario)},
+                        block_seasons=["peak1", "peak2"])
+
+def sample_load_peak(data, sample_year, seasons, scenario, period,
+                     regularSeasonHours, peakSeasonHours, overall_sample,
+                     country_sample):
     [country_peak, overall_peak,
-     country_hours, overall_hours] = gather_peak_sample(data, seasons,
+     country_hours, overall_hours] = gather_peak_sample(data, sample_year,
+                                                        seasons,
                                                         regularSeasonHours, 
                                                         peakSeasonHours, 
                                                         country_sample,
                                                         overall_sample)
-    for c in country_peak.columns:
-        df = pd.DataFrame(
-            data={'Node': c, "Period": period, 
-                  "Operationalhour": country_hours,
-                  "Scenario": "scenario" + str(scenario),
-                  "ElectricLoadRaw_in_MW": country_peak[c].values})
-        peak_data = pd.concat([peak_data,df], ignore_index=True)
-        df = pd.DataFrame(
-            data={'Node': c, "Period": period, 
-                  "Operationalhour": overall_hours,
-                  "Scenario": "scenario" + str(scenario),
-                  "ElectricLoadRaw_in_MW": overall_peak[c].values})
-        peak_data = pd.concat([peak_data,df], ignore_index=True)
-    return peak_data
-
-def sample_generator_peak(data, seasons, g, scenario,
+    return stack_sample(data['nodes'], [country_peak, overall_peak],
+                        [country_hours, overall_hours],
+                        "ElectricLoadRaw_in_MW",
+                        {"Period": period,
+                         "Scenario": "scenario" + str(scenario)})
+
+def sample_generator_peak(data, sample_year, seasons, g, scenario,
                           period, regularSeasonHours, peakSeasonHours,
                           overall_sample, country_sample):
-    peak_data = pd.DataFrame()
     [country_peak, overall_peak,
-     country_hours, overall_hours] = gather_peak_sample(data, seasons,
+     country_hours, overall_hours] = gather_peak_sample(data, sample_year,
+                                                        seasons,
                                                         regularSeasonHours,
                                                         peakSeasonHours, 
                                                         country_sample, 
                                                         overall_sample)
-    if g=='Windoffshoregrounded' or g=='Windoffshorefloating':
-        startNOnode = 2
-    else:
-        startNOnode = 1
-    for c in country_peak.columns:
-        # if c == "NO":
-        #     for i in range(startNOnode, 6):
-        #         c_no = c + str(i)
-        #         df = pd.DataFrame(
-        #         data={'Node': c_no, "IntermitentGenerators": g,
-        #               "Operationalhour": country_hours,
-        #               "Scenario": "scenario" + str(scenario),
-        #               "Period": period,
-        #               "GeneratorStochasticAvailabilityRaw":
-        #                   country_peak[c].values})
-        #         peak_data = peak_data.append(df, ignore_index=True)
-        #         df = pd.DataFrame(
-        #         data={'Node': c_no, "IntermitentGenerators": g,
-        #               "Operationalhour": overall_hours,
-        #               "Scenario": "scenario" + str(scenario),
-        #               "Period": period,
-        #               "GeneratorStochasticAvailabilityRaw":
-        #                   overall_peak[c].values})
-        #         peak_data = peak_data.append(df, ignore_index=True)
-        # else:
-        df = pd.DataFrame(
-        data={'Node': c, "IntermitentGenerators": g,
-              "Operationalhour": country_hours,
-              "Scenario": "scenario" + str(scenario),
-              "Period": period,
-              "GeneratorStochasticAvailabilityRaw":
-                  country_peak[c].values})
-        peak_data = pd.concat([peak_data,df], ignore_index=True)
-        df = pd.DataFrame(
-        data={'Node': c, "IntermitentGenerators": g,
-              "Operationalhour": overall_hours,
-              "Scenario": "scenario" + str(scenario),
-              "Period": period,
-             "GeneratorStochasticAvailabilityRaw":
-                 overall_peak[c].values})
-        peak_data = pd.concat([peak_data,df], ignore_index=True)
-    return peak_data
+    return stack_sample(data['nodes'], [country_peak, overall_peak],
+                        [country_hours, overall_hours],
+                        "GeneratorStochasticAvailabilityRaw",
+                        {"IntermitentGenerators": g,
+                         "Scenario": "scenario" + str(scenario),
+                         "Period": period})
 
-def generate_random_scenario(filepath, tab_file_path, scenarios, seasons,
-                             Periods, regularSeasonHours, peakSeasonHours, 
-                             dict_countries):
+def sample_regular_season(data, period, scenario, season, seasons,
+                          regularSeasonHours, sample_hour, year, year_load,
+                          year_hydro, year_hydroseasonal):
+    # Function description: sample one regular season of one scenario
+    # Input: indexed raw data, sample hour and the sample years of the
+    # solar/wind, load, run-of-the-river and seasonal hydro series
+    # Output: generator availability, electric load and seasonal hydro blocks
+    genAvail = []
     
-    print("Generating random scenarios...")
+    # Sample generator availability for regular seasons
+    for raw, raw_year, generator in [
+            ('solar', year, "Solar"),
+            ('windonshore', year, "Windonshore"),
+            ('windoffshore', year, "Windoffshoregrounded"),
+            ('windoffshore', year, "Windoffshorefloating"),
+            ('hydroror', year_hydro, "Hydrorun-of-the-river")]:
+        genAvail.append(
+            sample_generator(data=data[raw], sample_year=raw_year,
+                             regularSeasonHours=regularSeasonHours,
+                             scenario=scenario, season=season,
+                             seasons=seasons, period=period,
+                             generator=generator,
+                             sample_hour=sample_hour))
+
+    # Sample electric load for regular seasons
+    elecLoad = [
+        sample_load(data=data['electricload'], sample_year=year_load,
+                    regularSeasonHours=regularSeasonHours,
+                    scenario=scenario, season=season,
+                    seasons=seasons, period=period,
+                    sample_hour=sample_hour)]
+    
+    # Sample seasonal hydro limit for regular seasons
+    hydroSeasonal = [
+        sample_hydro(data=data['hydroseasonal'],
+                     sample_year=year_hydroseasonal,
+                     regularSeasonHours=regularSeasonHours,
+                     scenario=scenario, season=season,
+                     seasons=seasons, period=period,
+                     sample_hour=sample_hour)]
+    return [genAvail, elecLoad, hydroSeasonal]
 
-    # Generate dataframes to print as stochastic-files
-    genAvail = pd.DataFrame()
-    elecLoad = pd.DataFrame()
-    hydroSeasonal = pd.DataFrame()
+def sample_peak_seasons(data, period, scenario, seasons, regularSeasonHours,
+                        peakSeasonHours, year, year_load, year_hydro,
+                        year_hydroseasonal):
+    # Function description: sample the two peak seasons of one scenario
+    # Input: as sample_regular_season. The peaks are found in the load of
+    # year_load
+    # Output: generator availability, electric load and seasonal hydro blocks
+    genAvail = []
     
-    # Load all the raw scenario data
-    solar_data = pd.read_csv(filepath + "/solar.csv")
-    windonshore_data = pd.read_csv(filepath + "/windonshore.csv")
-    windoffshore_data = pd.read_csv(filepath + "/windoffshore.csv")
-    hydrorunoftheriver_data = pd.read_csv(filepath + "/hydroror.csv")
-    hydroseasonal_data = pd.read_csv(filepath + "/hydroseasonal.csv")
-    electricload_data = pd.read_csv(filepath + "/electricload.csv")
-
-    for i in range(1,Periods+1):
-        years = []
-        for scenario in range(1,scenarios+1):
-            
-            # Get sample years for each scenario (solar/wind, hydro, load)
-            
-            sample_year = list(np.random.randint(2015, 2017, 1))
-            sample_year_load = list(np.random.randint(2015, 2017, 1))
-            sample_year_hydro = list(np.random.randint(2015, 2017, 1))
-            
-            # Filter out the hours within the sample year
-            
-            solar_data_year = filter_sample_year(
-                data=solar_data, sample_year=sample_year)
-            windonshore_data_year = filter_sample_year(
-                data=windonshore_data, sample_year=sample_year)
-            windoffshore_data_year = filter_sample_year(
-                data=windoffshore_data, sample_year=sample_year)
-            hydrorunoftheriver_data_year = filter_sample_year(
-                data=hydrorunoftheriver_data, sample_year=sample_year_hydro)
-            hydroseasonal_data = filter_sample_year(
-                data=hydroseasonal_data, sample_year=None)
-            electricload_data_year = filter_sample_year(
-                data=electricload_data, sample_year=sample_year_load)
-
-            # Ensure the same climatic year is not chosen twice for wind/solar
-            
-            while sample_year in years:
-                sample_year = list(np.random.randint(1985, 2016, 1))
-            years.append(sample_year[0])
-
-            ###################
-            ##REGULAR SEASONS##
-            ###################
-
-            for s in seasons:
-                
-                # Get the sample range for regular season s. 
-                # 'max_sample' is the max "last hour" for season s
-                
-                max_sample = min(
-                    gather_season(data=hydrorunoftheriver_data_year,
-                                  season=s).shape[0],
-                    gather_season(data=electricload_data_year,
-                                  season=s).shape[0], 
-                    gather_season(data=windoffshore_data_year,
-                                  season=s).shape[0])
-                sample_hour = np.random.randint(
-                    0, max_sample - regularSeasonHours - 1)
-                
-                # Sample generator availability for regular seasons
-                genAvail = pd.concat([genAvail,
-                                      sample_generator(data=solar_data_year,
-                                     regularSeasonHours=regularSeasonHours,
-                                     scenario=scenario, season=s,
-                                     seasons=seasons, period=i,
-                                     generator="Solar",
-                                     sample_hour=sample_hour)],ignore_index=True)
-                genAvail = pd.concat([genAvail,
-                                      sample_generator(data=windonshore_data_year,
-                                     regularSeasonHours=regularSeasonHours,
-                                     scenario=scenario, season=s,
-                                     seasons=seasons, period=i,
-                                     generator="Windonshore",
-                                     sample_hour=sample_hour)],ignore_index=True)
-                genAvail = pd.concat([genAvail,
-                                      sample_generator(data=windoffshore_data_year,
-                                     regularSeasonHours=regularSeasonHours,
-                                     scenario=scenario, season=s,
-                                     seasons=seasons, period=i,
-                                     generator="Windoffshoregrounded",
-                                     sample_hour=sample_hour)],ignore_index=True)
-                genAvail = pd.concat([genAvail,
-                    sample_generator(data=windoffshore_data_year,
-                                     regularSeasonHours=regularSeasonHours,
-                                     scenario=scenario, season=s,
-                                     seasons=seasons, period=i,
-                                     generator="Windoffshorefloating",
-                                     sample_hour=sample_hour)],ignore_index=True)
-                genAvail = pd.concat([genAvail,
-                                      sample_generator(data=hydrorunoftheriver_data_year,
-                                     regularSeasonHours=regularSeasonHours,
-                                     scenario=scenario, season=s,
-                                     seasons=seasons, period=i,
-                                     generator="Hydrorun-of-the-river",
-                                     sample_hour=sample_hour)],ignore_index=True)
-
-                # Sample electric load for regular seasons
-                elecLoad = pd.concat([elecLoad,
-                    sample_load(data=electricload_data_year,
-                                regularSeasonHours=regularSeasonHours,
-                                scenario=scenario, season=s,
-                                seasons=seasons, period=i,
-                                sample_hour=sample_hour)],ignore_index=True)
-                
-                # Sample seasonal hydro limit for regular seasons
-                hydroSeasonal = pd.concat([hydroSeasonal,
-                                           sample_hydro(data=hydroseasonal_data,
-                                 regularSeasonHours=regularSeasonHours,
-                                 scenario=scenario, season=s,
-                                 seasons=seasons, period=i,
-                                 sample_hour=sample_hour)],ignore_index=True)
-            
-            ################
-            ##PEAK SEASONS##
-            ################
-            
-            #Peak1: The highest load when all loads are summed together
-            electricload_data_year_notime = remove_time_index(electricload_data_year)
-            overall_sample = electricload_data_year_notime.sum(axis=1).idxmax()
-            #Peak2: The highest load of a single country
-            max_load_country = electricload_data_year_notime.max().idxmax()
-            country_sample = electricload_data_year_notime[max_load_country].idxmax()
-
-            #Sample generator availability for peak seasons
-            genAvail = pd.concat([genAvail,
-                                  sample_generator_peak(data=solar_data_year,
-                                      seasons=seasons,
-                                      g="Solar", scenario=scenario, period=i,
-                                      regularSeasonHours=regularSeasonHours,
-                                      peakSeasonHours=peakSeasonHours,
-                                      overall_sample=overall_sample,
-                                      country_sample=country_sample)],ignore_index=True)
-            genAvail = pd.concat([genAvail,
-                sample_generator_peak(data=windonshore_data_year,
-                                      seasons=seasons,
-                                      g="Windonshore", scenario=scenario,
-                                      period=i,
-                                      regularSeasonHours=regularSeasonHours,
-                                      peakSeasonHours=peakSeasonHours,
-                                      overall_sample=overall_sample,
-                                      country_sample=country_sample)],ignore_index=True)
-            genAvail = pd.concat([genAvail,
-                sample_generator_peak(data=windoffshore_data_year,
-                                      seasons=seasons,
-                                      g="Windoffshoregrounded", scenario=scenario,
-                                      period=i,
-                                      regularSeasonHours=regularSeasonHours,
-                                      peakSeasonHours=peakSeasonHours,
-                                      overall_sample=overall_sample,
-                                      country_sample=country_sample)],ignore_index=True)
-            genAvail = pd.concat([genAvail,
-                sample_generator_peak(data=windoffshore_data_year,
-                                      seasons=seasons,
-                                      g="Windoffshorefloating", scenario=scenario,
-                                      period=i,
-                                      regularSeasonHours=regularSeasonHours,
-                                      peakSeasonHours=peakSeasonHours,
-                                      overall_sample=overall_sample,
-                                      country_sample=country_sample)],ignore_index=True)
-            genAvail = pd.concat([genAvail,
-                sample_generator_peak(data=hydrorunoftheriver_data_year,
-                                      seasons=seasons,
-                                      g="Hydrorun-of-the-river",
-                                      scenario=scenario, period=i,
-                                      regularSeasonHours=regularSeasonHours,
-                                      peakSeasonHours=peakSeasonHours,
-                                      overall_sample=overall_sample,
-                                      country_sample=country_sample)],ignore_index=True)
-            
-            #Sample electric load for peak seasons
-            elecLoad = pd.concat([elecLoad,
-                sample_load_peak(data=electricload_data_year,
-                                 seasons=seasons,
-                                 scenario=scenario, period=i,
-                                 regularSeasonHours=regularSeasonHours,
-                                 peakSeasonHours=peakSeasonHours,
-                                 overall_sample=overall_sample,
-                                 country_sample=country_sample)],ignore_index=True)
-            
-            #Sample seasonal hydro limit for peak seasons
-            hydroSeasonal = pd.concat([hydroSeasonal,
-                sample_hydro_peak(data=hydroseasonal_data,
+    electricload_data_year_notime = pd.DataFrame(
+        data['electricload']['values'][
+            data['electricload']['rows'][year_load]['all']],
+        columns=data['electricload']['nodes'])
+    #Peak1: The highest load when all loads are summed together
+    overall_sample = electricload_data_year_notime.sum(axis=1).idxmax()
+    #Peak2: The highest load of a single country
+    max_load_country = electricload_data_year_notime.max().idxmax()
+    country_sample = electricload_data_year_notime[max_load_country].idxmax()
+
+    #Sample generator availability for peak seasons
+    for raw, raw_year, g in [
+            ('solar', year, "Solar"),
+            ('windonshore', year, "Windonshore"),
+            ('windoffshore', year, "Windoffshoregrounded"),
+            ('windoffshore', year, "Windoffshorefloating"),
+            ('hydroror', year_hydro, "Hydrorun-of-the-river")]:
+        genAvail.append(
+            sample_generator_peak(data=data[raw], sample_year=raw_year,
                                   seasons=seasons,
-                                  scenario=scenario, period=i,
+                                  g=g, scenario=scenario, period=period,
                                   regularSeasonHours=regularSeasonHours,
                                   peakSeasonHours=peakSeasonHours,
                                   overall_sample=overall_sample,
-                                  country_sample=country_sample)],ignore_index=True)
+                                  country_sample=country_sample))
+    
+    #Sample electric load for peak seasons
+    elecLoad = [
+        sample_load_peak(data=data['electricload'], sample_year=year_load,
+                         seasons=seasons,
+                         scenario=scenario, period=period,
+                         regularSeasonHours=regularSeasonHours,
+                         peakSeasonHours=peakSeasonHours,
+                         overall_sample=overall_sample,
+                         country_sample=country_sample)]
+    
+    #Sample seasonal hydro limit for peak seasons
+    hydroSeasonal = [
+        sample_hydro_peak(data=data['hydroseasonal'],
+                          sample_year=year_hydroseasonal,
+                          seasons=seasons,
+                          scenario=scenario, period=period,
+                          regularSeasonHours=regularSeasonHours,
+                          peakSeasonHours=peakSeasonHours,
+                          overall_sample=overall_sample,
+                          country_sample=country_sample)]
+    return [genAvail, elecLoad, hydroSeasonal]
+
+def sample_scenario(data, period, scenario, seed, seasons,
+                    regularSeasonHours, peakSeasonHours):
+    # Function description: sample all seasons of one scenario in one period
+    # Input: indexed raw data (see index_scenario_data), period, scenario and
+    # the seed of this (period, scenario)
+    # Output: generator availability, electric load and seasonal hydro tables
+    
+    rng = np.random.default_rng(seed)
+    samples = [[], [], []]
+    
+    # Get sample years for the scenario (solar/wind, hydro, load). 
+    # Seasonal hydro is sampled from all years
+    
+    year = rng.integers(2015, 2017)
+    year_load = rng.integers(2015, 2017)
+    year_hydro = rng.integers(2015, 2017)
+
+    ###################
+    ##REGULAR SEASONS##
+    ###################
+
+    for s in seasons:
+        
+        # Get the sample range for regular season s. 
+        # 'max_sample' is the max "last hour" for season s
+        
+        max_sample = min(
+            len(data['hydroror']['rows'][year_hydro][s]),
+            len(data['electricload']['rows'][year_load][s]),
+            len(data['windoffshore']['rows'][year][s]))
+        sample_hour = rng.integers(0, max_sample - regularSeasonHours - 1)
+        
+        for sample, blocks in zip(samples, sample_regular_season(
+                data, period, scenario, s, seasons, regularSeasonHours,
+                sample_hour, year, year_load, year_hydro, None)):
+            sample.extend(blocks)
+    
+    ################
+    ##PEAK SEASONS##
+    ################
+    
+    for sample, blocks in zip(samples, sample_peak_seasons(
+            data, period, scenario, seasons, regularSeasonHours,
+            peakSeasonHours, year, year_load, year_hydro, None)):
+        sample.extend(blocks)
+
+    return [pd.concat(sample, ignore_index=True) for sample in samples]
+
+def representative_season_names(seasons, weeksPerSeason):
+    # Names of the regular seasons when each season is represented by
+    # 'weeksPerSeason' clustered weeks (sampling='cluster'), e.g. winter1
+    return [s + str(j + 1) for s in seasons for j in range(weeksPerSeason)]
+
+def common_years(data):
+    # Years that are present in all series of the indexed raw data
+    return sorted(set.intersection(*[
+        set(y for y in data[raw]['rows'] if y is not None) for raw in data]))
+
+def k_medoids(distance, k, max_iterations=100):
+    # Function description: k-medoids clustering with a greedy build of the
+    # initial medoids followed by alternating assignment and medoid updates
+    # Input: distance matrix between the items, number of clusters
+    # Output: item index of each medoid and the cluster of each item
+    k = min(k, distance.shape[0])
+    medoids = [int(np.argmin(distance.sum(axis=1)))]
+    while len(medoids) < k:
+        nearest = distance[:, medoids].min(axis=1)
+        cost = np.minimum(nearest[None, :], distance).sum(axis=1)
+        cost[medoids] = np.inf
+        medoids.append(int(np.argmin(cost)))
+    for iteration in range(max_iterations):
+        labels = np.argmin(distance[:, medoids], axis=1)
+        new_medoids = []
+        for j in range(k):
+            members = np.flatnonzero(labels == j)
+            if len(members) == 0:
+                new_medoids.append(medoids[j])
+                continue
+            new_medoids.append(int(members[np.argmin(
+                distance[np.ix_(members, members)].sum(axis=1))]))
+        if new_medoids == medoids:
+            break
+        medoids = new_medoids
+    labels = np.argmin(distance[:, medoids], axis=1)
+    return [medoids, labels]
+
+def select_representative_weeks(data, seasons, regularSeasonHours,
+                                weeksPerSeason):
+    # Function description: cluster the candidate weeks of each season
+    # jointly on load, wind, solar and hydro profiles and select the medoids
+    # as representative weeks
+    # Input: indexed raw data, season names, hours per week, number of
+    # representative weeks per season
+    # Output: list of [season, year, sample hour, weight] for each
+    # representative week, where weight is the share of the candidate weeks
+    # of the season that the week represents
+    feature_series = ['electricload', 'solar', 'windonshore', 'windoffshore',
+                      'hydroror']
+    
+    # Candidate weeks are the non-overlapping weeks of each season in the
+    # years that are present in all series
+    years = common_years(data)
+    scale = {}
+    for raw in feature_series:
+        scale[raw] = np.abs(data[raw]['values']).max(axis=0)
+        scale[raw][scale[raw] == 0] = 1
+
+    weeks = []
+    for s in seasons:
+        candidates = []
+        for y in years:
+            season_rows = min(len(data[raw]['rows'][y][s]) for raw in data)
+            for sample_hour in range(0, season_rows - regularSeasonHours + 1,
+                                     regularSeasonHours):
+                candidates.append([y, sample_hour])
+        if len(candidates) < weeksPerSeason:
+            raise ValueError('Only ' + str(len(candidates)) +
+                             ' candidate weeks for season ' + s)
+        
+        # Profiles are normalised with the maximum of each node and series
+        features = np.array([np.concatenate([
+            (gather_regular_sample(data[raw], y, s, seasons,
+                                   regularSeasonHours, sample_hour)[0]
+             / scale[raw]).ravel() for raw in feature_series])
+            for [y, sample_hour] in candidates])
+        squared = (features ** 2).sum(axis=1)
+        distance = np.sqrt(np.maximum(
+            squared[:, None] + squared[None, :] - 2 * features @ features.T,
+            0))
+        
+        [medoids, labels] = k_medoids(distance, weeksPerSeason)
+        season_weeks = [candidates[m] + [np.mean(labels == j)]
+                        for j, m in enumerate(medoids)]
+        weeks.extend([[s] + week for week in sorted(season_weeks)])
+    return weeks
+
+def sample_representative_scenario(data, period, scenario, weeks, seasons,
+                                   regularSeasonHours, peakSeasonHours,
+                                   peak_year):
+    # Function description: write the representative weeks and the peaks of
+    # peak_year as one scenario in one period
+    # Input: indexed raw data, period, scenario, representative weeks (see
+    # select_representative_weeks) and the representative season names
+    # Output: generator availability, electric load and seasonal hydro tables
+    samples = [[], [], []]
+    for representative_season, [s, year, sample_hour, weight] in zip(
+            seasons, weeks):
+        for sample, blocks in zip(samples, sample_regular_season(
+                data, period, scenario, representative_season, seasons,
+                regularSeasonHours, sample_hour, year, year, year, year)):
+            sample.extend(blocks)
+    for sample, blocks in zip(samples, sample_peak_seasons(
+            data, period, scenario, seasons, regularSeasonHours,
+            peakSeasonHours, peak_year, peak_year, peak_year, peak_year)):
+        sample.extend(blocks)
+    return [pd.concat(sample, ignore_index=True) for sample in samples]
+
+# Indexed raw data of a worker process, set once by init_sample_worker
+worker_data = None
+
+def init_sample_worker(data):
+    global worker_data
+    worker_data = data
+
+def sample_scenario_worker(task):
+    return sample_scenario(worker_data, *task)
+
+def sample_random_scenarios(data, scenarios, seasons, Periods,
+                            regularSeasonHours, peakSeasonHours, seed,
+                            workers):
+    # Function description: sample all (period, scenario) in a process pool,
+    # each from its own random stream derived from the seed
+    # Output: list of sample_scenario outputs in (period, scenario) order
+    seed_sequence = np.random.SeedSequence(seed)
+    if seed is None:
+        print("Scenario generation seed: " + str(seed_sequence.entropy))
+
+    tasks = [(i, scenario,
+              np.random.SeedSequence(seed_sequence.entropy,
+                                     spawn_key=(i, scenario)),
+              seasons, regularSeasonHours, peakSeasonHours)
+             for i in range(1,Periods+1) for scenario in range(1,scenarios+1)]
+    if workers == 1:
+        samples = [sample_scenario(data, *task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=init_sample_worker,
+                                 initargs=(data,)) as pool:
+            samples = list(pool.map(sample_scenario_worker, tasks))
+
+    return samples
+
+def generate_random_scenario(filepath, tab_file_path, scenarios, seasons,
+                             Periods, regularSeasonHours, peakSeasonHours, 
+                             dict_countries, tab_file_format='tab',
+                             seed=None, workers=None, sampling='random',
+                             weeksPerSeason=1, file_suffix=''):
+    # Every (period, scenario) is sampled from its own random stream, derived
+    # from 'seed' with np.random.SeedSequence. The scenarios are sampled in
+    # a process pool with 'workers' processes (None = one per CPU, 1 = serial)
+    # and merged in (period, scenario) order, so the output only depends on
+    # the seed and not on the number of workers.
+    # With sampling='cluster' each season is instead represented by the
+    # 'weeksPerSeason' medoids of a k-medoids clustering of all its weeks
+    # (seasons named as in representative_season_names) and the peaks of the
+    # year with the highest load. The weeks are the same in all periods and
+    # scenarios (so there should be one scenario per hydrogen scenario), and
+    # their weights are written to Stochastic_SeasonScale. The clustering is
+    # deterministic, 'seed' and 'workers' are not used.
+    # The tables are written with 'file_suffix' appended to their names, e.g.
+    # _h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios} as read by
+    # run_empire.
+    
+    print("Generating random scenarios...")
+    
+    # Load all the raw scenario data, parse the time stamps and index the
+    # rows of each year and season once
+    data = {}
+    for raw in ['solar', 'windonshore', 'windoffshore', 'hydroror',
+                'hydroseasonal', 'electricload']:
+        data[raw] = index_scenario_data(
+            pd.read_csv(filepath + "/" + raw + ".csv"), seasons)
+
+    if sampling == 'cluster':
+        if seed is not None or workers is not None:
+            print("WARNING: seed and workers are not used with "
+                  "sampling='cluster', the clustered weeks are deterministic")
+        weeks = select_representative_weeks(data, seasons, regularSeasonHours,
+                                            weeksPerSeason)
+        representative_seasons = representative_season_names(seasons,
+                                                              weeksPerSeason)
+        
+        # The representative seasons are sampled from the rows of their season
+        for raw in data:
+            for y in data[raw]['rows']:
+                for representative_season, week in zip(representative_seasons,
+                                                       weeks):
+                    data[raw]['rows'][y][representative_season] = \
+                        data[raw]['rows'][y][week[0]]
+        
+        load = data['electricload']
+        peak_year = max(common_years(data), key=lambda y: load['values'][
+            load['rows'][y]['all']].sum(axis=1).max())
+        samples = [sample_representative_scenario(
+            data, i, scenario, weeks, representative_seasons,
+            regularSeasonHours, peakSeasonHours, peak_year)
+            for i in range(1,Periods+1) for scenario in range(1,scenarios+1)]
+        
+        # Each regular season represents its share of the non-peak hours
+        regularHours = 8760 - 2 * peakSeasonHours
+        seasonScale = pd.DataFrame({
+            "Season": representative_seasons + ["peak1", "peak2"],
+            "seasScale": [week[3] * regularHours /
+                          (len(seasons) * regularSeasonHours)
+                          for week in weeks] + [1, 1]})
+        if not os.path.exists(tab_file_path):
+            os.makedirs(tab_file_path)
+        save_tab_file(seasonScale, tab_file_path + "/Stochastic_SeasonScale" +
+                      file_suffix, tab_file_format)
+    else:
+        samples = sample_random_scenarios(data, scenarios, seasons, Periods,
+                                          regularSeasonHours, peakSeasonHours,
+                                          seed, workers)
+
+    genAvail = pd.concat([sample[0] for sample in samples], ignore_index=True)
+    elecLoad = pd.concat([sample[1] for sample in samples], ignore_index=True)
+    hydroSeasonal = pd.concat([sample[2] for sample in samples],
+                              ignore_index=True)
 
     #Replace country codes with country names
     genAvail = genAvail.replace({"Node": dict_countries})
@@ -459,12 +555,11 @@ def generate_random_scenario(filepath, tab_file_path, scenarios, seasons,
     #Make filepath (if it does not exist) and print .tab-files
     if not os.path.exists(tab_file_path):
         os.makedirs(tab_file_path)
-    genAvail.to_csv(
-        tab_file_path + "/Stochastic_StochasticAvailability" + '.tab',
-        header=True, index=None, sep='\t', mode='w')
-    elecLoad.to_csv(
-        tab_file_path + "/Stochastic_ElectricLoadRaw" + '.tab',
-        header=True, index=None, sep='\t', mode='w')
-    hydroSeasonal.to_csv(
-        tab_file_path + "/Stochastic_HydroGenMaxSeasonalProduction" + '.tab',
-        header=True, index=None, sep='\t', mode='w')
\ No newline at end of file
+    save_tab_file(genAvail, tab_file_path +
+                  "/Stochastic_StochasticAvailability" + file_suffix,
+                  tab_file_format)
+    save_tab_file(elecLoad, tab_file_path + "/Stochastic_ElectricLoadRaw" +
+                  file_suffix, tab_file_format)
+    save_tab_file(hydroSeasonal, tab_file_path +
+                  "/Stochastic_HydroGenMaxSeasonalProduction" + file_suffix,
+                  tab_file_format)
@@ -0,0 +1,173 @@
+import pandas as pd
+import numpy as np
+import os
+from reader import save_tab_file, load_tab_frame
+
+# Stochastic tables and their value columns. The scenarios are compared on
+# all of them.
+STOCHASTIC_TABLES = {
+    "Stochastic_StochasticAvailability": "GeneratorStochasticAvailabilityRaw",
+    "Stochastic_ElectricLoadRaw": "ElectricLoadRaw_in_MW",
+    "Stochastic_HydroGenMaxSeasonalProduction": "HydroGeneratorMaxSeasonalProduction"}
+SERIES_COLUMNS = ["Node", "IntermitentGenerators"]
+
+def scenario_features(table, value, scenarios):
+    # Function description: one row of normalised values per scenario, where
+    # each series (node, generator) is scaled with its maximum over all hours
+    # and scenarios
+    # Input: stochastic table, name of its value column, scenario names
+    # Output: array with one row per scenario
+    keys = [c for c in table.columns if c not in ["Scenario", value]]
+    series = [c for c in SERIES_COLUMNS if c in keys]
+    scale = table[value].abs().groupby([table[c] for c in series]) \
+        .transform('max').replace(0, 1)
+    features = table.assign(**{value: table[value] / scale}).pivot_table(
+        index="Scenario", columns=keys, values=value, aggfunc='first')
+    return features.reindex(scenarios).fillna(0).to_numpy()
+
+def scenario_distances(features):
+    # Euclidean distance between the scenario rows of 'features'
+    squared = (features ** 2).sum(axis=1)
+    return np.sqrt(np.maximum(
+        squared[:, None] + squared[None, :] - 2 * features @ features.T, 0))
+
+def redistribute_probabilities(distance, probabilities, selected):
+    # Function description: optimal redistribution, the probability of every
+    # deleted scenario is added to the closest selected scenario
+    # Output: probabilities of the selected scenarios and the (Kantorovich)
+    # distance between the original and the reduced distribution
+    nearest = np.argmin(distance[:, selected], axis=1)
+    nearest[selected] = np.arange(len(selected))
+    reduced = np.bincount(nearest, weights=probabilities,
+                          minlength=len(selected))
+    reduction_distance = float(np.sum(probabilities * distance[
+        np.arange(len(probabilities)), np.asarray(selected)[nearest]]))
+    return [reduced, reduction_distance]
+
+def fast_forward_selection(distance, probabilities, k):
+    # Function description: fast forward selection (Heitsch and Roemisch),
+    # adds the scenario that reduces the probability distance the most until
+    # k scenarios are selected
+    # Input: distance matrix, scenario probabilities, number of scenarios
+    # Output: indices of the selected scenarios in the order of selection
+    cost = distance.copy()
+    selected = []
+    for step in range(k):
+        # Probability weighted distance of all scenarios to the selected
+        # scenarios if scenario u is selected as well
+        z = probabilities @ cost
+        z[selected] = np.inf
+        u = int(np.argmin(z))
+        selected.append(u)
+        cost = np.minimum(cost, cost[:, [u]])
+    return selected
+
+def backward_reduction(distance, probabilities, k):
+    # Function description: simultaneous backward reduction (Heitsch and
+    # Roemisch), deletes the scenario that increases the probability distance
+    # the least until k scenarios are left
+    # Input: distance matrix, scenario probabilities, number of scenarios
+    # Output: indices of the remaining scenarios
+    remaining = list(range(len(probabilities)))
+    while len(remaining) > k:
+        costs = []
+        for l in remaining:
+            kept = [j for j in remaining if j != l]
+            costs.append(probabilities @ distance[:, kept].min(axis=1))
+        remaining.pop(int(np.argmin(costs)))
+    return remaining
+
+def reduce_scenarios(scenario_data_path, reduced_scenario_data_path,
+                     NoOfHydrogenScenarios, NoOfNormalScenarios,
+                     NoOfReducedScenarios, method='forward',
+                     tab_file_format='tab'):
+    # Function description: reduce the stochastic tables of
+    # NoOfHydrogenScenarios x NoOfNormalScenarios scenarios to
+    # NoOfHydrogenScenarios x NoOfReducedScenarios scenarios. The normal
+    # scenarios of each hydrogen scenario are reduced separately, so that the
+    # scenario numbering (scenario w belongs to hydrogen scenario
+    # ceil(w/NoOfNormalScenarios)) is kept. The reduced tables and the scenario
+    # probabilities (Stochastic_ScenarioProbability, read by run_empire) are
+    # written with the suffix _h2_{NoOfHydrogenScenarios}_scen_{NoOfReducedScenarios}
+    # Input: directories of the full and the reduced stochastic tables, number
+    # of scenarios, method 'forward' (fast forward selection) or 'backward'
+    # (backward reduction)
+    # Output: dataframe with the selected scenario and probability of each
+    # reduced scenario
+
+    print("Reducing scenarios...")
+
+    suffix = f'_h2_{NoOfHydrogenScenarios}_scen_{NoOfNormalScenarios}'
+    reduced_suffix = f'_h2_{NoOfHydrogenScenarios}_scen_{NoOfReducedScenarios}'
+    scenarios = ["scenario" + str(w + 1)
+                 for w in range(NoOfHydrogenScenarios * NoOfNormalScenarios)]
+
+    tables = {}
+    for name in STOCHASTIC_TABLES:
+        tables[name] = load_tab_frame(scenario_data_path + "/" + name + suffix,
+                                      tab_file_format)
+
+    # Scenario probabilities of the full set are read if it is already weighted
+    probability_file = scenario_data_path + "/Stochastic_ScenarioProbability" + suffix
+    if os.path.exists(probability_file + '.tab') or \
+            (tab_file_format == 'parquet' and
+             os.path.exists(probability_file + '.parquet')):
+        probabilities = load_tab_frame(probability_file, tab_file_format) \
+            .set_index("Scenario")["sceProbab"].reindex(scenarios).to_numpy()
+    else:
+        probabilities = np.full(len(scenarios), 1 / len(scenarios))
+
+    features = np.hstack([scenario_features(tables[name], value, scenarios)
+                          for name, value in STOCHASTIC_TABLES.items()])
+
+    reduction = []
+    for h2_scen in range(NoOfHydrogenScenarios):
+        block = np.arange(h2_scen * NoOfNormalScenarios,
+                          (h2_scen + 1) * NoOfNormalScenarios)
+        distance = scenario_distances(features[block])
+        block_probability = probabilities[block].sum()
+        relative = probabilities[block] / block_probability
+        if method == 'forward':
+            selected = fast_forward_selection(distance, relative,
+                                              NoOfReducedScenarios)
+        elif method == 'backward':
+            selected = backward_reduction(distance, relative,
+                                          NoOfReducedScenarios)
+        else:
+            raise ValueError("Unknown scenario reduction method: " + method)
+        selected = sorted(selected)
+        [reduced, reduction_distance] = redistribute_probabilities(
+            distance, relative, selected)
+        print("Hydrogen scenario " + str(h2_scen + 1) + ": kept " +
+              str([scenarios[block[j]] for j in selected]) +
+              ", distance to full distribution: " + str(reduction_distance))
+        for j, p in zip(selected, reduced):
+            reduction.append([scenarios[block[j]], p * block_probability])
+
+    reduction = pd.DataFrame(reduction, columns=["Original", "sceProbab"])
+    reduction["Scenario"] = ["scenario" + str(w + 1)
+                             for w in range(len(reduction))]
+    renumber = dict(zip(reduction["Original"], reduction["Scenario"]))
+
+    #Make filepath (if it does not exist) and print reduced .tab-files
+    if not os.path.exists(reduced_scenario_data_path):
+        os.makedirs(reduced_scenario_data_path)
+    for name, table in tables.items():
+        table = table[table["Scenario"].isin(renumber)]
+        table = table.assign(Scenario=table["Scenario"].map(renumber))
+        save_tab_file(table, reduced_scenario_data_path + "/" + name +
+                      reduced_suffix, tab_file_format)
+    save_tab_file(reduction[["Scenario", "sceProbab"]],
+                  reduced_scenario_data_path + "/Stochastic_ScenarioProbability" +
+                  reduced_suffix, tab_file_format)
+
+    # Season scales of clustered weeks are the same in all scenarios
+    season_scale_file = scenario_data_path + "/Stochastic_SeasonScale" + suffix
+    if os.path.exists(season_scale_file + '.tab') or \
+            (tab_file_format == 'parquet' and
+             os.path.exists(season_scale_file + '.parquet')):
+        save_tab_file(load_tab_frame(season_scale_file, tab_file_format),
+                      reduced_scenario_data_path + "/Stochastic_SeasonScale" +
+                      reduced_suffix, tab_file_format)
+
+    return reduction[["Scenario", "Original", "sceProbab"]]